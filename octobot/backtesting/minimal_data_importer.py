@@ -58,6 +58,14 @@ class MinimalDataImporter(octobot_backtesting.importers.ExchangeDataImporter):
     async def get_data_timestamp_interval(self, time_frame=None):
         return self._min_timestamp, self._max_timestamp
 
+    async def get_available_timestamps(self) -> list:
+        timestamps = set()
+        for time_frame, candles_by_symbol in self._candles_cache.items():
+            for symbol in candles_by_symbol:
+                timestamps.update(candle[0] for candle in self._select(databases.SQLiteDatabase.DEFAULT_SIZE,
+                                                                        symbol, time_frame))
+        return sorted(timestamps)
+
     async def get_ohlcv(self, exchange_name=None, symbol=None,
                         time_frame=octobot_commons.enums.TimeFrames.ONE_HOUR,
                         limit=databases.SQLiteDatabase.DEFAULT_SIZE,
@@ -100,6 +100,7 @@ from octobot.community.history_backend import (
     history_backend_client,
     HistoricalBackendClient,
     ClickhouseHistoricalBackendClient,
+    IcebergCandlesCache,
     IcebergHistoricalBackendClient,
 )
 from octobot.community.community_bot import (
@@ -165,6 +166,7 @@ __all__ = [
     "history_backend_client",
     "HistoricalBackendClient",
     "ClickhouseHistoricalBackendClient",
+    "IcebergCandlesCache",
     "IcebergHistoricalBackendClient",
     "CommunityBot",
     "MissingDeploymentError",
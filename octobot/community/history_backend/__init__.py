@@ -29,6 +29,11 @@ from octobot.community.history_backend.clickhouse_historical_backend_client impo
     ClickhouseHistoricalBackendClient,
 )
 
+from octobot.community.history_backend import iceberg_candles_cache
+from octobot.community.history_backend.iceberg_candles_cache import (
+    IcebergCandlesCache,
+)
+
 from octobot.community.history_backend import iceberg_historical_backend_client
 from octobot.community.history_backend.iceberg_historical_backend_client import (
     IcebergHistoricalBackendClient,
@@ -38,5 +43,6 @@ __all__ = [
     "history_backend_client",
     "HistoricalBackendClient",
     "ClickhouseHistoricalBackendClient",
+    "IcebergCandlesCache",
     "IcebergHistoricalBackendClient",
 ]
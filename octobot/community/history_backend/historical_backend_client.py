@@ -14,6 +14,8 @@
 #  You should have received a copy of the GNU General Public
 #  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
 import typing
+import numpy
+
 import octobot_commons.enums as commons_enums
 
 
@@ -46,6 +48,26 @@ class HistoricalBackendClient:
     ) -> list[list[typing.Union[float, str]]]:
         raise NotImplementedError("fetch_extended_candles_history is not implemented")
 
+    async def fetch_candles_history_arrays(
+        self,
+        exchange: str,
+        symbol: str,
+        time_frame: commons_enums.TimeFrames,
+        first_open_time: float,
+        last_open_time: float
+    ) -> numpy.ndarray:
+        raise NotImplementedError("fetch_candles_history_arrays is not implemented")
+
+    async def fetch_extended_candles_history_arrays(
+        self,
+        exchange: str,
+        symbols: list[str],
+        time_frames: list[commons_enums.TimeFrames],
+        first_open_time: typing.Optional[float] = None,
+        last_open_time: typing.Optional[float] = None,
+    ) -> dict[str, dict[str, numpy.ndarray]]:
+        raise NotImplementedError("fetch_extended_candles_history_arrays is not implemented")
+
     async def fetch_candles_history_range(
         self,
         exchange: str,
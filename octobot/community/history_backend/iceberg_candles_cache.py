@@ -0,0 +1,245 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import dataclasses
+import glob
+import math
+import os
+import shutil
+import threading
+import typing
+import urllib.parse
+import uuid
+
+import octobot_commons.constants as commons_constants
+import octobot_commons.enums as commons_enums
+import octobot_commons.logging as commons_logging
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    class PyArrowMock():
+        # mock to allow typing hints
+        Table = None
+    pyarrow = PyArrowMock()
+
+import octobot.constants as constants
+
+
+_PARQUET_EXTENSION = ".parquet"
+_PARTIAL_BUCKET_SUFFIX = ".partial"
+_SNAPSHOT_ID_METADATA_KEY = b"snapshot_id"
+
+
+@dataclasses.dataclass(frozen=True)
+class CandlesBucket:
+    start: float
+    end: float  # excluded
+    is_complete: bool
+
+
+class IcebergCandlesCache:
+    """
+    Local parquet cache of iceberg candles scans.
+    Candles are cached by exchange, symbol, time frame, time bucket and table snapshot id.
+    A complete bucket only contains history that is already stored in the table:
+    it can't change anymore and can be used whatever the current snapshot id.
+    Partial buckets (usually the most recent one) are only used while the table snapshot id is unchanged.
+    The least recently used buckets are removed when the cache gets larger than max_size bytes.
+    """
+
+    def __init__(
+        self,
+        cache_path: str = constants.ICEBERG_CANDLES_CACHE_PATH,
+        max_size: int = constants.ICEBERG_CANDLES_CACHE_MAX_SIZE,
+        candles_per_bucket: int = constants.ICEBERG_CANDLES_CACHE_BUCKET_CANDLES_COUNT,
+    ):
+        self.cache_path: str = cache_path
+        self.max_size: int = max_size
+        self.candles_per_bucket: int = candles_per_bucket
+        self._size: typing.Optional[int] = None  # lazily computed
+        self._size_lock: threading.Lock = threading.Lock()
+
+    def get_buckets(
+        self,
+        time_frame: commons_enums.TimeFrames,
+        first_open_time: float,
+        last_open_time: float,
+        stored_candles_range: tuple[float, float],
+    ) -> list[CandlesBucket]:
+        """
+        :return: the buckets of the candles from first_open_time to last_open_time
+        """
+        time_frame_seconds = commons_enums.TimeFramesMinutes[time_frame] * commons_constants.MINUTE_TO_SECONDS
+        bucket_duration = time_frame_seconds * self.candles_per_bucket
+        first_stored_candle_time, last_stored_candle_time = stored_candles_range
+        buckets = []
+        for bucket_index in range(
+            math.floor(first_open_time / bucket_duration), math.floor(last_open_time / bucket_duration) + 1
+        ):
+            bucket_start = bucket_index * bucket_duration
+            bucket_end = bucket_start + bucket_duration
+            buckets.append(CandlesBucket(
+                start=bucket_start,
+                end=bucket_end,
+                # the bucket last candle is stored and no older candle can be added to it
+                is_complete=(
+                    first_stored_candle_time <= bucket_start
+                    and bucket_end - time_frame_seconds <= last_stored_candle_time
+                ),
+            ))
+        return buckets
+
+    def get(
+        self,
+        exchange: str,
+        symbol: str,
+        time_frame: commons_enums.TimeFrames,
+        bucket: CandlesBucket,
+        snapshot_id: int,
+    ) -> typing.Optional[pyarrow.Table]:
+        """
+        :return: the cached candles of the bucket, None when not cached
+        """
+        bucket_path = self._get_bucket_path(exchange, symbol, time_frame, bucket)
+        for path in (
+            self._get_complete_bucket_file(bucket_path),
+            self._get_partial_bucket_file(bucket_path, snapshot_id),
+        ):
+            try:
+                candles = pyarrow.parquet.read_table(path)
+                # reading a bucket makes it the most recently used one
+                os.utime(path)
+                return candles
+            except FileNotFoundError:
+                continue
+            except (OSError, pyarrow.ArrowException) as err:
+                self._get_logger().warning(f"Ignored invalid cached candles file {path}: {err}")
+                self._remove_file(path)
+        return None
+
+    def set(
+        self,
+        exchange: str,
+        symbol: str,
+        time_frame: commons_enums.TimeFrames,
+        bucket: CandlesBucket,
+        snapshot_id: int,
+        candles: pyarrow.Table,
+    ) -> None:
+        """
+        Save the candles of the bucket, fetched from the snapshot_id table snapshot
+        """
+        bucket_path = self._get_bucket_path(exchange, symbol, time_frame, bucket)
+        # previous partial versions of this bucket are outdated
+        for previous_partial_file in glob.glob(self._get_partial_bucket_file(bucket_path, "*")):
+            self._remove_file(previous_partial_file)
+        path = self._get_complete_bucket_file(bucket_path) if bucket.is_complete \
+            else self._get_partial_bucket_file(bucket_path, snapshot_id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        candles = candles.replace_schema_metadata({
+            **(candles.schema.metadata or {}),
+            _SNAPSHOT_ID_METADATA_KEY: str(snapshot_id).encode(),
+        })
+        # write in a temporary file first: other processes can read this cache at the same time
+        temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            pyarrow.parquet.write_table(candles, temp_path)
+            os.replace(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        self._add_to_size(os.path.getsize(path))
+
+    def clear(self) -> None:
+        with self._size_lock:
+            if os.path.isdir(self.cache_path):
+                shutil.rmtree(self.cache_path)
+            self._size = 0
+
+    def get_size(self) -> int:
+        with self._size_lock:
+            if self._size is None:
+                self._size = self._get_cached_files_size()
+            return self._size
+
+    def _add_to_size(self, added_size: int) -> None:
+        with self._size_lock:
+            if self._size is None:
+                # already includes the added file
+                self._size = self._get_cached_files_size()
+            else:
+                # replaced files are not deducted: size is recomputed from cached files when removing files
+                self._size += added_size
+            if self._size > self.max_size:
+                self._remove_least_recently_used_files()
+
+    def _get_cached_files_size(self) -> int:
+        return sum(size for _, size, _ in self._get_cached_files())
+
+    def _remove_least_recently_used_files(self) -> None:
+        # also account for files written by other processes
+        cached_files = sorted(self._get_cached_files())
+        self._size = sum(size for _, size, _ in cached_files)
+        for _, size, path in cached_files:
+            if self._size <= self.max_size:
+                break
+            if self._remove_file(path):
+                self._size -= size
+
+    def _get_cached_files(self) -> list[tuple[float, int, str]]:
+        cached_files = []
+        for root, _, files in os.walk(self.cache_path):
+            for file_name in files:
+                if file_name.endswith(_PARQUET_EXTENSION):
+                    path = os.path.join(root, file_name)
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:
+                        # removed in the meantime
+                        continue
+                    cached_files.append((stat.st_mtime, stat.st_size, path))
+        return cached_files
+
+    def _remove_file(self, path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def _get_bucket_path(
+        self, exchange: str, symbol: str, time_frame: commons_enums.TimeFrames, bucket: CandlesBucket
+    ) -> str:
+        return os.path.join(
+            self.cache_path,
+            urllib.parse.quote(exchange, safe=""),
+            urllib.parse.quote(symbol, safe=""),
+            time_frame.value,
+            str(int(bucket.start)),
+        )
+
+    @staticmethod
+    def _get_complete_bucket_file(bucket_path: str) -> str:
+        return f"{bucket_path}{_PARQUET_EXTENSION}"
+
+    @staticmethod
+    def _get_partial_bucket_file(bucket_path: str, snapshot_id: typing.Union[int, str]) -> str:
+        return f"{bucket_path}.{snapshot_id}{_PARTIAL_BUCKET_SUFFIX}{_PARQUET_EXTENSION}"
+
+    @classmethod
+    def _get_logger(cls):
+        return commons_logging.get_logger(cls.__name__)
@@ -23,6 +23,9 @@ import logging
 import json
 import time
 import dataclasses
+import functools
+
+import numpy
 
 import octobot_commons.logging as commons_logging
 import octobot_commons.os_util as os_util
@@ -32,6 +35,7 @@ try:
         raise ImportError("pyarrow is not available on Raspberry Pi")
     else:
         import pyarrow
+        import pyarrow.compute
 except ImportError as err:
     commons_logging.get_logger().info(f"Skipped pyarrow import: {err}")
     class PyArrowMock():
@@ -98,6 +102,7 @@ except ImportError as err:
 import octobot_commons.enums as commons_enums
 import octobot.constants as constants
 import octobot.community.history_backend.historical_backend_client as historical_backend_client
+import octobot.community.history_backend.iceberg_candles_cache as iceberg_candles_cache
 import octobot.community.history_backend.util as history_backend_util
 import octobot_commons.os_util as os_util
 
@@ -116,6 +121,14 @@ _METADATA_SEPARATOR = "|"
 _METADATA_VERSION = "1.0.0"
 _MAX_STATISTICS_FILES = 10 # keep only the last X statistics files
 _MAX_PENDING_BATCH_INSERT_SIZE = 500000 # max number of pending rows to store before inserting when enable_async_batch_inserts is True
+_ARROW_TIMESTAMP_UNITS_PER_SECOND = {"s": 1, "ms": 1_000, "us": 1_000_000, "ns": 1_000_000_000}
+_OHLCV_PRICE_COLUMNS = (
+    (commons_enums.PriceIndexes.IND_PRICE_OPEN, "open"),
+    (commons_enums.PriceIndexes.IND_PRICE_HIGH, "high"),
+    (commons_enums.PriceIndexes.IND_PRICE_LOW, "low"),
+    (commons_enums.PriceIndexes.IND_PRICE_CLOSE, "close"),
+    (commons_enums.PriceIndexes.IND_PRICE_VOL, "volume"),
+)
 
 class _MetadataIdentifiers(enum.Enum):
     UPDATED_AT = "updated_at"
@@ -133,11 +146,22 @@ class _PendingInsertData:
 
 class IcebergHistoricalBackendClient(historical_backend_client.HistoricalBackendClient):
 
-    def __init__(self, enable_async_batch_inserts: bool = True, **kwargs):
+    def __init__(
+        self,
+        enable_async_batch_inserts: bool = True,
+        candles_cache: typing.Optional[iceberg_candles_cache.IcebergCandlesCache] = None,
+        **kwargs
+    ):
         # enable_async_batch_inserts is used to avoid concurrent inserts, which are not properly supported by iceberg
         if pyarrow.Table is None:
             raise ImportError(f"The pyarrow dependency is required to use {self.__class__.__name__}")
         self.enable_async_batch_inserts: bool = enable_async_batch_inserts
+        # when set, single symbol candles scans are cached locally
+        self.candles_cache: typing.Optional[iceberg_candles_cache.IcebergCandlesCache] = (
+            candles_cache if candles_cache is not None
+            else iceberg_candles_cache.IcebergCandlesCache() if constants.ENABLE_ICEBERG_CANDLES_CACHE
+            else None
+        )
         self.namespace: typing.Optional[str] = None
         self.catalog: pyiceberg.catalog.Catalog = None # type: ignore
         self._executor: typing.Optional[concurrent.futures.ThreadPoolExecutor] = None # only availble when client is open
@@ -201,7 +225,7 @@ class IcebergHistoricalBackendClient(historical_backend_client.HistoricalBackend
         return await self._run_in_executor(
             self._sync_fetch_candles_history, 
             exchange, symbol, time_frame, None, None, first_open_time, last_open_time,
-            False
+            False, await self._get_cached_candles_history_range(exchange, symbol, time_frame)
         )
 
     async def fetch_extended_candles_history(
@@ -218,6 +242,41 @@ class IcebergHistoricalBackendClient(historical_backend_client.HistoricalBackend
             True
         )
 
+    async def fetch_candles_history_arrays(
+        self,
+        exchange: str,
+        symbol: str,
+        time_frame: commons_enums.TimeFrames,
+        first_open_time: float,
+        last_open_time: float
+    ) -> numpy.ndarray:
+        return await self._run_in_executor(
+            self._sync_fetch_candles_history_arrays,
+            exchange, symbol, time_frame, first_open_time, last_open_time,
+            await self._get_cached_candles_history_range(exchange, symbol, time_frame)
+        )
+
+    async def _get_cached_candles_history_range(
+        self, exchange: str, symbol: str, time_frame: commons_enums.TimeFrames
+    ) -> typing.Optional[tuple[float, float]]:
+        # the stored candles range is required to identify complete cached buckets
+        if self.candles_cache is None:
+            return None
+        return await self.fetch_candles_history_range(exchange, symbol, time_frame)
+
+    async def fetch_extended_candles_history_arrays(
+        self,
+        exchange: str,
+        symbols: list[str],
+        time_frames: list[commons_enums.TimeFrames],
+        first_open_time: typing.Optional[float] = None,
+        last_open_time: typing.Optional[float] = None,
+    ) -> dict[str, dict[str, numpy.ndarray]]:
+        return await self._run_in_executor(
+            self._sync_fetch_extended_candles_history_arrays,
+            exchange, symbols, time_frames, first_open_time, last_open_time
+        )
+
     def _get_filter(
         self, element: str, value: typing.Union[None, str, list[str]]
     ) -> typing.Optional[pyiceberg.expressions.BooleanExpression]:
@@ -240,8 +299,80 @@ class IcebergHistoricalBackendClient(historical_backend_client.HistoricalBackend
         first_open_time: typing.Optional[float],
         last_open_time: typing.Optional[float],
         extended: bool,
+        stored_candles_range: typing.Optional[tuple[float, float]] = None,
     ) -> list[list[typing.Union[float, str]]]:
+        formatted = self._format_ohlcvs(
+            self._sync_scan_candles_history(
+                exchange, symbol, time_frame, symbols, time_frames, first_open_time, last_open_time, extended,
+                stored_candles_range
+            ),
+            extended
+        )
+        # ensure no duplicates as they can happen due to no unicity constraint
+        return history_backend_util.deduplicate(formatted, [0, 1, 2] if extended else [0])
+
+    def _sync_fetch_candles_history_arrays(
+        self,
+        exchange: str,
+        symbol: str,
+        time_frame: commons_enums.TimeFrames,
+        first_open_time: float,
+        last_open_time: float,
+        stored_candles_range: typing.Optional[tuple[float, float]] = None,
+    ) -> numpy.ndarray:
+        ohlcvs_table = self._sync_scan_candles_history(
+            exchange, symbol, time_frame, None, None, first_open_time, last_open_time, False, stored_candles_range
+        )
+        return self._get_ohlcvs_array(self._sort_and_deduplicate_ohlcvs(ohlcvs_table, False))
+
+    def _sync_fetch_extended_candles_history_arrays(
+        self,
+        exchange: str,
+        symbols: list[str],
+        time_frames: list[commons_enums.TimeFrames],
+        first_open_time: typing.Optional[float],
+        last_open_time: typing.Optional[float],
+    ) -> dict[str, dict[str, numpy.ndarray]]:
+        ohlcvs_table = self._sync_scan_candles_history(
+            exchange, None, None, symbols, time_frames, first_open_time, last_open_time, True
+        )
+        return self._get_ohlcvs_arrays_by_symbol_and_time_frame(self._sort_and_deduplicate_ohlcvs(ohlcvs_table, True))
+
+    def _sync_scan_candles_history(
+        self,
+        exchange: str,
+        symbol: typing.Optional[str],
+        time_frame: typing.Optional[commons_enums.TimeFrames],
+        symbols: typing.Optional[list[str]],
+        time_frames: typing.Optional[list[commons_enums.TimeFrames]],
+        first_open_time: typing.Optional[float],
+        last_open_time: typing.Optional[float],
+        extended: bool,
+        stored_candles_range: typing.Optional[tuple[float, float]] = None,
+    ) -> pyarrow.Table:
         table = self._get_or_create_table(TableNames.OHLCV_HISTORY)
+        and_filters = self._get_candles_history_filters(exchange, symbol, time_frame, symbols, time_frames)
+        if (
+            self.candles_cache is not None and stored_candles_range is not None
+            and symbol and time_frame and first_open_time and last_open_time
+        ):
+            return self._sync_scan_cached_candles_history(
+                table, and_filters, exchange, symbol, time_frame, first_open_time, last_open_time, stored_candles_range
+            )
+        if first_open_time:
+            and_filters.append(pyiceberg.expressions.GreaterThanOrEqual("timestamp", self.get_formatted_time(first_open_time)))
+        if last_open_time:
+            and_filters.append(pyiceberg.expressions.LessThanOrEqual("timestamp", self.get_formatted_time(last_open_time)))
+        return self._scan_candles_history(table, and_filters, extended)
+
+    def _get_candles_history_filters(
+        self,
+        exchange: str,
+        symbol: typing.Optional[str],
+        time_frame: typing.Optional[commons_enums.TimeFrames],
+        symbols: typing.Optional[list[str]],
+        time_frames: typing.Optional[list[commons_enums.TimeFrames]],
+    ) -> list[pyiceberg.expressions.BooleanExpression]:
         and_filters = [
             pyiceberg.expressions.EqualTo("exchange_internal_name", exchange),
         ]
@@ -252,10 +383,14 @@ class IcebergHistoricalBackendClient(historical_backend_client.HistoricalBackend
             and_filters.append(tf_filter)
         if symbol_filter := self._get_filter("symbol", symbol or symbols):
             and_filters.append(symbol_filter)
-        if first_open_time:
-            and_filters.append(pyiceberg.expressions.GreaterThanOrEqual("timestamp", self.get_formatted_time(first_open_time)))
-        if last_open_time:
-            and_filters.append(pyiceberg.expressions.LessThanOrEqual("timestamp", self.get_formatted_time(last_open_time)))
+        return and_filters
+
+    def _scan_candles_history(
+        self,
+        table: pyiceberg.table.Table,
+        and_filters: list[pyiceberg.expressions.BooleanExpression],
+        extended: bool,
+    ) -> pyarrow.Table:
         filter = pyiceberg.expressions.And(*and_filters) # pylint: disable=no-value-for-parameter
         selected_fields = ["timestamp", "open", "high", "low", "close", "volume"]
         if extended:
@@ -265,10 +400,74 @@ class IcebergHistoricalBackendClient(historical_backend_client.HistoricalBackend
             selected_fields=selected_fields,
             case_sensitive=True,
         )
+        return result.to_arrow()
 
-        formatted = self._format_ohlcvs(result.to_arrow(), extended)
-        # ensure no duplicates as they can happen due to no unicity constraint
-        return history_backend_util.deduplicate(formatted, [0, 1, 2] if extended else [0])
+    def _sync_scan_cached_candles_history(
+        self,
+        table: pyiceberg.table.Table,
+        and_filters: list[pyiceberg.expressions.BooleanExpression],
+        exchange: str,
+        symbol: str,
+        time_frame: commons_enums.TimeFrames,
+        first_open_time: float,
+        last_open_time: float,
+        stored_candles_range: tuple[float, float],
+    ) -> pyarrow.Table:
+        snapshot_id = self._get_snapshot_id(table)
+        buckets = self.candles_cache.get_buckets(time_frame, first_open_time, last_open_time, stored_candles_range)
+        candles_by_bucket = {}
+        missing_buckets = []
+        for bucket in buckets:
+            if (cached_candles := self.candles_cache.get(exchange, symbol, time_frame, bucket, snapshot_id)) is None:
+                missing_buckets.append(bucket)
+            else:
+                candles_by_bucket[bucket] = cached_candles
+        # fetch contiguous missing buckets using a single scan
+        for contiguous_buckets in self._get_contiguous_buckets(missing_buckets):
+            fetched_candles = self._scan_candles_history(
+                table,
+                and_filters + [
+                    pyiceberg.expressions.GreaterThanOrEqual(
+                        "timestamp", self.get_formatted_time(contiguous_buckets[0].start)
+                    ),
+                    pyiceberg.expressions.LessThan(
+                        "timestamp", self.get_formatted_time(contiguous_buckets[-1].end)
+                    ),
+                ],
+                False
+            )
+            fetched_times = self._get_utc_timestamps(fetched_candles["timestamp"])
+            for bucket in contiguous_buckets:
+                bucket_candles = fetched_candles.filter(
+                    pyarrow.array((fetched_times >= bucket.start) & (fetched_times < bucket.end))
+                )
+                try:
+                    self.candles_cache.set(exchange, symbol, time_frame, bucket, snapshot_id, bucket_candles)
+                except OSError as err:
+                    # caching is not required to fetch candles
+                    self._get_logger().warning(f"Failed to cache {exchange} {symbol} {time_frame.value} candles: {err}")
+                candles_by_bucket[bucket] = bucket_candles
+        self._get_logger().debug(
+            f"Fetched {len(missing_buckets)} and used {len(buckets) - len(missing_buckets)} cached candles buckets "
+            f"for {exchange} {symbol} {time_frame.value}"
+        )
+        candles = pyarrow.concat_tables(
+            [candles_by_bucket[bucket] for bucket in buckets], promote_options="default"
+        ).replace_schema_metadata(None)
+        times = self._get_utc_timestamps(candles["timestamp"])
+        return candles.filter(pyarrow.array((times >= first_open_time) & (times <= last_open_time)))
+
+    @staticmethod
+    def _get_contiguous_buckets(
+        buckets: list[iceberg_candles_cache.CandlesBucket]
+    ) -> list[list[iceberg_candles_cache.CandlesBucket]]:
+        contiguous_buckets = []
+        for bucket in buckets:
+            if contiguous_buckets and contiguous_buckets[-1][-1].end == bucket.start:
+                contiguous_buckets[-1].append(bucket)
+            else:
+                contiguous_buckets.append([bucket])
+        return contiguous_buckets
 
     async def fetch_candles_history_range(
         self,
@@ -454,7 +653,69 @@ class IcebergHistoricalBackendClient(historical_backend_client.HistoricalBackend
             )
         ]
         return ohlcvs
-    
+
+    @staticmethod
+    def _sort_and_deduplicate_ohlcvs(ohlcvs_table: pyarrow.Table, extended: bool) -> pyarrow.Table:
+        # ohlcv are fetched in "random" order and can contain duplicates due to no unicity constraint:
+        # sort and deduplicate them using arrow compute to avoid creating python objects
+        keys = ["symbol", "time_frame", "timestamp"] if extended else ["timestamp"]
+        sorted_table = ohlcvs_table.sort_by([(key, "ascending") for key in keys])
+        return sorted_table.filter(
+            pyarrow.array(IcebergHistoricalBackendClient._get_key_changes_mask(sorted_table, keys))
+        )
+
+    @staticmethod
+    def _get_key_changes_mask(sorted_table: pyarrow.Table, keys: list[str]) -> numpy.ndarray:
+        # True for each row which keys are different from the previous row ones
+        mask = numpy.ones(sorted_table.num_rows, dtype=bool)
+        if sorted_table.num_rows > 1:
+            previous_rows = sorted_table.slice(0, sorted_table.num_rows - 1)
+            rows = sorted_table.slice(1)
+            mask[1:] = functools.reduce(
+                pyarrow.compute.or_,
+                (pyarrow.compute.not_equal(rows[key], previous_rows[key]) for key in keys)
+            ).to_numpy()
+        return mask
+
+    @staticmethod
+    def _get_ohlcvs_array(ohlcvs_table: pyarrow.Table) -> numpy.ndarray:
+        # one row per candle, uses PriceIndexes order, same as _format_ohlcvs candles
+        ohlcvs = numpy.empty((ohlcvs_table.num_rows, len(commons_enums.PriceIndexes)), dtype=numpy.float64)
+        ohlcvs[:, commons_enums.PriceIndexes.IND_PRICE_TIME.value] = (
+            IcebergHistoricalBackendClient._get_utc_timestamps(ohlcvs_table["timestamp"])
+        )
+        for price_index, column in _OHLCV_PRICE_COLUMNS:
+            ohlcvs[:, price_index.value] = ohlcvs_table[column].to_numpy()
+        return ohlcvs
+
+    @staticmethod
+    def _get_utc_timestamps(timestamps: pyarrow.ChunkedArray) -> numpy.ndarray:
+        # WARNING: usable here as we know this DB stores time in UTC only:
+        # raw timestamp values are UTC epochs expressed in the column time unit
+        return pyarrow.compute.divide(
+            pyarrow.compute.cast(pyarrow.compute.cast(timestamps, pyarrow.int64()), pyarrow.float64()),
+            float(_ARROW_TIMESTAMP_UNITS_PER_SECOND[timestamps.type.unit])
+        ).to_numpy()
+
+    @staticmethod
+    def _get_ohlcvs_arrays_by_symbol_and_time_frame(
+        sorted_ohlcvs_table: pyarrow.Table
+    ) -> dict[str, dict[str, numpy.ndarray]]:
+        # sorted_ohlcvs_table rows are grouped by symbol and time frame: split ohlcvs array into views
+        ohlcvs = IcebergHistoricalBackendClient._get_ohlcvs_array(sorted_ohlcvs_table)
+        group_starts = numpy.flatnonzero(
+            IcebergHistoricalBackendClient._get_key_changes_mask(sorted_ohlcvs_table, ["symbol", "time_frame"])
+        )
+        symbols = sorted_ohlcvs_table["symbol"]
+        time_frames = sorted_ohlcvs_table["time_frame"]
+        ohlcvs_by_symbol_and_time_frame = {}
+        for group_start, group_end in zip(group_starts, [*group_starts[1:], len(ohlcvs)]):
+            symbol = symbols[group_start].as_py()
+            if symbol not in ohlcvs_by_symbol_and_time_frame:
+                ohlcvs_by_symbol_and_time_frame[symbol] = {}
+            ohlcvs_by_symbol_and_time_frame[symbol][time_frames[group_start].as_py()] = ohlcvs[group_start:group_end]
+        return ohlcvs_by_symbol_and_time_frame
+
     def _load_catalog(self) -> pyiceberg.catalog.Catalog:
         self.namespace = constants.ICEBERG_CATALOG_NAMESPACE
         catalog = pyiceberg.catalog.load_catalog(constants.ICEBERG_CATALOG_NAME, **self._get_catalog_properties())
@@ -106,6 +106,14 @@ ICEBERG_S3_SECRET_KEY = os.getenv("ICEBERG_S3_SECRET_KEY")
 ICEBERG_S3_REGION = os.getenv("ICEBERG_S3_REGION")
 ICEBERG_S3_ENDPOINT = os.getenv("ICEBERG_S3_ENDPOINT")
 CREATE_ICEBERG_DB_IF_MISSING = os_util.parse_boolean_environment_var("CREATE_ICEBERG_DB_IF_MISSING", "false")
+# local parquet cache of iceberg candles scans
+ENABLE_ICEBERG_CANDLES_CACHE = os_util.parse_boolean_environment_var("ENABLE_ICEBERG_CANDLES_CACHE", "false")
+ICEBERG_CANDLES_CACHE_PATH = os.getenv(
+    "ICEBERG_CANDLES_CACHE_PATH",
+    f"{octobot_commons.constants.USER_FOLDER}/{octobot_commons.constants.CACHE_FOLDER}/iceberg_candles"
+)
+ICEBERG_CANDLES_CACHE_MAX_SIZE = int(float(os.getenv("ICEBERG_CANDLES_CACHE_MAX_SIZE_MB", "2048")) * 1024 * 1024)
+ICEBERG_CANDLES_CACHE_BUCKET_CANDLES_COUNT = int(os.getenv("ICEBERG_CANDLES_CACHE_BUCKET_CANDLES_COUNT", "10000"))
 
 OCTOBOT_MARKET_MAKING_URL = os.getenv("OCTOBOT_MARKET_MAKING_URL", "https://market-making.octobot.cloud")
 
@@ -291,6 +299,9 @@ OPTIMIZER_DEFAULT_MAX_MUTATION_PROBABILITY_PERCENT = decimal.Decimal(95)
 OPTIMIZER_DEFAULT_MIN_MUTATION_PROBABILITY_PERCENT = decimal.Decimal(10)
 OPTIMIZER_DEFAULT_MAX_MUTATION_NUMBER_MULTIPLIER = 3
 OPTIMIZER_DEFAULT_DB_UPDATE_PERIOD = 15
+OPTIMIZER_DEFAULT_USE_SHARED_DATASET = os_util.parse_boolean_environment_var(
+    "OPTIMIZER_DEFAULT_USE_SHARED_DATASET", "False"
+)
 
 # Databases
 DEFAULT_MAX_TOTAL_RUN_DATABASES_SIZE = 1000000000   # 1GB
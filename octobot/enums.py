@@ -63,6 +63,7 @@ class OptimizerConfig(enum.Enum):
     IDLE_CORES = "idle_cores"
     NOTIFY_WHEN_COMPLETE = "notify_when_complete"
     DB_UPDATE_PERIOD = "db_update_period"
+    USE_SHARED_DATASET = "use_shared_dataset"
     MODE = "mode"
     MAX_OPTIMIZER_RUNS = "max_optimizer_runs"
     INITIAL_GENERATION_COUNT = "initial_generation_count"
@@ -51,6 +51,9 @@ class OptimizerSettings:
         # update run database at the end of each period
         self.db_update_period = int(settings_dict.get(enums.OptimizerConfig.DB_UPDATE_PERIOD.value,
                                                       constants.OPTIMIZER_DEFAULT_DB_UPDATE_PERIOD))
+        # decode data files once into memory-mapped datasets shared by every optimizer process
+        self.use_shared_dataset = settings_dict.get(enums.OptimizerConfig.USE_SHARED_DATASET.value,
+                                                    constants.OPTIMIZER_DEFAULT_USE_SHARED_DATASET)
         # AI / genetic
         self.max_optimizer_runs = settings_dict.get(enums.OptimizerConfig.MAX_OPTIMIZER_RUNS.value,
                                                     constants.OPTIMIZER_DEFAULT_MAX_OPTIMIZER_RUNS)
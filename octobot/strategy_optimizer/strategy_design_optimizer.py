@@ -42,6 +42,8 @@ import octobot_commons.logging as commons_logging
 import octobot_commons.multiprocessing_util as multiprocessing_util
 import octobot_commons.databases as databases
 import octobot_commons.dict_util as dict_util
+import octobot_backtesting.api as backtesting_api
+import octobot_backtesting.constants as backtesting_constants
 import octobot_backtesting.errors as backtesting_errors
 import octobot_tentacles_manager.api as tentacles_manager_api
 import octobot_services.api as services_api
@@ -145,6 +147,7 @@ class StrategyDesignOptimizer:
         shared_keep_running = multiprocessing.Value(ctypes.c_bool, True)
         shared_run_time = multiprocessing.Array(ctypes.c_float, [0.0 for _ in range(self.active_processes_count)])
         try:
+            memory_mapped_datasets = await self._create_memory_mapped_datasets(optimizer_settings)
             async for selected_optimizer_ids in self._all_optimizer_ids(optimizer_ids,
                                                                         optimizer_settings.empty_the_queue):
                 run_queues_by_optimizer_id = {
@@ -156,7 +159,8 @@ class StrategyDesignOptimizer:
                     await self._run_multi_processed_optimizer(
                         optimizer_settings, lock,
                         shared_keep_running, shared_run_time,
-                        run_queues_by_optimizer_id
+                        run_queues_by_optimizer_id,
+                        memory_mapped_datasets
                     )
                 finally:
                     # properly empty and close queues to avoid underlying thread issues
@@ -185,25 +189,26 @@ class StrategyDesignOptimizer:
 
     async def _run_multi_processed_optimizer(self, optimizer_settings,
                                              lock, shared_keep_running, shared_run_time,
-                                             run_queues_by_optimizer_id):
+                                             run_queues_by_optimizer_id,
+                                             memory_mapped_datasets=None):
+        shared_elements = {
+            self.SHARED_KEEP_RUNNING_KEY: shared_keep_running,
+            self.SHARED_RUN_TIMES_KEY: shared_run_time,
+            self.SHARED_RUNS_QUEUES_KEY: run_queues_by_optimizer_id,
+        }
+        if memory_mapped_datasets:
+            # importers of each process attach to these datasets instead of reading data files
+            shared_elements[backtesting_constants.SHARED_MEMORY_MAPPED_DATASETS_KEY] = memory_mapped_datasets
         with multiprocessing_util.registered_lock_and_shared_elements(
                 commons_enums.MultiprocessingLocks.DBLock.value,
                 lock,
-                {
-                    self.SHARED_KEEP_RUNNING_KEY: shared_keep_running,
-                    self.SHARED_RUN_TIMES_KEY: shared_run_time,
-                    self.SHARED_RUNS_QUEUES_KEY: run_queues_by_optimizer_id,
-                }), \
+                shared_elements), \
                 concurrent.futures.ProcessPoolExecutor(
                     max_workers=self.active_processes_count,
                     initializer=multiprocessing_util.register_lock_and_shared_elements,
                     initargs=(commons_enums.MultiprocessingLocks.DBLock.value,
                               lock,
-                              {
-                                  self.SHARED_KEEP_RUNNING_KEY: shared_keep_running,
-                                  self.SHARED_RUN_TIMES_KEY: shared_run_time,
-                                  self.SHARED_RUNS_QUEUES_KEY: run_queues_by_optimizer_id,
-                              })) as pool:
+                              shared_elements)) as pool:
             coros = []
             self.logger.info(f"Dispatching optimizer backtesting runs into {self.active_processes_count} "
                              f"parallel processes (based on the current computer physical processors).")
@@ -226,6 +231,15 @@ class StrategyDesignOptimizer:
                 )
             self.process_pool_handle = await asyncio.gather(*coros)
 
+    async def _create_memory_mapped_datasets(self, optimizer_settings):
+        if not optimizer_settings.use_shared_dataset:
+            return {}
+        t0 = time.time()
+        memory_mapped_datasets = await backtesting_api.create_memory_mapped_datasets(optimizer_settings.data_files)
+        self.logger.info(f"Prepared shared memory-mapped datasets for {', '.join(memory_mapped_datasets)} "
+                         f"in {round(time.time() - t0, 2)} seconds.")
+        return memory_mapped_datasets
+
     async def _all_optimizer_ids(self, prioritized_ids, empty_the_queue):
         if prioritized_ids:
             yield prioritized_ids
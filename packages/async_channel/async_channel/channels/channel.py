@@ -68,6 +68,18 @@ class Channel:
         # - Possibly other filters under other keys and values
         self.consumers: list[dict[str, typing.Any]] = []
 
+        # Consumers index: {filter key: {filter value: consumer filters list}}, maintained in
+        # 'add_new_consumer' and 'remove_consumer' to only check consumers that can match a selection.
+        # Each indexed list is kept in consumers registration order.
+        self._consumers_index: dict[str, dict[typing.Any, list[dict[str, typing.Any]]]] = {}
+        # Consumer filters that can't be indexed for a filter key (unhashable filter value)
+        self._unindexed_consumers: dict[str, list[dict[str, typing.Any]]] = {}
+        # Consumer filters registration order: {id(consumer filters): order}
+        self._consumers_order: dict[int, int] = {}
+        self._consumers_order_counter: int = 0
+        # Cached 'get_prioritized_consumers' results by priority level, reset on consumers update
+        self._prioritized_consumers: dict[int, list["async_channel.consumer.Consumer"]] = {}
+
         # Used to perform global send from non-producer context
         self.internal_producer: typing.Optional["async_channel.producer.Producer"] = (
             None
@@ -95,6 +107,7 @@ class Channel:
         internal_consumer: typing.Optional["async_channel.consumer.Consumer"] = None,
         size: int = 0,
         priority_level: int = DEFAULT_PRIORITY_LEVEL,
+        conflation_key: typing.Optional[str] = None,
     ) -> "async_channel.consumer.Consumer":
         """
         Create an appropriate consumer instance for this async_channel and add it to the consumer list
@@ -104,17 +117,35 @@ class Channel:
         :param size: queue size, default 0
         :param priority_level: used by Producers the lowest level has the highest priority
         :param internal_consumer: internal consumer instance to use if specified
+        :param conflation_key: when set, pending updates with the same value for this key are replaced
+        by the latest one. Ignored on synchronized channels where every update has to be processed
         :return: consumer instance created
         """
+        conflation_key = self.get_consumer_conflation_key(conflation_key)
         consumer = (
             internal_consumer
             if internal_consumer
-            else self.CONSUMER_CLASS(callback, size=size, priority_level=priority_level)  # type: ignore
+            else self.CONSUMER_CLASS(  # type: ignore
+                callback,
+                size=size,
+                priority_level=priority_level,
+                # only given when set to keep supporting consumer classes without conflation
+                **({} if conflation_key is None else {"conflation_key": conflation_key}),
+            )
         )
         await self._add_new_consumer_and_run(consumer, consumer_filters)
         await self._check_producers_state()
         return consumer
 
+    def get_consumer_conflation_key(
+        self, conflation_key: typing.Optional[str]
+    ) -> typing.Optional[str]:
+        """
+        :param conflation_key: the requested consumer conflation key
+        :return: the conflation key to use: None on synchronized channels
+        """
+        return None if self.is_synchronized else conflation_key
+
     # pylint: disable=unused-argument
     async def _add_new_consumer_and_run(
         self,
@@ -145,6 +176,7 @@ class Channel:
         """
         consumer_filters[self.INSTANCE_KEY] = consumer
         self.consumers.append(consumer_filters)
+        self._add_to_consumers_index(consumer_filters)
 
     def get_consumer_from_filters(
         self, consumer_filters: dict
@@ -175,11 +207,16 @@ class Channel:
         Can be overwritten according to the class needs
         :return: the subscribed consumers list
         """
-        return [
-            consumer[self.INSTANCE_KEY]
-            for consumer in self.consumers
-            if consumer[self.INSTANCE_KEY].priority_level <= priority_level
-        ]
+        try:
+            return self._prioritized_consumers[priority_level]
+        except KeyError:
+            prioritized_consumers = [
+                consumer[self.INSTANCE_KEY]
+                for consumer in self.consumers
+                if consumer[self.INSTANCE_KEY].priority_level <= priority_level
+            ]
+            self._prioritized_consumers[priority_level] = prioritized_consumers
+            return prioritized_consumers
 
     def _filter_consumers(
         self, consumer_filters: dict
@@ -190,12 +227,115 @@ class Channel:
         :param consumer_filters: listed consumer filters
         :return: the list of the filtered consumers
         """
+        candidates = self._get_indexed_candidates(consumer_filters)
         return [
             consumer[self.INSTANCE_KEY]
-            for consumer in self.consumers
+            for consumer in (self.consumers if candidates is None else candidates)
             if _check_filters(consumer, consumer_filters)
         ]
 
+    def _get_indexed_candidates(
+        self, consumer_filters: dict
+    ) -> typing.Optional[list[dict[str, typing.Any]]]:
+        """
+        Uses the consumers index to select the smallest set of consumers that can match the selection
+        :param consumer_filters: listed consumer filters
+        :return: the candidate consumer filters in registration order, None if the index can't be used
+        """
+        selected_candidates = None
+        for key, value in consumer_filters.items():
+            if value == async_channel.CHANNEL_WILDCARD:
+                continue
+            try:
+                candidates = self._get_filter_candidates(key, value)
+            except TypeError:
+                # unhashable value: can't use index on this key
+                continue
+            if selected_candidates is None or len(candidates) < len(selected_candidates):
+                selected_candidates = candidates
+                if not selected_candidates:
+                    break
+        return selected_candidates
+
+    def _get_filter_candidates(
+        self, key: str, value: typing.Any
+    ) -> list[dict[str, typing.Any]]:
+        """
+        :param key: the filter key
+        :param value: the selected filter value
+        :return: the consumer filters that can match the value on this key in registration order
+        """
+        values_index = self._consumers_index.get(key, {})
+        buckets = [
+            bucket
+            for bucket in (
+                values_index.get(value),
+                values_index.get(async_channel.CHANNEL_WILDCARD),
+                self._unindexed_consumers.get(key),
+            )
+            if bucket
+        ]
+        if not buckets:
+            return []
+        if len(buckets) == 1:
+            return buckets[0]
+        return sorted(
+            (consumer for bucket in buckets for consumer in bucket),
+            key=lambda consumer: self._consumers_order[id(consumer)],
+        )
+
+    def _add_to_consumers_index(self, consumer_filters: dict) -> None:
+        """
+        Registers the given consumer filters into the consumers index
+        :param consumer_filters: the consumer filters to index
+        """
+        self._prioritized_consumers = {}
+        self._consumers_order[id(consumer_filters)] = self._consumers_order_counter
+        self._consumers_order_counter += 1
+        for key, filter_value in consumer_filters.items():
+            if key == self.INSTANCE_KEY:
+                continue
+            try:
+                values = _get_indexed_values(filter_value)
+            except TypeError:
+                # unhashable filter value: always check this consumer for this key
+                self._unindexed_consumers.setdefault(key, []).append(consumer_filters)
+                continue
+            values_index = self._consumers_index.setdefault(key, {})
+            for value in values:
+                values_index.setdefault(value, []).append(consumer_filters)
+
+    def _remove_from_consumers_index(self, consumer_filters: dict) -> None:
+        """
+        Removes the given consumer filters from the consumers index
+        :param consumer_filters: the consumer filters to remove
+        """
+        self._prioritized_consumers = {}
+        self._consumers_order.pop(id(consumer_filters), None)
+        for key, filter_value in consumer_filters.items():
+            if key == self.INSTANCE_KEY:
+                continue
+            try:
+                values = _get_indexed_values(filter_value)
+            except TypeError:
+                self._unindexed_consumers[key] = [
+                    consumer
+                    for consumer in self._unindexed_consumers.get(key, [])
+                    if consumer is not consumer_filters
+                ]
+                continue
+            values_index = self._consumers_index.get(key, {})
+            for value in values:
+                remaining = [
+                    consumer
+                    for consumer in values_index.get(value, [])
+                    if consumer is not consumer_filters
+                ]
+                if remaining:
+                    values_index[value] = remaining
+                else:
+                    values_index.pop(value, None)
+
     async def remove_consumer(
         self, consumer: "async_channel.consumer.Consumer"
     ) -> None:
@@ -207,6 +347,7 @@ class Channel:
         for consumer_candidate in self.consumers:
             if consumer == consumer_candidate[self.INSTANCE_KEY]:
                 self.consumers.remove(consumer_candidate)
+                self._remove_from_consumers_index(consumer_candidate)
                 await self._check_producers_state()
                 await consumer.stop()
 
@@ -379,6 +520,17 @@ def get_chan(chan_name: str) -> Channel:
     return channel_instances.ChannelInstances.instance().channels[chan_name]
 
 
+def _get_indexed_values(filter_value: typing.Any) -> typing.Iterable:
+    """
+    :param filter_value: a consumer filter value
+    :return: the values under which the consumer should be indexed
+    :raises TypeError: when the filter value can't be indexed
+    """
+    return dict.fromkeys(
+        filter_value if isinstance(filter_value, list) else (filter_value,)
+    )
+
+
 def _check_filters(consumer_filters: dict, expected_filters: dict) -> bool:
     """
     Checks if the consumer match the specified filters
@@ -392,7 +544,10 @@ def _check_filters(consumer_filters: dict, expected_filters: dict) -> bool:
             if value == async_channel.CHANNEL_WILDCARD:
                 continue
             if isinstance(consumer_filters[key], list):
-                if set(consumer_filters[key]) & {value, async_channel.CHANNEL_WILDCARD}:
+                if (
+                    value in consumer_filters[key]
+                    or async_channel.CHANNEL_WILDCARD in consumer_filters[key]
+                ):
                     continue
                 return False
             if consumer_filters[key] not in [value, async_channel.CHANNEL_WILDCARD]:
@@ -20,6 +20,7 @@ import asyncio
 import typing
 
 import async_channel.util.logging_util as logging
+import async_channel.util.conflated_queue as conflated_queue
 import async_channel.enums
 
 
@@ -36,11 +37,18 @@ class Consumer:
         callback: typing.Callable,
         size: int = async_channel.constants.DEFAULT_QUEUE_SIZE,
         priority_level: int = async_channel.enums.ChannelConsumerPriorityLevels.HIGH.value,
+        conflation_key: typing.Optional[str] = None,
     ):
         self.logger = logging.get_logger(self.__class__.__name__)
 
         # Consumer data queue. It contains producer's work (received through Producer.send()).
-        self.queue: asyncio.Queue = asyncio.Queue(maxsize=size)
+        # When a conflation_key is given, a pending update is replaced by any newer update
+        # with the same conflation_key value ("latest value wins") instead of being followed by it.
+        self.queue: asyncio.Queue = (
+            asyncio.Queue(maxsize=size)
+            if conflation_key is None
+            else conflated_queue.ConflatedQueue(conflation_key, maxsize=size)
+        )
 
         # Method to be called when performing task is done
         self.callback: typing.Callable = callback
@@ -167,11 +175,14 @@ class SupervisedConsumer(Consumer):
         callback: typing.Callable,
         size: int = async_channel.constants.DEFAULT_QUEUE_SIZE,
         priority_level: int = async_channel.enums.ChannelConsumerPriorityLevels.HIGH.value,
+        conflation_key: typing.Optional[str] = None,
     ):
         """
         The constructor only override the callback to be the 'internal_callback' method
         """
-        super().__init__(callback, size=size, priority_level=priority_level)
+        super().__init__(
+            callback, size=size, priority_level=priority_level, conflation_key=conflation_key
+        )
 
         # Clear when perform is running (set after)
         self.idle: asyncio.Event = asyncio.Event()
@@ -0,0 +1,87 @@
+#  Drakkar-Software Async-Channel
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+"""
+Define the ConflatedQueue class
+"""
+import asyncio
+import collections
+import typing
+
+
+class ConflatedQueue(asyncio.Queue):
+    """
+    A "latest value wins" asyncio.Queue: a put item replaces the pending item that has the same
+    conflation key value instead of being queued after it.
+    The replaced item keeps its position in the queue.
+    Items that are not dicts or that don't contain the conflation key are queued as usual.
+    """
+
+    def __init__(self, conflation_key: str, maxsize: int = 0):
+        self.conflation_key: str = conflation_key
+        # Pending conflated items by conflation key value
+        self._pending_items: dict[typing.Hashable, typing.Any] = {}
+        # Number of pending items that have been replaced by a newer one
+        self.conflated_items_count: int = 0
+        super().__init__(maxsize=maxsize)
+
+    def _init(self, maxsize):
+        # queued entries: (is conflated, conflation key value or item)
+        self._queue = collections.deque()
+
+    def _get_conflation_value(self, item) -> typing.Optional[typing.Hashable]:
+        try:
+            value = item[self.conflation_key]
+            hash(value)
+            return value
+        except (TypeError, KeyError, IndexError):
+            return None
+
+    def _put(self, item):
+        value = self._get_conflation_value(item)
+        if value is None:
+            self._queue.append((False, item))
+        else:
+            self._pending_items[value] = item
+            self._queue.append((True, value))
+
+    def _get(self):
+        is_conflated, entry = self._queue.popleft()
+        if is_conflated:
+            return self._pending_items.pop(entry)
+        return entry
+
+    def _replace_pending_item(self, item) -> bool:
+        value = self._get_conflation_value(item)
+        if value is not None and value in self._pending_items:
+            self._pending_items[value] = item
+            self.conflated_items_count += 1
+            return True
+        return False
+
+    async def put(self, item):
+        """
+        Replace the pending item with the same conflation key value if any, put item into the queue otherwise.
+        Never waits for a free slot when replacing a pending item.
+        """
+        if not self._replace_pending_item(item):
+            await super().put(item)
+
+    def put_nowait(self, item):
+        """
+        Replace the pending item with the same conflation key value if any, put item into the queue otherwise.
+        """
+        if not self._replace_pending_item(item):
+            super().put_nowait(item)
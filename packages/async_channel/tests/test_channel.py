@@ -210,6 +210,56 @@ async def test_new_consumer_with_multiple_consumer_filtering(test_channel):
            [consumers[11], consumers[21], consumers[22]]
 
 
+@pytest.mark.asyncio
+async def test_get_consumer_from_filters_after_consumers_update(test_channel):
+    channel = channels.get_chan(tests.EMPTY_TEST_CHANNEL)
+    consumer_1 = await channel.new_consumer(tests.empty_test_callback, {"symbol": "BTC/USDT", "time_frame": "1h"})
+    consumer_2 = await channel.new_consumer(tests.empty_test_callback, {"symbol": async_channel.CHANNEL_WILDCARD,
+                                                                        "time_frame": ["1h", "4h"]})
+    consumer_3 = await channel.new_consumer(tests.empty_test_callback, {"symbol": {"unhashable": True},
+                                                                        "time_frame": "1h"})
+    consumer_4 = await channel.new_consumer(tests.empty_test_callback, {"symbol": "BTC/USDT", "time_frame": "4h"})
+    assert channel.get_consumer_from_filters({"symbol": "BTC/USDT", "time_frame": "1h"}) == \
+           [consumer_1, consumer_2]
+    assert channel.get_consumer_from_filters({"symbol": "BTC/USDT", "time_frame": "4h"}) == \
+           [consumer_2, consumer_4]
+    assert channel.get_consumer_from_filters({"symbol": "ETH/USDT"}) == [consumer_2]
+    assert channel.get_consumer_from_filters({"symbol": {"unhashable": True}}) == [consumer_2, consumer_3]
+    assert channel.get_consumer_from_filters({"time_frame": "1h"}) == [consumer_1, consumer_2, consumer_3]
+    assert channel.get_consumer_from_filters({"time_frame": "1d"}) == []
+    assert channel.get_consumer_from_filters({"other": "1d"}) == []
+
+    await channel.remove_consumer(consumer_2)
+    await channel.remove_consumer(consumer_3)
+    assert channel.get_consumer_from_filters({"symbol": "BTC/USDT", "time_frame": "4h"}) == [consumer_4]
+    assert channel.get_consumer_from_filters({"time_frame": "1h"}) == [consumer_1]
+    assert channel.get_consumer_from_filters({"symbol": "ETH/USDT"}) == []
+    assert channel.get_consumer_from_filters({}) == [consumer_1, consumer_4]
+
+
+@pytest.mark.asyncio
+async def test_get_prioritized_consumers(test_channel):
+    channel = channels.get_chan(tests.EMPTY_TEST_CHANNEL)
+    high_consumer = await channel.new_consumer(
+        tests.empty_test_callback, priority_level=async_channel.ChannelConsumerPriorityLevels.HIGH.value
+    )
+    optional_consumer = await channel.new_consumer(
+        tests.empty_test_callback, priority_level=async_channel.ChannelConsumerPriorityLevels.OPTIONAL.value
+    )
+    assert channel.get_prioritized_consumers(async_channel.ChannelConsumerPriorityLevels.HIGH.value) == \
+           [high_consumer]
+    assert channel.get_prioritized_consumers(async_channel.ChannelConsumerPriorityLevels.OPTIONAL.value) == \
+           [high_consumer, optional_consumer]
+    medium_consumer = await channel.new_consumer(
+        tests.empty_test_callback, priority_level=async_channel.ChannelConsumerPriorityLevels.MEDIUM.value
+    )
+    assert channel.get_prioritized_consumers(async_channel.ChannelConsumerPriorityLevels.MEDIUM.value) == \
+           [high_consumer, medium_consumer]
+    await channel.remove_consumer(high_consumer)
+    assert channel.get_prioritized_consumers(async_channel.ChannelConsumerPriorityLevels.OPTIONAL.value) == \
+           [optional_consumer, medium_consumer]
+
+
 @pytest.mark.asyncio
 async def test_remove_consumer(test_channel):
     consumer = await channels.get_chan(tests.EMPTY_TEST_CHANNEL).new_consumer(tests.empty_test_callback)
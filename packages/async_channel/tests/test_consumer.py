@@ -106,3 +106,71 @@ async def test_supervised_consumer():
     await channels.get_chan(tests.TEST_CHANNEL).get_internal_producer().send({})
     await consumer.queue.join()
     await channels.get_chan(tests.TEST_CHANNEL).stop()
+
+
+@pytest.mark.asyncio
+async def test_conflated_queue():
+    queue = util.ConflatedQueue("symbol")
+    queue.put_nowait({"symbol": "BTC/USDT", "price": 1})
+    await queue.put({"symbol": "ETH/USDT", "price": 10})
+    queue.put_nowait({"price": 100})
+    queue.put_nowait("not a dict")
+    # replace pending updates in place
+    await queue.put({"symbol": "BTC/USDT", "price": 2})
+    queue.put_nowait({"symbol": "BTC/USDT", "price": 3})
+    assert queue.qsize() == 4
+    assert queue.conflated_items_count == 2
+    assert await queue.get() == {"symbol": "BTC/USDT", "price": 3}
+    # BTC/USDT is not pending anymore: queued after other updates
+    queue.put_nowait({"symbol": "BTC/USDT", "price": 4})
+    assert [queue.get_nowait() for _ in range(queue.qsize())] == [
+        {"symbol": "ETH/USDT", "price": 10},
+        {"price": 100},
+        "not a dict",
+        {"symbol": "BTC/USDT", "price": 4},
+    ]
+    assert queue.empty()
+
+    # replacing a pending update doesn't wait for a free slot
+    full_queue = util.ConflatedQueue("symbol", maxsize=1)
+    await full_queue.put({"symbol": "BTC/USDT", "price": 1})
+    assert full_queue.full()
+    await full_queue.put({"symbol": "BTC/USDT", "price": 2})
+    assert full_queue.get_nowait() == {"symbol": "BTC/USDT", "price": 2}
+
+
+@pytest.mark.asyncio
+async def test_conflated_supervised_consumer():
+    class TestSupervisedConsumer(channel_consumer.SupervisedConsumer):
+        pass
+
+    class TestChannel(channels.Channel):
+        PRODUCER_CLASS = tests.EmptyTestProducer
+        CONSUMER_CLASS = TestSupervisedConsumer
+
+    channels.del_chan(tests.TEST_CHANNEL)
+    await util.create_channel_instance(TestChannel, channels.set_chan)
+    producer = tests.EmptyTestProducer(channels.get_chan(tests.TEST_CHANNEL))
+    await producer.run()
+    callback = mock.AsyncMock()
+    consumer = await channels.get_chan(tests.TEST_CHANNEL).new_consumer(callback, conflation_key="symbol")
+    assert isinstance(consumer.queue, util.ConflatedQueue)
+    for price in range(3):
+        await channels.get_chan(tests.TEST_CHANNEL).get_internal_producer().send({"symbol": "BTC/USDT", "price": price})
+    await channels.get_chan(tests.TEST_CHANNEL).get_internal_producer().send({"symbol": "ETH/USDT", "price": 10})
+    await consumer.queue.join()
+    assert callback.mock_calls == [
+        mock.call(symbol="BTC/USDT", price=2),
+        mock.call(symbol="ETH/USDT", price=10),
+    ]
+    assert not isinstance(
+        (await channels.get_chan(tests.TEST_CHANNEL).new_consumer(callback)).queue, util.ConflatedQueue
+    )
+    await channels.get_chan(tests.TEST_CHANNEL).stop()
+
+    # synchronized channels process every update
+    channels.del_chan(tests.TEST_CHANNEL)
+    await util.create_channel_instance(TestChannel, channels.set_chan, is_synchronized=True)
+    consumer = await channels.get_chan(tests.TEST_CHANNEL).new_consumer(callback, conflation_key="symbol")
+    assert not isinstance(consumer.queue, util.ConflatedQueue)
+    await channels.get_chan(tests.TEST_CHANNEL).stop()
@@ -29,6 +29,7 @@ from octobot_backtesting.api.data_file import (
     get_all_available_data_files,
     delete_data_file,
     get_file_description,
+    create_memory_mapped_datasets,
 )
 from octobot_backtesting.api.importer import (
     create_importer,
@@ -50,6 +51,8 @@ from octobot_backtesting.api.backtesting import (
     get_backtesting_starting_time,
     get_backtesting_ending_time,
     register_backtesting_timestamp_whitelist,
+    register_backtesting_data_timestamps,
+    get_open_orders_and_positions_check_callback,
     get_backtesting_timestamp_whitelist,
     is_backtesting_enabled,
     get_backtesting_data_files,
@@ -87,6 +90,7 @@ __all__ = [
     "get_all_available_data_files",
     "delete_data_file",
     "get_file_description",
+    "create_memory_mapped_datasets",
     "create_importer",
     "get_available_data_types",
     "get_data_file",
@@ -104,6 +108,8 @@ __all__ = [
     "get_backtesting_starting_time",
     "get_backtesting_ending_time",
     "register_backtesting_timestamp_whitelist",
+    "register_backtesting_data_timestamps",
+    "get_open_orders_and_positions_check_callback",
     "get_backtesting_timestamp_whitelist",
     "is_backtesting_enabled",
     "get_backtesting_data_files",
@@ -151,6 +151,14 @@ async def adapt_backtesting_channels(backtesting, config, importer_class,
             set_time_updater_interval(backtesting,
                                       common_enums.TimeFramesMinutes[min_time_frame_to_consider] *
                                       common_constants.MINUTE_TO_SECONDS)
+        if constants.ENABLE_EVENT_DRIVEN_TIME_UPDATES:
+            await register_backtesting_data_timestamps(
+                backtesting,
+                check_callback=get_open_orders_and_positions_check_callback(backtesting),
+                # exchange simulators read the shortest time frame candles one candle in advance (future candles)
+                data_timestamps_offset=common_enums.TimeFramesMinutes[min_time_frame_to_consider] *
+                common_constants.MINUTE_TO_SECONDS
+            )
     except ImportError:
         logging.get_logger(LOGGER_NAME).error("requires OctoBot-Trading package installed")
     return min_timestamp, max_timestamp
@@ -206,6 +214,39 @@ def register_backtesting_timestamp_whitelist(backtesting, timestamps, check_call
                                                           append_to_whitelist=append_to_whitelist)
 
 
+async def register_backtesting_data_timestamps(backtesting, check_callback=None, data_timestamps_offset=0) -> bool:
+    timestamps = []
+    for importer in backtesting.importers:
+        try:
+            timestamps += await importer.get_available_timestamps()
+        except NotImplementedError:
+            logging.get_logger(LOGGER_NAME).warning(f"{importer.__class__.__name__} does not provide its available "
+                                                    f"timestamps, every time point will be processed.")
+            return False
+    backtesting.time_manager.register_data_timestamps(timestamps, check_callback, data_timestamps_offset)
+    return True
+
+
+def get_open_orders_and_positions_check_callback(backtesting):
+    import octobot_trading.api as exchange_api
+
+    def _has_open_orders_or_positions():
+        # open orders and positions can be updated at any time point: don't skip time points
+        for exchange_id in backtesting.exchange_ids:
+            try:
+                exchange_manager = exchange_api.get_exchange_manager_from_exchange_id(exchange_id)
+            except KeyError:
+                # exchange is stopped
+                continue
+            if exchange_api.get_open_orders(exchange_manager):
+                return True
+            if any(not position.is_idle() for position in exchange_api.get_positions(exchange_manager)):
+                return True
+        return False
+
+    return _has_open_orders_or_positions
+
+
 def get_backtesting_timestamp_whitelist(backtesting) -> list:
     return backtesting.time_manager.timestamps_whitelist
 
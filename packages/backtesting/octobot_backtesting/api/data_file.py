@@ -53,3 +53,15 @@ def get_all_available_data_files(data_path=constants.BACKTESTING_FILE_PATH) -> l
 
 def delete_data_file(file_name, data_path=constants.BACKTESTING_FILE_PATH) -> tuple:
     return data.delete_data_file(data_path, file_name)
+
+
+async def create_memory_mapped_datasets(data_files, data_path=constants.BACKTESTING_FILE_PATH) -> dict:
+    """
+    :return: the memory-mapped dataset folder of each of the given data files
+    """
+    return {
+        data_file: await data.MemoryMappedExchangeDataset.create(
+            data_file if path.isfile(data_file) else path.join(data_path, data_file)
+        )
+        for data_file in data_files
+    }
@@ -24,7 +24,8 @@ def exchange_historical_data_collector_factory(exchange_name,
                                                time_frames=None,
                                                start_timestamp=None,
                                                end_timestamp=None,
-                                               config=None):
+                                               config=None,
+                                               **collector_kwargs):
     return _exchange_collector_factory(collectors.AbstractExchangeHistoryCollector,
                                        exchange_name,
                                        exchange_type,
@@ -33,7 +34,8 @@ def exchange_historical_data_collector_factory(exchange_name,
                                        time_frames,
                                        start_timestamp,
                                        end_timestamp,
-                                       config)
+                                       config,
+                                       **collector_kwargs)
 
 
 def exchange_bot_snapshot_data_collector_factory(exchange_name,
@@ -58,12 +60,13 @@ def exchange_bot_snapshot_data_collector_factory(exchange_name,
 
 
 def _exchange_collector_factory(collector_parent_class, exchange_name, exchange_type, tentacles_setup_config, symbols,
-                                time_frames, start_timestamp, end_timestamp, config):
+                                time_frames, start_timestamp, end_timestamp, config, **collector_kwargs):
     collector_class = tentacles_management.get_single_deepest_child_class(collector_parent_class)
     collector_instance = collector_class(config or {}, exchange_name, exchange_type,
                                          tentacles_setup_config, symbols, time_frames,
                                          use_all_available_timeframes=time_frames is None,
-                                         start_timestamp=start_timestamp, end_timestamp=end_timestamp)
+                                         start_timestamp=start_timestamp, end_timestamp=end_timestamp,
+                                         **collector_kwargs)
     return collector_instance
 
 
@@ -83,10 +83,13 @@ class DataCollector:
 
     def create_database(self) -> None:
         if not self.database:
-            self.database = databases.SQLiteDatabase(self.temp_file_path)
+            self.database = databases.SQLiteDatabase(self.temp_file_path,
+                                                     journal_mode=constants.COLLECTOR_DATABASE_JOURNAL_MODE,
+                                                     synchronous=constants.COLLECTOR_DATABASE_SYNCHRONOUS_MODE)
 
     def finalize_database(self):
-        os.rename(self.temp_file_path, self.file_path)
+        # replace any existing data file, as when topping up a data file
+        os.replace(self.temp_file_path, self.file_path)
 
     def create_aiohttp_session(self) -> None:
         if not self.aiohttp_session:
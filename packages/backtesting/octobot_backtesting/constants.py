@@ -16,6 +16,7 @@
 import os
 
 import octobot_commons.enums as enums
+import octobot_commons.os_util as os_util
 
 CONFIG_BACKTESTING = "backtesting"
 CONFIG_BACKTESTING_DATA_FILES = "files"
@@ -32,8 +33,19 @@ BACKTESTING_DATA_FILE_TIME_WRITE_FORMAT = '%Y%m%d_%H%M%S'
 BACKTESTING_DATA_FILE_TIME_READ_FORMAT = BACKTESTING_DATA_FILE_TIME_WRITE_FORMAT.replace("_", "")
 BACKTESTING_DATA_FILE_TIME_DISPLAY_FORMAT = '%d %B %Y at %H:%M:%S'
 BACKTESTING_DEFAULT_JOIN_TIMEOUT = 1800  # 30min
+# collected data files are temporary files until completed: no need to wait for each write to reach the disk
+COLLECTOR_DATABASE_JOURNAL_MODE = enums.SQLiteJournalModes(os.getenv("COLLECTOR_DATABASE_JOURNAL_MODE", "WAL"))
+COLLECTOR_DATABASE_SYNCHRONOUS_MODE = enums.SQLiteSynchronousModes(
+    os.getenv("COLLECTOR_DATABASE_SYNCHRONOUS_MODE", "OFF")
+)
+# when enabled, time points without new data in data files are skipped
+ENABLE_EVENT_DRIVEN_TIME_UPDATES = os_util.parse_boolean_environment_var("ENABLE_EVENT_DRIVEN_TIME_UPDATES", "False")
 
 BACKTESTING_TIME_FRAMES_TO_DISPLAY = [enums.TimeFrames.THIRTY_MINUTES.value,
                                       enums.TimeFrames.ONE_HOUR.value,
                                       enums.TimeFrames.FOUR_HOURS.value,
                                       enums.TimeFrames.ONE_DAY.value]
+
+# memory-mapped columnar copies of data files, shared between backtesting processes
+MEMORY_MAPPED_DATASET_EXT = ".columns"
+SHARED_MEMORY_MAPPED_DATASETS_KEY = "memory_mapped_datasets"
@@ -26,6 +26,11 @@ from octobot_backtesting.data.data_file_manager import (
     get_database_description,
     get_file_description,
 )
+from octobot_backtesting.data import memory_mapped_dataset
+from octobot_backtesting.data.memory_mapped_dataset import (
+    MemoryMappedExchangeDataset,
+    get_dataset_folder,
+)
 
 __all__ = [
     "get_backtesting_file_name",
@@ -37,4 +42,6 @@ __all__ = [
     "delete_data_file",
     "get_database_description",
     "get_file_description",
+    "MemoryMappedExchangeDataset",
+    "get_dataset_folder",
 ]
@@ -0,0 +1,176 @@
+#  Drakkar-Software OctoBot-Backtesting
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import json
+import os
+import os.path as path
+import shutil
+
+import numpy as np
+
+import octobot_commons.databases as databases
+import octobot_commons.enums as common_enums
+import octobot_commons.logging as logging
+
+import octobot_backtesting.constants as constants
+import octobot_backtesting.enums as enums
+
+
+class MemoryMappedExchangeDataset:
+    """
+    Read-only columnar copy of the candles of an exchange data file.
+    Candles are decoded once from the SQLite data file into numpy files that are then memory-mapped:
+    every process attached to the same dataset shares the same pages of the operating system cache.
+    """
+    SUPPORTED_TABLES = (enums.ExchangeDataTables.OHLCV, enums.ExchangeDataTables.KLINE)
+    METADATA_FILE = "metadata.json"
+    SOURCE_SIZE_KEY = "source_size"
+    SOURCE_MODIFICATION_TIME_KEY = "source_modification_time"
+    COLUMNS_KEY = "columns"
+    TABLE_KEY = "table"
+    EXCHANGE_NAME_KEY = "exchange_name"
+    CRYPTOCURRENCY_KEY = "cryptocurrency"
+    SYMBOL_KEY = "symbol"
+    TIME_FRAME_KEY = "time_frame"
+    TIMESTAMPS_FILE_KEY = "timestamps_file"
+    CANDLES_FILE_KEY = "candles_file"
+    GROUPED_COLUMNS = (EXCHANGE_NAME_KEY, CRYPTOCURRENCY_KEY, SYMBOL_KEY, TIME_FRAME_KEY)
+
+    def __init__(self, folder_path):
+        self.folder_path = folder_path
+        # (table, exchange_name, symbol, time_frame) -> (cryptocurrency, timestamps, candles)
+        self._columns_by_key = {}
+
+    @classmethod
+    async def create(cls, data_file_path, folder_path=None) -> str:
+        """
+        Decodes the candles of the given data file into a memory-mappable dataset.
+        Does nothing if an up-to-date dataset already exists for this data file.
+        :param data_file_path: path of the SQLite data file to decode
+        :param folder_path: folder to store the dataset into, defaults to get_dataset_folder(data_file_path)
+        :return: the dataset folder path
+        """
+        folder_path = folder_path or get_dataset_folder(data_file_path)
+        source_details = cls._get_source_details(data_file_path)
+        metadata = cls._get_metadata(folder_path)
+        if all(metadata.get(key) == value for key, value in source_details.items()):
+            return folder_path
+        # write into a temporary folder to never expose a partial dataset
+        temp_folder_path = f"{folder_path}{constants.BACKTESTING_DATA_FILE_TEMP_EXT}"
+        shutil.rmtree(temp_folder_path, ignore_errors=True)
+        os.makedirs(temp_folder_path)
+        columns = []
+        async with databases.new_sqlite_database(data_file_path) as database:
+            for table in cls.SUPPORTED_TABLES:
+                if not (await database.check_table_exists(table) and await database.check_table_not_empty(table)):
+                    continue
+                for group in await database.select_min(table, [databases.SQLiteDatabase.TIMESTAMP_COLUMN],
+                                                       list(cls.GROUPED_COLUMNS),
+                                                       group_by=", ".join(cls.GROUPED_COLUMNS)):
+                    column_details = dict(zip(cls.GROUPED_COLUMNS, group[1:]))
+                    if await cls._save_columns(database, table, column_details, temp_folder_path, len(columns)):
+                        columns.append(column_details)
+        with open(path.join(temp_folder_path, cls.METADATA_FILE), "w") as metadata_file:
+            json.dump({**source_details, cls.COLUMNS_KEY: columns}, metadata_file)
+        shutil.rmtree(folder_path, ignore_errors=True)
+        os.replace(temp_folder_path, folder_path)
+        return folder_path
+
+    @classmethod
+    def attach(cls, folder_path):
+        """
+        :param folder_path: folder of a dataset created by MemoryMappedExchangeDataset.create
+        :return: the read-only memory-mapped dataset
+        """
+        dataset = cls(folder_path)
+        for column_details in cls._get_metadata(folder_path)[cls.COLUMNS_KEY]:
+            key = (
+                column_details[cls.TABLE_KEY], column_details[cls.EXCHANGE_NAME_KEY],
+                column_details[cls.SYMBOL_KEY], column_details[cls.TIME_FRAME_KEY]
+            )
+            dataset._columns_by_key[key] = (
+                column_details[cls.CRYPTOCURRENCY_KEY],
+                np.load(path.join(folder_path, column_details[cls.TIMESTAMPS_FILE_KEY]), mmap_mode="r"),
+                np.load(path.join(folder_path, column_details[cls.CANDLES_FILE_KEY]), mmap_mode="r"),
+            )
+        return dataset
+
+    def has(self, table, exchange_name, symbol, time_frame) -> bool:
+        return time_frame is not None and \
+            self._get_key(table, exchange_name, symbol, time_frame) in self._columns_by_key
+
+    def get(self, table, exchange_name, symbol, time_frame, inferior_timestamp, superior_timestamp) -> list:
+        """
+        :return: the rows of the given time window, formatted as if read from the data file
+        (timestamp, exchange_name, cryptocurrency, symbol, time_frame, candle), in chronological order
+        """
+        cryptocurrency, timestamps, candles = self._columns_by_key[
+            self._get_key(table, exchange_name, symbol, time_frame)
+        ]
+        min_index, max_index = databases.ColumnarChronologicalReadDatabaseCache.get_window_indexes(
+            timestamps, inferior_timestamp, superior_timestamp
+        )
+        # only the selected window is read from the memory-mapped files
+        return [
+            [timestamp, exchange_name, cryptocurrency, symbol, time_frame.value, candle]
+            for timestamp, candle in zip(timestamps[min_index:max_index].tolist(),
+                                         candles[min_index:max_index].tolist())
+        ]
+
+    @staticmethod
+    def _get_key(table, exchange_name, symbol, time_frame):
+        return table.value, exchange_name, symbol, time_frame.value
+
+    @classmethod
+    async def _save_columns(cls, database, table, column_details, folder_path, index) -> bool:
+        rows = await database.select(table, sort=common_enums.DataBaseOrderBy.ASC.value, **column_details)
+        try:
+            # keep timestamps as integers when possible to return the same values as the data file
+            timestamps = np.asarray([row[0] for row in rows])
+            candles = np.asarray([json.loads(row[-1]) for row in rows], dtype=np.float64)
+            if timestamps.dtype.kind not in ("i", "f") or candles.ndim != 2:
+                raise ValueError(f"unexpected dtype or shape: {timestamps.dtype}, {candles.shape}")
+        except (ValueError, TypeError) as err:
+            # these rows will be read from the data file
+            logging.get_logger(cls.__name__).warning(
+                f"Skipping non columnar {table.value} data for {column_details}: {err}"
+            )
+            return False
+        column_details[cls.TABLE_KEY] = table.value
+        column_details[cls.TIMESTAMPS_FILE_KEY] = f"{index}_timestamps.npy"
+        column_details[cls.CANDLES_FILE_KEY] = f"{index}_candles.npy"
+        np.save(path.join(folder_path, column_details[cls.TIMESTAMPS_FILE_KEY]), timestamps)
+        np.save(path.join(folder_path, column_details[cls.CANDLES_FILE_KEY]), candles)
+        return True
+
+    @classmethod
+    def _get_source_details(cls, data_file_path) -> dict:
+        stat = os.stat(data_file_path)
+        return {
+            cls.SOURCE_SIZE_KEY: stat.st_size,
+            cls.SOURCE_MODIFICATION_TIME_KEY: stat.st_mtime,
+        }
+
+    @classmethod
+    def _get_metadata(cls, folder_path) -> dict:
+        try:
+            with open(path.join(folder_path, cls.METADATA_FILE)) as metadata_file:
+                return json.load(metadata_file)
+        except FileNotFoundError:
+            return {}
+
+
+def get_dataset_folder(data_file_path) -> str:
+    return f"{data_file_path}{constants.MEMORY_MAPPED_DATASET_EXT}"
@@ -43,6 +43,9 @@ class DataImporter:
     async def get_data_timestamp_interval(self, time_frame=None):
         raise NotImplementedError("get_data_timestamp_interval is not implemented")
 
+    async def get_available_timestamps(self) -> list:
+        raise NotImplementedError("get_available_timestamps is not implemented")
+
     async def stop(self) -> None:
         if not self.should_stop:
             self.should_stop = True
@@ -17,7 +17,9 @@ import octobot_commons.constants as common_constants
 import octobot_commons.enums as common_enums
 import octobot_commons.errors as common_errors
 import octobot_commons.databases as databases
+import octobot_commons.multiprocessing_util as multiprocessing_util
 
+import octobot_backtesting.constants as constants
 import octobot_backtesting.data as data
 import octobot_backtesting.enums as enums
 import octobot_backtesting.errors as errors
@@ -27,6 +29,10 @@ import octobot_backtesting.importers as importers
 class ExchangeDataImporter(importers.DataImporter):
     def __init__(self, config, file_path):
         super().__init__(config, file_path)
+        # exchange data are read once per backtesting iteration: use binary search based time windows
+        self.chronological_cache = databases.ColumnarChronologicalReadDatabaseCache()
+        # set when a memory-mapped copy of this data file is shared between processes
+        self.memory_mapped_dataset: data.MemoryMappedExchangeDataset = None
 
         self.exchange_name = None
         self.symbols = []
@@ -45,6 +51,7 @@ class ExchangeDataImporter(importers.DataImporter):
         self.time_frames = description[enums.DataFormatKeys.TIME_FRAMES.value]
         self.has_all_time_frames_candles_history = bool(description.get(enums.DataFormatKeys.START_TIMESTAMP.value))
         await self._init_available_data_types()
+        self._attach_memory_mapped_dataset()
 
         self.logger.info(f"Loaded {self.exchange_name} data file with "
                          f"{', '.join(self.symbols)} on {', '.join([tf.value for tf in self.time_frames])}")
@@ -105,6 +112,26 @@ class ExchangeDataImporter(importers.DataImporter):
             return max(minimum_timestamp, min_ohlcv_timestamp), max(maximum_timestamp, max_ohlcv_timestamp)
         return min_ohlcv_timestamp, max_ohlcv_timestamp
 
+    async def get_available_timestamps(self) -> list:
+        timestamps = set()
+        for table in self.available_data_types:
+            timestamps.update(
+                row[0]
+                for row in await self.database.select_distinct(table, [databases.SQLiteDatabase.TIMESTAMP_COLUMN])
+            )
+        return sorted(timestamps)
+
+    def _attach_memory_mapped_dataset(self):
+        try:
+            dataset_folder = multiprocessing_util.get_shared_element(
+                constants.SHARED_MEMORY_MAPPED_DATASETS_KEY
+            )[self.file_path]
+        except KeyError:
+            # no shared dataset for this data file
+            return
+        self.memory_mapped_dataset = data.MemoryMappedExchangeDataset.attach(dataset_folder)
+        self.logger.debug(f"Attached to {self.file_path} memory-mapped dataset: {dataset_folder}")
+
     async def _init_available_data_types(self):
         self.available_data_types = [table for table in enums.ExchangeDataTables
                                      if await self.database.check_table_exists(table)
@@ -151,8 +178,8 @@ class ExchangeDataImporter(importers.DataImporter):
                                         limit=databases.SQLiteDatabase.DEFAULT_SIZE,
                                         inferior_timestamp=-1, superior_timestamp=-1) -> list:
         """
-        Reads OHLCV history from database and populates a local ChronologicalReadDatabaseCache.
-        Warning: can't read data from before last given inferior_timestamp unless associated cache is reset
+        Reads OHLCV history from database and populates a local ColumnarChronologicalReadDatabaseCache.
+        Warning: can't read data from before the inferior_timestamp given when the associated cache was created
         """
         return await self._get_from_cache(exchange_name, symbol, time_frame, enums.ExchangeDataTables.OHLCV,
                                           inferior_timestamp, superior_timestamp, self.get_ohlcv, limit)
@@ -172,8 +199,8 @@ class ExchangeDataImporter(importers.DataImporter):
                                          limit=databases.SQLiteDatabase.DEFAULT_SIZE,
                                          inferior_timestamp=-1, superior_timestamp=-1):
         """
-        Reads ticker history from database and populates a local ChronologicalReadDatabaseCache.
-        Warning: can't read data from before last given inferior_timestamp unless associated cache is reset
+        Reads ticker history from database and populates a local ColumnarChronologicalReadDatabaseCache.
+        Warning: can't read data from before the inferior_timestamp given when the associated cache was created
         """
         return await self._get_from_cache(exchange_name, symbol, None, enums.ExchangeDataTables.TICKER,
                                           inferior_timestamp, superior_timestamp, self.get_ticker, limit)
@@ -193,8 +220,8 @@ class ExchangeDataImporter(importers.DataImporter):
                                              limit=databases.SQLiteDatabase.DEFAULT_SIZE,
                                              inferior_timestamp=-1, superior_timestamp=-1):
         """
-        Reads order book history from database and populates a local ChronologicalReadDatabaseCache.
-        Warning: can't read data from before last given inferior_timestamp unless associated cache is reset
+        Reads order book history from database and populates a local ColumnarChronologicalReadDatabaseCache.
+        Warning: can't read data from before the inferior_timestamp given when the associated cache was created
         """
         return await self._get_from_cache(exchange_name, symbol, None, enums.ExchangeDataTables.ORDER_BOOK,
                                           inferior_timestamp, superior_timestamp, self.get_order_book, limit)
@@ -214,8 +241,8 @@ class ExchangeDataImporter(importers.DataImporter):
                                                 limit=databases.SQLiteDatabase.DEFAULT_SIZE,
                                                 inferior_timestamp=-1, superior_timestamp=-1):
         """
-        Reads recent trades history from database and populates a local ChronologicalReadDatabaseCache.
-        Warning: can't read data from before last given inferior_timestamp unless associated cache is reset
+        Reads recent trades history from database and populates a local ColumnarChronologicalReadDatabaseCache.
+        Warning: can't read data from before the inferior_timestamp given when the associated cache was created
         """
         return await self._get_from_cache(exchange_name, symbol, None, enums.ExchangeDataTables.RECENT_TRADES,
                                           inferior_timestamp, superior_timestamp, self.get_recent_trades, limit)
@@ -238,14 +265,19 @@ class ExchangeDataImporter(importers.DataImporter):
                                         limit=databases.SQLiteDatabase.DEFAULT_SIZE,
                                         inferior_timestamp=-1, superior_timestamp=-1):
         """
-        Reads kline history from database and populates a local ChronologicalReadDatabaseCache.
-        Warning: can't read data from before last given inferior_timestamp unless associated cache is reset
+        Reads kline history from database and populates a local ColumnarChronologicalReadDatabaseCache.
+        Warning: can't read data from before the inferior_timestamp given when the associated cache was created
         """
         return await self._get_from_cache(exchange_name, symbol, time_frame, enums.ExchangeDataTables.KLINE,
                                           inferior_timestamp, superior_timestamp, self.get_kline, limit)
 
     async def _get_from_cache(self, exchange_name, symbol, time_frame, data_type,
                               inferior_timestamp, superior_timestamp, set_cache_method, limit):
+        if self.memory_mapped_dataset is not None and \
+                self.memory_mapped_dataset.has(data_type, exchange_name or self.exchange_name, symbol, time_frame):
+            # data is already decoded and sorted in memory-mapped files: only read the requested window
+            return self.memory_mapped_dataset.get(data_type, exchange_name or self.exchange_name, symbol, time_frame,
+                                                  inferior_timestamp, superior_timestamp)
         if not self.chronological_cache.has((exchange_name, symbol, time_frame, data_type)):
             # ignore superior timestamp to select everything starting from inferior_timestamp and cache it
             select_superior_timestamp = -1
@@ -13,7 +13,9 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import bisect
 import collections
+import math
 import time
 
 import octobot_commons.logging as logging
@@ -39,6 +41,10 @@ class TimeManager:
         self.timestamps_whitelist: set = None
         self._timestamps_whitelist_queue: collections.deque = None
 
+        self.data_timestamps_check_callback = None
+        self.data_timestamps: list = None
+        self.data_timestamps_offset = 0
+
     def initialize(self):
         self._reset_time()
         self.time_initialized = True
@@ -62,12 +68,36 @@ class TimeManager:
         return self.current_timestamp >= self.finishing_timestamp
 
     def next_timestamp(self):
+        previous_timestamp = self.current_timestamp
         self.current_timestamp += self.time_interval
+        if self.data_timestamps is not None and not self._should_accept_every_timestamp():
+            # when data_timestamps is set: fast forward time to the next time point with new data
+            self.current_timestamp = max(self.current_timestamp, self._get_next_data_time_point(previous_timestamp))
         if self._timestamps_whitelist_queue is not None:
             # when timestamps_whitelist is set: fast forward time to only trigger whitelisted timestamps
             while self._should_skip_current_timestamp() and self.current_timestamp <= self.finishing_timestamp:
                 self.current_timestamp += self.time_interval
 
+    def _should_accept_every_timestamp(self):
+        return self.data_timestamps_check_callback is not None and self.data_timestamps_check_callback()
+
+    def _get_next_data_time_point(self, previous_timestamp):
+        # data at timestamp T is first read at T - data_timestamps_offset (ex: future candles in exchange
+        # simulators) and then at T: the next time point is the earliest one reading new data
+        next_time_point = min(
+            self._get_next_data_timestamp(previous_timestamp + self.data_timestamps_offset)
+            - self.data_timestamps_offset,
+            self._get_next_data_timestamp(previous_timestamp)
+        )
+        # stay on the time_interval grid to select the same data as when going through every time point
+        return previous_timestamp + \
+            math.ceil((next_time_point - previous_timestamp) / self.time_interval) * self.time_interval
+
+    def _get_next_data_timestamp(self, timestamp):
+        next_data_index = bisect.bisect_right(self.data_timestamps, timestamp)
+        return self.data_timestamps[next_data_index] \
+            if next_data_index < len(self.data_timestamps) else self.finishing_timestamp
+
     def _should_skip_current_timestamp(self):
         if self.timestamp_accept_check_callback is not None and self.timestamp_accept_check_callback():
             return False
@@ -108,3 +138,10 @@ class TimeManager:
         else:
             self.timestamps_whitelist = sorted(set(timestamps))
         self._timestamps_whitelist_queue = collections.deque(self.timestamps_whitelist)
+
+    def register_data_timestamps(self, timestamps, check_callback=None, data_timestamps_offset=0):
+        # check_callback returning True disables time points skipping (ex: to handle pending orders)
+        # data_timestamps_offset: time before its timestamp at which data is read
+        self.data_timestamps_check_callback = check_callback
+        self.data_timestamps = sorted(set(timestamps))
+        self.data_timestamps_offset = data_timestamps_offset
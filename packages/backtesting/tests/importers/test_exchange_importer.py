@@ -19,6 +19,9 @@ from contextlib import asynccontextmanager
 
 
 import octobot_commons.errors as commons_errors
+import octobot_commons.multiprocessing_util as multiprocessing_util
+from octobot_backtesting.constants import SHARED_MEMORY_MAPPED_DATASETS_KEY
+from octobot_backtesting.data.memory_mapped_dataset import MemoryMappedExchangeDataset
 from octobot_backtesting.importers.exchanges.exchange_importer import ExchangeDataImporter
 from octobot_backtesting.enums import ExchangeDataTables
 from octobot_commons.enums import TimeFrames
@@ -27,11 +30,13 @@ from octobot_commons.enums import TimeFrames
 pytestmark = pytest.mark.asyncio
 
 
+DATABASE_FILE = os.path.join("tests", "static", "ExchangeHistoryDataCollector_1589740606.4862757.data")
+
+
 # use context manager instead of fixture to prevent pytest threads issues
 @asynccontextmanager
 async def get_importer():
-    database_file = os.path.join("tests", "static", "ExchangeHistoryDataCollector_1589740606.4862757.data")
-    importer = ExchangeDataImporter({}, database_file)
+    importer = ExchangeDataImporter({}, DATABASE_FILE)
     try:
         await importer.initialize()
         yield importer
@@ -59,6 +64,14 @@ async def test_get_data_timestamp_interval():
         assert await importer.get_data_timestamp_interval("1M") == (1501459200, 1590883200)
 
 
+async def test_get_available_timestamps():
+    async with get_importer() as importer:
+        timestamps = await importer.get_available_timestamps()
+        assert timestamps == sorted(set(timestamps))
+        assert (timestamps[0], timestamps[-1]) == (1500249600, 1590883200)
+        assert 1587978000 in timestamps
+
+
 async def test_get_ohlcv():
     async with get_importer() as importer:
         # default values
@@ -102,6 +115,42 @@ async def test_get_ohlcv_from_timestamps():
         assert all(1587978000 <= data[0] <= 1588060800 for data in ohlcv)
 
 
+async def test_get_ohlcv_from_timestamps_with_memory_mapped_dataset(tmp_path):
+    dataset_folder = await MemoryMappedExchangeDataset.create(DATABASE_FILE, str(tmp_path / "dataset"))
+    # up-to-date dataset: not created again
+    assert await MemoryMappedExchangeDataset.create(DATABASE_FILE, dataset_folder) == dataset_folder
+    async with get_importer() as importer:
+        assert importer.memory_mapped_dataset is None
+        expected_ohlcvs = [
+            await importer.get_ohlcv_from_timestamps(exchange_name="binance", symbol="ETH/BTC", time_frame=time_frame)
+            for time_frame in (TimeFrames.ONE_HOUR, TimeFrames.ONE_WEEK)
+        ]
+        expected_window = await importer.get_ohlcv_from_timestamps(exchange_name="binance", symbol="ETH/BTC",
+                                                                   inferior_timestamp=1587978000,
+                                                                   superior_timestamp=1588060800)
+    with multiprocessing_util.registered_lock_and_shared_elements(
+            "lock", None, {SHARED_MEMORY_MAPPED_DATASETS_KEY: {DATABASE_FILE: dataset_folder}}
+    ):
+        async with get_importer() as importer:
+            assert importer.memory_mapped_dataset is not None
+            assert [
+                await importer.get_ohlcv_from_timestamps(exchange_name="binance", symbol="ETH/BTC",
+                                                         time_frame=time_frame)
+                for time_frame in (TimeFrames.ONE_HOUR, TimeFrames.ONE_WEEK)
+            ] == expected_ohlcvs
+            ohlcv = await importer.get_ohlcv_from_timestamps(exchange_name="binance", symbol="ETH/BTC",
+                                                             inferior_timestamp=1587978000,
+                                                             superior_timestamp=1588060800)
+            assert len(ohlcv) == 24
+            assert ohlcv == expected_window
+            # not in dataset: read from data file
+            assert await importer.get_ohlcv_from_timestamps(exchange_name="binance", symbol="ETH/XXX") == []
+            assert importer.chronological_cache.has(("binance", "ETH/XXX", TimeFrames.ONE_HOUR,
+                                                     ExchangeDataTables.OHLCV))
+            assert not importer.chronological_cache.has(("binance", "ETH/BTC", TimeFrames.ONE_HOUR,
+                                                         ExchangeDataTables.OHLCV))
+
+
 async def test_get_ticker():
     async with get_importer() as importer:
         # TODO complete this test when available datafile with ticker data
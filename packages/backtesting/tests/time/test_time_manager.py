@@ -0,0 +1,75 @@
+#  Drakkar-Software OctoBot-Backtesting
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+from octobot_backtesting.time.time_manager import TimeManager
+
+
+def _get_time_manager(starting_timestamp, finishing_timestamp, time_interval):
+    time_manager = TimeManager({})
+    time_manager.initialize()
+    time_manager.starting_timestamp = starting_timestamp
+    time_manager.finishing_timestamp = finishing_timestamp
+    time_manager.time_interval = time_interval
+    time_manager.start()
+    return time_manager
+
+
+def _get_all_time_points(time_manager):
+    time_points = [time_manager.current_timestamp]
+    while not time_manager.has_finished():
+        time_manager.next_timestamp()
+        time_points.append(time_manager.current_timestamp)
+    return time_points
+
+
+def test_next_timestamp():
+    time_manager = _get_time_manager(0, 100, 10)
+    assert _get_all_time_points(time_manager) == list(range(0, 110, 10))
+
+
+def test_next_timestamp_with_data_timestamps():
+    time_manager = _get_time_manager(0, 100, 10)
+    # data timestamps out of the time grid are reached on the following time point
+    time_manager.register_data_timestamps([35, 20, 20, 0, 71])
+    assert time_manager.data_timestamps == [0, 20, 35, 71]
+    assert _get_all_time_points(time_manager) == [0, 20, 40, 80, 100]
+
+
+def test_next_timestamp_with_data_timestamps_and_check_callback():
+    time_manager = _get_time_manager(0, 100, 10)
+    accept_every_timestamp = False
+
+    def _check_callback():
+        return accept_every_timestamp
+
+    time_manager.register_data_timestamps([30, 90], check_callback=_check_callback)
+    time_manager.next_timestamp()
+    assert time_manager.current_timestamp == 30
+    accept_every_timestamp = True
+    time_manager.next_timestamp()
+    assert time_manager.current_timestamp == 40
+    accept_every_timestamp = False
+    time_manager.next_timestamp()
+    assert time_manager.current_timestamp == 90
+    time_manager.next_timestamp()
+    assert time_manager.current_timestamp == 100
+    assert time_manager.has_finished()
+
+
+def test_next_timestamp_with_data_timestamps_and_offset():
+    time_manager = _get_time_manager(0, 100, 10)
+    # data is read 10 before its timestamp and at its timestamp: both time points are reached
+    time_manager.register_data_timestamps([0, 10, 60, 70], data_timestamps_offset=10)
+    assert _get_all_time_points(time_manager) == [0, 10, 50, 60, 70, 90, 100]
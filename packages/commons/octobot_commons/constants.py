@@ -277,6 +277,13 @@ EXTERNAL_RESOURCE_URL = "https://raw.githubusercontent.com/Drakkar-Software/Octo
 DATA_FOLDER = "data"
 DB_SEPARATOR = "_"
 TINYDB_EXT = ".json"
+SQLITE_DOCUMENT_DB_EXT = ".sqlite"
+# when True, run databases are stored using SQLiteAdaptor instead of TinyDBAdaptor by default
+USE_SQLITE_RUN_DATABASES = parse_boolean_environment_var(
+    "USE_SQLITE_RUN_DATABASES", "false"
+)
+# rows given to a single executemany call when bulk inserting into SQLite
+SQLITE_INSERT_BATCH_SIZE = 10000
 MAX_BACKTESTING_RUNS = 500000
 MAX_OPTIMIZER_RUNS = 50000
 FORCE_BACKTESTING_LOGS = parse_boolean_environment_var(
@@ -35,11 +35,14 @@ from octobot_commons.databases.global_storage import (
 from octobot_commons.databases.database_caches import (
     GenericDatabaseCache,
     ChronologicalReadDatabaseCache,
+    ColumnarChronologicalReadDatabaseCache,
 )
 
 from octobot_commons.databases.document_database_adaptors import (
     AbstractDocumentDatabaseAdaptor,
     TinyDBAdaptor,
+    SQLiteAdaptor,
+    SQLiteDocument,
 )
 
 from octobot_commons.databases.bases import (
@@ -77,6 +80,8 @@ from octobot_commons.databases.cache_manager import (
 
 from octobot_commons.databases.databases_util import (
     CacheWrapper,
+    migrate_database,
+    migrate_databases,
 )
 
 from octobot_commons.databases.cache_client import (
@@ -88,8 +93,11 @@ __all__ = [
     "GlobalSharedMemoryStorage",
     "GenericDatabaseCache",
     "ChronologicalReadDatabaseCache",
+    "ColumnarChronologicalReadDatabaseCache",
     "AbstractDocumentDatabaseAdaptor",
     "TinyDBAdaptor",
+    "SQLiteAdaptor",
+    "SQLiteDocument",
     "DocumentDatabase",
     "BaseDatabase",
     "MetaDatabase",
@@ -109,5 +117,7 @@ __all__ = [
     "run_databases_pruner_factory",
     "CacheManager",
     "CacheWrapper",
+    "migrate_database",
+    "migrate_databases",
     "CacheClient",
 ]
@@ -17,6 +17,9 @@
 
 from octobot_commons.databases.database_caches import generic_database_cache
 from octobot_commons.databases.database_caches import chronological_read_database_cache
+from octobot_commons.databases.database_caches import (
+    columnar_chronological_read_database_cache,
+)
 
 from octobot_commons.databases.database_caches.generic_database_cache import (
     GenericDatabaseCache,
@@ -24,9 +27,13 @@ from octobot_commons.databases.database_caches.generic_database_cache import (
 from octobot_commons.databases.database_caches.chronological_read_database_cache import (
     ChronologicalReadDatabaseCache,
 )
+from octobot_commons.databases.database_caches.columnar_chronological_read_database_cache import (
+    ColumnarChronologicalReadDatabaseCache,
+)
 
 
 __all__ = [
     "GenericDatabaseCache",
     "ChronologicalReadDatabaseCache",
+    "ColumnarChronologicalReadDatabaseCache",
 ]
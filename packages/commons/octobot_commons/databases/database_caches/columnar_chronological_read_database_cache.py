@@ -0,0 +1,108 @@
+#  Drakkar-Software OctoBot-Commons
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+
+import octobot_commons.constants as constants
+import octobot_commons.databases.database_caches.chronological_read_database_cache as chronological_read_database_cache
+
+
+class ColumnarChronologicalReadDatabaseCache(
+    chronological_read_database_cache.ChronologicalReadDatabaseCache
+):
+    """
+    ChronologicalReadDatabaseCache storing each cache set timestamps in a numpy array:
+    time windows are resolved using binary searches and returned as slices of the sorted data.
+    Unlike ChronologicalReadDatabaseCache, data can be selected in any chronological order.
+    """
+
+    TIMESTAMPS_KEY = "timestamps"
+
+    def set(self, values, sort_key, identifiers):
+        """
+        Set whole cache to later be able to efficiently select it
+        :param values: cache values to set
+        :param sort_key: key in the values dict to use to chronologically order data
+        :param identifiers: identifiers of the given cache. Used to store multiple cache sets
+        """
+        sorted_values = sorted(values, key=lambda x: x[sort_key])
+        self.set_sorted(
+            sorted_values,
+            np.fromiter(
+                (value[sort_key] for value in sorted_values),
+                dtype=np.float64,
+                count=len(sorted_values),
+            ),
+            sort_key,
+            identifiers,
+        )
+
+    def set_sorted(self, sorted_values, timestamps, sort_key, identifiers):
+        """
+        Set whole cache from already chronologically sorted values
+        :param sorted_values: cache values to set, sorted by sort_key
+        :param timestamps: sorted numpy array of the sort_key value of each value
+        :param sort_key: key in the values dict to use to chronologically order data
+        :param identifiers: identifiers of the given cache. Used to store multiple cache sets
+        """
+        nested_cache = self.timestamped_sorted_data
+        for identifier in identifiers:
+            if identifier not in nested_cache:
+                nested_cache[identifier] = {}
+            nested_cache = nested_cache[identifier]
+        data = self._get_cache_data(identifiers)
+        data[self.DATA_SORT_KEY] = sort_key
+        data[self.DATA_KEY] = sorted_values
+        data[self.TIMESTAMPS_KEY] = timestamps
+        # unused: kept to be compatible with reset_cached_indexes
+        data[self.CHRONO_INDEX_KEY] = 0
+
+    def get(self, inferior_timestamp, superior_timestamp, identifiers):
+        """
+        Returns a cache values
+        :param inferior_timestamp: timestamp to start selecting from. Use constants.DEFAULT_IGNORED_VALUE to select all
+        :param superior_timestamp: timestamp to stop selecting at. Use constants.DEFAULT_IGNORED_VALUE to select all
+        :param identifiers: identifiers of the cache to look into. Used to store multiple cache sets
+        """
+        cache_data = self._get_cache_data(identifiers)
+        if (
+            inferior_timestamp == constants.DEFAULT_IGNORED_VALUE
+            and superior_timestamp == constants.DEFAULT_IGNORED_VALUE
+        ):
+            return cache_data[self.DATA_KEY]
+        min_index, max_index = self.get_window_indexes(
+            cache_data[self.TIMESTAMPS_KEY], inferior_timestamp, superior_timestamp
+        )
+        return cache_data[self.DATA_KEY][min_index:max_index]
+
+    @staticmethod
+    def get_window_indexes(timestamps, inferior_timestamp, superior_timestamp):
+        """
+        :param timestamps: sorted timestamps numpy array
+        :param inferior_timestamp: included window start. Use constants.DEFAULT_IGNORED_VALUE to select all
+        :param superior_timestamp: included window end. Use constants.DEFAULT_IGNORED_VALUE to select all
+        :return: the (start, end) slice indexes of the given time window
+        """
+        min_index = (
+            0
+            if inferior_timestamp == constants.DEFAULT_IGNORED_VALUE
+            else int(np.searchsorted(timestamps, inferior_timestamp, side="left"))
+        )
+        max_index = (
+            len(timestamps)
+            if superior_timestamp == constants.DEFAULT_IGNORED_VALUE
+            else int(np.searchsorted(timestamps, superior_timestamp, side="right"))
+        )
+        return min_index, max(min_index, max_index)
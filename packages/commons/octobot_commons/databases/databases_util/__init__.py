@@ -19,3 +19,8 @@ from octobot_commons.databases.databases_util import cache_wrapper
 from octobot_commons.databases.databases_util.cache_wrapper import (
     CacheWrapper,
 )
+from octobot_commons.databases.databases_util import database_migration
+from octobot_commons.databases.databases_util.database_migration import (
+    migrate_database,
+    migrate_databases,
+)
@@ -0,0 +1,127 @@
+#  Drakkar-Software OctoBot-Commons
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import os
+import re
+
+import tinydb
+
+import octobot_commons.enums as enums
+import octobot_commons.logging as commons_logging
+import octobot_commons.databases.document_database_adaptors as adaptors
+
+
+_RUN_DATABASE_NAME_PREFIXES = tuple(
+    run_database.value
+    for run_database in (
+        enums.RunDatabases.RUN_DATA_DB,
+        enums.RunDatabases.PORTFOLIO_VALUE_DB,
+        enums.RunDatabases.ORDERS_DB,
+        enums.RunDatabases.TRADES_DB,
+        enums.RunDatabases.TRANSACTIONS_DB,
+        enums.RunDatabases.METADATA,
+        enums.RunDatabases.OPTIMIZER_RUNS_SCHEDULE_DB,
+    )
+)
+# symbol databases are named after merged symbols: BTCUSDT or BTCUSDT_USDT
+_SYMBOL_DATABASE_NAME = re.compile(r"[A-Z0-9]+(_[A-Z0-9]+)?")
+
+
+def _is_run_database_name(database_name: str) -> bool:
+    """
+    :param database_name: name of the database file, without extension
+    :return: True when database_name is the name of a RunDatabasesIdentifier database
+    """
+    return (
+        database_name.startswith(_RUN_DATABASE_NAME_PREFIXES)
+        or _SYMBOL_DATABASE_NAME.fullmatch(database_name) is not None
+    )
+
+
+async def migrate_database(
+    source_path: str,
+    destination_path: str,
+    source_adaptor=adaptors.TinyDBAdaptor,
+    destination_adaptor=adaptors.SQLiteAdaptor,
+) -> int:
+    """
+    Copies every table of the source database into the destination database
+    :param source_path: path of the database to migrate
+    :param destination_path: path of the migrated database
+    :param source_adaptor: database adaptor of the database to migrate
+    :param destination_adaptor: database adaptor of the migrated database
+    :return: the number of migrated documents
+    """
+    source = source_adaptor(source_path)
+    source.initialize()
+    destination = destination_adaptor(destination_path)
+    destination.initialize()
+    migrated_documents_count = 0
+    try:
+        for table_name in await source.tables():
+            # keep doc_ids: documents can be selected or upserted using their uuid
+            documents = [
+                tinydb.table.Document(document, doc_id=source.get_uuid(document))
+                for document in await source.select(table_name, None)
+            ]
+            # replace any previous migration result
+            await destination.delete(table_name, None)
+            if documents:
+                await destination.insert_many(table_name, documents)
+            migrated_documents_count += len(documents)
+        await destination.flush()
+    finally:
+        await destination.close()
+        await source.close()
+    return migrated_documents_count
+
+
+async def migrate_databases(
+    root_path: str,
+    source_adaptor=adaptors.TinyDBAdaptor,
+    destination_adaptor=adaptors.SQLiteAdaptor,
+    remove_source: bool = False,
+) -> list:
+    """
+    Migrates every source_adaptor run database file located under root_path into destination_adaptor databases
+    Other files using the source_adaptor file extension are ignored
+    Migrated databases are created next to the source ones using the destination_adaptor file extension
+    :param root_path: folder to look for databases into, usually a RunDatabasesIdentifier data path
+    :param source_adaptor: database adaptor of the databases to migrate
+    :param destination_adaptor: database adaptor of the migrated databases
+    :param remove_source: when True, source databases are removed after being migrated
+    :return: the paths of the migrated databases
+    """
+    source_ext = source_adaptor.get_db_file_ext()
+    destination_ext = destination_adaptor.get_db_file_ext()
+    migrated_paths = []
+    for root, _, files in os.walk(root_path):
+        for file_name in sorted(files):
+            if not file_name.endswith(source_ext) or not _is_run_database_name(
+                file_name[: -len(source_ext)]
+            ):
+                continue
+            source_path = os.path.join(root, file_name)
+            destination_path = f"{source_path[:-len(source_ext)]}{destination_ext}"
+            migrated_documents_count = await migrate_database(
+                source_path, destination_path, source_adaptor, destination_adaptor
+            )
+            commons_logging.get_logger("DatabaseMigration").debug(
+                f"Migrated {migrated_documents_count} documents from {source_path} to {destination_path}"
+            )
+            if remove_source:
+                os.remove(source_path)
+            migrated_paths.append(destination_path)
+    return migrated_paths
@@ -14,11 +14,11 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 
-
 from octobot_commons.databases.document_database_adaptors import (
     abstract_document_database_adaptor,
 )
 from octobot_commons.databases.document_database_adaptors import tinydb_adaptor
+from octobot_commons.databases.document_database_adaptors import sqlite_adaptor
 
 
 from octobot_commons.databases.document_database_adaptors.abstract_document_database_adaptor import (
@@ -27,9 +27,15 @@ from octobot_commons.databases.document_database_adaptors.abstract_document_data
 from octobot_commons.databases.document_database_adaptors.tinydb_adaptor import (
     TinyDBAdaptor,
 )
+from octobot_commons.databases.document_database_adaptors.sqlite_adaptor import (
+    SQLiteAdaptor,
+    SQLiteDocument,
+)
 
 
 __all__ = [
     "AbstractDocumentDatabaseAdaptor",
     "TinyDBAdaptor",
+    "SQLiteAdaptor",
+    "SQLiteDocument",
 ]
@@ -0,0 +1,363 @@
+# pylint: disable=C0301, R0904, W0231
+#  Drakkar-Software OctoBot-Commons
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import json
+import os
+import sqlite3
+
+try:
+    import tinydb
+except ImportError:
+    pass
+
+import octobot_commons.constants as constants
+import octobot_commons.enums as enums
+import octobot_commons.errors as errors
+import octobot_commons.databases.document_database_adaptors.abstract_document_database_adaptor as abstract_document_database_adaptor
+import octobot_commons.databases.document_database_adaptors.tinydb_adaptor as tinydb_adaptor
+
+
+class SQLiteDocument(dict):
+    """
+    A document read from a SQLiteAdaptor database
+    """
+
+    def __init__(self, value: dict, doc_id: int):
+        super().__init__(value)
+        self.doc_id = doc_id
+
+
+class SQLiteAdaptor(
+    abstract_document_database_adaptor.AbstractDocumentDatabaseAdaptor
+):
+    """
+    SQLiteAdaptor is an AbstractDatabaseAdaptor storing each document as a JSON row of a SQLite table.
+    Contrary to TinyDBAdaptor, the database file is not loaded in RAM and flushing only writes updated documents.
+    Queries are tinydb queries: they are evaluated on the documents of the selected table.
+    Documents are JSON serialized when written: non json-serializable values are rejected right away.
+    """
+
+    DEFAULT_WRITE_CACHE_SIZE = 5000
+    HARD_RESET_ERRORS = [
+        sqlite3.DatabaseError
+    ]  # errors that should trigger a hard reset
+    ID_COLUMN = "id"
+    DOCUMENT_COLUMN = "document"
+    JOURNAL_MODE = enums.SQLiteJournalModes.WAL
+    SYNCHRONOUS = enums.SQLiteSynchronousModes.NORMAL
+
+    # identifiers are file system paths, as with TinyDBAdaptor
+    create_identifier = staticmethod(tinydb_adaptor.TinyDBAdaptor.create_identifier)
+    identifier_exists = staticmethod(tinydb_adaptor.TinyDBAdaptor.identifier_exists)
+    get_sub_identifiers = staticmethod(tinydb_adaptor.TinyDBAdaptor.get_sub_identifiers)
+    get_single_sub_identifier = staticmethod(
+        tinydb_adaptor.TinyDBAdaptor.get_single_sub_identifier
+    )
+
+    def __init__(self, file_path: str, cache_size: int = None, **kwargs):
+        """
+        SQLiteAdaptor constructor.
+        :param file_path: path to the database file
+        :param cache_size: number of write operations before committing them into the database file
+        :param kwargs: unused
+        """
+        super().__init__(file_path)
+        self.database = None
+        self.cache_size = cache_size
+        self._pending_writes_count = 0
+        self._tables = set()
+
+    def initialize(self):
+        """
+        Initialize the database: opens the database file.
+        """
+        dir_path = os.path.dirname(self.db_path)
+        if dir_path and not os.path.exists(dir_path):
+            raise errors.DatabaseNotFoundError(
+                f'Can\'t open database at "{self.db_path}"'
+            )
+        self.database = sqlite3.connect(self.db_path)
+        self.database.execute(f"PRAGMA journal_mode={self.JOURNAL_MODE.value}")
+        self.database.execute(f"PRAGMA synchronous={self.SYNCHRONOUS.value}")
+        self._tables = set(self._select_table_names())
+
+    @staticmethod
+    def is_file_system_based() -> bool:
+        """
+        Returns True when this database is identified as a file in the current file system,
+        False when it's managed by a database server
+        """
+        return True
+
+    @staticmethod
+    def get_db_file_ext() -> str:
+        """
+        Returns the database file extension. Implemented in file system based databases
+        """
+        return constants.SQLITE_DOCUMENT_DB_EXT
+
+    def get_uuid(self, document) -> int:
+        """
+        Returns the uuid of the document
+        :param document: the document
+        """
+        return document.doc_id
+
+    async def select(self, table_name: str, query, uuid=None) -> list:
+        """
+        Select data from the table_name table
+        :param table_name: name of the table
+        :param query: select query
+        :param uuid: id of the document
+        """
+        if uuid is None:
+            return self._select_documents(table_name, query)
+        return self._select_document(table_name, uuid)
+
+    async def tables(self) -> list:
+        """
+        Select tables
+        """
+        return self._select_table_names()
+
+    async def insert(self, table_name: str, row: dict) -> int:
+        """
+        Insert dict data into the table_name table
+        :param table_name: name of the table
+        :param row: data to insert
+        """
+        return self._insert_documents(table_name, (row,))[0]
+
+    async def upsert(self, table_name: str, row: dict, query, uuid=None) -> int:
+        """
+        Insert or update dict data into the table_name table
+        :param table_name: name of the table
+        :param row: data to insert
+        :param query: select query
+        :param uuid: id of the document
+        """
+        if uuid is None:
+            if updated_ids := self._update_documents(
+                table_name, row, self._select_documents(table_name, query)
+            ):
+                return updated_ids
+            return self._insert_documents(table_name, (row,))
+        if document := self._select_document(table_name, uuid):
+            return self._update_documents(table_name, row, (document,))
+        return self._insert_documents(table_name, (row,), doc_ids=(uuid,))
+
+    async def insert_many(self, table_name: str, rows: list) -> list:
+        """
+        Insert multiple dict data into the table_name table
+        :param table_name: name of the table
+        :param rows: data to insert, documents keep their doc_id as with TinyDBAdaptor
+        """
+        # rows without doc_id get a NULL id: assigned by sqlite
+        return self._insert_documents(
+            table_name, rows, doc_ids=[getattr(row, "doc_id", None) for row in rows]
+        )
+
+    async def update(self, table_name: str, row: dict, query, uuid=None) -> list:
+        """
+        Select data from the table_name table
+        :param table_name: name of the table
+        :param row: data to update
+        :param query: select query
+        :param uuid: id of the document
+        """
+        if uuid is None:
+            return self._update_documents(
+                table_name, row, self._select_documents(table_name, query)
+            )
+        if document := self._select_document(table_name, uuid):
+            return self._update_documents(table_name, row, (document,))
+        return []
+
+    async def update_many(self, table_name: str, update_values: list) -> list:
+        """
+        Update multiple values from the table_name table
+        :param table_name: name of the table
+        :param update_values: values to update as (row, query) tuples
+        """
+        documents = self._select_documents(table_name, None)
+        updated_ids = []
+        for row, query in update_values:
+            updated_ids += self._update_documents(
+                table_name, row, [document for document in documents if query(document)]
+            )
+        return updated_ids
+
+    async def delete(self, table_name: str, query, uuid=None) -> list:
+        """
+        Delete data from the table_name table
+        :param table_name: name of the table
+        :param query: select query
+        :param uuid: id of the document
+        """
+        if uuid is None:
+            if query is None:
+                return self._drop_table(table_name)
+            doc_ids = [
+                document.doc_id
+                for document in self._select_documents(table_name, query)
+            ]
+        else:
+            doc_ids = [uuid]
+        if doc_ids and table_name in self._tables:
+            self._write(
+                f"DELETE FROM {self._quote(table_name)} WHERE {self.ID_COLUMN} = ?",
+                [(doc_id,) for doc_id in doc_ids],
+            )
+        return doc_ids
+
+    async def count(self, table_name: str, query) -> int:
+        """
+        Counts documents in the table_name table
+        :param table_name: name of the table
+        :param query: select query
+        """
+        return len(self._select_documents(table_name, query))
+
+    async def query_factory(self):
+        """
+        Creates a new empty select query
+        """
+        return tinydb.Query()
+
+    async def hard_reset(self):
+        """
+        Completely reset the database
+        """
+        await self.close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.isfile(f"{self.db_path}{suffix}"):
+                os.remove(f"{self.db_path}{suffix}")
+        self.initialize()
+
+    async def flush(self):
+        """
+        Commits pending writes into the database file
+        """
+        self._commit()
+
+    async def close(self):
+        """
+        Closes the database
+        """
+        if self.database is None:
+            # when self.database didn't open properly
+            return
+        self._commit()
+        self.database.close()
+        self.database = None
+
+    def _select_table_names(self) -> list:
+        return [
+            name
+            for (name,) in self.database.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+            )
+        ]
+
+    def _select_documents(self, table_name: str, query) -> list:
+        if table_name not in self._tables:
+            return []
+        documents = [
+            SQLiteDocument(json.loads(document), doc_id)
+            for doc_id, document in self.database.execute(
+                f"SELECT {self.ID_COLUMN}, {self.DOCUMENT_COLUMN} FROM {self._quote(table_name)} "
+                f"ORDER BY {self.ID_COLUMN}"
+            )
+        ]
+        if query:
+            return [document for document in documents if query(document)]
+        return documents
+
+    def _select_document(self, table_name: str, uuid: int):
+        if table_name not in self._tables:
+            return None
+        for (document,) in self.database.execute(
+            f"SELECT {self.DOCUMENT_COLUMN} FROM {self._quote(table_name)} WHERE {self.ID_COLUMN} = ?",
+            (uuid,),
+        ):
+            return SQLiteDocument(json.loads(document), uuid)
+        return None
+
+    def _insert_documents(self, table_name: str, rows, doc_ids=None) -> list:
+        self._ensure_table(table_name)
+        quoted_table_name = self._quote(table_name)
+        inserted_ids = []
+        for index, row in enumerate(rows):
+            if doc_ids is None:
+                cursor = self.database.execute(
+                    f"INSERT INTO {quoted_table_name} ({self.DOCUMENT_COLUMN}) VALUES (?)",
+                    (json.dumps(row),),
+                )
+            else:
+                cursor = self.database.execute(
+                    f"INSERT INTO {quoted_table_name} ({self.ID_COLUMN}, {self.DOCUMENT_COLUMN}) VALUES (?, ?)",
+                    (doc_ids[index], json.dumps(row)),
+                )
+            inserted_ids.append(cursor.lastrowid)
+        self._register_writes(len(inserted_ids))
+        return inserted_ids
+
+    def _update_documents(self, table_name: str, row: dict, documents) -> list:
+        updated_documents = []
+        for document in documents:
+            document.update(row)
+            updated_documents.append((json.dumps(document), document.doc_id))
+        if updated_documents:
+            self._write(
+                f"UPDATE {self._quote(table_name)} SET {self.DOCUMENT_COLUMN} = ? WHERE {self.ID_COLUMN} = ?",
+                updated_documents,
+            )
+        return [doc_id for _, doc_id in updated_documents]
+
+    def _drop_table(self, table_name: str) -> list:
+        if table_name in self._tables:
+            self._write(f"DROP TABLE {self._quote(table_name)}", [()])
+            self._tables.remove(table_name)
+        return []
+
+    def _ensure_table(self, table_name: str):
+        if table_name not in self._tables:
+            self.database.execute(
+                f"CREATE TABLE IF NOT EXISTS {self._quote(table_name)} "
+                f"({self.ID_COLUMN} INTEGER PRIMARY KEY AUTOINCREMENT, {self.DOCUMENT_COLUMN} TEXT NOT NULL)"
+            )
+            self._tables.add(table_name)
+
+    def _write(self, statement: str, parameters: list):
+        self.database.executemany(statement, parameters)
+        self._register_writes(len(parameters))
+
+    def _register_writes(self, count: int):
+        # writes are committed by batches, like TinyDBAdaptor write cache
+        self._pending_writes_count += count
+        if self._pending_writes_count >= (
+            self.cache_size or self.DEFAULT_WRITE_CACHE_SIZE
+        ):
+            self._commit()
+
+    def _commit(self):
+        self.database.commit()
+        self._pending_writes_count = 0
+
+    @staticmethod
+    def _quote(table_name: str) -> str:
+        escaped_table_name = table_name.replace('"', '""')
+        return f'"{escaped_table_name}"'
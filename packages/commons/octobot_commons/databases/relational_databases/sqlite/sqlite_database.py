@@ -14,6 +14,7 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import asyncio
 import contextlib
 import sqlite3
 
@@ -45,7 +46,12 @@ class SQLiteDatabase:
     DEFAULT_SIZE = -1
     CACHE_SIZE = 50
 
-    def __init__(self, file_name):
+    def __init__(
+        self,
+        file_name,
+        journal_mode: enums.SQLiteJournalModes = None,
+        synchronous: enums.SQLiteSynchronousModes = None,
+    ):
         self.file_name = file_name
         self.logger = logging.get_logger(self.__class__.__name__)
 
@@ -53,18 +59,65 @@ class SQLiteDatabase:
         self.cache = {}
 
         self.connection = None
+        # pragmas to apply on connection, SQLite defaults are used when None
+        self.journal_mode = journal_mode
+        self.synchronous = synchronous
 
         # should never be used directly, use async with self.aio_cursor() as cursor: instead
         self._cursor_pool = None
+        # the connection is shared: only one task at a time can have an open transaction()
+        self._transaction_lock = asyncio.Lock()
+        self._transaction_task = None
+        # commits are delayed until the end of the outermost transaction()
+        self._transaction_depth = 0
 
     async def initialize(self):
         try:
             self.connection = await aiosqlite.connect(self.file_name)
             self._cursor_pool = cursor_pool.CursorPool(self.connection)
+            await self.__init_pragmas()
             await self.__init_tables_list()
         except (sqlite3.OperationalError, sqlite3.DatabaseError) as err:
             raise errors.DatabaseNotFoundError(f"{err} (file: {self.file_name})")
 
+    async def __init_pragmas(self):
+        async with self.aio_cursor() as cursor:
+            if self.journal_mode is not None:
+                await cursor.execute(f"PRAGMA journal_mode={self.journal_mode.value}")
+            if self.synchronous is not None:
+                await cursor.execute(f"PRAGMA synchronous={self.synchronous.value}")
+
+    @contextlib.asynccontextmanager
+    async def transaction(self):
+        """
+        Use this as a context manager to commit every write of the context at once
+        Nested transactions are committed with the outermost one.
+        Transactions from other tasks wait for the current one to be committed or rolled back.
+        :yield: None
+        :return: None
+        """
+        if self._transaction_task is asyncio.current_task():
+            # nested transaction: committed or rolled back with the outermost one
+            self._transaction_depth += 1
+            try:
+                yield
+            finally:
+                self._transaction_depth -= 1
+            return
+        async with self._transaction_lock:
+            self._transaction_task = asyncio.current_task()
+            self._transaction_depth = 1
+            try:
+                yield
+            except BaseException:
+                await self.connection.rollback()
+                raise
+            else:
+                await self.connection.commit()
+            finally:
+                self._transaction_depth = 0
+                self._transaction_task = None
+
     async def create_index(self, table, columns):
         await self.__execute_index_creation(
             table, "_".join(columns), ", ".join(columns)
@@ -91,29 +144,30 @@ class SQLiteDatabase:
             await self.__create_table(table, **kwargs)
 
         # Insert a row of data
-        inserting_values = [f"'{value}'" for value in kwargs.values()]
         await self.__execute_insert(
-            table, self.__insert_values(timestamp, ", ".join(inserting_values))
+            table, [self.__insert_row(timestamp, kwargs.values())]
         )
 
     async def insert_all(self, table, timestamp, **kwargs):
-        # TODO refactor with : cursor.executemany("INSERT INTO my_table VALUES (?,?)", values)
+        """
+        Insert a row for each timestamp, list values are the values of each row
+        """
         if table.value not in self.tables:
             await self.__create_table(table, **kwargs)
 
-        insert_values = []
-
-        for index, values in enumerate(timestamp):
-            # Insert a row of data
-            inserting_values = [
-                f"'{value if not isinstance(value, list) else value[index]}'"
-                for value in kwargs.values()
-            ]
-            insert_values.append(
-                self.__insert_values(values, ", ".join(inserting_values))
-            )
-
-        await self.__execute_insert(table, ", ".join(insert_values))
+        await self.__execute_insert(
+            table,
+            [
+                self.__insert_row(
+                    row_timestamp,
+                    (
+                        value if not isinstance(value, list) else value[index]
+                        for value in kwargs.values()
+                    ),
+                )
+                for index, row_timestamp in enumerate(timestamp)
+            ],
+        )
 
     async def update(self, table, updated_value_by_column, **kwargs):
         # Update a row of data
@@ -126,24 +180,29 @@ class SQLiteDatabase:
             self.__where_clauses_from_kwargs(**kwargs),
         )
 
-    def __insert_values(self, timestamp, inserting_values) -> str:
-        return f"({timestamp}, {inserting_values})"
+    def __insert_row(self, timestamp, inserting_values) -> tuple:
+        # values are stored as text, as when quoted in SQL
+        return (timestamp, *(str(value) for value in inserting_values))
 
-    async def __execute_insert(self, table, insert_items) -> None:
-        async with self.aio_cursor() as cursor:
-            await cursor.execute(f"INSERT INTO {table.value} VALUES {insert_items}")
-
-        # Save (commit) the changes
-        await self.connection.commit()
+    async def __execute_insert(self, table, rows) -> None:
+        if not rows:
+            return
+        placeholders = ", ".join("?" * len(rows[0]))
+        async with self.transaction():
+            async with self.aio_cursor() as cursor:
+                for index in range(0, len(rows), constants.SQLITE_INSERT_BATCH_SIZE):
+                    await cursor.executemany(
+                        f"INSERT INTO {table.value} VALUES ({placeholders})",
+                        rows[index : index + constants.SQLITE_INSERT_BATCH_SIZE],
+                    )
 
     async def __execute_update(self, table, update_items, where_clauses) -> None:
-        async with self.aio_cursor() as cursor:
-            await cursor.execute(
-                f"UPDATE {table.value} SET {update_items} WHERE {where_clauses}"
-            )
-
         # Save (commit) the changes
-        await self.connection.commit()
+        async with self.transaction():
+            async with self.aio_cursor() as cursor:
+                await cursor.execute(
+                    f"UPDATE {table.value} SET {update_items} WHERE {where_clauses}"
+                )
 
     async def select(
         self,
@@ -167,6 +226,21 @@ class SQLiteDatabase:
             where_clauses=self.__where_clauses_from_kwargs(**kwargs),
         )
 
+    async def select_distinct(
+        self,
+        table,
+        distinct_columns,
+        order_by=DEFAULT_ORDER_BY,
+        sort=DEFAULT_SORT,
+        **kwargs,
+    ):
+        return await self.__execute_select(
+            table=table,
+            select_items=f"DISTINCT {self.__selected_columns(distinct_columns)}",
+            where_clauses=self.__where_clauses_from_kwargs(**kwargs),
+            additional_clauses=self.__select_order_by(order_by, sort),
+        )
+
     async def select_max(
         self, table, max_columns, selected_items=None, group_by=None, **kwargs
     ):
@@ -358,6 +432,11 @@ class SQLiteDatabase:
 
     async def stop(self):
         try:
+            if (
+                self.journal_mode is enums.SQLiteJournalModes.WAL
+                and self.connection is not None
+            ):
+                await self.__leave_wal_journal_mode()
             if self._cursor_pool is not None:
                 await self._cursor_pool.close()
         finally:
@@ -366,10 +445,26 @@ class SQLiteDatabase:
                 self.connection = None
                 await conn.close()
 
+    async def __leave_wal_journal_mode(self):
+        # merge the write-ahead log into the database file
+        try:
+            async with self.aio_cursor() as cursor:
+                await cursor.execute(
+                    f"PRAGMA journal_mode={enums.SQLiteJournalModes.DELETE.value}"
+                )
+        except sqlite3.OperationalError as err:
+            # the database is still open from another connection: the write-ahead log
+            # is merged when the last connection is closed
+            self.logger.debug(
+                f"Keeping {self.journal_mode.value} journal mode for {self.file_name}: {err}"
+            )
+
 
 @contextlib.asynccontextmanager
-async def new_sqlite_database(file_path):
-    local_database = SQLiteDatabase(file_path)
+async def new_sqlite_database(file_path, journal_mode=None, synchronous=None):
+    local_database = SQLiteDatabase(
+        file_path, journal_mode=journal_mode, synchronous=synchronous
+    )
     try:
         await local_database.initialize()
         yield local_database
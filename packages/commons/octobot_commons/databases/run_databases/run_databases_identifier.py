@@ -29,14 +29,18 @@ class RunDatabasesIdentifier:
         self,
         tentacle_class,
         optimization_campaign_name=None,
-        database_adaptor=adaptors.TinyDBAdaptor,
+        database_adaptor=None,
         backtesting_id=None,
         live_id=None,
         optimizer_id=None,
         context=None,
         enable_storage=True,
     ):
-        self.database_adaptor = database_adaptor
+        self.database_adaptor = database_adaptor or (
+            adaptors.SQLiteAdaptor
+            if constants.USE_SQLITE_RUN_DATABASES
+            else adaptors.TinyDBAdaptor
+        )
         self.optimization_campaign_name = optimization_campaign_name
         self.backtesting_id = backtesting_id
         self.live_id = live_id
@@ -294,6 +294,7 @@ class DBTables(enum.Enum):
     PORTFOLIO = "portfolio"
     ORDERS = "all_orders"
     HISTORICAL_ORDERS_UPDATES = "order_updates"
+    ORDERS_JOURNAL = "orders_journal"
     TRADES = "all_trades"
     TRANSACTIONS = "all_transactions"
     CANDLES = "candles"
@@ -349,6 +350,25 @@ class DataBaseOperations(enum.Enum):
     SUP_EQUALS = f"{SUP}{EQUALS}"
 
 
+class SQLiteJournalModes(enum.Enum):
+    """
+    SQLite journal_mode pragma values
+    """
+
+    DELETE = "DELETE"
+    WAL = "WAL"
+
+
+class SQLiteSynchronousModes(enum.Enum):
+    """
+    SQLite synchronous pragma values
+    """
+
+    OFF = "OFF"
+    NORMAL = "NORMAL"
+    FULL = "FULL"
+
+
 class RunDatabases(enum.Enum):
     """
     Database identifiers
@@ -0,0 +1,61 @@
+#  Drakkar-Software OctoBot-Commons
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import random
+
+import octobot_commons.constants as constants
+import octobot_commons.databases as databases
+
+IDENTIFIERS = ("binance", "BTC/USDT", "1h", "ohlcv")
+
+
+def _rows(count):
+    rows = [[float(timestamp * 10), timestamp, timestamp + 1] for timestamp in range(count)]
+    random.shuffle(rows)
+    return rows
+
+
+def test_get():
+    cache = databases.ColumnarChronologicalReadDatabaseCache()
+    assert not cache.has(IDENTIFIERS)
+    rows = _rows(100)
+    cache.set(rows, 0, IDENTIFIERS)
+    assert cache.has(IDENTIFIERS)
+    sorted_rows = sorted(rows)
+    ignored = constants.DEFAULT_IGNORED_VALUE
+    assert cache.get(ignored, ignored, IDENTIFIERS) == sorted_rows
+    assert cache.get(ignored, 50, IDENTIFIERS) == sorted_rows[:6]
+    assert cache.get(955, ignored, IDENTIFIERS) == sorted_rows[96:]
+    assert cache.get(100, 150, IDENTIFIERS) == sorted_rows[10:16]
+    assert cache.get(101, 149, IDENTIFIERS) == sorted_rows[11:15]
+    assert cache.get(5000, 6000, IDENTIFIERS) == []
+    assert cache.get(150, 100, IDENTIFIERS) == []
+    # can go back in time
+    assert cache.get(0, 10, IDENTIFIERS) == sorted_rows[:2]
+
+
+def test_same_results_as_chronological_read_database_cache():
+    columnar_cache = databases.ColumnarChronologicalReadDatabaseCache()
+    cache = databases.ChronologicalReadDatabaseCache()
+    rows = _rows(1000)
+    columnar_cache.set(rows, 0, IDENTIFIERS)
+    cache.set(rows, 0, IDENTIFIERS)
+    for inferior_timestamp in range(0, 10000, 70):
+        superior_timestamp = inferior_timestamp + 135
+        assert columnar_cache.get(inferior_timestamp, superior_timestamp, IDENTIFIERS) == \
+               cache.get(inferior_timestamp, superior_timestamp, IDENTIFIERS)
+    columnar_cache.reset_cached_indexes()
+    columnar_cache.clear()
+    assert not columnar_cache.has(IDENTIFIERS)
@@ -0,0 +1,201 @@
+# type: ignore
+#  Drakkar-Software OctoBot-Commons
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import os
+import sqlite3
+
+import pytest
+import tinydb
+
+import octobot_commons.constants as constants
+import octobot_commons.errors as errors
+import octobot_commons.databases as databases
+import octobot_commons.databases.document_database_adaptors.sqlite_adaptor as sqlite_adaptor
+import octobot_commons.databases.document_database_adaptors.tinydb_adaptor as tinydb_adaptor
+
+@pytest.fixture
+def sqlite_database(tmp_path):
+    adaptor = sqlite_adaptor.SQLiteAdaptor(os.path.join(tmp_path, "test_db.sqlite"))
+    adaptor.initialize()
+    yield adaptor
+    if adaptor.database is not None:
+        adaptor.database.close()
+
+
+def test_get_db_file_ext():
+    assert sqlite_adaptor.SQLiteAdaptor.is_file_system_based() is True
+    assert sqlite_adaptor.SQLiteAdaptor.get_db_file_ext() == constants.SQLITE_DOCUMENT_DB_EXT
+
+
+def test_initialize(sqlite_database):
+    assert sqlite_database.database.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    with pytest.raises(errors.DatabaseNotFoundError):
+        sqlite_adaptor.SQLiteAdaptor("/non/existent/path/db.sqlite").initialize()
+
+
+@pytest.mark.asyncio
+async def test_create_identifier(tmp_path):
+    identifier_path = os.path.join(tmp_path, "new_identifier")
+    await sqlite_adaptor.SQLiteAdaptor.create_identifier(identifier_path)
+    assert await sqlite_adaptor.SQLiteAdaptor.identifier_exists(identifier_path, False) is True
+    assert await sqlite_adaptor.SQLiteAdaptor.get_single_sub_identifier(tmp_path, []) == "new_identifier"
+
+
+@pytest.mark.asyncio
+async def test_insert_and_select(sqlite_database):
+    query = tinydb.Query()
+    assert await sqlite_database.tables() == []
+    assert await sqlite_database.select("table", None) == []
+    assert await sqlite_database.insert("table", {"a": 1, "b": {"c": [1, 2]}}) == 1
+    assert await sqlite_database.insert_many("table", [{"a": 2}, {"a": 3}]) == [2, 3]
+    assert await sqlite_database.tables() == ["table"]
+    documents = await sqlite_database.select("table", None)
+    assert documents == [{"a": 1, "b": {"c": [1, 2]}}, {"a": 2}, {"a": 3}]
+    assert [sqlite_database.get_uuid(document) for document in documents] == [1, 2, 3]
+    assert await sqlite_database.select("table", query.a >= 2) == [{"a": 2}, {"a": 3}]
+    assert await sqlite_database.select("table", None, uuid=2) == {"a": 2}
+    assert await sqlite_database.select("table", None, uuid=5) is None
+    assert await sqlite_database.count("table", query.a > 1) == 2
+    with pytest.raises(TypeError):
+        await sqlite_database.insert("table", {"a": object()})
+
+
+@pytest.mark.asyncio
+async def test_update_upsert_and_delete(sqlite_database):
+    query = tinydb.Query()
+    await sqlite_database.insert_many("table", [{"a": 1}, {"a": 2}, {"a": 3}])
+    assert await sqlite_database.update("table", {"b": True}, query.a == 1) == [1]
+    assert await sqlite_database.update("table", {"b": False}, None, uuid=2) == [2]
+    assert await sqlite_database.update_many("table", [({"c": 1}, query.a == 3)]) == [3]
+    assert await sqlite_database.upsert("table", {"a": 3, "c": 2}, query.a == 3) == [3]
+    assert await sqlite_database.upsert("table", {"a": 4}, query.a == 4) == [4]
+    assert await sqlite_database.upsert("table", {"a": 10}, None, uuid=10) == [10]
+    assert await sqlite_database.select("table", None) == [
+        {"a": 1, "b": True}, {"a": 2, "b": False}, {"a": 3, "c": 2}, {"a": 4}, {"a": 10}
+    ]
+    assert await sqlite_database.delete("table", query.a > 3) == [4, 10]
+    assert await sqlite_database.delete("table", None, uuid=1) == [1]
+    assert await sqlite_database.select("table", None) == [{"a": 2, "b": False}, {"a": 3, "c": 2}]
+    await sqlite_database.delete("table", None)
+    assert await sqlite_database.tables() == []
+    assert await sqlite_database.select("table", None) == []
+    # ids are reset with the table
+    assert await sqlite_database.insert("table", {"a": 1}) == 1
+
+
+@pytest.mark.asyncio
+async def test_flush_and_close(sqlite_database):
+    sqlite_database.cache_size = 2
+    await sqlite_database.insert("table", {"a": 1})
+    assert sqlite_database._pending_writes_count == 1
+    await sqlite_database.insert("table", {"a": 2})
+    # committed when reaching cache size
+    assert sqlite_database._pending_writes_count == 0
+    await sqlite_database.insert("table", {"a": 3})
+    await sqlite_database.flush()
+    assert sqlite_database._pending_writes_count == 0
+    await sqlite_database.close()
+    assert sqlite_database.database is None
+    # closing twice is fine
+    await sqlite_database.close()
+    sqlite_database.initialize()
+    assert await sqlite_database.select("table", None) == [{"a": 1}, {"a": 2}, {"a": 3}]
+
+
+@pytest.mark.asyncio
+async def test_hard_reset(sqlite_database):
+    await sqlite_database.insert("table", {"a": 1})
+    await sqlite_database.hard_reset()
+    assert await sqlite_database.select("table", None) == []
+    assert sqlite_database.is_hard_reset_error(sqlite3.DatabaseError("file is not a database"))
+
+
+@pytest.mark.asyncio
+async def test_db_writer_reader(tmp_path):
+    database = databases.DBWriterReader(
+        os.path.join(tmp_path, "test_db.sqlite"), database_adaptor=sqlite_adaptor.SQLiteAdaptor
+    )
+    await database.log("table", {"a": 1, "b": "x"})
+    await database.upsert("table", {"a": 1, "b": "y"}, await database.search({"a": 1}))
+    await database.delete("other_table", {"a": 1})
+    assert await database.select("table", (await database.search()).b == "y") == [{"a": 1, "b": "y"}]
+    await database.replace_all("table", [{"a": 2}])
+    assert await database.all("table") == [{"a": 2}]
+    await database.close()
+
+
+@pytest.mark.asyncio
+async def test_migrate_databases(tmp_path):
+    os.makedirs(os.path.join(tmp_path, "run", "exchange"))
+    source_path = os.path.join(tmp_path, "run", "exchange", "trades.json")
+    source = tinydb_adaptor.TinyDBAdaptor(source_path)
+    source.initialize()
+    await source.insert_many("all_trades", [{"id": 1, "price": 1.5}, {"id": 2, "price": 2}])
+    await source.insert("metadata", {"name": "run"})
+    await source.close()
+
+    assert await databases.migrate_databases(tmp_path, remove_source=True) == [
+        os.path.join(tmp_path, "run", "exchange", "trades.sqlite")
+    ]
+    assert not os.path.exists(source_path)
+    migrated = sqlite_adaptor.SQLiteAdaptor(os.path.join(tmp_path, "run", "exchange", "trades.sqlite"))
+    migrated.initialize()
+    try:
+        assert sorted(await migrated.tables()) == ["all_trades", "metadata"]
+        assert await migrated.select("all_trades", None) == [{"id": 1, "price": 1.5}, {"id": 2, "price": 2}]
+        assert await migrated.select("metadata", None) == [{"name": "run"}]
+    finally:
+        await migrated.close()
+
+
+@pytest.mark.asyncio
+async def test_migrate_databases_keeps_doc_ids_and_skips_other_files(tmp_path):
+    os.makedirs(os.path.join(tmp_path, "run", "exchange"))
+    source_path = os.path.join(tmp_path, "run", "exchange", "portfolio_value.json")
+    source = tinydb_adaptor.TinyDBAdaptor(source_path)
+    source.initialize()
+    await source.insert_many("historical_portfolio_value", [{"value": 1}, {"value": 2}, {"value": 3}])
+    await source.delete("historical_portfolio_value", tinydb.Query().value == 1)
+    # metadata is upserted using uuid=1
+    await source.upsert("metadata", {"name": "run"}, None, uuid=1)
+    await source.close()
+    symbol_path = os.path.join(tmp_path, "run", "exchange", "BTCUSDT.json")
+    symbol_db = tinydb_adaptor.TinyDBAdaptor(symbol_path)
+    symbol_db.initialize()
+    await symbol_db.insert("cache", {"t": 1})
+    await symbol_db.close()
+    other_path = os.path.join(tmp_path, "run", "tentacle_config.json")
+    with open(other_path, "w") as other_file:
+        other_file.write('{"enabled": true}')
+
+    assert sorted(await databases.migrate_databases(tmp_path)) == [
+        os.path.join(tmp_path, "run", "exchange", "BTCUSDT.sqlite"),
+        os.path.join(tmp_path, "run", "exchange", "portfolio_value.sqlite"),
+    ]
+    # not a run database: not migrated
+    assert not os.path.exists(os.path.join(tmp_path, "run", "tentacle_config.sqlite"))
+    migrated = sqlite_adaptor.SQLiteAdaptor(os.path.join(tmp_path, "run", "exchange", "portfolio_value.sqlite"))
+    migrated.initialize()
+    try:
+        assert [
+            (migrated.get_uuid(document), document)
+            for document in await migrated.select("historical_portfolio_value", None)
+        ] == [(2, {"value": 2}), (3, {"value": 3})]
+        assert await migrated.select("metadata", None, uuid=1) == {"name": "run"}
+        # new documents are inserted after migrated ones
+        assert await migrated.insert("historical_portfolio_value", {"value": 4}) == 4
+    finally:
+        await migrated.close()
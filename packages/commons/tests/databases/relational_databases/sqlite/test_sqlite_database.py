@@ -120,6 +120,18 @@ async def test_select_count():
         assert await database.select_count(OHLCV, ["*"], time_frame="1M") == [(35,)]
 
 
+async def test_select_distinct():
+    async with get_database() as database:
+        assert await database.select_distinct(OHLCV, ["time_frame"], order_by="time_frame", sort="ASC") == [
+            (time_frame, )
+            for time_frame in sorted(("1m", "3m", "5m", "15m", "30m", "1h", "2h",
+                                      "4h", "6h", "8h", "12h", "1d", "3d", "1w", "1M"))
+        ]
+        timestamps = await database.select_distinct(OHLCV, ["timestamp"], time_frame="1h")
+        assert len(timestamps) == 500
+        assert timestamps[0] == (1589742000,)
+
+
 async def test_select_from_timestamp():
     async with get_database() as database:
         operations = [enums.DataBaseOperations.INF_EQUALS.value]
@@ -243,6 +255,116 @@ async def test_insert_all():
         assert await temp_empty_database.select(OHLCV, date="05") == [(2, 'abc', '10', '05')]
 
 
+async def test_insert_all_in_batches():
+    async with get_temp_empty_database() as temp_empty_database:
+        with mock.patch("octobot_commons.constants.SQLITE_INSERT_BATCH_SIZE", 2):
+            await temp_empty_database.insert_all(OHLCV,
+                                                 symbol="xyz",
+                                                 timestamp=[1, 2, 3, 4, 5],
+                                                 candle=[f"[{i}, 'a']" for i in range(5)])
+        assert await temp_empty_database.select_count(OHLCV, ["*"]) == [(5,)]
+        # values are stored as text, quotes included
+        assert await temp_empty_database.select(OHLCV, timestamp=5) == [(5, 'xyz', "[4, 'a']")]
+        # no row: nothing to insert
+        await temp_empty_database.insert_all(OHLCV, symbol="xyz", timestamp=[], candle=[])
+        assert await temp_empty_database.select_count(OHLCV, ["*"]) == [(5,)]
+
+
+async def test_transaction():
+    async with get_temp_empty_database() as temp_empty_database:
+        with mock.patch.object(temp_empty_database.connection, "commit",
+                               mock.AsyncMock(wraps=temp_empty_database.connection.commit)) as commit_mock:
+            async with temp_empty_database.transaction():
+                await temp_empty_database.insert(OHLCV, 1, symbol="xyz", price="1")
+                await temp_empty_database.insert_all(OHLCV, symbol="abc", timestamp=[2, 3], price=["2", "3"])
+                await temp_empty_database.update(OHLCV, {"price": "4"}, symbol="xyz")
+                commit_mock.assert_not_called()
+            commit_mock.assert_awaited_once()
+        assert await temp_empty_database.select(OHLCV) == [(3, 'abc', '3'), (2, 'abc', '2'), (1, 'xyz', '4')]
+
+        with pytest.raises(ZeroDivisionError):
+            async with temp_empty_database.transaction():
+                await temp_empty_database.insert(OHLCV, 4, symbol="xyz", price="5")
+                1 / 0
+        # rolled back
+        assert await temp_empty_database.select_count(OHLCV, ["*"]) == [(3,)]
+
+
+async def test_concurrent_transactions():
+    async with get_temp_empty_database() as temp_empty_database:
+        await temp_empty_database.insert(OHLCV, 1, symbol="xyz", price="1")
+        first_transaction_started = asyncio.Event()
+        can_fail_first_transaction = asyncio.Event()
+
+        async def _failing_transaction():
+            async with temp_empty_database.transaction():
+                await temp_empty_database.insert(OHLCV, 2, symbol="xyz", price="2")
+                first_transaction_started.set()
+                await can_fail_first_transaction.wait()
+                raise ZeroDivisionError
+
+        async def _transaction():
+            await first_transaction_started.wait()
+            async with temp_empty_database.transaction():
+                await temp_empty_database.insert(OHLCV, 3, symbol="xyz", price="3")
+
+        failing_task = asyncio.create_task(_failing_transaction())
+        task = asyncio.create_task(_transaction())
+        await first_transaction_started.wait()
+        await asyncio_tools.wait_asyncio_next_cycle()
+        # waiting for the first transaction to complete
+        assert not task.done()
+        can_fail_first_transaction.set()
+        with pytest.raises(ZeroDivisionError):
+            await failing_task
+        await task
+        # only the failing transaction is rolled back
+        assert await temp_empty_database.select(OHLCV) == [(3, 'xyz', '3'), (1, 'xyz', '1')]
+
+
+async def test_stop_wal_database_while_opened_elsewhere():
+    database_name = "temp_wal_database"
+    try:
+        async with databases.new_sqlite_database(database_name,
+                                                 journal_mode=enums.SQLiteJournalModes.WAL) as other_database:
+            async with databases.new_sqlite_database(database_name,
+                                                     journal_mode=enums.SQLiteJournalModes.WAL) as database:
+                await database.insert_all(OHLCV, symbol="xyz", timestamp=[1, 2], price=["1", "2"])
+                assert await other_database.select(OHLCV) == [(2, 'xyz', '2'), (1, 'xyz', '1')]
+            # stopped without raising: journal mode can't be changed while other_database is open
+            assert database.connection is None
+            assert await other_database.select(OHLCV) == [(2, 'xyz', '2'), (1, 'xyz', '1')]
+        await asyncio_tools.wait_asyncio_next_cycle()
+        assert not os.path.exists(f"{database_name}-wal")
+    finally:
+        os.remove(database_name)
+
+
+async def test_pragmas():
+    database_name = "temp_wal_database"
+    try:
+        async with databases.new_sqlite_database(database_name,
+                                                 journal_mode=enums.SQLiteJournalModes.WAL,
+                                                 synchronous=enums.SQLiteSynchronousModes.OFF) as database:
+            async with database.aio_cursor() as cursor:
+                await cursor.execute("PRAGMA journal_mode")
+                assert await cursor.fetchall() == [("wal",)]
+                await cursor.execute("PRAGMA synchronous")
+                assert await cursor.fetchall() == [(0,)]
+            await database.insert_all(OHLCV, symbol="xyz", timestamp=[1, 2], price=["1", "2"])
+        await asyncio_tools.wait_asyncio_next_cycle()
+        # write-ahead log is merged into the database file on stop
+        assert not os.path.exists(f"{database_name}-wal")
+        async with databases.new_sqlite_database(database_name) as database:
+            async with database.aio_cursor() as cursor:
+                await cursor.execute("PRAGMA journal_mode")
+                assert await cursor.fetchall() == [("delete",)]
+            assert await database.select(OHLCV) == [(2, 'xyz', '2'), (1, 'xyz', '1')]
+        await asyncio_tools.wait_asyncio_next_cycle()
+    finally:
+        os.remove(database_name)
+
+
 async def test_delete():
     async with get_temp_empty_database() as temp_empty_database:
         await temp_empty_database.insert_all(OHLCV,
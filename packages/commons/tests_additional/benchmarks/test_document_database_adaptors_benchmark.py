@@ -0,0 +1,70 @@
+#  Drakkar-Software OctoBot-Commons
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import os
+import time
+
+import pytest
+
+import octobot_commons.databases as databases
+
+pytestmark = pytest.mark.asyncio
+
+STORED_DOCUMENTS_COUNT = 20000
+FLUSHED_UPDATES_COUNT = 200
+TABLE = "all_trades"
+
+
+def _get_document(index):
+    return {
+        "id": str(index),
+        "symbol": "BTC/USDT",
+        "side": "buy" if index % 2 else "sell",
+        "price": 20000 + index,
+        "amount": 0.001 * index,
+        "fee": {"cost": 0.01, "currency": "USDT"},
+        "timestamp": 1700000000 + index,
+    }
+
+
+@pytest.mark.parametrize("database_adaptor", [databases.TinyDBAdaptor, databases.SQLiteAdaptor])
+async def test_flushed_writes_and_reads(database_adaptor, tmp_path):
+    # run with: pytest tests_additional/benchmarks -s
+    db_path = os.path.join(tmp_path, f"db{database_adaptor.get_db_file_ext()}")
+    database = databases.DBWriterReader(db_path, database_adaptor=database_adaptor)
+    await database.log_many(TABLE, [_get_document(index) for index in range(STORED_DOCUMENTS_COUNT)], cache=False)
+    await database.flush()
+
+    # live bot like usage: each update is flushed
+    t0 = time.perf_counter()
+    for index in range(STORED_DOCUMENTS_COUNT, STORED_DOCUMENTS_COUNT + FLUSHED_UPDATES_COUNT):
+        await database.log(TABLE, _get_document(index), cache=False)
+        await database.flush()
+    writes_elapsed = time.perf_counter() - t0
+    await database.close()
+
+    t0 = time.perf_counter()
+    database = databases.DBWriterReader(db_path, database_adaptor=database_adaptor)
+    documents = await database.all(TABLE)
+    reads_elapsed = time.perf_counter() - t0
+    await database.close()
+    print(
+        f"{database_adaptor.__name__}: {FLUSHED_UPDATES_COUNT} flushed writes with {STORED_DOCUMENTS_COUNT} stored "
+        f"documents: {round(writes_elapsed, 3)}s ({round(writes_elapsed / FLUSHED_UPDATES_COUNT * 1e3, 2)}ms per "
+        f"write), open and read all: {round(reads_elapsed, 3)}s, "
+        f"file size: {round(os.path.getsize(db_path) / 1024 / 1024, 2)}MB"
+    )
+    assert len(documents) == STORED_DOCUMENTS_COUNT + FLUSHED_UPDATES_COUNT
+    assert documents[-1] == _get_document(STORED_DOCUMENTS_COUNT + FLUSHED_UPDATES_COUNT - 1)
@@ -48,6 +48,7 @@ async def initialize_scheduler():
         )
     import octobot_node.scheduler.schedules as schedules
     SCHEDULER.start()
+    await SCHEDULER.initialize_workflows_index()
     # apply_schedules requires DBOS launch (sys_db); must run after start().
     await schedules.register_schedules(SCHEDULER)
 
@@ -33,6 +33,7 @@ import octobot_node.models
 import octobot_node.constants
 import octobot_node.scheduler.workflows_util as workflows_util
 import octobot_node.scheduler.workflows_retention as workflows_retention
+import octobot_node.scheduler.workflows_index as workflows_index
 import octobot_node.scheduler.workflows.params as workflow_params
 import octobot_node.scheduler.user_actions.user_action_util as user_action_util
 import octobot_node.scheduler.encryption as encryption
@@ -67,6 +68,9 @@ class Scheduler:
     AUTOMATION_WORKFLOW_QUEUE: dbos.Queue = None # type: ignore
     USER_ACTION_QUEUE: dbos.Queue = None # type: ignore
     DBOS_CLEANUP_QUEUE: dbos.Queue = None # type: ignore
+    # updated on enqueue, used for lookups once every stored workflow is indexed
+    WORKFLOWS_INDEX: typing.Optional[workflows_index.WorkflowsIndex] = None
+    IS_WORKFLOWS_INDEX_SYNCHRONIZED: bool = False
 
     @staticmethod
     def _wallet_filter_queue(queue_names: typing.Optional[list[str]]) -> octobot_node.enums.SchedulerQueues:
@@ -151,6 +155,8 @@ class Scheduler:
         Scheduler.AUTOMATION_WORKFLOW_QUEUE = None
         Scheduler.USER_ACTION_QUEUE = None
         Scheduler.DBOS_CLEANUP_QUEUE = None
+        Scheduler.WORKFLOWS_INDEX = None
+        Scheduler.IS_WORKFLOWS_INDEX_SYNCHRONIZED = False
 
     def create_queues(self):
         self.AUTOMATION_WORKFLOW_QUEUE = dbos.Queue(name=octobot_node.enums.SchedulerQueues.AUTOMATION_WORKFLOW_QUEUE.value)
@@ -161,6 +167,38 @@ class Scheduler:
             concurrency=1,
         )
 
+    async def initialize_workflows_index(self) -> None:
+        """Create the workflows index and index workflows created before it. Requires a launched DBOS instance."""
+        try:
+            Scheduler.WORKFLOWS_INDEX = workflows_index.WorkflowsIndex.from_dbos(self.INSTANCE)
+            await asyncio.to_thread(Scheduler.WORKFLOWS_INDEX.create)
+            await workflows_index.synchronize(Scheduler.WORKFLOWS_INDEX, self.INSTANCE)
+            Scheduler.IS_WORKFLOWS_INDEX_SYNCHRONIZED = True
+        except Exception as e:
+            self.logger.exception(f"Failed to initialize workflows index, workflows will be scanned: {e}")
+            Scheduler.WORKFLOWS_INDEX = None
+
+    async def index_workflows(self, entries: list[workflows_index.WorkflowIndexEntry]) -> None:
+        """Index workflows: call before enqueuing them to never miss them in lookups."""
+        if self.WORKFLOWS_INDEX is None:
+            return
+        try:
+            # index queries are synchronous: don't block the event loop
+            await asyncio.to_thread(self.WORKFLOWS_INDEX.add, entries)
+        except Exception as e:
+            # lookups would miss these workflows: scan workflows until the next synchronization
+            Scheduler.IS_WORKFLOWS_INDEX_SYNCHRONIZED = False
+            self.logger.exception(f"Failed to index workflows, workflows will be scanned: {e}")
+
+    async def remove_indexed_workflows(self, workflow_ids: list[str]) -> None:
+        if self.WORKFLOWS_INDEX is None:
+            return
+        try:
+            await asyncio.to_thread(self.WORKFLOWS_INDEX.remove, workflow_ids)
+        except Exception as e:
+            # lookups ignore indexed workflows missing from DBOS
+            self.logger.warning(f"Failed to remove {len(workflow_ids)} workflows from index: {e}")
+
     async def get_periodic_tasks(self, user_id: typing.Optional[str] = None) -> list[octobot_node.models.Execution]:
         """DBOS scheduled workflows are not easily introspectable; return empty list."""
         return [] # TODO
@@ -202,8 +240,18 @@ class Scheduler:
         user_id: typing.Optional[str], 
         statuses: typing.Optional[list[dbos.WorkflowStatusString]],
         queue_names: typing.Optional[list[str]],
-        load_output: bool
+        load_output: bool,
+        parent_ids: typing.Optional[list[str]] = None,
+        user_action_ids: typing.Optional[list[str]] = None,
     ) -> list[dbos.WorkflowStatus]:
+        """
+        parent_ids and user_action_ids restrict listed workflows when they can be resolved from
+        the workflows index, callers still have to filter returned workflows by these ids
+        """
+        indexed_workflow_ids = await self._get_indexed_workflow_ids(user_id, queue_names, parent_ids, user_action_ids)
+        if indexed_workflow_ids is not None:
+            # already filtered by wallet
+            return await self._list_workflows_by_ids(indexed_workflow_ids, statuses, queue_names, load_output)
         workflows = await self.INSTANCE.list_workflows_async(
             status=[status.value for status in statuses] if statuses else None,
             queue_name=queue_names,
@@ -217,6 +265,49 @@ class Scheduler:
             )
         return workflows
 
+    async def _get_indexed_workflow_ids(
+        self,
+        user_id: typing.Optional[str],
+        queue_names: typing.Optional[list[str]],
+        parent_ids: typing.Optional[list[str]],
+        user_action_ids: typing.Optional[list[str]],
+    ) -> typing.Optional[list[str]]:
+        if (
+            not self.IS_WORKFLOWS_INDEX_SYNCHRONIZED
+            or self.WORKFLOWS_INDEX is None
+            or not queue_names or len(queue_names) != 1
+            or (user_id is None and parent_ids is None and user_action_ids is None)
+        ):
+            return None
+        try:
+            return await asyncio.to_thread(
+                self.WORKFLOWS_INDEX.get_workflow_ids,
+                queue_names[0], user_id=user_id, parent_ids=parent_ids, user_action_ids=user_action_ids
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to read workflows index, workflows will be scanned: {e}")
+            return None
+
+    async def _list_workflows_by_ids(
+        self,
+        workflow_ids: list[str],
+        statuses: typing.Optional[list[dbos.WorkflowStatusString]],
+        queue_names: typing.Optional[list[str]],
+        load_output: bool
+    ) -> list[dbos.WorkflowStatus]:
+        workflows = []
+        for index in range(0, len(workflow_ids), workflows_index.MAX_QUERY_VALUES):
+            workflows.extend(await self.INSTANCE.list_workflows_async(
+                workflow_ids=workflow_ids[index:index + workflows_index.MAX_QUERY_VALUES],
+                status=[status.value for status in statuses] if statuses else None,
+                queue_name=queue_names,
+                load_output=load_output
+            ))
+        if len(workflow_ids) > workflows_index.MAX_QUERY_VALUES:
+            # keep the DBOS listing order
+            workflows.sort(key=lambda workflow: workflow.created_at or 0)
+        return workflows
+
     async def _get_parent_and_children_automation_workflows(
         self,
         user_id: typing.Optional[str],
@@ -224,13 +315,14 @@ class Scheduler:
         statuses: list[dbos.WorkflowStatusString],
         load_output: bool = False,
     ) -> list[dbos.WorkflowStatus]:
-        all_workflows = await self._list_workflows(
-            user_id, statuses, [octobot_node.enums.SchedulerQueues.AUTOMATION_WORKFLOW_QUEUE.value], load_output
-        )
         parent_workflow_ids = set(
             workflows_util.normalize_parent_automation_id(workflow_id)
             for workflow_id in workflow_ids
         )
+        all_workflows = await self._list_workflows(
+            user_id, statuses, [octobot_node.enums.SchedulerQueues.AUTOMATION_WORKFLOW_QUEUE.value], load_output,
+            parent_ids=list(parent_workflow_ids),
+        )
         return [
             workflow
             for workflow in all_workflows
@@ -261,7 +353,8 @@ class Scheduler:
         user_action_id_set = set(user_action_ids)
         matching_workflows = await self._list_workflows(
             user_id, statuses,
-            [octobot_node.enums.SchedulerQueues.USER_ACTION_QUEUE.value], load_output
+            [octobot_node.enums.SchedulerQueues.USER_ACTION_QUEUE.value], load_output,
+            user_action_ids=user_action_ids,
         )
         matched_workflow_ids: list[str] = []
         for workflow in matching_workflows:
@@ -419,6 +512,7 @@ class Scheduler:
             self.INSTANCE,
             merged_to_delete_workflow_ids,
         )
+        await self.remove_indexed_workflows(merged_to_delete_workflow_ids)
 
     async def get_scheduled_tasks(self, user_id: typing.Optional[str] = None) -> list[octobot_node.models.Execution]:
         """DBOS has no direct 'scheduled for later' queue; return empty list."""
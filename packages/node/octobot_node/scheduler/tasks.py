@@ -16,6 +16,7 @@
 import asyncio
 import time
 import typing
+import uuid
 
 import octobot_flow.entities
 import octobot_node.constants as node_constants
@@ -23,6 +24,7 @@ import octobot_node.enums
 import octobot_node.errors as node_errors
 import octobot_node.models
 import octobot_node.scheduler.workflows_util as workflows_util
+import octobot_node.scheduler.workflows_index as workflows_index
 import octobot_node.scheduler.workflows.params as params
 import octobot_protocol.models as protocol_models
 
@@ -35,12 +37,18 @@ async def trigger_user_action_workflow(
     if not octobot_node.scheduler.is_initialized():
         raise RuntimeError("Scheduler is not initialized")
     import octobot_node.scheduler.workflows.user_action_workflow as user_action_workflow
-    handle = await octobot_node.scheduler.SCHEDULER.USER_ACTION_QUEUE.enqueue_async(
-        user_action_workflow.UserActionWorkflow.execute_user_action,
-        inputs=params.UserActionWorkflowInputs(
-            user_id=user_id, user_action=user_action,
-        ).to_dict(include_default_values=False)
-    )
+    workflow_id = str(uuid.uuid4())
+    # index before enqueuing to never miss the workflow in lookups
+    await octobot_node.scheduler.SCHEDULER.index_workflows([
+        workflows_index.create_user_action_index_entry(workflow_id, user_id, user_action.id)
+    ])
+    with octobot_node.scheduler.SCHEDULER.SetWorkflowID(workflow_id):
+        handle = await octobot_node.scheduler.SCHEDULER.USER_ACTION_QUEUE.enqueue_async(
+            user_action_workflow.UserActionWorkflow.execute_user_action,
+            inputs=params.UserActionWorkflowInputs(
+                user_id=user_id, user_action=user_action,
+            ).to_dict(include_default_values=False)
+        )
     return handle.workflow_id
 
 async def trigger_task(
@@ -54,13 +62,12 @@ async def trigger_task(
     # enqueue workflow instead of starting it to dispatch them to multiple workers if possible
     if task.type == octobot_node.models.TaskType.EXECUTE_ACTIONS.value:
         inputs = params.AutomationWorkflowInputs(task=task).to_dict(include_default_values=False)
-        if target_workflow_id:
-            with octobot_node.scheduler.SCHEDULER.SetWorkflowID(target_workflow_id):
-                handle = await octobot_node.scheduler.SCHEDULER.AUTOMATION_WORKFLOW_QUEUE.enqueue_async(
-                    automation_workflow.AutomationWorkflow.execute_automation,
-                    inputs=inputs
-                )
-        else:
+        workflow_id = target_workflow_id or str(uuid.uuid4())
+        # index before enqueuing to never miss the workflow in lookups
+        await octobot_node.scheduler.SCHEDULER.index_workflows([
+            workflows_index.create_automation_index_entry(workflow_id, task.user_id)
+        ])
+        with octobot_node.scheduler.SCHEDULER.SetWorkflowID(workflow_id):
             handle = await octobot_node.scheduler.SCHEDULER.AUTOMATION_WORKFLOW_QUEUE.enqueue_async(
                 automation_workflow.AutomationWorkflow.execute_automation,
                 inputs=inputs
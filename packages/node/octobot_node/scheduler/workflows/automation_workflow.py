@@ -35,6 +35,7 @@ import octobot_node.scheduler.task_context
 import octobot_node.constants as constants
 import octobot_node.scheduler.workflows.params as params
 import octobot_node.scheduler.workflows_util as workflows_util
+import octobot_node.scheduler.workflows_index as workflows_index
 import octobot_node.errors as errors
 import octobot_node.protocol.accounts_trading as accounts_trading_protocol
 
@@ -429,6 +430,9 @@ class AutomationWorkflow:
             f"remaining steps: {progress_status.remaining_steps}{delay_str}."
         )
         next_workflow_id = AutomationWorkflow._get_next_child_workflow_id()
+        await SCHEDULER.index_workflows([
+            workflows_index.create_automation_index_entry(next_workflow_id, parsed_inputs.task.user_id)
+        ])
         with SCHEDULER.SetWorkflowID(next_workflow_id):
             await SCHEDULER.AUTOMATION_WORKFLOW_QUEUE.enqueue_async(
                 AutomationWorkflow.execute_automation,
@@ -0,0 +1,206 @@
+#  Drakkar-Software OctoBot-Node
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import dataclasses
+import typing
+
+import dbos
+import sqlalchemy
+
+import octobot_commons.logging as logging
+import octobot_node.enums
+import octobot_node.scheduler.workflows_util as workflows_util
+
+TABLE_NAME = "octobot_node_workflows_index"
+# max number of bound values per query, below SQLite limits
+MAX_QUERY_VALUES = 500
+
+
+@dataclasses.dataclass
+class WorkflowIndexEntry:
+    workflow_id: str
+    queue_name: str
+    user_id: typing.Optional[str] = None
+    parent_id: typing.Optional[str] = None
+    user_action_id: typing.Optional[str] = None
+
+
+class WorkflowsIndex:
+    """
+    Persisted secondary index of the scheduler queues workflows: (queue, user id, parent automation id,
+    user action id) -> workflow ids.
+    Stored in the DBOS system database, next to the indexed workflows. Workflow statuses are not indexed:
+    they are resolved by DBOS when fetching the indexed workflow ids.
+    """
+
+    def __init__(self, engine: sqlalchemy.Engine, schema: typing.Optional[str] = None):
+        self.engine = engine
+        self.metadata = sqlalchemy.MetaData(schema=schema)
+        self.table = sqlalchemy.Table(
+            TABLE_NAME,
+            self.metadata,
+            sqlalchemy.Column("workflow_id", sqlalchemy.Text, primary_key=True),
+            sqlalchemy.Column("queue_name", sqlalchemy.Text, nullable=False),
+            sqlalchemy.Column("user_id", sqlalchemy.Text, nullable=True),
+            sqlalchemy.Column("parent_id", sqlalchemy.Text, nullable=True),
+            sqlalchemy.Column("user_action_id", sqlalchemy.Text, nullable=True),
+            sqlalchemy.Index(f"idx_{TABLE_NAME}_queue_name_user_id", "queue_name", "user_id"),
+            sqlalchemy.Index(f"idx_{TABLE_NAME}_parent_id", "parent_id"),
+            sqlalchemy.Index(f"idx_{TABLE_NAME}_user_action_id", "user_action_id"),
+        )
+
+    @classmethod
+    def from_dbos(cls, dbos_instance: dbos.DBOS) -> "WorkflowsIndex":
+        return cls(dbos_instance._sys_db.engine, schema=dbos_instance._sys_db.schema)
+
+    def create(self) -> None:
+        self.metadata.create_all(self.engine, checkfirst=True)
+
+    def add(self, entries: list[WorkflowIndexEntry]) -> None:
+        if not entries:
+            return
+        with self.engine.begin() as connection:
+            # replace existing entries: workflows can be indexed again (workflow replays)
+            self._delete(connection, [entry.workflow_id for entry in entries])
+            connection.execute(
+                sqlalchemy.insert(self.table),
+                [dataclasses.asdict(entry) for entry in entries],
+            )
+
+    def remove(self, workflow_ids: list[str]) -> None:
+        if not workflow_ids:
+            return
+        with self.engine.begin() as connection:
+            self._delete(connection, workflow_ids)
+
+    def get_workflow_ids(
+        self,
+        queue_name: str,
+        user_id: typing.Optional[str] = None,
+        parent_ids: typing.Optional[list[str]] = None,
+        user_action_ids: typing.Optional[list[str]] = None,
+    ) -> list[str]:
+        """
+        :return: the ids of the queue workflows matching the given user and parent or user action ids.
+        As when filtering workflows by wallet, workflows without user id match any user_id.
+        """
+        base_query = sqlalchemy.select(self.table.c.workflow_id).where(self.table.c.queue_name == queue_name)
+        if user_id is not None:
+            base_query = base_query.where(
+                sqlalchemy.or_(
+                    self.table.c.user_id == user_id,
+                    self.table.c.user_id.is_(None),
+                    self.table.c.user_id == "",
+                )
+            )
+        with self.engine.connect() as connection:
+            if parent_ids is None and user_action_ids is None:
+                return [row[0] for row in connection.execute(base_query)]
+            column, values = (
+                (self.table.c.parent_id, parent_ids) if parent_ids is not None
+                else (self.table.c.user_action_id, user_action_ids)
+            )
+            return [
+                row[0]
+                for chunk in _chunks(list(values))
+                for row in connection.execute(base_query.where(column.in_(chunk)))
+            ]
+
+    def get_indexed_workflow_ids(self) -> set[str]:
+        with self.engine.connect() as connection:
+            return set(row[0] for row in connection.execute(sqlalchemy.select(self.table.c.workflow_id)))
+
+    def _delete(self, connection: sqlalchemy.Connection, workflow_ids: list[str]) -> None:
+        for chunk in _chunks(workflow_ids):
+            connection.execute(sqlalchemy.delete(self.table).where(self.table.c.workflow_id.in_(chunk)))
+
+
+def create_automation_index_entry(
+    workflow_id: str, user_id: typing.Optional[str]
+) -> WorkflowIndexEntry:
+    return WorkflowIndexEntry(
+        workflow_id=workflow_id,
+        queue_name=octobot_node.enums.SchedulerQueues.AUTOMATION_WORKFLOW_QUEUE.value,
+        user_id=user_id,
+        parent_id=workflows_util.normalize_parent_automation_id(workflow_id),
+    )
+
+
+def create_user_action_index_entry(
+    workflow_id: str, user_id: typing.Optional[str], user_action_id: typing.Optional[str]
+) -> WorkflowIndexEntry:
+    return WorkflowIndexEntry(
+        workflow_id=workflow_id,
+        queue_name=octobot_node.enums.SchedulerQueues.USER_ACTION_QUEUE.value,
+        user_id=user_id,
+        user_action_id=user_action_id,
+    )
+
+
+def create_index_entry(workflow_status: dbos.WorkflowStatus) -> typing.Optional[WorkflowIndexEntry]:
+    """
+    :return: the index entry of a stored workflow, parsed as when filtering workflows by wallet
+    """
+    if workflow_status.queue_name == octobot_node.enums.SchedulerQueues.AUTOMATION_WORKFLOW_QUEUE.value:
+        task = workflows_util.get_automation_input_task(workflow_status)
+        return create_automation_index_entry(workflow_status.workflow_id, task.user_id if task else None)
+    if workflow_status.queue_name == octobot_node.enums.SchedulerQueues.USER_ACTION_QUEUE.value:
+        resolved = workflows_util.resolve_user_action_workflow_inputs(workflow_status)
+        if resolved.inputs is not None and resolved.inputs.user_action is not None:
+            return create_user_action_index_entry(
+                workflow_status.workflow_id, resolved.inputs.user_id, resolved.inputs.user_action.id
+            )
+        # unparsable inputs are visible to every user
+        return create_user_action_index_entry(
+            workflow_status.workflow_id, None, resolved.partial_user_action_id
+        )
+    return None
+
+
+async def synchronize(index: WorkflowsIndex, dbos_instance: dbos.DBOS) -> None:
+    """
+    Index the queues workflows that are not indexed yet (created before the index or by an interrupted enqueue).
+    Index queries are synchronous: they run in a thread to not block the event loop.
+    """
+    stored_workflow_ids = set(
+        workflow_status.workflow_id
+        for workflow_status in await dbos_instance.list_workflows_async(
+            queue_name=[
+                octobot_node.enums.SchedulerQueues.AUTOMATION_WORKFLOW_QUEUE.value,
+                octobot_node.enums.SchedulerQueues.USER_ACTION_QUEUE.value,
+            ],
+            load_input=False,
+            load_output=False,
+        )
+    )
+    # indexed workflows missing from DBOS are not removed here: they might be about to be enqueued
+    to_index_workflow_ids = list(stored_workflow_ids - await asyncio.to_thread(index.get_indexed_workflow_ids))
+    for chunk in _chunks(to_index_workflow_ids):
+        await asyncio.to_thread(index.add, [
+            entry
+            for workflow_status in await dbos_instance.list_workflows_async(workflow_ids=chunk, load_output=False)
+            if (entry := create_index_entry(workflow_status)) is not None
+        ])
+    _get_logger().info(f"Workflows index synchronized: {len(to_index_workflow_ids)} newly indexed workflows")
+
+
+def _chunks(values: list) -> typing.Iterator[list]:
+    for index in range(0, len(values), MAX_QUERY_VALUES):
+        yield values[index:index + MAX_QUERY_VALUES]
+
+
+def _get_logger() -> logging.BotLogger:
+    return logging.get_logger("workflows_index")
@@ -210,6 +210,7 @@ async def cleanup_outdated_automation_executions(
             scheduler.INSTANCE,
             all_ids_to_delete,
         )
+        await scheduler.remove_indexed_workflows(all_ids_to_delete)
     _get_logger().info("DBOS cleanup summary: %s", summary)
     return summary
 
@@ -51,6 +51,9 @@ class TestShutdownSchedulerAndTradingSignalChannel:
         async def track_register_schedules(*args, **kwargs) -> None:
             init_call_order.append("register_schedules")
 
+        async def track_initialize_workflows_index() -> None:
+            init_call_order.append("initialize_workflows_index")
+
         previous_instance = scheduler_module.SCHEDULER.INSTANCE
         scheduler_module.SCHEDULER.INSTANCE = mock.Mock()
         try:
@@ -67,6 +70,10 @@ class TestShutdownSchedulerAndTradingSignalChannel:
                             schedules_module,
                             "register_schedules",
                             side_effect=track_register_schedules,
+                        ), mock.patch.object(
+                            scheduler_module.SCHEDULER,
+                            "initialize_workflows_index",
+                            side_effect=track_initialize_workflows_index,
                         ):
                             scheduler_module._shutdown_done = True
                             await scheduler_module.initialize_scheduler()
@@ -75,5 +82,6 @@ class TestShutdownSchedulerAndTradingSignalChannel:
         assert scheduler_module._shutdown_done is False
         assert init_call_order == [
             "start",
+            "initialize_workflows_index",
             "register_schedules",
         ]
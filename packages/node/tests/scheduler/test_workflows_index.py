@@ -0,0 +1,165 @@
+#  Drakkar-Software OctoBot-Node
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+
+import mock
+import pytest
+import sqlalchemy
+import dbos
+
+import octobot_node.enums
+import octobot_node.scheduler.scheduler as scheduler_module
+import octobot_node.scheduler.workflows_index as workflows_index
+
+_AUTOMATION_QUEUE = octobot_node.enums.SchedulerQueues.AUTOMATION_WORKFLOW_QUEUE.value
+_USER_ACTION_QUEUE = octobot_node.enums.SchedulerQueues.USER_ACTION_QUEUE.value
+_PARENT_ID_A = "741ce171-dac9-40be-83dc-b443c0eaf0e2"
+_PARENT_ID_B = "852df282-edb0-51cf-94ed-c554d1fbf1f3"
+
+
+@pytest.fixture
+def index(tmp_path):
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'index.sqlite'}")
+    workflows_index_instance = workflows_index.WorkflowsIndex(engine)
+    workflows_index_instance.create()
+    # creating twice is a no-op
+    workflows_index_instance.create()
+    try:
+        yield workflows_index_instance
+    finally:
+        engine.dispose()
+
+
+def _workflow_status(workflow_id: str) -> mock.Mock:
+    workflow_status = mock.Mock(spec=dbos.WorkflowStatus)
+    workflow_status.workflow_id = workflow_id
+    workflow_status.created_at = 0
+    return workflow_status
+
+
+class TestWorkflowsIndex:
+    def test_get_workflow_ids_by_user(self, index):
+        index.add([
+            workflows_index.create_automation_index_entry(_PARENT_ID_A, "user-a"),
+            workflows_index.create_automation_index_entry(f"{_PARENT_ID_A}_1", "user-a"),
+            workflows_index.create_automation_index_entry(_PARENT_ID_B, "user-b"),
+            workflows_index.create_automation_index_entry("no-user", None),
+            workflows_index.create_user_action_index_entry("action-a", "user-a", "user-action-a"),
+        ])
+        assert sorted(index.get_workflow_ids(_AUTOMATION_QUEUE, user_id="user-a")) == sorted(
+            [_PARENT_ID_A, f"{_PARENT_ID_A}_1", "no-user"]
+        )
+        assert sorted(index.get_workflow_ids(_AUTOMATION_QUEUE, user_id="user-b")) == sorted(
+            [_PARENT_ID_B, "no-user"]
+        )
+        assert len(index.get_workflow_ids(_AUTOMATION_QUEUE)) == 4
+        assert index.get_workflow_ids(_USER_ACTION_QUEUE, user_id="user-a") == ["action-a"]
+        assert index.get_workflow_ids(_USER_ACTION_QUEUE, user_id="user-b") == []
+
+    def test_get_workflow_ids_by_parent_and_user_action(self, index):
+        index.add([
+            workflows_index.create_automation_index_entry(_PARENT_ID_A, "user-a"),
+            workflows_index.create_automation_index_entry(f"{_PARENT_ID_A}_1", "user-a"),
+            workflows_index.create_automation_index_entry(_PARENT_ID_B, "user-a"),
+            workflows_index.create_user_action_index_entry("action-a", "user-a", "user-action-a"),
+            workflows_index.create_user_action_index_entry("action-b", "user-a", "user-action-b"),
+        ])
+        assert sorted(index.get_workflow_ids(_AUTOMATION_QUEUE, user_id="user-a", parent_ids=[_PARENT_ID_A])) == \
+            sorted([_PARENT_ID_A, f"{_PARENT_ID_A}_1"])
+        assert index.get_workflow_ids(_AUTOMATION_QUEUE, user_id="user-b", parent_ids=[_PARENT_ID_A]) == []
+        assert index.get_workflow_ids(_AUTOMATION_QUEUE, parent_ids=[]) == []
+        assert index.get_workflow_ids(
+            _USER_ACTION_QUEUE, user_action_ids=["user-action-b", "unknown"]
+        ) == ["action-b"]
+
+    def test_add_replaces_and_remove(self, index):
+        index.add([workflows_index.create_automation_index_entry(_PARENT_ID_A, "user-a")])
+        index.add([workflows_index.create_automation_index_entry(_PARENT_ID_A, "user-b")])
+        assert index.get_workflow_ids(_AUTOMATION_QUEUE, user_id="user-a") == []
+        assert index.get_workflow_ids(_AUTOMATION_QUEUE, user_id="user-b") == [_PARENT_ID_A]
+        workflow_ids = [f"{_PARENT_ID_B}_{i}" for i in range(1, workflows_index.MAX_QUERY_VALUES * 2 + 2)]
+        index.add([workflows_index.create_automation_index_entry(workflow_id, "user-b") for workflow_id in workflow_ids])
+        assert len(index.get_workflow_ids(_AUTOMATION_QUEUE, parent_ids=[_PARENT_ID_B])) == len(workflow_ids)
+        index.remove(workflow_ids + ["unknown"])
+        assert index.get_indexed_workflow_ids() == {_PARENT_ID_A}
+
+
+class TestSynchronize:
+    @pytest.mark.asyncio
+    async def test_indexes_missing_workflows(self, index):
+        index.add([workflows_index.create_automation_index_entry(_PARENT_ID_A, "user-a")])
+        dbos_instance = mock.Mock()
+        dbos_instance.list_workflows_async = mock.AsyncMock(side_effect=[
+            [_workflow_status(_PARENT_ID_A), _workflow_status(_PARENT_ID_B)],
+            [_workflow_status(_PARENT_ID_B)],
+        ])
+        with mock.patch.object(
+            workflows_index, "create_index_entry",
+            mock.Mock(return_value=workflows_index.create_automation_index_entry(_PARENT_ID_B, "user-b"))
+        ) as create_index_entry_mock:
+            await workflows_index.synchronize(index, dbos_instance)
+        create_index_entry_mock.assert_called_once()
+        assert dbos_instance.list_workflows_async.await_args_list[1].kwargs["workflow_ids"] == [_PARENT_ID_B]
+        assert index.get_workflow_ids(_AUTOMATION_QUEUE, user_id="user-b") == [_PARENT_ID_B]
+
+
+class TestSchedulerIndexedLookups:
+    @pytest.mark.asyncio
+    async def test_lists_indexed_workflows_only_when_synchronized(self, index):
+        scheduler = scheduler_module.Scheduler()
+        scheduler.INSTANCE = mock.Mock()
+        scheduler.INSTANCE.list_workflows_async = mock.AsyncMock(return_value=[])
+        scheduler.WORKFLOWS_INDEX = index
+        await scheduler.index_workflows([workflows_index.create_automation_index_entry(_PARENT_ID_A, "user-a")])
+        with mock.patch.object(scheduler_module.workflows_util, "filter_by_wallet", mock.Mock(return_value=[])):
+            # not synchronized: full scan
+            await scheduler._list_workflows("user-a", None, [_AUTOMATION_QUEUE], False)
+            assert "workflow_ids" not in scheduler.INSTANCE.list_workflows_async.await_args.kwargs
+            scheduler.IS_WORKFLOWS_INDEX_SYNCHRONIZED = True
+            await scheduler._list_workflows("user-a", None, [_AUTOMATION_QUEUE], False)
+            assert scheduler.INSTANCE.list_workflows_async.await_args.kwargs["workflow_ids"] == [_PARENT_ID_A]
+            # no indexed workflow: DBOS is not called
+            scheduler.INSTANCE.list_workflows_async.reset_mock()
+            assert await scheduler._list_workflows("user-b", None, [_AUTOMATION_QUEUE], False) == []
+            scheduler.INSTANCE.list_workflows_async.assert_not_awaited()
+        await scheduler.remove_indexed_workflows([_PARENT_ID_A])
+        assert index.get_indexed_workflow_ids() == set()
+
+    @pytest.mark.asyncio
+    async def test_index_queries_do_not_run_in_event_loop(self, index):
+        scheduler = scheduler_module.Scheduler()
+        scheduler.INSTANCE = mock.Mock()
+        scheduler.INSTANCE.list_workflows_async = mock.AsyncMock(return_value=[])
+        scheduler.WORKFLOWS_INDEX = index
+        scheduler.IS_WORKFLOWS_INDEX_SYNCHRONIZED = True
+        with mock.patch.object(
+            scheduler_module.asyncio, "to_thread", mock.AsyncMock(wraps=scheduler_module.asyncio.to_thread)
+        ) as to_thread_mock:
+            await scheduler.index_workflows([workflows_index.create_automation_index_entry(_PARENT_ID_A, "user-a")])
+            to_thread_mock.assert_awaited_once()
+            assert to_thread_mock.await_args.args[0] == index.add
+            await scheduler._list_workflows("user-a", None, [_AUTOMATION_QUEUE], False)
+            assert to_thread_mock.await_args.args[0] == index.get_workflow_ids
+            await scheduler.remove_indexed_workflows([_PARENT_ID_A])
+            assert to_thread_mock.await_args.args[0] == index.remove
+            assert to_thread_mock.await_count == 3
+        assert index.get_indexed_workflow_ids() == set()
+
+    @pytest.mark.asyncio
+    async def test_stop_resets_workflows_index(self, index):
+        scheduler = scheduler_module.Scheduler()
+        scheduler.INSTANCE = mock.Mock()
+        with mock.patch.object(workflows_index.WorkflowsIndex, "from_dbos", mock.Mock(return_value=index)), \
+                mock.patch.object(workflows_index, "synchronize", mock.AsyncMock()) as synchronize_mock:
+            await scheduler.initialize_workflows_index()
+            synchronize_mock.assert_awaited_once_with(index, scheduler.INSTANCE)
+        try:
+            assert scheduler_module.Scheduler.WORKFLOWS_INDEX is index
+            assert scheduler_module.Scheduler.IS_WORKFLOWS_INDEX_SYNCHRONIZED is True
+            scheduler.stop()
+            assert scheduler_module.Scheduler.WORKFLOWS_INDEX is None
+            assert scheduler_module.Scheduler.IS_WORKFLOWS_INDEX_SYNCHRONIZED is False
+            # a new scheduler does not use the stopped scheduler index
+            assert scheduler_module.Scheduler().WORKFLOWS_INDEX is None
+        finally:
+            scheduler_module.Scheduler.WORKFLOWS_INDEX = None
+            scheduler_module.Scheduler.IS_WORKFLOWS_INDEX_SYNCHRONIZED = False
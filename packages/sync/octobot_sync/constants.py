@@ -26,6 +26,13 @@ BLOB_DATA_KEY = "data"
 
 IV_BYTES = 12
 
+# Pushed user actions element holding a list of sealed {iv, data} actions instead of a single one
+USER_ACTIONS_BATCH_ITEMS_KEY = "items"
+
+# Derived collection keys cache: avoids HKDF derivations and wallet lookups on each encrypt/decrypt
+DERIVED_KEYS_CACHE_MAXSIZE = 4096
+DERIVED_KEYS_CACHE_TTL_SECONDS = 10 * 60
+
 DEFAULT_ENCRYPTION_INFO = "starfish-e2e"
 COLLECTIONS_FILE = "collections.json"
 SYNC_NAMESPACE = "octobot"
@@ -25,8 +25,10 @@ import binascii
 import hashlib
 import json
 import os
+import threading
 import typing
 
+import cachetools
 from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
@@ -109,6 +111,82 @@ def _require_non_empty_secret(wallet_private_key: str) -> None:
         )
 
 
+class DerivedCollectionKeyCache:
+    """Bounded, TTL-evicted cache of derived collection AES keys by ``(user_id, collection)``.
+
+    The wallet private key is only resolved (through *get_wallet_private_key*) when
+    the key of a ``(user_id, collection)`` pair is not cached yet.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = constants.DERIVED_KEYS_CACHE_MAXSIZE,
+        ttl: float = constants.DERIVED_KEYS_CACHE_TTL_SECONDS,
+    ) -> None:
+        self._keys: cachetools.TTLCache[tuple[str, str], bytes] = cachetools.TTLCache(
+            maxsize=maxsize,
+            ttl=ttl,
+        )
+        self._lock = threading.Lock()
+
+    def get_key(
+        self,
+        user_id: str,
+        collection: str,
+        get_wallet_private_key: typing.Callable[[str], str],
+    ) -> bytes:
+        cache_key = (user_id, collection)
+        with self._lock:
+            aes_key = self._keys.get(cache_key)
+        if aes_key is None:
+            wallet_private_key = get_wallet_private_key(user_id)
+            _require_non_empty_secret(wallet_private_key)
+            aes_key = _collection_aes_key(wallet_private_key, collection)
+            with self._lock:
+                self._keys[cache_key] = aes_key
+        return aes_key
+
+    def invalidate_user(self, user_id: str) -> None:
+        with self._lock:
+            for cache_key in [cache_key for cache_key in self._keys if cache_key[0] == user_id]:
+                self._keys.pop(cache_key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._keys.clear()
+
+
+def _to_blob_dict(initialization_vector: bytes, ciphertext: bytes) -> dict[str, str]:
+    return {
+        constants.BLOB_IV_KEY: base64.b64encode(initialization_vector).decode("ascii"),
+        constants.BLOB_DATA_KEY: base64.b64encode(ciphertext).decode("ascii"),
+    }
+
+
+def encrypt_bytes_with_key(plaintext: bytes, aes_key: bytes) -> dict[str, str]:
+    """Encrypt arbitrary bytes with an already derived collection key; return ``{iv, data}``."""
+    initialization_vector = os.urandom(constants.IV_BYTES)
+    ciphertext = AESGCM(aes_key).encrypt(initialization_vector, plaintext, None)
+    return _to_blob_dict(initialization_vector, ciphertext)
+
+
+def encrypt_bytes_batch_with_key(
+    plaintexts: typing.Sequence[bytes], aes_key: bytes
+) -> list[dict[str, str]]:
+    """Encrypt each plaintext of a multi-item collection with the same cipher; one IV per item."""
+    aesgcm = AESGCM(aes_key)
+    initialization_vectors = os.urandom(constants.IV_BYTES * len(plaintexts))
+    blobs = []
+    for index, plaintext in enumerate(plaintexts):
+        initialization_vector = initialization_vectors[
+            index * constants.IV_BYTES:(index + 1) * constants.IV_BYTES
+        ]
+        blobs.append(
+            _to_blob_dict(initialization_vector, aesgcm.encrypt(initialization_vector, plaintext, None))
+        )
+    return blobs
+
+
 def encrypt_bytes_to_blob_dict(
     plaintext: bytes,
     wallet_private_key: str,
@@ -116,22 +194,21 @@ def encrypt_bytes_to_blob_dict(
 ) -> dict[str, str]:
     """Encrypt arbitrary bytes with AES-256-GCM; return ``{iv, data}`` (base64 ASCII)."""
     _require_non_empty_secret(wallet_private_key)
-    aes_key = _collection_aes_key(wallet_private_key, collection)
-    initialization_vector = os.urandom(constants.IV_BYTES)
-    ciphertext = AESGCM(aes_key).encrypt(initialization_vector, plaintext, None)
-    return {
-        constants.BLOB_IV_KEY: base64.b64encode(initialization_vector).decode("ascii"),
-        constants.BLOB_DATA_KEY: base64.b64encode(ciphertext).decode("ascii"),
-    }
+    return encrypt_bytes_with_key(plaintext, _collection_aes_key(wallet_private_key, collection))
 
 
-def decrypt_blob_dict_to_bytes(
-    blob: dict[str, typing.Any],
+def encrypt_bytes_batch_to_blob_dicts(
+    plaintexts: typing.Sequence[bytes],
     wallet_private_key: str,
     collection: str,
-) -> bytes:
-    """Decrypt a ``{iv, data}`` blob to the original plaintext bytes."""
+) -> list[dict[str, str]]:
+    """Encrypt multiple items of a collection, deriving the collection key once."""
     _require_non_empty_secret(wallet_private_key)
+    return encrypt_bytes_batch_with_key(plaintexts, _collection_aes_key(wallet_private_key, collection))
+
+
+def _parse_blob_dict(blob: dict[str, typing.Any]) -> tuple[bytes, bytes]:
+    """Return the ``(iv, ciphertext)`` of a ``{iv, data}`` blob."""
     try:
         iv_encoded = blob[constants.BLOB_IV_KEY]
         data_encoded = blob[constants.BLOB_DATA_KEY]
@@ -152,16 +229,52 @@ def decrypt_blob_dict_to_bytes(
         raise sync_errors.OctobotSyncCryptoFormatError(
             f"Invalid IV length: expected {constants.IV_BYTES} bytes"
         )
+    return initialization_vector, ciphertext
+
 
-    aes_key = _collection_aes_key(wallet_private_key, collection)
+def _decrypt_with_cipher(aesgcm: AESGCM, blob: dict[str, typing.Any]) -> bytes:
+    initialization_vector, ciphertext = _parse_blob_dict(blob)
     try:
-        return AESGCM(aes_key).decrypt(initialization_vector, ciphertext, None)
+        return aesgcm.decrypt(initialization_vector, ciphertext, None)
     except InvalidTag as err:
         raise sync_errors.OctobotSyncCryptoDecryptError(
             "Failed to decrypt collection payload"
         ) from err
 
 
+def decrypt_blob_dict_with_key(blob: dict[str, typing.Any], aes_key: bytes) -> bytes:
+    """Decrypt a ``{iv, data}`` blob with an already derived collection key."""
+    return _decrypt_with_cipher(AESGCM(aes_key), blob)
+
+
+def decrypt_blob_dicts_batch_with_key(
+    blobs: typing.Sequence[dict[str, typing.Any]], aes_key: bytes
+) -> list[bytes]:
+    """Decrypt each ``{iv, data}`` blob of a multi-item collection with the same cipher."""
+    aesgcm = AESGCM(aes_key)
+    return [_decrypt_with_cipher(aesgcm, blob) for blob in blobs]
+
+
+def decrypt_blob_dict_to_bytes(
+    blob: dict[str, typing.Any],
+    wallet_private_key: str,
+    collection: str,
+) -> bytes:
+    """Decrypt a ``{iv, data}`` blob to the original plaintext bytes."""
+    _require_non_empty_secret(wallet_private_key)
+    return decrypt_blob_dict_with_key(blob, _collection_aes_key(wallet_private_key, collection))
+
+
+def decrypt_blob_dicts_to_bytes(
+    blobs: typing.Sequence[dict[str, typing.Any]],
+    wallet_private_key: str,
+    collection: str,
+) -> list[bytes]:
+    """Decrypt multiple items of a collection, deriving the collection key once."""
+    _require_non_empty_secret(wallet_private_key)
+    return decrypt_blob_dicts_batch_with_key(blobs, _collection_aes_key(wallet_private_key, collection))
+
+
 def encrypt_utf8_json_to_wire(
     plaintext_json: str,
     wallet_private_key: str,
@@ -88,9 +88,23 @@ def _get_wallet_private_key(user_id: str) -> str:
         ) from err
 
 
+# Derived collection keys by (user_id, collection): skips wallet lookups and HKDF on each pull
+_collection_keys_cache = sync_crypto.DerivedCollectionKeyCache()
+
+
+def _get_collection_key(user_id: str, collection: str) -> bytes:
+    return _collection_keys_cache.get_key(user_id, collection, _get_wallet_private_key)
+
+
+def invalidate_user_collection_keys(user_id: str) -> None:
+    """Forget the cached collection keys of *user_id*: to call when its wallet is removed or replaced."""
+    _collection_keys_cache.invalidate_user(user_id)
+
+
 def _encrypt(data: str, user_id: str, collection: str) -> str:
-    wallet_private_key = _get_wallet_private_key(user_id)
-    return sync_crypto.encrypt_utf8_json_to_wire(data, wallet_private_key, collection)
+    return json.dumps(
+        sync_crypto.encrypt_bytes_with_key(data.encode("utf-8"), _get_collection_key(user_id, collection))
+    )
 
 
 def _wrap_as_stored_document(encrypted_payload: str, plaintext_for_hash: str) -> str:
@@ -137,19 +151,24 @@ async def _user_actions_after_write(event: WriteEvent) -> None:
     if element is None:
         return
     identity = event.params["identity"]
-    wallet_private_key = _get_wallet_private_key(identity)
-    plaintext = sync_crypto.decrypt_blob_dict_to_bytes(
-        dict(element), wallet_private_key, event.collection
-    ).decode("utf-8")
-    action = protocol_models.UserAction.from_json(plaintext)
-    if action is None:
-        return
-    try:
-        await user_actions_protocol.execute_user_action(action, identity)
-    except Exception as exc:
-        _get_logger().exception(
-            exc, True, f"Unexpected error executing user action: {action.id}: {exc}"
+    aes_key = _get_collection_key(identity, event.collection)
+    if sync_constants.USER_ACTIONS_BATCH_ITEMS_KEY in element:
+        # batched actions: decrypt every sealed action with the same cipher
+        plaintexts = sync_crypto.decrypt_blob_dicts_batch_with_key(
+            [dict(item) for item in element[sync_constants.USER_ACTIONS_BATCH_ITEMS_KEY]], aes_key
         )
+    else:
+        plaintexts = [sync_crypto.decrypt_blob_dict_with_key(dict(element), aes_key)]
+    for plaintext in plaintexts:
+        action = protocol_models.UserAction.from_json(plaintext.decode("utf-8"))
+        if action is None:
+            continue
+        try:
+            await user_actions_protocol.execute_user_action(action, identity)
+        except Exception as exc:
+            _get_logger().exception(
+                exc, True, f"Unexpected error executing user action: {action.id}: {exc}"
+            )
 
 
 user_actions_plugin = ServerPlugin(
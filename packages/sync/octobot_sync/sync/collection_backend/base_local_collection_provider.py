@@ -88,6 +88,11 @@ class BaseLocalCollectionProvider(
     def _set_cached_state(self, user_id: str, state: S) -> None:
         self._cache.set(user_id, user_id, state)
 
+    def _set_saved_cached_state(
+        self, user_id: str, state: S, file_fingerprint: base_storage.FileFingerprint
+    ) -> None:
+        self._cache.set_with_fingerprint(user_id, state, file_fingerprint)
+
     def _empty_state(self) -> S:
         return typing.cast(
             S,
@@ -126,8 +131,8 @@ class BaseLocalCollectionProvider(
 
     def _save_state(self, user_id: str, state: S) -> None:
         wallet_private_key = self._get_wallet_private_key(user_id)
-        self._storage.save_state(user_id, wallet_private_key, state)
-        self._set_cached_state(user_id, state)
+        file_fingerprint = self._storage.save_state(user_id, wallet_private_key, state)
+        self._set_saved_cached_state(user_id, state, file_fingerprint)
 
     def _list_items_for_key(self, user_id: str, items_key: str) -> list:
         state = self._load_state(user_id)
@@ -15,6 +15,7 @@
 #  License along with this library.
 
 
+import dataclasses
 import datetime
 import hashlib
 import json
@@ -36,6 +37,20 @@ import octobot_sync.sync.collection_backend.tolerant_state_loading as tolerant_s
 _MISSING_FILE_CHECKSUM = ""
 
 
+@dataclasses.dataclass(frozen=True, slots=True)
+class FileStatSignature:
+    """Cheap identity of an on-disk file version: any rewrite changes at least one field."""
+    inode: int
+    size: int
+    mtime_ns: int
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class FileFingerprint:
+    stat_signature: typing.Optional[FileStatSignature]
+    checksum: str
+
+
 class BaseLocalCollectionStorage:
     """
     Thread-safe, per-wallet-user_id encrypted collection storage.
@@ -75,6 +90,27 @@ class BaseLocalCollectionStorage:
             with open(path, "rb") as handle:
                 return hashlib.sha256(handle.read()).hexdigest()
 
+    def get_file_stat_signature(self, storage_key: str) -> typing.Optional[FileStatSignature]:
+        """Return the (inode, size, mtime_ns) signature of the collection file, None when missing."""
+        try:
+            stat_result = os.stat(self._file_path(storage_key))
+        except FileNotFoundError:
+            return None
+        return FileStatSignature(
+            inode=stat_result.st_ino,
+            size=stat_result.st_size,
+            mtime_ns=stat_result.st_mtime_ns,
+        )
+
+    def get_file_fingerprint(self, storage_key: str) -> FileFingerprint:
+        """Return the stat signature and checksum of the collection file."""
+        # stat first: a file changing in between can't be associated with a previous checksum
+        stat_signature = self.get_file_stat_signature(storage_key)
+        return FileFingerprint(
+            stat_signature=stat_signature,
+            checksum=self.get_file_checksum(storage_key),
+        )
+
     def _payload_to_json_bytes(self, payload: state_model.StateModel) -> bytes:
         """Serialize a state dict to JSON bytes (handles datetime values from protocol models)."""
 
@@ -212,18 +248,22 @@ class BaseLocalCollectionStorage:
         storage_key: str,
         wallet_private_key: str,
         state: state_model.StateModel,
-    ) -> None:
+    ) -> FileFingerprint:
         """
         Encrypt and atomically persist the state dict for a given storage key.
+
+        Returns the fingerprint of the written file, computed from the written bytes
+        to avoid reading the file back.
         """
         path = self._file_path(storage_key)
         path.parent.mkdir(parents=True, exist_ok=True)
         blob = self._encrypt(state, wallet_private_key)
         tmp_path = path.with_suffix(".tmp")
+        file_bytes = json.dumps(blob, indent=2).encode("utf-8")
 
         with self._lock:
-            with open(tmp_path, "w", encoding="utf-8") as handle:
-                json.dump(blob, handle, indent=2)
+            with open(tmp_path, "wb") as handle:
+                handle.write(file_bytes)
                 # Ensure the temp file is fully written before rename: ``with``/close
                 # flushes Python buffers, but ``os.fsync`` asks the OS to commit data
                 # toward durable storage so a crash right after ``replace`` is less
@@ -232,3 +272,8 @@ class BaseLocalCollectionStorage:
                 handle.flush()
                 os.fsync(handle.fileno())
             tmp_path.replace(path)
+            stat_signature = self.get_file_stat_signature(storage_key)
+        return FileFingerprint(
+            stat_signature=stat_signature,
+            checksum=hashlib.sha256(file_bytes).hexdigest(),
+        )
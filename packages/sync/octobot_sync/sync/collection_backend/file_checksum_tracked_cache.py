@@ -32,10 +32,16 @@ S = typing.TypeVar("S", bound=state_model.StateModel)
 class CachedStateEnvelope(typing.Generic[S]):
     state: S
     file_checksum: str
+    file_stat_signature: typing.Optional[base_storage.FileStatSignature] = None
 
 
 class FileChecksumTrackedCache(typing.Generic[CacheKeyT, S]):
-    """TTL cache that invalidates entries when the backing collection file changes."""
+    """
+    TTL cache that invalidates entries when the backing collection file changes.
+
+    Freshness is first checked with the file (inode, size, mtime_ns) signature. The file
+    is only hashed when this signature differs from the cached one.
+    """
 
     def __init__(
         self,
@@ -54,14 +60,27 @@ class FileChecksumTrackedCache(typing.Generic[CacheKeyT, S]):
         envelope = self._cache.get(cache_key)
         if envelope is None:
             return None
+        stat_signature = self._storage.get_file_stat_signature(storage_key)
+        if stat_signature is not None and stat_signature == envelope.file_stat_signature:
+            return envelope.state
         current_checksum = self._storage.get_file_checksum(storage_key)
         if current_checksum != envelope.file_checksum:
             self._cache.pop(cache_key, None)
             return None
+        if stat_signature is not None:
+            # same content: keep the new stat signature to skip hashing on next reads
+            self._cache[cache_key] = dataclasses.replace(envelope, file_stat_signature=stat_signature)
         return envelope.state
 
     def set(self, cache_key: CacheKeyT, storage_key: str, state: S) -> None:
+        self.set_with_fingerprint(cache_key, state, self._storage.get_file_fingerprint(storage_key))
+
+    def set_with_fingerprint(
+        self, cache_key: CacheKeyT, state: S, file_fingerprint: base_storage.FileFingerprint
+    ) -> None:
+        """Write-through path: cache a state using the fingerprint returned when saving it."""
         self._cache[cache_key] = CachedStateEnvelope(
             state=state,
-            file_checksum=self._storage.get_file_checksum(storage_key),
+            file_checksum=file_fingerprint.checksum,
+            file_stat_signature=file_fingerprint.stat_signature,
         )
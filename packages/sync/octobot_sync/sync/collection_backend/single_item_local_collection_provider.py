@@ -67,6 +67,11 @@ class SingleItemLocalCollectionProvider(abstract_provider.AbstractLocalCollectio
         identifier = self._build_identifier(user_id, account_id)
         self._state_cache.set((user_id, account_id), identifier, state)
 
+    def _set_saved_cached_state(
+        self, user_id: str, account_id: str, state: S, file_fingerprint: base_storage.FileFingerprint
+    ) -> None:
+        self._state_cache.set_with_fingerprint((user_id, account_id), state, file_fingerprint)
+
     def load_state(self, user_id: str, account_id: str) -> S:
         cached_state = self._get_cached_state(user_id, account_id)
         if cached_state is not None:
@@ -84,8 +89,8 @@ class SingleItemLocalCollectionProvider(abstract_provider.AbstractLocalCollectio
     def save_state(self, user_id: str, account_id: str, state: S) -> None:
         identifier = self._build_identifier(user_id, account_id)
         wallet_private_key = self._get_wallet_private_key(user_id)
-        self._storage.save_state(identifier, wallet_private_key, state)
-        self._set_cached_state(user_id, account_id, state)
+        file_fingerprint = self._storage.save_state(identifier, wallet_private_key, state)
+        self._set_saved_cached_state(user_id, account_id, state, file_fingerprint)
 
     def load_state_encrypted(self, user_id: str, account_id: str) -> dict[str, str]:
         identifier = self._build_identifier(user_id, account_id)
@@ -28,6 +28,9 @@ _TEST_ADDRESS = "0xaaabbbcccddd"
 _TEST_PRIVATE_KEY = "private-key"
 _CHECKSUM_V1 = "checksum-v1"
 _CHECKSUM_V2 = "checksum-v2"
+_STAT_SIGNATURE_V1 = base_storage_module.FileStatSignature(inode=1, size=100, mtime_ns=1_000)
+_STAT_SIGNATURE_V2 = base_storage_module.FileStatSignature(inode=2, size=100, mtime_ns=2_000)
+_STAT_SIGNATURE_V3 = base_storage_module.FileStatSignature(inode=3, size=120, mtime_ns=3_000)
 
 
 class _TestItem(pydantic.BaseModel):
@@ -77,9 +80,20 @@ _SAMPLE_STATE = _TestState(
 )
 
 
-def _make_storage_mock(*, checksum: str = _CHECKSUM_V1) -> mock.Mock:
+def _make_storage_mock(
+    *,
+    checksum: str = _CHECKSUM_V1,
+    stat_signature: typing.Optional[base_storage_module.FileStatSignature] = None,
+) -> mock.Mock:
     storage = mock.Mock()
     storage.get_file_checksum = mock.Mock(return_value=checksum)
+    storage.get_file_stat_signature = mock.Mock(return_value=stat_signature)
+    storage.get_file_fingerprint = mock.Mock(
+        side_effect=lambda storage_key: base_storage_module.FileFingerprint(
+            stat_signature=storage.get_file_stat_signature(storage_key),
+            checksum=storage.get_file_checksum(storage_key),
+        )
+    )
     return storage
 
 
@@ -149,6 +163,72 @@ class TestFileChecksumTrackedCacheGetIfFresh:
         storage.get_file_checksum.assert_called_once_with(storage_key)
 
 
+class TestFileChecksumTrackedCacheStatSignature:
+    def test_skips_checksum_when_stat_signature_matches(self):
+        storage = _make_storage_mock(checksum=_CHECKSUM_V1, stat_signature=_STAT_SIGNATURE_V1)
+        cache = _make_cache(storage)
+        cache.set(_CACHE_KEY, _STORAGE_KEY, _SAMPLE_STATE)
+        storage.get_file_checksum.reset_mock()
+
+        result = cache.get_if_fresh(_CACHE_KEY, _STORAGE_KEY)
+
+        assert result == _SAMPLE_STATE
+        storage.get_file_stat_signature.assert_called_with(_STORAGE_KEY)
+        storage.get_file_checksum.assert_not_called()
+
+    def test_checks_checksum_when_stat_signature_changes(self):
+        storage = _make_storage_mock(checksum=_CHECKSUM_V1, stat_signature=_STAT_SIGNATURE_V1)
+        cache = _make_cache(storage)
+        cache.set(_CACHE_KEY, _STORAGE_KEY, _SAMPLE_STATE)
+        storage.get_file_checksum.reset_mock()
+        # same content, rewritten file
+        storage.get_file_stat_signature.return_value = _STAT_SIGNATURE_V2
+
+        assert cache.get_if_fresh(_CACHE_KEY, _STORAGE_KEY) == _SAMPLE_STATE
+        storage.get_file_checksum.assert_called_once_with(_STORAGE_KEY)
+
+        # different content
+        storage.get_file_stat_signature.return_value = _STAT_SIGNATURE_V3
+        storage.get_file_checksum.return_value = _CHECKSUM_V2
+        assert cache.get_if_fresh(_CACHE_KEY, _STORAGE_KEY) is None
+        assert _CACHE_KEY not in cache._cache
+
+    def test_keeps_new_stat_signature_when_checksum_matches(self):
+        storage = _make_storage_mock(checksum=_CHECKSUM_V1, stat_signature=_STAT_SIGNATURE_V1)
+        cache = _make_cache(storage)
+        cache.set(_CACHE_KEY, _STORAGE_KEY, _SAMPLE_STATE)
+        storage.get_file_checksum.reset_mock()
+        # same content, touched file
+        storage.get_file_stat_signature.return_value = _STAT_SIGNATURE_V2
+
+        assert cache.get_if_fresh(_CACHE_KEY, _STORAGE_KEY) == _SAMPLE_STATE
+        storage.get_file_checksum.assert_called_once_with(_STORAGE_KEY)
+        assert cache._cache[_CACHE_KEY].file_stat_signature == _STAT_SIGNATURE_V2
+        assert cache._cache[_CACHE_KEY].file_checksum == _CHECKSUM_V1
+        storage.get_file_checksum.reset_mock()
+
+        # the new stat signature is used: the file is not hashed again
+        assert cache.get_if_fresh(_CACHE_KEY, _STORAGE_KEY) == _SAMPLE_STATE
+        storage.get_file_checksum.assert_not_called()
+
+    def test_set_with_fingerprint_does_not_read_storage(self):
+        storage = _make_storage_mock(checksum=_CHECKSUM_V1, stat_signature=_STAT_SIGNATURE_V1)
+        cache = _make_cache(storage)
+
+        cache.set_with_fingerprint(
+            _CACHE_KEY,
+            _SAMPLE_STATE,
+            base_storage_module.FileFingerprint(stat_signature=_STAT_SIGNATURE_V1, checksum=_CHECKSUM_V1),
+        )
+
+        envelope = cache._cache[_CACHE_KEY]
+        assert envelope.file_checksum == _CHECKSUM_V1
+        assert envelope.file_stat_signature == _STAT_SIGNATURE_V1
+        storage.get_file_fingerprint.assert_not_called()
+        assert cache.get_if_fresh(_CACHE_KEY, _STORAGE_KEY) == _SAMPLE_STATE
+        storage.get_file_checksum.assert_not_called()
+
+
 class TestFileChecksumTrackedCacheSet:
     def test_records_current_checksum_from_storage(self):
         storage = _make_storage_mock(checksum=_CHECKSUM_V1)
@@ -197,3 +277,23 @@ class TestFileChecksumTrackedCacheRealStorage:
 
         assert stale_result is None
         assert _CACHE_KEY not in cache._cache
+
+    def test_save_state_fingerprint_matches_written_file(self, tmp_path):
+        storage = _make_real_storage(tmp_path)
+        cache = _make_cache(storage)
+
+        file_fingerprint = storage.save_state(_TEST_ADDRESS, _TEST_PRIVATE_KEY, _SAMPLE_STATE)
+
+        assert file_fingerprint == storage.get_file_fingerprint(_TEST_ADDRESS)
+        cache.set_with_fingerprint(_CACHE_KEY, _SAMPLE_STATE, file_fingerprint)
+        with mock.patch.object(storage, "get_file_checksum", mock.Mock()) as get_file_checksum_mock:
+            assert cache.get_if_fresh(_CACHE_KEY, _TEST_ADDRESS) == _SAMPLE_STATE
+            get_file_checksum_mock.assert_not_called()
+
+        external_state = _TestState(
+            version="1.0.0",
+            items=[_TestItem(id="external", label="From disk")],
+        )
+        storage.save_state(_TEST_ADDRESS, _TEST_PRIVATE_KEY, external_state)
+
+        assert cache.get_if_fresh(_CACHE_KEY, _TEST_ADDRESS) is None
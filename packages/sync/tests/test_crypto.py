@@ -17,6 +17,7 @@
 import base64
 import json
 
+import mock
 import pytest
 
 import octobot_sync.constants as sync_constants
@@ -87,6 +88,81 @@ class TestDecryptBlobDictToBytes:
             sync_crypto.decrypt_blob_dict_to_bytes(blob, _TEST_PRIVATE_KEY, _TEST_COLLECTION)
 
 
+class TestBatchEncryption:
+    def test_round_trip_with_decrypt_blob_dicts_to_bytes(self):
+        plaintexts = [b'{"id":"1"}', b'{"id":"2"}', b'{"id":"2"}']
+        blobs = sync_crypto.encrypt_bytes_batch_to_blob_dicts(plaintexts, _TEST_PRIVATE_KEY, _TEST_COLLECTION)
+        assert len(blobs) == 3
+        # one IV per item
+        assert len({blob[sync_constants.BLOB_IV_KEY] for blob in blobs}) == 3
+        assert sync_crypto.decrypt_blob_dicts_to_bytes(blobs, _TEST_PRIVATE_KEY, _TEST_COLLECTION) == plaintexts
+        # compatible with single item helpers
+        assert sync_crypto.decrypt_blob_dict_to_bytes(blobs[0], _TEST_PRIVATE_KEY, _TEST_COLLECTION) == plaintexts[0]
+        single_blob = sync_crypto.encrypt_bytes_to_blob_dict(plaintexts[1], _TEST_PRIVATE_KEY, _TEST_COLLECTION)
+        assert sync_crypto.decrypt_blob_dicts_to_bytes(
+            [single_blob], _TEST_PRIVATE_KEY, _TEST_COLLECTION
+        ) == [plaintexts[1]]
+
+    def test_empty_batch(self):
+        assert sync_crypto.encrypt_bytes_batch_to_blob_dicts([], _TEST_PRIVATE_KEY, _TEST_COLLECTION) == []
+        assert sync_crypto.decrypt_blob_dicts_to_bytes([], _TEST_PRIVATE_KEY, _TEST_COLLECTION) == []
+
+    def test_wrong_private_key_raises_decrypt_error(self):
+        blobs = sync_crypto.encrypt_bytes_batch_to_blob_dicts([b"{}"], _TEST_PRIVATE_KEY, _TEST_COLLECTION)
+        with pytest.raises(sync_errors.OctobotSyncCryptoDecryptError):
+            sync_crypto.decrypt_blob_dicts_to_bytes(blobs, _OTHER_PRIVATE_KEY, _TEST_COLLECTION)
+
+    def test_empty_private_key_raises_format_error(self):
+        with pytest.raises(sync_errors.OctobotSyncCryptoFormatError):
+            sync_crypto.encrypt_bytes_batch_to_blob_dicts([b"{}"], "", _TEST_COLLECTION)
+
+
+class TestDerivedCollectionKeyCache:
+    def test_resolves_wallet_and_derives_once_per_user_and_collection(self):
+        cache = sync_crypto.DerivedCollectionKeyCache()
+        get_wallet_private_key = mock.Mock(return_value=_TEST_PRIVATE_KEY)
+
+        first_key = cache.get_key("user-1", _TEST_COLLECTION, get_wallet_private_key)
+        second_key = cache.get_key("user-1", _TEST_COLLECTION, get_wallet_private_key)
+
+        assert first_key is second_key
+        get_wallet_private_key.assert_called_once_with("user-1")
+        blob = sync_crypto.encrypt_bytes_with_key(b'{"k":1}', first_key)
+        assert sync_crypto.decrypt_blob_dict_to_bytes(blob, _TEST_PRIVATE_KEY, _TEST_COLLECTION) == b'{"k":1}'
+        assert sync_crypto.decrypt_blob_dict_with_key(blob, second_key) == b'{"k":1}'
+
+        other_collection_key = cache.get_key("user-1", "other-collection", get_wallet_private_key)
+        assert other_collection_key != first_key
+        assert get_wallet_private_key.call_count == 2
+
+    def test_invalidate_user_and_eviction(self):
+        cache = sync_crypto.DerivedCollectionKeyCache(maxsize=2, ttl=60)
+        get_wallet_private_key = mock.Mock(return_value=_TEST_PRIVATE_KEY)
+        cache.get_key("user-1", _TEST_COLLECTION, get_wallet_private_key)
+        cache.get_key("user-2", _TEST_COLLECTION, get_wallet_private_key)
+
+        cache.invalidate_user("user-1")
+        cache.get_key("user-2", _TEST_COLLECTION, get_wallet_private_key)
+        assert get_wallet_private_key.call_count == 2
+        cache.get_key("user-1", _TEST_COLLECTION, get_wallet_private_key)
+        assert get_wallet_private_key.call_count == 3
+
+        # bounded: user-2 is evicted
+        cache.get_key("user-3", _TEST_COLLECTION, get_wallet_private_key)
+        cache.get_key("user-2", _TEST_COLLECTION, get_wallet_private_key)
+        assert get_wallet_private_key.call_count == 5
+
+        cache.clear()
+        cache.get_key("user-3", _TEST_COLLECTION, get_wallet_private_key)
+        assert get_wallet_private_key.call_count == 6
+
+    def test_empty_private_key_is_not_cached(self):
+        cache = sync_crypto.DerivedCollectionKeyCache()
+        with pytest.raises(sync_errors.OctobotSyncCryptoFormatError):
+            cache.get_key("user-1", _TEST_COLLECTION, mock.Mock(return_value=""))
+        assert cache.get_key("user-1", _TEST_COLLECTION, mock.Mock(return_value=_TEST_PRIVATE_KEY))
+
+
 class TestEncryptUtf8JsonToWire:
     def test_round_trip_with_decrypt_wire_to_utf8_json(self):
         plain = '{"ok":true}'
@@ -288,6 +288,69 @@ class TestUserActionsAfterWrite:
             await server._user_actions_after_write(event)
         mock_logger.exception.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_user_actions_executes_batched_actions_in_order(self):
+        plain_bodies = [json.dumps({"id": f"act-{index}"}) for index in range(3)]
+        element = {
+            "items": sync_crypto.encrypt_bytes_batch_to_blob_dicts(
+                [plain_body.encode("utf-8") for plain_body in plain_bodies],
+                _TEST_WALLET_PRIVATE_KEY,
+                enums.Collections.USER_ACTIONS.value,
+            )
+        }
+        event = WriteEvent(
+            collection=enums.Collections.USER_ACTIONS.value,
+            hash="x",
+            timestamp=0,
+            params={"identity": "0xbatchwallet"},
+            body=element,
+        )
+        actions = [mock.MagicMock(id=f"act-{index}") for index in range(3)]
+
+        with (
+            mock.patch("octobot_sync.server.user_actions_protocol") as mock_proto,
+            mock.patch(
+                "octobot_sync.server._get_wallet_private_key",
+                return_value=_TEST_WALLET_PRIVATE_KEY,
+            ) as get_wallet_private_key_mock,
+            mock.patch("octobot_sync.server.protocol_models") as mock_pm,
+        ):
+            mock_pm.UserAction.from_json.side_effect = actions
+            mock_proto.execute_user_action = mock.AsyncMock()
+            await server._user_actions_after_write(event)
+            get_wallet_private_key_mock.assert_called_once_with("0xbatchwallet")
+        assert mock_pm.UserAction.from_json.mock_calls == [mock.call(plain_body) for plain_body in plain_bodies]
+        assert mock_proto.execute_user_action.mock_calls == [
+            mock.call(action, "0xbatchwallet") for action in actions
+        ]
+        server.invalidate_user_collection_keys("0xbatchwallet")
+
+
+class TestInvalidateUserCollectionKeys:
+    def test_invalidated_user_keys_are_derived_again(self):
+        user_actions = enums.Collections.USER_ACTIONS.value
+        with mock.patch(
+            "octobot_sync.server._get_wallet_private_key",
+            return_value=_TEST_WALLET_PRIVATE_KEY,
+        ) as get_wallet_private_key_mock:
+            key = server._get_collection_key("0xinvalidated", user_actions)
+            other_user_key = server._get_collection_key("0xother", user_actions)
+            assert server._get_collection_key("0xinvalidated", user_actions) == key
+            assert get_wallet_private_key_mock.call_count == 2
+
+            server.invalidate_user_collection_keys("0xinvalidated")
+            assert server._get_collection_key("0xinvalidated", user_actions) == key
+            assert get_wallet_private_key_mock.call_count == 3
+            # other users keys are kept
+            assert server._get_collection_key("0xother", user_actions) == other_user_key
+            assert get_wallet_private_key_mock.call_count == 3
+
+            get_wallet_private_key_mock.side_effect = errors.OctobotSyncWalletNotFoundError("removed")
+            server.invalidate_user_collection_keys("0xinvalidated")
+            with pytest.raises(errors.OctobotSyncWalletNotFoundError):
+                server._get_collection_key("0xinvalidated", user_actions)
+        server.invalidate_user_collection_keys("0xother")
+
 
 class TestPutData:
     @pytest.mark.asyncio
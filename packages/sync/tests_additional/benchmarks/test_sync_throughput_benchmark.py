@@ -0,0 +1,144 @@
+#  This file is part of OctoBot Sync (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+
+import json
+import time
+
+import pytest
+from starfish_server.storage.filesystem import FilesystemObjectStore, FilesystemStorageOptions
+
+import octobot_sync.crypto as sync_crypto
+
+USERS_COUNT = 50
+COLLECTIONS = ["user-data", "user-accounts", "user-actions", "debug"]
+ROUNDS = 5
+ITEMS_PER_COLLECTION = 50
+WALLET_PRIVATE_KEYS = {
+    f"user-{index}": f"0x{index:064x}" for index in range(USERS_COUNT)
+}
+PAYLOAD = json.dumps({
+    "version": "1.0.0",
+    "items": [{"id": str(index), "label": f"item {index}", "value": index * 1.5} for index in range(20)],
+})
+
+
+def _get_wallet_private_key(user_id: str) -> str:
+    return WALLET_PRIVATE_KEYS[user_id]
+
+
+def _storage_key(user_id: str, collection: str) -> str:
+    return f"users/{user_id}/{collection}"
+
+
+class _NoStore:
+    """Keeps the last pushed document in memory to measure encryption costs only."""
+
+    def __init__(self):
+        self._documents = {}
+
+    async def put(self, key: str, body: str) -> None:
+        self._documents[key] = body
+
+    async def get_string(self, key: str) -> str:
+        return self._documents[key]
+
+
+async def _push_pull_per_call_derivation(store: FilesystemObjectStore) -> int:
+    operations = 0
+    for _ in range(ROUNDS):
+        for user_id in WALLET_PRIVATE_KEYS:
+            for collection in COLLECTIONS:
+                wire = sync_crypto.encrypt_utf8_json_to_wire(PAYLOAD, _get_wallet_private_key(user_id), collection)
+                await store.put(_storage_key(user_id, collection), wire)
+                pulled = await store.get_string(_storage_key(user_id, collection))
+                assert sync_crypto.decrypt_wire_to_utf8_json(
+                    pulled, _get_wallet_private_key(user_id), collection
+                ) == PAYLOAD
+                operations += 2
+    return operations
+
+
+async def _push_pull_cached_keys(store: FilesystemObjectStore) -> int:
+    keys_cache = sync_crypto.DerivedCollectionKeyCache()
+    operations = 0
+    for _ in range(ROUNDS):
+        for user_id in WALLET_PRIVATE_KEYS:
+            for collection in COLLECTIONS:
+                aes_key = keys_cache.get_key(user_id, collection, _get_wallet_private_key)
+                wire = json.dumps(sync_crypto.encrypt_bytes_with_key(PAYLOAD.encode("utf-8"), aes_key))
+                await store.put(_storage_key(user_id, collection), wire)
+                pulled = await store.get_string(_storage_key(user_id, collection))
+                aes_key = keys_cache.get_key(user_id, collection, _get_wallet_private_key)
+                assert sync_crypto.decrypt_blob_dict_with_key(json.loads(pulled), aes_key).decode("utf-8") == PAYLOAD
+                operations += 2
+    return operations
+
+
+async def _push_pull_items(store: FilesystemObjectStore, batched: bool) -> int:
+    items = [json.dumps({"id": str(index), "payload": PAYLOAD}).encode("utf-8") for index in range(ITEMS_PER_COLLECTION)]
+    operations = 0
+    for user_id in WALLET_PRIVATE_KEYS:
+        wallet_private_key = _get_wallet_private_key(user_id)
+        if batched:
+            blobs = sync_crypto.encrypt_bytes_batch_to_blob_dicts(items, wallet_private_key, "user-actions")
+        else:
+            blobs = [
+                sync_crypto.encrypt_bytes_to_blob_dict(item, wallet_private_key, "user-actions")
+                for item in items
+            ]
+        await store.put(_storage_key(user_id, "user-actions-items"), json.dumps(blobs))
+        pulled_blobs = json.loads(await store.get_string(_storage_key(user_id, "user-actions-items")))
+        if batched:
+            pulled_items = sync_crypto.decrypt_blob_dicts_to_bytes(pulled_blobs, wallet_private_key, "user-actions")
+        else:
+            pulled_items = [
+                sync_crypto.decrypt_blob_dict_to_bytes(blob, wallet_private_key, "user-actions")
+                for blob in pulled_blobs
+            ]
+        assert pulled_items == items
+        operations += 2
+    return operations
+
+
+async def _get_operations_per_second(coroutine) -> float:
+    t0 = time.perf_counter()
+    operations = await coroutine
+    return operations / (time.perf_counter() - t0)
+
+
+@pytest.mark.asyncio
+async def test_sync_pull_push_throughput(tmp_path):
+    # run with: pytest tests_additional/benchmarks -s
+    store = FilesystemObjectStore(FilesystemStorageOptions(base_dir=str(tmp_path)))
+    per_call_derivation = await _get_operations_per_second(_push_pull_per_call_derivation(store))
+    cached_keys = await _get_operations_per_second(_push_pull_cached_keys(store))
+    print(
+        f"pull/push: {round(per_call_derivation)} operations/s with per call key derivation, "
+        f"{round(cached_keys)} operations/s with cached keys (x{round(cached_keys / per_call_derivation, 2)})"
+    )
+    in_memory_per_call_derivation = await _get_operations_per_second(_push_pull_per_call_derivation(_NoStore()))
+    in_memory_cached_keys = await _get_operations_per_second(_push_pull_cached_keys(_NoStore()))
+    print(
+        f"encryption only: {round(in_memory_per_call_derivation)} operations/s with per call key derivation, "
+        f"{round(in_memory_cached_keys)} operations/s with cached keys "
+        f"(x{round(in_memory_cached_keys / in_memory_per_call_derivation, 2)})"
+    )
+    per_item = await _get_operations_per_second(_push_pull_items(store, False))
+    batched = await _get_operations_per_second(_push_pull_items(store, True))
+    print(
+        f"{ITEMS_PER_COLLECTION} items collections pull/push: {round(per_item, 1)} operations/s per item, "
+        f"{round(batched, 1)} operations/s batched (x{round(batched / per_item, 2)})"
+    )
@@ -0,0 +1,108 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import octobot_commons.constants as commons_constants
+import octobot_commons.enums as commons_enums
+
+
+def get_time_frame_seconds(time_frame: commons_enums.TimeFrames) -> int:
+    return commons_enums.TimeFramesMinutes[time_frame] * commons_constants.MINUTE_TO_SECONDS
+
+
+class CandlesResampler:
+    """
+    Aggregates source_time_frame candles into time_frame candles.
+    Candles are given by ascending time chunks, resampled candles are returned once complete.
+    Resampled candles are aligned on the epoch, as exchanges do for time frames up to 1d.
+    """
+
+    def __init__(self, source_time_frame: commons_enums.TimeFrames, time_frame: commons_enums.TimeFrames,
+                 start_time: float = None):
+        """
+        :param source_time_frame: time frame of the given candles
+        :param time_frame: time frame of the resampled candles
+        :param start_time: in seconds, resampled candles opening before start_time are not returned
+        """
+        self.source_time_frame = source_time_frame
+        self.time_frame = time_frame
+        self.start_time = start_time
+        self._source_time_frame_seconds = get_time_frame_seconds(source_time_frame)
+        self._time_frame_seconds = get_time_frame_seconds(time_frame)
+        self._current_candle = None
+        self._last_source_candle_time = None
+
+    @staticmethod
+    def can_resample(source_time_frame: commons_enums.TimeFrames, time_frame: commons_enums.TimeFrames) -> bool:
+        source_minutes = commons_enums.TimeFramesMinutes[source_time_frame]
+        minutes = commons_enums.TimeFramesMinutes[time_frame]
+        # weeks and months are not aligned on the epoch
+        return source_minutes < minutes <= commons_enums.TimeFramesMinutes[commons_enums.TimeFrames.ONE_DAY] \
+            and minutes % source_minutes == 0
+
+    def add_candles(self, candles: list) -> list:
+        """
+        :param candles: source_time_frame candles, sorted by ascending time
+        :return: the resampled candles completed by the given candles
+        """
+        completed_candles = []
+        for candle in candles:
+            candle_time = candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value]
+            open_time = candle_time - candle_time % self._time_frame_seconds
+            if self._current_candle is not None \
+                    and open_time != self._current_candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value]:
+                self._add_current_candle(completed_candles)
+            if self._current_candle is None:
+                self._current_candle = [
+                    open_time,
+                    candle[commons_enums.PriceIndexes.IND_PRICE_OPEN.value],
+                    candle[commons_enums.PriceIndexes.IND_PRICE_HIGH.value],
+                    candle[commons_enums.PriceIndexes.IND_PRICE_LOW.value],
+                    candle[commons_enums.PriceIndexes.IND_PRICE_CLOSE.value],
+                    candle[commons_enums.PriceIndexes.IND_PRICE_VOL.value],
+                ]
+            else:
+                self._current_candle[commons_enums.PriceIndexes.IND_PRICE_HIGH.value] = max(
+                    self._current_candle[commons_enums.PriceIndexes.IND_PRICE_HIGH.value],
+                    candle[commons_enums.PriceIndexes.IND_PRICE_HIGH.value]
+                )
+                self._current_candle[commons_enums.PriceIndexes.IND_PRICE_LOW.value] = min(
+                    self._current_candle[commons_enums.PriceIndexes.IND_PRICE_LOW.value],
+                    candle[commons_enums.PriceIndexes.IND_PRICE_LOW.value]
+                )
+                self._current_candle[commons_enums.PriceIndexes.IND_PRICE_CLOSE.value] = \
+                    candle[commons_enums.PriceIndexes.IND_PRICE_CLOSE.value]
+                self._current_candle[commons_enums.PriceIndexes.IND_PRICE_VOL.value] += \
+                    candle[commons_enums.PriceIndexes.IND_PRICE_VOL.value]
+            self._last_source_candle_time = candle_time
+        return completed_candles
+
+    def flush(self) -> list:
+        """
+        :return: the last resampled candle when its last source candle has been added
+        """
+        completed_candles = []
+        if self._current_candle is not None and (
+            self._last_source_candle_time + self._source_time_frame_seconds
+            == self._current_candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value] + self._time_frame_seconds
+        ):
+            self._add_current_candle(completed_candles)
+        self._current_candle = None
+        return completed_candles
+
+    def _add_current_candle(self, completed_candles: list):
+        if self.start_time is None \
+                or self._current_candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value] >= self.start_time:
+            completed_candles.append(self._current_candle)
+        self._current_candle = None
@@ -20,3 +20,7 @@ from octobot_backtesting.collectors.exchanges.exchange_collector cimport Abstrac
 cdef class ExchangeHistoryDataCollector(AbstractExchangeHistoryCollector):
     cdef public object exchange
     cdef public object exchange_manager
+    cdef public bint concurrent_fetch
+    cdef public bint resample_time_frames
+    cdef public object existing_data_file
+    cdef object _database_lock
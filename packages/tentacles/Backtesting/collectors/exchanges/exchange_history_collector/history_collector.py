@@ -13,17 +13,24 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import asyncio
+import json
 import logging
 import os
+import shutil
 import time
 
 import octobot_backtesting.collectors as collector
+import octobot_backtesting.constants as backtesting_constants
+import octobot_backtesting.data as backtesting_data
 import octobot_backtesting.enums as backtesting_enums
 import octobot_backtesting.errors as errors
 import octobot_commons.constants as commons_constants
 import octobot_commons.enums as commons_enums
+import octobot_commons.symbols as commons_symbols
 import octobot_commons.time_frame_manager as time_frame_manager
 import tentacles.Backtesting.importers.exchanges.generic_exchange_importer as generic_exchange_importer
+import tentacles.Backtesting.collectors.exchanges.exchange_history_collector.candles_resampler as candles_resampler
 
 try:
     import octobot_trading.api as trading_api
@@ -35,17 +42,46 @@ except ImportError:
 
 class ExchangeHistoryDataCollector(collector.AbstractExchangeHistoryCollector):
     IMPORTER = generic_exchange_importer.GenericExchangeDataImporter
+    MAX_CONCURRENT_FETCHES = 10
 
     def __init__(self, config, exchange_name, exchange_type, tentacles_setup_config, symbols, time_frames,
                  use_all_available_timeframes=False,
                  data_format=backtesting_enums.DataFormats.REGULAR_COLLECTOR_DATA,
                  start_timestamp=None,
-                 end_timestamp=None):
+                 end_timestamp=None,
+                 concurrent_fetch=False,
+                 resample_time_frames=False,
+                 existing_data_file=None):
+        """
+        :param concurrent_fetch: when True, symbols and time frames histories are fetched simultaneously,
+        within the exchange rate limit
+        :param resample_time_frames: when True and start_timestamp is set, time frames up to 1d are computed from
+        the smallest collected time frame instead of being fetched from the exchange
+        :param existing_data_file: name of a data file to top up: its symbols and time frames are collected from
+        their last stored candle. The data file is replaced once the collect is complete
+        """
         super().__init__(config, exchange_name, exchange_type, tentacles_setup_config, symbols, time_frames,
                          use_all_available_timeframes, data_format=data_format,
                          start_timestamp=start_timestamp, end_timestamp=end_timestamp)
         self.exchange = None
         self.exchange_manager = None
+        self.concurrent_fetch = concurrent_fetch
+        self.resample_time_frames = resample_time_frames
+        self.existing_data_file = existing_data_file
+        if self.existing_data_file is not None:
+            self.file_name = self.existing_data_file
+            self.set_file_path()
+        self._database_lock = asyncio.Lock()
+
+    async def initialize(self):
+        if self.existing_data_file is not None:
+            if not os.path.isfile(self.file_path):
+                raise errors.DataCollectorError(f"Data file to top up not found: {self.file_path}")
+            # collect into a copy of the existing data file: the data file is replaced when the collect is complete
+            shutil.copyfile(self.file_path, self.temp_file_path)
+        await super().initialize()
+        if self.existing_data_file is not None:
+            await self._load_existing_data_file_content()
 
     async def start(self):
         self.should_stop = False
@@ -69,22 +105,31 @@ class ExchangeHistoryDataCollector(collector.AbstractExchangeHistoryCollector):
             # create description
             await self._create_description()
 
-            self.total_steps = len(self.time_frames) * len(self.symbols)
+            fetched_time_frames = self._get_fetched_time_frames()
+            self.total_steps = len(fetched_time_frames) * len(self.symbols)
             self.in_progress = True
 
             self.logger.info(f"Start collecting history on {self.exchange_name}")
-            for symbol_index, symbol in enumerate(self.symbols):
-                self.logger.info(f"Collecting history for {symbol} {self.time_frames}...")
-                await self.get_ticker_history(self.exchange_name, symbol)
-                await self.get_order_book_history(self.exchange_name, symbol)
-                await self.get_recent_trades_history(self.exchange_name, symbol)
+            if self.concurrent_fetch:
+                await self._collect_concurrently(fetched_time_frames)
+            else:
+                for symbol_index, symbol in enumerate(self.symbols):
+                    self.logger.info(f"Collecting history for {symbol} {self.time_frames}...")
+                    await self.get_ticker_history(self.exchange_name, symbol)
+                    await self.get_order_book_history(self.exchange_name, symbol)
+                    await self.get_recent_trades_history(self.exchange_name, symbol)
 
-                for time_frame_index, time_frame in enumerate(self.time_frames):
-                    self.current_step_index = (symbol_index * len(self.time_frames)) + time_frame_index + 1
-                    self.logger.info(
-                        f"[{time_frame_index}/{len(self.time_frames)}] Collecting {symbol} history on {time_frame}...")
-                    await self.get_ohlcv_history(self.exchange_name, symbol, time_frame)
-                    await self.get_kline_history(self.exchange_name, symbol, time_frame)
+                    for time_frame_index, (time_frame, resampled_time_frames) in enumerate(
+                        fetched_time_frames.items()
+                    ):
+                        self.current_step_index = (symbol_index * len(fetched_time_frames)) + time_frame_index + 1
+                        self.logger.info(
+                            f"[{time_frame_index}/{len(fetched_time_frames)}] Collecting {symbol} history on "
+                            f"{time_frame}...")
+                        await self.get_ohlcv_history(
+                            self.exchange_name, symbol, time_frame, resampled_time_frames=resampled_time_frames
+                        )
+                        await self.get_kline_history(self.exchange_name, symbol, time_frame)
         except Exception as err:
             await self.database.stop()
             should_stop_database = False
@@ -98,6 +143,161 @@ class ExchangeHistoryDataCollector(collector.AbstractExchangeHistoryCollector):
         finally:
             await self.stop(should_stop_database=should_stop_database)
 
+    async def _collect_concurrently(self, fetched_time_frames):
+        # ccxt throttles requests according to the exchange rate limit: don't schedule many more
+        # simultaneous fetches than the number of requests allowed each second
+        rate_limit = self.exchange.get_rate_limit()
+        max_concurrent_fetches = self.MAX_CONCURRENT_FETCHES if not rate_limit \
+            else max(1, min(self.MAX_CONCURRENT_FETCHES, int(1 / rate_limit)))
+        semaphore = asyncio.Semaphore(max_concurrent_fetches)
+        self.logger.info(
+            f"Collecting {len(self.symbols)} symbols history on {len(fetched_time_frames)} time frames using "
+            f"up to {max_concurrent_fetches} simultaneous fetches"
+        )
+
+        async def _collect_symbol_data(symbol):
+            async with semaphore:
+                await self.get_ticker_history(self.exchange_name, symbol)
+                await self.get_order_book_history(self.exchange_name, symbol)
+                await self.get_recent_trades_history(self.exchange_name, symbol)
+
+        async def _collect_time_frame_history(symbol, time_frame, resampled_time_frames):
+            async with semaphore:
+                await self.get_ohlcv_history(
+                    self.exchange_name, symbol, time_frame, resampled_time_frames=resampled_time_frames
+                )
+                await self.get_kline_history(self.exchange_name, symbol, time_frame)
+                self.current_step_index += 1
+                self.current_step_percent = self.current_step_index / self.total_steps * 100
+                self.logger.info(
+                    f"[{self.current_step_index}/{self.total_steps}] Collected {symbol} history on {time_frame}"
+                )
+
+        await asyncio.gather(
+            *(_collect_symbol_data(symbol) for symbol in self.symbols),
+            *(
+                _collect_time_frame_history(symbol, time_frame, resampled_time_frames)
+                for symbol in self.symbols
+                for time_frame, resampled_time_frames in fetched_time_frames.items()
+            )
+        )
+
+    def _get_fetched_time_frames(self) -> dict:
+        """
+        :return: the time frames to fetch from the exchange associated to the time frames to resample from them
+        """
+        if not (self.resample_time_frames and self.start_timestamp is not None and self.time_frames):
+            # without start_timestamp, only the most recent candles are collected: resampling would
+            # return less candles than fetching each time frame
+            return {time_frame: [] for time_frame in self.time_frames}
+        source_time_frame = time_frame_manager.find_min_time_frame(self.time_frames)
+        fetched_time_frames = {source_time_frame: []}
+        for time_frame in self.time_frames:
+            if time_frame is source_time_frame:
+                continue
+            if candles_resampler.CandlesResampler.can_resample(source_time_frame, time_frame):
+                fetched_time_frames[source_time_frame].append(time_frame)
+            else:
+                fetched_time_frames[time_frame] = []
+        return fetched_time_frames
+
+    async def _load_existing_data_file_content(self):
+        description = await backtesting_data.get_database_description(self.database)
+        if description[backtesting_enums.DataFormatKeys.EXCHANGE.value] != self.exchange_name:
+            raise errors.DataCollectorError(
+                f"Impossible to top up {self.existing_data_file} {self.exchange_name} data: this data file "
+                f"contains {description[backtesting_enums.DataFormatKeys.EXCHANGE.value]} data"
+            )
+        # top up every symbol and time frame of the data file
+        symbols = [symbol.symbol_str for symbol in self.symbols]
+        self.symbols = self.symbols + [
+            commons_symbols.parse_symbol(symbol)
+            for symbol in description[backtesting_enums.DataFormatKeys.SYMBOLS.value]
+            if symbol not in symbols
+        ]
+        self.time_frames = time_frame_manager.sort_time_frames(list(set(self.time_frames).union(
+            description[backtesting_enums.DataFormatKeys.TIME_FRAMES.value]
+        )))
+        self.config[commons_constants.CONFIG_TIME_FRAME] = self.time_frames
+        self.config[commons_constants.CONFIG_CRYPTO_CURRENCIES] = {"Symbols": {
+            commons_constants.CONFIG_CRYPTO_PAIRS: [str(symbol) for symbol in self.symbols]}}
+        # description values are stored as text
+        if self.start_timestamp is None \
+                and (start_timestamp := int(description[backtesting_enums.DataFormatKeys.START_TIMESTAMP.value])):
+            self.start_timestamp = start_timestamp * 1000
+
+    async def _create_description(self):
+        if self.existing_data_file is None:
+            return await super()._create_description()
+        # top up: update the data file description instead of adding a second one
+        description = await backtesting_data.get_database_description(self.database)
+        start_timestamp = int(self.start_timestamp / 1000) if self.start_timestamp else 0
+        if stored_start_timestamp := int(description[backtesting_enums.DataFormatKeys.START_TIMESTAMP.value]):
+            start_timestamp = min(start_timestamp or stored_start_timestamp, stored_start_timestamp)
+        await self.database.update(
+            backtesting_enums.DataTables.DESCRIPTION,
+            {
+                "version": backtesting_constants.CURRENT_VERSION,
+                "symbols": json.dumps([symbol.symbol_str for symbol in self.symbols]),
+                "time_frames": json.dumps([tf.value for tf in self.time_frames]),
+                "start_timestamp": start_timestamp,
+                "end_timestamp": int(self.end_timestamp / 1000) if self.end_timestamp
+                else int(time.time()) if start_timestamp else 0,
+            },
+            exchange=self.exchange_name
+        )
+
+    async def _remove_last_stored_candle(self, symbol, time_frame):
+        """
+        Removes the last stored candle which might have been stored before being closed
+        :return: the removed candle open time in seconds, None when no candle is stored
+        """
+        if self.existing_data_file is None \
+                or backtesting_enums.ExchangeDataTables.OHLCV.value not in self.database.tables:
+            return None
+        async with self._database_lock:
+            max_timestamp = (await self.database.select_max(
+                backtesting_enums.ExchangeDataTables.OHLCV, ["timestamp"],
+                symbol=symbol.symbol_str, time_frame=time_frame.value
+            ))[0][0]
+            if max_timestamp is None:
+                return None
+            async with self.database.transaction():
+                await self.database.delete(
+                    backtesting_enums.ExchangeDataTables.OHLCV,
+                    symbol=symbol.symbol_str, time_frame=time_frame.value, timestamp=max_timestamp
+                )
+        # stored timestamp is the candle close time
+        return float(max_timestamp) - candles_resampler.get_time_frame_seconds(time_frame)
+
+    async def _get_collect_start_time(self, symbol, time_frame, is_fetched):
+        """
+        :return: the time to collect candles from in milliseconds, None to collect the most recent candles
+        """
+        if (last_stored_candle_open_time := await self._remove_last_stored_candle(symbol, time_frame)) is not None:
+            # top up: collect again the last stored candle as it might have been partial
+            return last_stored_candle_open_time * 1000
+        if self.start_timestamp is None or not is_fetched:
+            return self.start_timestamp
+        first_candle_timestamp = await self.get_first_candle_timestamp(
+            self.start_timestamp, symbol, time_frame
+        ) * 1000
+        return max(self.start_timestamp, first_candle_timestamp)
+
+    async def _save_candles(self, exchange, cryptocurrency, symbol, time_frame, candles):
+        if not candles:
+            return
+        # use time_frame_sec to add time to save the candle closing time
+        time_frame_sec = candles_resampler.get_time_frame_seconds(time_frame)
+        async with self._database_lock:
+            await self.save_ohlcv(
+                exchange=exchange,
+                cryptocurrency=cryptocurrency,
+                symbol=symbol.symbol_str, time_frame=time_frame, candle=candles,
+                timestamp=[candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value] + time_frame_sec
+                           for candle in candles],
+                multiple=True)
+
     def _load_all_available_timeframes(self):
         allowed_timeframes = set(tf.value for tf in commons_enums.TimeFrames)
         self.time_frames = [commons_enums.TimeFrames(time_frame)
@@ -125,42 +325,54 @@ class ExchangeHistoryDataCollector(collector.AbstractExchangeHistoryCollector):
     async def get_recent_trades_history(self, exchange, symbol):
         pass
 
-    async def get_ohlcv_history(self, exchange, symbol, time_frame):
-        self.current_step_percent = 0
-        # use time_frame_sec to add time to save the candle closing time
-        time_frame_sec = commons_enums.TimeFramesMinutes[time_frame] * commons_constants.MINUTE_TO_SECONDS
+    async def get_ohlcv_history(self, exchange, symbol, time_frame, resampled_time_frames=None):
+        if not self.concurrent_fetch:
+            # when fetching concurrently, progress is updated for each collected time frame
+            self.current_step_percent = 0
+        resampled_time_frames = resampled_time_frames or []
         symbol_id = str(symbol)
         cryptocurrency = self.exchange_manager.exchange.get_pair_cryptocurrency(symbol_id)
-        if self.start_timestamp is not None:
-            start_time = self.start_timestamp
+        # candles before fetched_start_time are only used to compute resampled candles
+        fetched_start_time = start_time = await self._get_collect_start_time(symbol, time_frame, True)
+        if start_time is not None:
+            resamplers = []
+            for resampled_time_frame in resampled_time_frames:
+                resampled_start_time = await self._get_collect_start_time(symbol, resampled_time_frame, False)
+                resamplers.append(candles_resampler.CandlesResampler(
+                    time_frame, resampled_time_frame, start_time=resampled_start_time / 1000
+                ))
+                # fetch source candles of every resampled candle to collect
+                start_time = min(start_time, resampled_start_time)
             end_time = self.end_timestamp or time.time() * 1000
-            first_candle_timestamp = await self.get_first_candle_timestamp(
-                self.start_timestamp, symbol, time_frame
-            ) * 1000
-            if self.start_timestamp < first_candle_timestamp:
-                start_time = first_candle_timestamp
             async for hist_candles in trading_api.get_historical_ohlcv(self.exchange_manager, symbol_id, time_frame,
                                                                        start_time, end_time):
                 if hist_candles:
-                    self.current_step_percent = \
-                        (hist_candles[-1][commons_enums.PriceIndexes.IND_PRICE_TIME.value] - start_time / 1000) / \
-                        ((end_time - start_time) / 1000) * 100
+                    if not self.concurrent_fetch:
+                        self.current_step_percent = \
+                            (hist_candles[-1][commons_enums.PriceIndexes.IND_PRICE_TIME.value] - start_time / 1000) / \
+                            ((end_time - start_time) / 1000) * 100
                     self.logger.info(f"[{self.current_step_percent}%] historical data fetched for {symbol} {time_frame}")
-                    await self.save_ohlcv(
-                        exchange=exchange,
-                        cryptocurrency=cryptocurrency,
-                        symbol=symbol.symbol_str, time_frame=time_frame, candle=hist_candles,
-                        timestamp=[candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value] + time_frame_sec
-                                   for candle in hist_candles],
-                        multiple=True)
+                    await self._save_candles(
+                        exchange, cryptocurrency, symbol, time_frame,
+                        [
+                            candle
+                            for candle in hist_candles
+                            if candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value] * 1000 >= fetched_start_time
+                        ]
+                    )
+                    for resampler in resamplers:
+                        await self._save_candles(
+                            exchange, cryptocurrency, symbol, resampler.time_frame, resampler.add_candles(hist_candles)
+                        )
+            for resampler in resamplers:
+                await self._save_candles(
+                    exchange, cryptocurrency, symbol, resampler.time_frame, resampler.flush()
+                )
         else:
             try:
                 candles = await self.exchange.get_symbol_prices(symbol_id, time_frame)
                 if candles:
-                    await self.save_ohlcv(exchange=exchange,
-                                          cryptocurrency=cryptocurrency,
-                                          symbol=symbol.symbol_str, time_frame=time_frame, candle=candles,
-                                          timestamp=[candle[0] + time_frame_sec for candle in candles], multiple=True)
+                    await self._save_candles(exchange, cryptocurrency, symbol, time_frame, candles)
                 else:
                     self.logger.error(f"No candles for {symbol} on {time_frame} ({exchange})")
             except trading_errors.FailedRequest as err:
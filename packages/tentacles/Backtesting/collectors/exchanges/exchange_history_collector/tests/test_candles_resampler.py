@@ -0,0 +1,68 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import octobot_commons.enums as commons_enums
+import tentacles.Backtesting.collectors.exchanges.exchange_history_collector.candles_resampler as candles_resampler
+
+
+def _candles(start_time, count, time_frame_seconds=60):
+    # [time, open, high, low, close, volume]
+    return [
+        [start_time + index * time_frame_seconds, index, index + 10, index - 10, index + 1, 2]
+        for index in range(count)
+    ]
+
+
+def test_can_resample():
+    assert candles_resampler.CandlesResampler.can_resample(commons_enums.TimeFrames.ONE_MINUTE,
+                                                           commons_enums.TimeFrames.FIVE_MINUTES)
+    assert candles_resampler.CandlesResampler.can_resample(commons_enums.TimeFrames.ONE_HOUR,
+                                                           commons_enums.TimeFrames.ONE_DAY)
+    assert not candles_resampler.CandlesResampler.can_resample(commons_enums.TimeFrames.ONE_MINUTE,
+                                                               commons_enums.TimeFrames.ONE_MINUTE)
+    assert not candles_resampler.CandlesResampler.can_resample(commons_enums.TimeFrames.FIVE_MINUTES,
+                                                               commons_enums.TimeFrames.ONE_MINUTE)
+    assert not candles_resampler.CandlesResampler.can_resample(commons_enums.TimeFrames.FIVE_MINUTES,
+                                                               commons_enums.TimeFrames.THREE_MINUTES)
+    assert not candles_resampler.CandlesResampler.can_resample(commons_enums.TimeFrames.ONE_DAY,
+                                                               commons_enums.TimeFrames.ONE_WEEK)
+
+
+def test_add_candles():
+    resampler = candles_resampler.CandlesResampler(commons_enums.TimeFrames.ONE_MINUTE,
+                                                   commons_enums.TimeFrames.FIVE_MINUTES)
+    # starts in the middle of a 5m candle: 12:03
+    candles = _candles(43380, 13)
+    # first partial candle is returned as exchanges do
+    assert resampler.add_candles(candles[:4]) == [[43200, 0, 11, -10, 2, 4]]
+    assert resampler.add_candles(candles[4:]) == [[43500, 2, 16, -8, 7, 10], [43800, 7, 21, -3, 12, 10]]
+    # 12:16 to 12:19 candles are missing: last 5m candle is not complete
+    assert resampler.flush() == []
+
+
+def test_flush():
+    resampler = candles_resampler.CandlesResampler(commons_enums.TimeFrames.ONE_MINUTE,
+                                                   commons_enums.TimeFrames.FIVE_MINUTES)
+    assert resampler.add_candles(_candles(43200, 10)) == [[43200, 0, 14, -10, 5, 10]]
+    assert resampler.flush() == [[43500, 5, 19, -5, 10, 10]]
+    assert resampler.flush() == []
+
+
+def test_start_time():
+    resampler = candles_resampler.CandlesResampler(commons_enums.TimeFrames.ONE_MINUTE,
+                                                   commons_enums.TimeFrames.FIVE_MINUTES,
+                                                   start_time=43500)
+    assert resampler.add_candles(_candles(43200, 10)) == []
+    assert resampler.flush() == [[43500, 5, 19, -5, 10, 10]]
@@ -0,0 +1,232 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import contextlib
+import json
+import os
+
+import mock
+import pytest
+
+import octobot_commons.databases as databases
+import octobot_commons.enums as commons_enums
+import octobot_commons.symbols as commons_symbols
+import octobot_backtesting.enums as enums
+import octobot_backtesting.errors as errors
+import octobot_trading.enums as trading_enums
+import tests.test_utils.config as test_utils_config
+import tentacles.Backtesting.collectors.exchanges.exchange_history_collector.history_collector as history_collector
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+EXCHANGE_NAME = "binanceus"
+SYMBOL = "BTC/USDT"
+TIME_FRAME = commons_enums.TimeFrames.ONE_HOUR
+HOUR_SECONDS = 3600
+START_TIME = 1699999200
+
+
+def _candles(start_time, count, close_price=10):
+    return [
+        [start_time + HOUR_SECONDS * index, 10, 12, 9, close_price, 100]
+        for index in range(count)
+    ]
+
+
+def _get_collector(symbols, time_frames, **kwargs):
+    return history_collector.ExchangeHistoryDataCollector(
+        {}, EXCHANGE_NAME, trading_enums.ExchangeTypes.SPOT, test_utils_config.load_test_tentacles_config(),
+        [commons_symbols.parse_symbol(symbol) for symbol in symbols], time_frames, **kwargs
+    )
+
+
+def _get_exchange_manager(rate_limit=None):
+    exchange = mock.Mock(
+        get_pair_cryptocurrency=mock.Mock(return_value="BTC"),
+        get_rate_limit=mock.Mock(return_value=rate_limit),
+    )
+    return mock.Mock(exchange=exchange, stop=mock.AsyncMock())
+
+
+def _get_exchange_builder(exchange_manager):
+    builder = mock.Mock(build=mock.AsyncMock(return_value=exchange_manager))
+    for method in ("is_simulated", "is_rest_only", "is_exchange_only", "is_future", "disable_trading_mode",
+                   "use_tentacles_setup_config"):
+        getattr(builder, method).return_value = builder
+    return builder
+
+
+@contextlib.contextmanager
+def _mocked_exchange(collected_candles, historical_ohlcv_calls, error=None):
+    async def _get_historical_ohlcv(exchange_manager, symbol, time_frame, start_time, end_time):
+        historical_ohlcv_calls.append((symbol, time_frame, start_time))
+        if error is not None:
+            raise error
+        yield collected_candles
+
+    async def _get_first_candle_timestamp(ideal_start_timestamp, symbol, time_frame):
+        return ideal_start_timestamp / 1000
+
+    with mock.patch.object(history_collector.trading_api, "create_exchange_builder",
+                           mock.Mock(return_value=_get_exchange_builder(_get_exchange_manager()))), \
+         mock.patch.object(history_collector.trading_api, "get_historical_ohlcv", _get_historical_ohlcv), \
+         mock.patch.object(history_collector.ExchangeHistoryDataCollector, "get_first_candle_timestamp",
+                           mock.AsyncMock(side_effect=_get_first_candle_timestamp)):
+        yield
+
+
+@contextlib.asynccontextmanager
+async def _data_file():
+    collector = _get_collector(
+        [SYMBOL], [TIME_FRAME], start_timestamp=START_TIME * 1000,
+        end_timestamp=(START_TIME + 3 * HOUR_SECONDS) * 1000
+    )
+    try:
+        await collector.initialize()
+        with _mocked_exchange(_candles(START_TIME, 3), []):
+            await collector.start()
+        yield collector.file_name
+    finally:
+        for path in (collector.file_path, collector.temp_file_path):
+            if path and os.path.isfile(path):
+                os.remove(path)
+
+
+async def _get_table_content(file_path, table):
+    database = databases.SQLiteDatabase(file_path)
+    try:
+        await database.initialize()
+        return await database.select(table)
+    finally:
+        await database.stop()
+
+
+async def _get_stored_candles(file_path):
+    return sorted(
+        json.loads(row[-1])
+        for row in await _get_table_content(file_path, enums.ExchangeDataTables.OHLCV)
+    )
+
+
+async def test_top_up_collects_again_last_stored_candle():
+    async with _data_file() as file_name:
+        collector = _get_collector([], [], existing_data_file=file_name)
+        await collector.initialize()
+        assert collector.symbols == [commons_symbols.parse_symbol(SYMBOL)]
+        assert collector.time_frames == [TIME_FRAME]
+        assert collector.start_timestamp == START_TIME * 1000
+        last_candle_open_time = START_TIME + 2 * HOUR_SECONDS
+        historical_ohlcv_calls = []
+        # the last stored candle was partial, it is now closed at 11 and a new candle is available
+        with _mocked_exchange(_candles(last_candle_open_time, 2, close_price=11), historical_ohlcv_calls):
+            await collector.start()
+        # collect from the last stored candle open time
+        assert historical_ohlcv_calls == [(SYMBOL, TIME_FRAME, last_candle_open_time * 1000)]
+        assert not os.path.isfile(collector.temp_file_path)
+        # the last stored candle is replaced and no candle is duplicated
+        assert await _get_stored_candles(collector.file_path) == \
+            _candles(START_TIME, 2) + _candles(last_candle_open_time, 2, close_price=11)
+        ohlcv_rows = await _get_table_content(collector.file_path, enums.ExchangeDataTables.OHLCV)
+        assert sorted(row[0] for row in ohlcv_rows) == [
+            START_TIME + HOUR_SECONDS * (index + 1)
+            for index in range(4)
+        ]
+        # the description is updated
+        descriptions = await _get_table_content(collector.file_path, enums.DataTables.DESCRIPTION)
+        assert len(descriptions) == 1
+        database = databases.SQLiteDatabase(collector.file_path)
+        try:
+            await database.initialize()
+            description = await history_collector.backtesting_data.get_database_description(database)
+        finally:
+            await database.stop()
+        assert description[enums.DataFormatKeys.SYMBOLS.value] == [SYMBOL]
+        assert description[enums.DataFormatKeys.TIME_FRAMES.value] == [TIME_FRAME]
+        assert int(description[enums.DataFormatKeys.START_TIMESTAMP.value]) == START_TIME
+        assert int(description[enums.DataFormatKeys.END_TIMESTAMP.value]) > START_TIME + 3 * HOUR_SECONDS
+
+
+async def test_top_up_keeps_data_file_on_error():
+    async with _data_file() as file_name:
+        collector = _get_collector([], [], existing_data_file=file_name)
+        with open(collector.file_path, "rb") as data_file:
+            origin_content = data_file.read()
+        await collector.initialize()
+        with _mocked_exchange([], [], error=ZeroDivisionError()):
+            with pytest.raises(errors.DataCollectorError):
+                await collector.start()
+        assert not os.path.isfile(collector.temp_file_path)
+        with open(collector.file_path, "rb") as data_file:
+            assert data_file.read() == origin_content
+        assert await _get_stored_candles(collector.file_path) == _candles(START_TIME, 3)
+
+
+async def test_top_up_missing_data_file():
+    collector = _get_collector([], [], existing_data_file="missing_file.data")
+    with pytest.raises(errors.DataCollectorError):
+        await collector.initialize()
+    assert not os.path.isfile(collector.temp_file_path)
+
+
+async def test_collect_concurrently_within_rate_limit():
+    symbols = [SYMBOL, "ETH/USDT", "ETH/BTC"]
+    time_frames = [commons_enums.TimeFrames.ONE_HOUR, commons_enums.TimeFrames.ONE_DAY]
+    collector = _get_collector(symbols, time_frames, concurrent_fetch=True)
+    collector.exchange = _get_exchange_manager(rate_limit=0.5).exchange
+    collector.total_steps = len(symbols) * len(time_frames)
+    collected = []
+    running_fetches = []
+    max_running_fetches = []
+
+    async def _get_ohlcv_history(exchange, symbol, time_frame, resampled_time_frames=None):
+        running_fetches.append(symbol)
+        max_running_fetches.append(len(running_fetches))
+        await asyncio.sleep(0.01)
+        collected.append((str(symbol), time_frame.value))
+        running_fetches.remove(symbol)
+
+    with mock.patch.object(collector, "get_ohlcv_history", mock.AsyncMock(side_effect=_get_ohlcv_history)):
+        await collector._collect_concurrently({time_frame: [] for time_frame in time_frames})
+    # a 0.5 second rate limit allows 2 requests per second
+    assert max(max_running_fetches) == 2
+    assert sorted(collected) == sorted(
+        (symbol, time_frame.value)
+        for symbol in symbols
+        for time_frame in time_frames
+    )
+    assert collector.current_step_index == collector.total_steps
+    assert collector.current_step_percent == 100
+
+
+async def test_get_ohlcv_history_keeps_concurrent_progress():
+    collector = _get_collector([SYMBOL], [TIME_FRAME], concurrent_fetch=True, start_timestamp=START_TIME * 1000,
+                               end_timestamp=(START_TIME + 3 * HOUR_SECONDS) * 1000)
+    try:
+        await collector.initialize()
+        collector.exchange_manager = _get_exchange_manager()
+        collector.current_step_percent = 50
+        with _mocked_exchange(_candles(START_TIME, 3), []):
+            await collector.get_ohlcv_history(EXCHANGE_NAME, commons_symbols.parse_symbol(SYMBOL), TIME_FRAME)
+        # progress is updated by the concurrent scheduler only
+        assert collector.current_step_percent == 50
+        collector.exchange_manager = None
+        await collector.stop()
+        assert await _get_stored_candles(collector.file_path) == _candles(START_TIME, 3)
+    finally:
+        for path in (collector.file_path, collector.temp_file_path):
+            if path and os.path.isfile(path):
+                os.remove(path)
@@ -32,6 +32,7 @@ class RSIMomentumEvaluator(evaluators.TAEvaluator):
     TREND_CHANGE_IDENTIFIER = "trend_change_identifier"
     LONG_THRESHOLD = "long_threshold"
     SHORT_THRESHOLD = "short_threshold"
+    INCREMENTAL_COMPUTATION = "incremental_computation"
 
     def __init__(self, tentacles_setup_config):
         super().__init__(tentacles_setup_config)
@@ -40,8 +41,11 @@ class RSIMomentumEvaluator(evaluators.TAEvaluator):
         self.short_threshold = 70
         self.long_threshold = 30
         self.is_trend_change_identifier = True
+        self.use_incremental_computation = False
         self.short_term_averages = [7, 5, 4, 3, 2, 1]
         self.long_term_averages = [40, 30, 20, 15, 10]
+        # (exchange_id, symbol, time_frame) -> IncrementalCandlesIndicator
+        self.incremental_rsi_by_candles = {}
 
     def init_user_inputs(self, inputs: dict) -> None:
         """
@@ -80,30 +84,59 @@ class RSIMomentumEvaluator(evaluators.TAEvaluator):
                 }
             }
         )
+        self.use_incremental_computation = self.UI.user_input(
+            self.INCREMENTAL_COMPUTATION, enums.UserInputTypes.BOOLEAN,
+            default_config["incremental_computation"], inputs,
+            title="Incremental computation: update RSI values one candle at a time instead of recomputing them "
+                  "from every candle. RSI values then also depend on candles older than the available history.",
+        )
 
     @classmethod
     def get_default_config(
         cls, period_length: typing.Optional[float] = None, trend_change_identifier: typing.Optional[bool] = None,
-        short_threshold: typing.Optional[float] = None, long_threshold: typing.Optional[float] = None
+        short_threshold: typing.Optional[float] = None, long_threshold: typing.Optional[float] = None,
+        incremental_computation: typing.Optional[bool] = None
     ):
         return {
             cls.PERIOD_LENGTH: period_length or 14,
             cls.TREND_CHANGE_IDENTIFIER: True if trend_change_identifier is None else trend_change_identifier,
             cls.SHORT_THRESHOLD: short_threshold or 70,
             cls.LONG_THRESHOLD: long_threshold or 30,
+            cls.INCREMENTAL_COMPUTATION: incremental_computation or False,
         }
 
     async def ohlcv_callback(self, exchange: str, exchange_id: str,
                              cryptocurrency: str, symbol: str, time_frame, candle, inc_in_construction_data):
-        candle_data = trading_api.get_symbol_close_candles(self.get_exchange_symbol_data(exchange, exchange_id, symbol),
+        symbol_data = self.get_exchange_symbol_data(exchange, exchange_id, symbol)
+        candle_data = trading_api.get_symbol_close_candles(symbol_data,
                                                            time_frame,
                                                            include_in_construction=inc_in_construction_data)
-        await self.evaluate(cryptocurrency, symbol, time_frame, candle_data, candle)
-
-    async def evaluate(self, cryptocurrency, symbol, time_frame, candle_data, candle):
+        rsi_v = None
+        if self.use_incremental_computation and candle_data is not None and len(candle_data) > self.period_length:
+            time_data = trading_api.get_symbol_time_candles(symbol_data, time_frame,
+                                                            include_in_construction=inc_in_construction_data)
+            rsi_v = self._get_incremental_rsi(exchange_id, symbol, time_frame).get_values(time_data, candle_data)
+        await self.evaluate(cryptocurrency, symbol, time_frame, candle_data, candle, rsi_v=rsi_v)
+
+    def _get_incremental_rsi(self, exchange_id, symbol, time_frame):
+        key = (exchange_id, symbol, time_frame)
+        try:
+            return self.incremental_rsi_by_candles[key]
+        except KeyError:
+            history_size = max(self.long_term_averages)
+            self.incremental_rsi_by_candles[key] = EvaluatorUtil.IncrementalCandlesIndicator(
+                lambda: EvaluatorUtil.IncrementalRSI(self.period_length, history_size=history_size)
+            )
+            return self.incremental_rsi_by_candles[key]
+
+    async def evaluate(self, cryptocurrency, symbol, time_frame, candle_data, candle, rsi_v=None):
+        """
+        :param rsi_v: already computed RSI values, computed from candle_data when None
+        """
         updated_value = False
         if candle_data is not None and len(candle_data) > self.period_length:
-            rsi_v = tulipy.rsi(candle_data, period=self.period_length)
+            if rsi_v is None:
+                rsi_v = tulipy.rsi(candle_data, period=self.period_length)
             if len(rsi_v) and not math.isnan(rsi_v[-1]):
                 if self.is_trend_change_identifier:
                     long_trend = EvaluatorUtil.TrendAnalysis.get_trend(rsi_v, self.long_term_averages)
@@ -464,15 +497,25 @@ class EMAMomentumEvaluator(evaluators.TAEvaluator):
 
 # ADX --> trend_strength
 class ADXMomentumEvaluator(evaluators.TAEvaluator):
+    INSTANT_EMA_PERIOD_LENGTH = 2
+    SLOW_EMA_PERIOD_LENGTH = 20
 
     def __init__(self, tentacles_setup_config):
         super().__init__(tentacles_setup_config)
         self.period_length = 14
+        self.use_incremental_computation = False
+        # (exchange_id, symbol, time_frame) -> (adx, instant ema, slow ema) IncrementalCandlesIndicator
+        self.incremental_indicators_by_candles = {}
 
     def init_user_inputs(self, inputs: dict) -> None:
         self.period_length = self.UI.user_input("period_length", enums.UserInputTypes.INT, self.period_length,
                                                 inputs, min_val=1,
                                                 title="Period: ADX period length.")
+        self.use_incremental_computation = self.UI.user_input(
+            "incremental_computation", enums.UserInputTypes.BOOLEAN, self.use_incremental_computation, inputs,
+            title="Incremental computation: update ADX and EMA values one candle at a time instead of recomputing "
+                  "them from every candle. Values then also depend on candles older than the available history.",
+        )
 
     def _get_minimal_data(self):
         # 26 minimal_data length required for 14 period_length
@@ -491,22 +534,62 @@ class ADXMomentumEvaluator(evaluators.TAEvaluator):
                                                                include_in_construction=inc_in_construction_data)
             low_candles = trading_api.get_symbol_low_candles(symbol_candles, time_frame,
                                                              include_in_construction=inc_in_construction_data)
-            await self.evaluate(cryptocurrency, symbol, time_frame, close_candles, high_candles, low_candles, candle)
+            adx = instant_ema = slow_ema = None
+            if self.use_incremental_computation:
+                time_candles = trading_api.get_symbol_time_candles(symbol_candles, time_frame,
+                                                                   include_in_construction=inc_in_construction_data)
+                adx_indicator, instant_ema_indicator, slow_ema_indicator = \
+                    self._get_incremental_indicators(exchange_id, symbol, time_frame)
+                adx = adx_indicator.get_values(time_candles, high_candles, low_candles, close_candles)
+                instant_ema = instant_ema_indicator.get_values(time_candles, close_candles)
+                slow_ema = slow_ema_indicator.get_values(time_candles, close_candles)
+            await self.evaluate(cryptocurrency, symbol, time_frame, close_candles, high_candles, low_candles, candle,
+                                adx=adx, instant_ema=instant_ema, slow_ema=slow_ema)
         else:
             self.eval_note = commons_constants.START_PENDING_EVAL_NOTE
             await self.evaluation_completed(cryptocurrency, symbol, time_frame,
                                             eval_time=evaluators_util.get_eval_time(full_candle=candle,
                                                                                     time_frame=time_frame))
 
-    async def evaluate(self, cryptocurrency, symbol, time_frame, close_candles, high_candles, low_candles, candle):
+    def _get_incremental_indicators(self, exchange_id, symbol, time_frame):
+        key = (exchange_id, symbol, time_frame)
+        try:
+            return self.incremental_indicators_by_candles[key]
+        except KeyError:
+            # only the last ema values are used
+            self.incremental_indicators_by_candles[key] = (
+                EvaluatorUtil.IncrementalCandlesIndicator(
+                    lambda: EvaluatorUtil.IncrementalADX(self.period_length)
+                ),
+                EvaluatorUtil.IncrementalCandlesIndicator(
+                    lambda: EvaluatorUtil.IncrementalEMA(self.INSTANT_EMA_PERIOD_LENGTH, history_size=1)
+                ),
+                EvaluatorUtil.IncrementalCandlesIndicator(
+                    lambda: EvaluatorUtil.IncrementalEMA(self.SLOW_EMA_PERIOD_LENGTH, history_size=1)
+                ),
+            )
+            return self.incremental_indicators_by_candles[key]
+
+    async def evaluate(self, cryptocurrency, symbol, time_frame, close_candles, high_candles, low_candles, candle,
+                       adx=None, instant_ema=None, slow_ema=None):
+        """
+        :param adx: already computed ADX values, computed from candles when None
+        :param instant_ema: already computed instant EMA values, computed from close_candles when None
+        :param slow_ema: already computed slow EMA values, computed from close_candles when None
+        """
         self.eval_note = commons_constants.START_PENDING_EVAL_NOTE
         if len(close_candles) >= self._get_minimal_data():
             min_adx = 7.5
             max_adx = 45
             neutral_adx = 25
-            adx = tulipy.adx(high_candles, low_candles, close_candles, self.period_length)
-            instant_ema = data_util.drop_nan(tulipy.ema(close_candles, 2))
-            slow_ema = data_util.drop_nan(tulipy.ema(close_candles, 20))
+            if adx is None:
+                adx = tulipy.adx(high_candles, low_candles, close_candles, self.period_length)
+            if instant_ema is None:
+                instant_ema = tulipy.ema(close_candles, self.INSTANT_EMA_PERIOD_LENGTH)
+            if slow_ema is None:
+                slow_ema = tulipy.ema(close_candles, self.SLOW_EMA_PERIOD_LENGTH)
+            instant_ema = data_util.drop_nan(instant_ema)
+            slow_ema = data_util.drop_nan(slow_ema)
             adx = data_util.drop_nan(adx)
 
             if len(adx):
@@ -553,6 +636,9 @@ class MACDMomentumEvaluator(evaluators.TAEvaluator):
         self.long_period_length = 26
         self.short_period_length = 12
         self.signal_period_length = 9
+        self.use_incremental_computation = False
+        # (exchange_id, symbol, time_frame) -> IncrementalCandlesIndicator
+        self.incremental_macd_by_candles = {}
 
     def init_user_inputs(self, inputs: dict) -> None:
         self.short_period_length = self.UI.user_input(
@@ -567,6 +653,11 @@ class MACDMomentumEvaluator(evaluators.TAEvaluator):
             "signal_period_length", enums.UserInputTypes.INT, self.signal_period_length, inputs,
             min_val=1, title="MACD signal period."
         )
+        self.use_incremental_computation = self.UI.user_input(
+            "incremental_computation", enums.UserInputTypes.BOOLEAN, self.use_incremental_computation, inputs,
+            title="Incremental computation: update MACD values one candle at a time instead of recomputing them "
+                  "from every candle. MACD values then also depend on candles older than the available history.",
+        )
 
     def _analyse_pattern(self, pattern, macd_hist, zero_crossing_indexes, price_weight,
                          pattern_move_time, sign_multiplier):
@@ -605,16 +696,40 @@ class MACDMomentumEvaluator(evaluators.TAEvaluator):
 
     async def ohlcv_callback(self, exchange: str, exchange_id: str,
                              cryptocurrency: str, symbol: str, time_frame, candle, inc_in_construction_data):
-        candle_data = trading_api.get_symbol_close_candles(self.get_exchange_symbol_data(exchange, exchange_id, symbol),
+        symbol_data = self.get_exchange_symbol_data(exchange, exchange_id, symbol)
+        candle_data = trading_api.get_symbol_close_candles(symbol_data,
                                                            time_frame,
                                                            include_in_construction=inc_in_construction_data)
-        await self.evaluate(cryptocurrency, symbol, time_frame, candle_data, candle)
-
-    async def evaluate(self, cryptocurrency, symbol, time_frame, candle_data, candle):
+        macd_hist = None
+        if self.use_incremental_computation and len(candle_data) > self.long_period_length:
+            time_data = trading_api.get_symbol_time_candles(symbol_data, time_frame,
+                                                            include_in_construction=inc_in_construction_data)
+            _, _, macd_hist = self._get_incremental_macd(exchange_id, symbol, time_frame).get_values(
+                time_data, candle_data
+            )
+        await self.evaluate(cryptocurrency, symbol, time_frame, candle_data, candle, macd_hist=macd_hist)
+
+    def _get_incremental_macd(self, exchange_id, symbol, time_frame):
+        key = (exchange_id, symbol, time_frame)
+        try:
+            return self.incremental_macd_by_candles[key]
+        except KeyError:
+            self.incremental_macd_by_candles[key] = EvaluatorUtil.IncrementalCandlesIndicator(
+                lambda: EvaluatorUtil.IncrementalMACD(
+                    self.short_period_length, self.long_period_length, self.signal_period_length
+                )
+            )
+            return self.incremental_macd_by_candles[key]
+
+    async def evaluate(self, cryptocurrency, symbol, time_frame, candle_data, candle, macd_hist=None):
+        """
+        :param macd_hist: already computed MACD histogram values, computed from candle_data when None
+        """
         self.eval_note = commons_constants.START_PENDING_EVAL_NOTE
         if len(candle_data) > self.long_period_length:
-            macd, macd_signal, macd_hist = tulipy.macd(candle_data, self.short_period_length,
-                                                       self.long_period_length, self.signal_period_length)
+            if macd_hist is None:
+                _, _, macd_hist = tulipy.macd(candle_data, self.short_period_length,
+                                              self.long_period_length, self.signal_period_length)
 
             # on macd hist => M pattern: bearish movement, W pattern: bullish movement
             #                 max on hist: optimal sell or buy
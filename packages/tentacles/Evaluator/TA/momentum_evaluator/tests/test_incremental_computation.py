@@ -0,0 +1,101 @@
+#  Drakkar-Software OctoBot-Tentacles
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import mock
+import numpy as np
+import pytest
+
+import octobot_commons.enums as commons_enums
+import tentacles.Evaluator.TA as TA
+import tests.test_utils.config as test_utils_config
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+CANDLES_COUNT = 300
+EXCHANGE_ID = "exchange_id"
+SYMBOL = "BTC/USDT"
+TIME_FRAME = commons_enums.TimeFrames.ONE_HOUR
+
+
+def _get_candles():
+    generator = np.random.default_rng(42)
+    close = 100 + np.cumsum(generator.normal(0, 1, CANDLES_COUNT))
+    high = close + generator.random(CANDLES_COUNT)
+    low = close - generator.random(CANDLES_COUNT)
+    times = np.arange(CANDLES_COUNT, dtype=np.float64) * 3600
+    return times, high, low, close
+
+
+def _get_candle(times, end_index):
+    candle = [0] * len(commons_enums.PriceIndexes)
+    candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value] = times[end_index - 1]
+    return candle
+
+
+def _create_evaluator(evaluator_class):
+    evaluator = evaluator_class(test_utils_config.load_test_tentacles_config())
+    evaluator.specific_config = {}
+    evaluator.init_user_inputs({})
+    return evaluator
+
+
+async def test_macd_incremental_computation():
+    times, _, _, close = _get_candles()
+    evaluator = _create_evaluator(TA.MACDMomentumEvaluator)
+    incremental_evaluator = _create_evaluator(TA.MACDMomentumEvaluator)
+    assert incremental_evaluator.use_incremental_computation is False
+    incremental_evaluator.use_incremental_computation = True
+    not_neutral_evaluations_count = 0
+    with mock.patch.object(evaluator, "evaluation_completed", mock.AsyncMock()), \
+            mock.patch.object(incremental_evaluator, "evaluation_completed", mock.AsyncMock()):
+        for end_index in range(evaluator.long_period_length + 1, CANDLES_COUNT):
+            candle = _get_candle(times, end_index)
+            await evaluator.evaluate("BTC", SYMBOL, TIME_FRAME, close[:end_index], candle)
+            _, _, macd_hist = incremental_evaluator._get_incremental_macd(EXCHANGE_ID, SYMBOL, TIME_FRAME) \
+                .get_values(times[:end_index], close[:end_index])
+            await incremental_evaluator.evaluate("BTC", SYMBOL, TIME_FRAME, close[:end_index], candle,
+                                                 macd_hist=macd_hist)
+            assert incremental_evaluator.eval_note == pytest.approx(evaluator.eval_note)
+            if evaluator.eval_note != 0:
+                not_neutral_evaluations_count += 1
+    assert not_neutral_evaluations_count > 0
+
+
+async def test_adx_incremental_computation():
+    times, high, low, close = _get_candles()
+    evaluator = _create_evaluator(TA.ADXMomentumEvaluator)
+    incremental_evaluator = _create_evaluator(TA.ADXMomentumEvaluator)
+    assert incremental_evaluator.use_incremental_computation is False
+    incremental_evaluator.use_incremental_computation = True
+    not_neutral_evaluations_count = 0
+    with mock.patch.object(evaluator, "evaluation_completed", mock.AsyncMock()), \
+            mock.patch.object(incremental_evaluator, "evaluation_completed", mock.AsyncMock()):
+        for end_index in range(evaluator._get_minimal_data() + 1, CANDLES_COUNT):
+            candle = _get_candle(times, end_index)
+            await evaluator.evaluate("BTC", SYMBOL, TIME_FRAME, close[:end_index], high[:end_index],
+                                     low[:end_index], candle)
+            adx_indicator, instant_ema_indicator, slow_ema_indicator = \
+                incremental_evaluator._get_incremental_indicators(EXCHANGE_ID, SYMBOL, TIME_FRAME)
+            await incremental_evaluator.evaluate(
+                "BTC", SYMBOL, TIME_FRAME, close[:end_index], high[:end_index], low[:end_index], candle,
+                adx=adx_indicator.get_values(times[:end_index], high[:end_index], low[:end_index], close[:end_index]),
+                instant_ema=instant_ema_indicator.get_values(times[:end_index], close[:end_index]),
+                slow_ema=slow_ema_indicator.get_values(times[:end_index], close[:end_index]),
+            )
+            assert incremental_evaluator.eval_note == pytest.approx(evaluator.eval_note)
+            if evaluator.eval_note != 0:
+                not_neutral_evaluations_count += 1
+    assert not_neutral_evaluations_count > 0
@@ -0,0 +1,2 @@
+from .incremental_indicators import IncrementalIndicator, IncrementalEMA, IncrementalRSI, IncrementalMACD, \
+    IncrementalBollingerBands, IncrementalADX, IncrementalCandlesIndicator
@@ -0,0 +1,314 @@
+#  Drakkar-Software OctoBot-Tentacles
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import collections
+import math
+
+import numpy as np
+
+
+class IncrementalIndicator:
+    """
+    Stateful technical indicator fed one value at a time.
+    Computes the same values as tulipy would on the whole fed series, without recomputing the past values.
+    update() commits a new closed candle value while peek() computes the value of an in construction
+    candle without changing the indicator state.
+    """
+
+    def __init__(self, history_size=None):
+        # last computed values, warm-up values excluded (as in tulipy outputs)
+        self.values = collections.deque(maxlen=history_size)
+        self._state = None
+
+    def update(self, *inputs):
+        """
+        :return: the indicator value after adding the given inputs, None while warming up
+        """
+        self._state, value = self._compute(self._state, *inputs)
+        self._commit(*inputs)
+        if value is not None:
+            self.values.append(value)
+        return value
+
+    def update_all(self, *inputs_series):
+        """
+        Seed the indicator from history
+        """
+        for inputs in zip(*inputs_series):
+            self.update(*inputs)
+
+    def peek(self, *inputs):
+        """
+        :return: the indicator value if the given inputs were added, the indicator state is not changed
+        """
+        return self._compute(self._state, *inputs)[1]
+
+    def get_values(self) -> np.ndarray:
+        return np.array(self.values, dtype=np.float64)
+
+    def get_start(self) -> int:
+        """
+        :return: the number of inputs without associated value (warm-up), same as tulipy start
+        """
+        return 0
+
+    def _compute(self, state, *inputs) -> tuple:
+        """
+        :return: the (updated state, value) tuple
+        """
+        raise NotImplementedError("_compute is not implemented")
+
+    def _commit(self, *inputs):
+        pass
+
+
+class IncrementalEMA(IncrementalIndicator):
+    def __init__(self, period, history_size=None):
+        super().__init__(history_size=history_size)
+        self.multiplier = 2 / (period + 1)
+
+    def _compute(self, state, value) -> tuple:
+        ema = value if state is None else (value - state) * self.multiplier + state
+        return ema, ema
+
+
+class IncrementalRSI(IncrementalIndicator):
+    def __init__(self, period, history_size=None):
+        super().__init__(history_size=history_size)
+        self.period = period
+
+    def get_start(self) -> int:
+        return self.period
+
+    def _compute(self, state, value) -> tuple:
+        if state is None:
+            # (inputs count, previous value, smoothed upward moves, smoothed downward moves)
+            return (1, value, 0, 0), None
+        count, previous_value, smooth_up, smooth_down = state
+        upward = value - previous_value if value > previous_value else 0
+        downward = previous_value - value if value < previous_value else 0
+        if count < self.period:
+            # warm-up: sum moves
+            return (count + 1, value, smooth_up + upward, smooth_down + downward), None
+        if count == self.period:
+            smooth_up = (smooth_up + upward) / self.period
+            smooth_down = (smooth_down + downward) / self.period
+        else:
+            smooth_up = (upward - smooth_up) / self.period + smooth_up
+            smooth_down = (downward - smooth_down) / self.period + smooth_down
+        return (count + 1, value, smooth_up, smooth_down), _get_rsi(smooth_up, smooth_down)
+
+
+class IncrementalMACD(IncrementalIndicator):
+    """
+    Values are (macd, signal, histogram) tuples
+    """
+
+    def __init__(self, short_period, long_period, signal_period, history_size=None):
+        super().__init__(history_size=history_size)
+        self.long_period = long_period
+        if short_period == 12 and long_period == 26:
+            # same as tulipy: use the usual 12-26 MACD multipliers
+            self.short_multiplier = 0.15
+            self.long_multiplier = 0.075
+        else:
+            self.short_multiplier = 2 / (short_period + 1)
+            self.long_multiplier = 2 / (long_period + 1)
+        self.signal_multiplier = 2 / (signal_period + 1)
+
+    def get_start(self) -> int:
+        return self.long_period - 1
+
+    def _compute(self, state, value) -> tuple:
+        if state is None:
+            # (inputs count, short ema, long ema, signal ema)
+            return (1, value, value, 0), None
+        count, short_ema, long_ema, signal_ema = state
+        short_ema = (value - short_ema) * self.short_multiplier + short_ema
+        long_ema = (value - long_ema) * self.long_multiplier + long_ema
+        macd = short_ema - long_ema
+        if count < self.long_period - 1:
+            return (count + 1, short_ema, long_ema, signal_ema), None
+        if count == self.long_period - 1:
+            signal_ema = macd
+        signal_ema = (macd - signal_ema) * self.signal_multiplier + signal_ema
+        return (count + 1, short_ema, long_ema, signal_ema), (macd, signal_ema, macd - signal_ema)
+
+    def get_values(self) -> np.ndarray:
+        """
+        :return: the macd, signal and histogram arrays
+        """
+        return np.array(self.values, dtype=np.float64).reshape(-1, 3).T
+
+
+class IncrementalBollingerBands(IncrementalIndicator):
+    """
+    Values are (lower, middle, upper) tuples
+    """
+
+    def __init__(self, period, stddev, history_size=None):
+        super().__init__(history_size=history_size)
+        self.period = period
+        self.stddev = stddev
+        self._window = collections.deque(maxlen=period)
+
+    def get_start(self) -> int:
+        return self.period - 1
+
+    def _compute(self, state, value) -> tuple:
+        window_sum, window_squares_sum = (0, 0) if state is None else state
+        window_sum += value
+        window_squares_sum += value * value
+        if len(self._window) < self.period - 1:
+            return (window_sum, window_squares_sum), None
+        if len(self._window) == self.period:
+            # remove the value leaving the window
+            removed = self._window[0]
+            window_sum -= removed
+            window_squares_sum -= removed * removed
+        scale = 1 / self.period
+        middle = window_sum * scale
+        deviation = math.sqrt(max(0, window_squares_sum * scale - middle * middle)) * self.stddev
+        return (window_sum, window_squares_sum), (middle - deviation, middle, middle + deviation)
+
+    def _commit(self, value):
+        self._window.append(value)
+
+    def get_values(self) -> np.ndarray:
+        """
+        :return: the lower, middle and upper bands arrays
+        """
+        return np.array(self.values, dtype=np.float64).reshape(-1, 3).T
+
+
+class IncrementalADX(IncrementalIndicator):
+    """
+    Inputs are (high, low, close)
+    """
+
+    def __init__(self, period, history_size=None):
+        super().__init__(history_size=history_size)
+        self.period = period
+        self.smoothing = (period - 1) / period
+
+    def get_start(self) -> int:
+        return (self.period - 1) * 2
+
+    def _compute(self, state, high, low, close) -> tuple:
+        if state is None:
+            # (inputs count, previous high, previous low, previous close, atr, +dm, -dm, adx sum)
+            return (1, high, low, close, 0, 0, 0, 0), None
+        count, previous_high, previous_low, previous_close, atr, dm_up, dm_down, adx = state
+        true_range = max(high - low, abs(high - previous_close), abs(low - previous_close))
+        direction_up, direction_down = _get_directional_moves(high, low, previous_high, previous_low)
+        if count < self.period:
+            atr += true_range
+            dm_up += direction_up
+            dm_down += direction_down
+        else:
+            atr = atr * self.smoothing + true_range
+            dm_up = dm_up * self.smoothing + direction_up
+            dm_down = dm_down * self.smoothing + direction_down
+        value = None
+        if count >= self.period - 1:
+            dx = _get_dx(dm_up, dm_down, atr)
+            # count - period + 1: number of dx values including this one
+            dx_count = count - self.period + 2
+            if dx_count < self.period:
+                adx += dx
+            elif dx_count == self.period:
+                adx += dx
+                value = adx / self.period
+            else:
+                adx = adx * self.smoothing + dx
+                value = adx / self.period
+        return (count + 1, high, low, close, atr, dm_up, dm_down, adx), value
+
+
+class IncrementalCandlesIndicator:
+    """
+    Keeps an IncrementalIndicator up to date with candles arrays: each closed candle is fed once and
+    the last (possibly in construction) candle is only peeked.
+    The indicator is seeded again when the given candles are not continuing the already fed ones.
+    Values older than the given candles are dropped: returned values have the tulipy output length.
+    """
+
+    def __init__(self, indicator_factory):
+        self.indicator_factory = indicator_factory
+        self.indicator: IncrementalIndicator = None
+        self.last_fed_time = None
+
+    def get_values(self, time_candles, *candles) -> np.ndarray:
+        """
+        :param time_candles: candles times
+        :param candles: indicator input candles arrays (ex: close candles)
+        :return: the indicator values, same as the tulipy equivalent on the given candles
+        """
+        if len(time_candles) == 0:
+            return np.array([], dtype=np.float64)
+        start_index = self._get_first_index_to_feed(time_candles)
+        if start_index is None:
+            self.indicator = self.indicator_factory()
+            start_index = 0
+        # last candle might be in construction: do not commit it
+        self.indicator.update_all(*(values[start_index:-1] for values in candles))
+        if len(time_candles) > 1:
+            self.last_fed_time = time_candles[-2]
+        last_value = self.indicator.peek(*(values[-1] for values in candles))
+        # drop values computed from candles that are not in the given candles anymore
+        committed_values_count = len(time_candles) - self.indicator.get_start() - 1
+        while len(self.indicator.values) > max(0, committed_values_count):
+            self.indicator.values.popleft()
+        values = self.indicator.get_values()
+        if last_value is None:
+            return values
+        if values.ndim > 1:
+            return np.column_stack((values, last_value))
+        return np.append(values, last_value)
+
+    def _get_first_index_to_feed(self, time_candles):
+        if self.indicator is None or self.last_fed_time is None:
+            return None
+        last_fed_index = int(np.searchsorted(time_candles, self.last_fed_time))
+        if last_fed_index < len(time_candles) and time_candles[last_fed_index] == self.last_fed_time:
+            return last_fed_index + 1
+        # fed candles are not in given candles anymore
+        return None
+
+
+def _get_rsi(smooth_up, smooth_down):
+    total = smooth_up + smooth_down
+    return 100 * smooth_up / total if total else math.nan
+
+
+def _get_directional_moves(high, low, previous_high, previous_low):
+    direction_up = high - previous_high
+    direction_down = previous_low - low
+    if direction_up < 0:
+        direction_up = 0
+    elif direction_up > direction_down:
+        direction_down = 0
+    if direction_down < 0:
+        direction_down = 0
+    elif direction_down > direction_up:
+        direction_up = 0
+    return direction_up, direction_down
+
+
+def _get_dx(dm_up, dm_down, atr):
+    di_up = dm_up / atr if atr else 0
+    di_down = dm_down / atr if atr else 0
+    di_sum = di_up + di_down
+    return abs(di_up - di_down) / di_sum * 100 if di_sum else math.nan
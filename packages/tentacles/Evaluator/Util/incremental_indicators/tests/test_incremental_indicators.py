@@ -0,0 +1,131 @@
+#  Drakkar-Software OctoBot-Tentacles
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+import tulipy
+
+import tentacles.Evaluator.Util as EvaluatorUtil
+
+CANDLES_COUNT = 500
+
+
+def _get_candles():
+    generator = np.random.default_rng(42)
+    close = 100 + np.cumsum(generator.normal(0, 1, CANDLES_COUNT))
+    high = close + generator.random(CANDLES_COUNT)
+    low = close - generator.random(CANDLES_COUNT)
+    times = np.arange(CANDLES_COUNT, dtype=np.float64) * 60
+    return times, high, low, close
+
+
+def test_ema():
+    _, _, _, close = _get_candles()
+    indicator = EvaluatorUtil.IncrementalEMA(14)
+    indicator.update_all(close)
+    np.testing.assert_allclose(indicator.get_values(), tulipy.ema(close, 14))
+
+
+def test_rsi():
+    _, _, _, close = _get_candles()
+    for period in (2, 14, 30):
+        indicator = EvaluatorUtil.IncrementalRSI(period)
+        indicator.update_all(close)
+        np.testing.assert_allclose(indicator.get_values(), tulipy.rsi(close, period))
+
+
+def test_macd():
+    _, _, _, close = _get_candles()
+    # 12-26 uses tulipy specific multipliers
+    for short_period, long_period, signal_period in ((12, 26, 9), (5, 10, 4)):
+        indicator = EvaluatorUtil.IncrementalMACD(short_period, long_period, signal_period)
+        indicator.update_all(close)
+        np.testing.assert_allclose(
+            indicator.get_values(), tulipy.macd(close, short_period, long_period, signal_period)
+        )
+
+
+def test_bollinger_bands():
+    _, _, _, close = _get_candles()
+    indicator = EvaluatorUtil.IncrementalBollingerBands(20, 2)
+    indicator.update_all(close)
+    np.testing.assert_allclose(indicator.get_values(), tulipy.bbands(close, 20, 2))
+
+
+def test_adx():
+    _, high, low, close = _get_candles()
+    indicator = EvaluatorUtil.IncrementalADX(14)
+    indicator.update_all(high, low, close)
+    np.testing.assert_allclose(indicator.get_values(), tulipy.adx(high, low, close, 14))
+
+
+def test_peek_does_not_update_state():
+    _, _, _, close = _get_candles()
+    indicator = EvaluatorUtil.IncrementalBollingerBands(20, 2)
+    indicator.update_all(close[:-1])
+    peeked = indicator.peek(close[-1])
+    assert indicator.peek(close[-1]) == peeked
+    assert indicator.update(close[-1]) == peeked
+    np.testing.assert_allclose(indicator.get_values(), tulipy.bbands(close, 20, 2))
+
+
+def test_history_size():
+    _, _, _, close = _get_candles()
+    indicator = EvaluatorUtil.IncrementalRSI(14, history_size=10)
+    indicator.update_all(close)
+    np.testing.assert_allclose(indicator.get_values(), tulipy.rsi(close, 14)[-10:])
+
+
+def test_candles_indicator():
+    times, _, _, close = _get_candles()
+    candles_indicator = EvaluatorUtil.IncrementalCandlesIndicator(lambda: EvaluatorUtil.IncrementalMACD(12, 26, 9))
+    for end_index in range(30, CANDLES_COUNT, 3):
+        np.testing.assert_allclose(
+            candles_indicator.get_values(times[:end_index], close[:end_index]),
+            tulipy.macd(close[:end_index], 12, 26, 9)
+        )
+    # in construction candle changes: not committed
+    in_construction_close = close.copy()
+    in_construction_close[-1] += 10
+    np.testing.assert_allclose(
+        candles_indicator.get_values(times, in_construction_close), tulipy.macd(in_construction_close, 12, 26, 9)
+    )
+    np.testing.assert_allclose(candles_indicator.get_values(times, close), tulipy.macd(close, 12, 26, 9))
+
+
+def test_candles_indicator_reseed():
+    times, _, _, close = _get_candles()
+    candles_indicator = EvaluatorUtil.IncrementalCandlesIndicator(lambda: EvaluatorUtil.IncrementalRSI(14))
+    candles_indicator.get_values(times[:100], close[:100])
+    # unrelated candles: indicator is seeded again
+    np.testing.assert_allclose(candles_indicator.get_values(times[200:], close[200:]), tulipy.rsi(close[200:], 14))
+
+
+
+def test_candles_indicator_sliding_window():
+    times, high, low, close = _get_candles()
+    window_size = 100
+    candles_indicator = EvaluatorUtil.IncrementalCandlesIndicator(lambda: EvaluatorUtil.IncrementalADX(14))
+    for end_index in range(window_size, CANDLES_COUNT):
+        start_index = end_index - window_size
+        values = candles_indicator.get_values(
+            times[start_index:end_index], high[start_index:end_index],
+            low[start_index:end_index], close[start_index:end_index]
+        )
+        # values are computed from older candles but have the same length as tulipy ones on the window
+        expected = tulipy.adx(high[start_index:end_index], low[start_index:end_index], close[start_index:end_index], 14)
+        assert len(values) == len(expected)
+        assert len(candles_indicator.indicator.values) == len(expected) - 1
+    np.testing.assert_allclose(values, tulipy.adx(high[:CANDLES_COUNT - 1], low[:CANDLES_COUNT - 1],
+                                                  close[:CANDLES_COUNT - 1], 14)[-len(values):])
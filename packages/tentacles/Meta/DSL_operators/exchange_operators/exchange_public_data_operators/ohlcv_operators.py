@@ -273,6 +273,9 @@ def _adapt_last_candle_value(
     candles_values: np.ndarray,
     kline: list
 ) -> np.ndarray:
+    if not candles_values.flags.writeable:
+        # candles managers can return read-only views on their stored candles: never edit those
+        candles_values = candles_values.copy()
     match candle_value:
         case commons_enums.PriceIndexes.IND_PRICE_CLOSE:
             candles_values[candles_manager.close_candles_index - 1] = kline[commons_enums.PriceIndexes.IND_PRICE_CLOSE.value]
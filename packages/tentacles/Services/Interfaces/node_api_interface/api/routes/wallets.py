@@ -20,13 +20,16 @@ import pydantic
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import HTTPBasicCredentials
 
+import octobot_sync.server as sync_server
 import octobot.community.authentication as community_auth
 import octobot.community.wallet_backend as wallet_backend
 
 try:
     from api.deps import CurrentUser, security_basic  # type: ignore[no-redef]
+    from api.user_id import evm_to_user_id  # type: ignore[no-redef]
 except ImportError:
     from tentacles.Services.Interfaces.node_api_interface.api.deps import CurrentUser, security_basic
+    from tentacles.Services.Interfaces.node_api_interface.api.user_id import evm_to_user_id
 
 router = APIRouter(tags=["wallets"])
 
@@ -165,9 +168,13 @@ def delete_wallet(address: str, current_user: CurrentUser) -> dict:
         )
     normalized = address.lower()
     try:
+        # resolved before removal: the wallet is required to derive its user_id
+        removed_user_id = evm_to_user_id(normalized)
         auth.remove_wallet(normalized)
     except wallet_backend.WalletNotFoundError as err:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(err)) from err
     except (wallet_backend.CannotRemoveLastWalletError, wallet_backend.CannotRemoveAdminWalletError) as err:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(err)) from err
+    # cached sync keys would otherwise keep serving the removed wallet's collections until they expire
+    sync_server.invalidate_user_collection_keys(removed_user_id)
     return {"address": normalized}
@@ -156,7 +156,7 @@ def mock_auth():
             return _admin_wallet
         if addr.lower() == TENANT_ADDRESS.lower():
             return _tenant_wallet
-        raise ValueError(f"Unknown wallet address: {addr}")
+        raise wallet_backend.WalletNotFoundError(f"Wallet {addr} not found")
 
     auth.get_wallet.side_effect = _get_wallet_for_bot
 
@@ -23,6 +23,7 @@ from .conftest import (
     ADMIN_PASSPHRASE,
     TENANT_ADDRESS,
     TENANT_PASSPHRASE,
+    TENANT_USER_ID,
 )
 
 NEW_WALLET_ADDRESS = "0xnew0000000000000000000000000000000001"
@@ -152,10 +153,12 @@ def test_rename_wallet_not_found(admin_client, mock_auth):
 
 def test_delete_wallet_as_admin(admin_client, mock_auth):
     mock_auth.remove_wallet.return_value = None
-    resp = admin_client.delete(f"/api/v1/wallets/{TENANT_ADDRESS}")
+    with mock.patch("octobot_sync.server.invalidate_user_collection_keys") as invalidate_mock:
+        resp = admin_client.delete(f"/api/v1/wallets/{TENANT_ADDRESS}")
     assert resp.status_code == 200
     assert resp.json()["address"] == TENANT_ADDRESS
     mock_auth.remove_wallet.assert_called_once_with(TENANT_ADDRESS)
+    invalidate_mock.assert_called_once_with(TENANT_USER_ID)
 
 
 def test_delete_wallet_as_tenant(tenant_client, mock_auth):
@@ -169,6 +172,14 @@ def test_delete_wallet_not_found(admin_client, mock_auth):
     assert resp.status_code == 404
 
 
+def test_delete_wallet_failure_keeps_cached_keys(admin_client, mock_auth):
+    mock_auth.remove_wallet.side_effect = wallet_backend.CannotRemoveLastWalletError("Cannot remove the last wallet")
+    with mock.patch("octobot_sync.server.invalidate_user_collection_keys") as invalidate_mock:
+        resp = admin_client.delete(f"/api/v1/wallets/{TENANT_ADDRESS}")
+    assert resp.status_code == 400
+    invalidate_mock.assert_not_called()
+
+
 def test_delete_admin_wallet_raises_400(admin_client, mock_auth):
     mock_auth.remove_wallet.side_effect = wallet_backend.CannotRemoveAdminWalletError("Cannot remove the admin wallet")
     resp = admin_client.delete(f"/api/v1/wallets/{ADMIN_ADDRESS}")
@@ -19,6 +19,9 @@ import octobot_trading.enums as trading_enums
 
 
 class Bitget(exchanges.RestExchange):
+    # batch-orders and cancel-batch-orders endpoints (orders of the same symbol only)
+    SUPPORTS_BULK_ORDERS_CREATION = True
+    SUPPORTS_BULK_ORDERS_CANCEL = True
 
     @classmethod
     def get_name(cls):
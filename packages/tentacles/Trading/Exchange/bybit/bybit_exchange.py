@@ -47,6 +47,10 @@ class Bybit(exchanges.RestExchange):
     SPOT_STOP_ORDERS_FILTER = "StopOrder"
     ORDER_FILTER = "orderFilter"
 
+    # createOrders and cancelOrders batch endpoints (UTA accounts only, ccxt raises NotSupported otherwise)
+    SUPPORTS_BULK_ORDERS_CREATION = True
+    SUPPORTS_BULK_ORDERS_CANCEL = True
+
     def __init__(
         self, config, exchange_manager, exchange_config_by_exchange: typing.Optional[dict[str, dict]],
         connector_class=None
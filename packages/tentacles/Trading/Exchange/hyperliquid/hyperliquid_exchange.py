@@ -37,6 +37,9 @@ class HyperliquidConnector(exchanges.CCXTConnector):
 
 class Hyperliquid(exchanges.RestExchange):
     DEFAULT_CONNECTOR_CLASS = HyperliquidConnector
+    # orders and cancel actions accept multiple orders
+    SUPPORTS_BULK_ORDERS_CREATION = True
+    SUPPORTS_BULK_ORDERS_CANCEL = True
 
     @classmethod
     def get_name(cls):
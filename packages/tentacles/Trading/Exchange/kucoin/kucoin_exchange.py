@@ -59,6 +59,9 @@ class Kucoin(exchanges.RestExchange):
     # implemented in ccxt
     INSTANT_RETRY_ERROR_CODE = "429000"
     FUTURES_CCXT_CLASS_NAME = "kucoinfutures"
+    # createOrders and cancelOrders batch endpoints
+    SUPPORTS_BULK_ORDERS_CREATION = True
+    SUPPORTS_BULK_ORDERS_CANCEL = True
     """
     Deprecated constants kept as comments for reference.
     # text content of errors due to api key permissions issues
@@ -193,6 +196,13 @@ class Kucoin(exchanges.RestExchange):
                                           side=side, current_price=current_price,
                                           reduce_only=reduce_only, params=params)
 
+    def _get_bulk_order_params(self, order: dict) -> dict:
+        params = super()._get_bulk_order_params(order)
+        if self.exchange_manager.is_future:
+            params = dict(params)
+            self._set_margin_mode_param_if_necessary(order["symbol"], params)
+        return params
+
     async def edit_order(self, exchange_order_id: str, order_type: trading_enums.TraderOrderType, symbol: str,
                          quantity: decimal.Decimal, price: decimal.Decimal,
                          stop_price: decimal.Decimal = None, side: trading_enums.TradeOrderSide = None,
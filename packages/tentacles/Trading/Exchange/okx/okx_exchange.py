@@ -117,6 +117,10 @@ class Okx(exchanges.RestExchange):
     _OKX_BUNDLED_ORDERS = [trading_enums.TraderOrderType.STOP_LOSS, trading_enums.TraderOrderType.TAKE_PROFIT,
                            trading_enums.TraderOrderType.BUY_MARKET, trading_enums.TraderOrderType.SELL_MARKET]
 
+    # createOrders and cancelOrders batch endpoints
+    SUPPORTS_BULK_ORDERS_CREATION = True
+    SUPPORTS_BULK_ORDERS_CANCEL = True
+
     @classmethod
     def get_name(cls):
         return 'okx'
@@ -257,6 +261,16 @@ class Okx(exchanges.RestExchange):
                                           side=side, current_price=current_price,
                                           reduce_only=reduce_only, params=params)
 
+    def _get_bulk_order_params(self, order: dict) -> dict:
+        params = super()._get_bulk_order_params(order)
+        if self._is_oco_order(params):
+            # not supported when creating orders one by one either
+            raise trading_errors.NotSupported(
+                f"OCO bundled orders (orders including both a stop loss and take profit price) "
+                f"are not yet supported on {self.get_name()}"
+            )
+        return params
+
     def _get_ccxt_margin_type(self, symbol, contract=None):
         if not self.exchange_manager.exchange.has_pair_contract(symbol):
             raise KeyError(f"{symbol} contract unavailable")
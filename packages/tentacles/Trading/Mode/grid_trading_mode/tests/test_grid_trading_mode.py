@@ -1760,27 +1760,33 @@ async def test_start_after_offline_with_added_funds_increasing_orders_count():
         producer.sell_funds = decimal.Decimal("0.0001")  # 9 sell orders
         # triggering orders will cancel all open orders and recreate grid orders with new funds
         with mock.patch.object(
-            consumer, "create_order", mock.AsyncMock(wraps=consumer.create_order)
-        ) as create_order_mock, mock.patch.object(
-            producer.trading_mode, "cancel_order", mock.AsyncMock(wraps=producer.trading_mode.cancel_order)
-        ) as cancel_order_mock:
+            consumer, "create_orders", mock.AsyncMock(wraps=consumer.create_orders)
+        ) as create_orders_mock, mock.patch.object(
+            producer.trading_mode, "cancel_orders", mock.AsyncMock(wraps=producer.trading_mode.cancel_orders)
+        ) as cancel_orders_mock:
             await producer._ensure_staggered_orders()
             # one more buy order
-            assert cancel_order_mock.call_count == orders_count # all orders are cancelled
+            cancelled_orders_calls = _get_cancelled_orders_calls(cancel_orders_mock)
+            assert len(cancelled_orders_calls) == orders_count # all orders are cancelled
+            # all orders are cancelled at once
+            cancel_orders_mock.assert_awaited_once()
             assert all(
-                call.kwargs["dependencies"] is None
-                for call in cancel_order_mock.mock_calls
+                dependencies is None
+                for _, dependencies in cancelled_orders_calls
             )
             new_orders_count = orders_count + 5
             await asyncio.create_task(_check_open_orders_count(exchange_manager, new_orders_count))
-            assert create_order_mock.call_count == new_orders_count
+            created_orders_calls = _get_created_orders_calls(create_orders_mock)
+            assert len(created_orders_calls) == new_orders_count
+            # all orders are created at once
+            create_orders_mock.assert_awaited_once()
             cancelled_orders_dependencies = trading_signals.get_orders_dependencies(
-                [call.args[0] for call in cancel_order_mock.mock_calls]
+                [order for order, _ in cancelled_orders_calls]
             )
             # cancel orders dependencies are forwarded as dependencies for newly created orders
             assert all(
-                call.args[3] == cancelled_orders_dependencies
-                for call in create_order_mock.mock_calls
+                dependencies == cancelled_orders_dependencies
+                for _, dependencies in created_orders_calls
             )
         new_orders = copy.copy(trading_api.get_open_orders(exchange_manager))
         assert len(new_orders) == new_orders_count
@@ -2168,29 +2174,31 @@ async def test_whole_grid_trailing_up_and_down():
         trading_api.force_set_mark_price(exchange_manager, producer.symbol, new_price)
         # will trail up
         with mock.patch.object(
-            consumer, "create_order", mock.AsyncMock(wraps=consumer.create_order)
-        ) as create_order_mock, mock.patch.object(
-            producer.trading_mode, "cancel_order", mock.AsyncMock(wraps=producer.trading_mode.cancel_order)
-        ) as cancel_order_mock, mock.patch.object(
+            consumer, "create_orders", mock.AsyncMock(wraps=consumer.create_orders)
+        ) as create_orders_mock, mock.patch.object(
+            producer.trading_mode, "cancel_orders", mock.AsyncMock(wraps=producer.trading_mode.cancel_orders)
+        ) as cancel_orders_mock, mock.patch.object(
             trading_modes, "convert_asset_to_target_asset", mock.AsyncMock(wraps=trading_modes.convert_asset_to_target_asset)
         ) as convert_asset_to_target_asset_mock:
             await producer._ensure_staggered_orders()
-            assert cancel_order_mock.call_count == 19 # all buy orders are cancelled
+            cancelled_orders_calls = _get_cancelled_orders_calls(cancel_orders_mock)
+            assert len(cancelled_orders_calls) == 19 # all buy orders are cancelled
             assert all(
-                call.kwargs["dependencies"] is None
-                for call in cancel_order_mock.mock_calls
+                dependencies is None
+                for _, dependencies in cancelled_orders_calls
             )
             cancelled_orders_dependencies = trading_signals.get_orders_dependencies(
-                [call.args[0] for call in cancel_order_mock.mock_calls]
+                [order for order, _ in cancelled_orders_calls]
             )
             convert_asset_to_target_asset_mock.assert_not_called()
             await asyncio.create_task(_check_open_orders_count(exchange_manager, producer.operational_depth))
             _check_created_orders(producer, trading_api.get_open_orders(exchange_manager), 250)
-            assert create_order_mock.call_count == producer.operational_depth
+            created_orders_calls = _get_created_orders_calls(create_orders_mock)
+            assert len(created_orders_calls) == producer.operational_depth
             # no conversion, will use cancel order dependencies
             assert all(
-                call.args[3] == cancelled_orders_dependencies
-                for call in create_order_mock.mock_calls
+                dependencies == cancelled_orders_dependencies
+                for _, dependencies in created_orders_calls
             )
 
         # B. orders get filled but not enough to trigger a trailing reset
@@ -2306,10 +2314,10 @@ async def test_order_by_order_trailing_up_and_down():
         origin_convert_asset_to_target_asset = trading_modes.convert_asset_to_target_asset
         # will trail up
         with mock.patch.object(
-            consumer, "create_order", mock.AsyncMock(wraps=consumer.create_order)
-        ) as create_order_mock, mock.patch.object(
-            producer.trading_mode, "cancel_order", mock.AsyncMock(wraps=producer.trading_mode.cancel_order)
-        ) as cancel_order_mock, mock.patch.object(
+            consumer, "create_orders", mock.AsyncMock(wraps=consumer.create_orders)
+        ) as create_orders_mock, mock.patch.object(
+            producer.trading_mode, "cancel_orders", mock.AsyncMock(wraps=producer.trading_mode.cancel_orders)
+        ) as cancel_orders_mock, mock.patch.object(
             trading_modes, "convert_asset_to_target_asset", mock.AsyncMock(side_effect=_convert_asset_to_target_asset)
         ) as convert_asset_to_target_asset_mock:
             await producer._ensure_staggered_orders()
@@ -2330,16 +2338,17 @@ async def test_order_by_order_trailing_up_and_down():
                 # converted to BTC for the trailed sell order
                 decimal.Decimal("100"),
             ]
-            assert cancel_order_mock.call_count == len(cancelled_orders_prices)
+            cancelled_orders_calls = _get_cancelled_orders_calls(cancel_orders_mock)
+            assert len(cancelled_orders_calls) == len(cancelled_orders_prices)
             assert sorted(
-                call.args[0].origin_price for call in cancel_order_mock.mock_calls
+                order.origin_price for order, _ in cancelled_orders_calls
             ) == cancelled_orders_prices
             assert all(
-                call.kwargs["dependencies"] is None
-                for call in cancel_order_mock.mock_calls
+                dependencies is None
+                for _, dependencies in cancelled_orders_calls
             )
             cancelled_orders_dependencies = trading_signals.get_orders_dependencies(
-                [call.args[0] for call in cancel_order_mock.mock_calls]
+                [order for order, _ in cancelled_orders_calls]
             )
             convert_asset_to_target_asset_mock.assert_awaited_once_with(
                 "USDT", "BTC", {
@@ -2355,10 +2364,11 @@ async def test_order_by_order_trailing_up_and_down():
             )
             await asyncio.create_task(_check_open_orders_count(exchange_manager, orders_count))
             _check_created_orders(producer, trading_api.get_open_orders(exchange_manager), 230)
-            assert create_order_mock.call_count == 25 + len(new_buy_order_prices_to_create) + 1 # replaced initial sell orders and created trailing buy orders + the "other side" order
+            created_orders_calls = _get_created_orders_calls(create_orders_mock)
+            assert len(created_orders_calls) == 25 + len(new_buy_order_prices_to_create) + 1 # replaced initial sell orders and created trailing buy orders + the "other side" order
             assert sorted(
-                call.args[0].price 
-                for call in create_order_mock.mock_calls
+                order_data.price
+                for order_data, _ in created_orders_calls
             ) == sorted(
                 [ 
                     # replaced sell orders
@@ -2371,8 +2381,8 @@ async def test_order_by_order_trailing_up_and_down():
             )
             # no conversion, will use cancel order dependencies
             assert all(
-                call.args[3] == convert_dependencies
-                for call in create_order_mock.mock_calls
+                dependencies == convert_dependencies
+                for _, dependencies in created_orders_calls
             )
             open_orders = trading_api.get_open_orders(exchange_manager)
             # ensure 1 sell order is open and the rest are buy orders
@@ -2544,6 +2554,22 @@ async def _wait_for_orders_creation(orders_count=1):
         await asyncio_tools.wait_asyncio_next_cycle()
 
 
+def _get_created_orders_calls(create_orders_mock):
+    return [
+        (order_data, call.args[3])
+        for call in create_orders_mock.mock_calls
+        for order_data in call.args[0]
+    ]
+
+
+def _get_cancelled_orders_calls(cancel_orders_mock):
+    return [
+        (order, call.kwargs["dependencies"])
+        for call in cancel_orders_mock.mock_calls
+        for order in call.args[0]
+    ]
+
+
 async def _check_open_orders_count(exchange_manager, count):
     await _wait_for_orders_creation(count)
     assert len(trading_api.get_open_orders(exchange_manager)) == count
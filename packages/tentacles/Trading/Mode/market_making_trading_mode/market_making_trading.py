@@ -328,6 +328,11 @@ class MarketMakingTradingModeConsumer(trading_modes.AbstractTradingModeConsumer)
                         skipped_actions[actions_class] = 1
                     else:
                         skipped_actions[actions_class] += 1
+                elif isinstance(action, CancelOrderAction):
+                    await self._process_cancel_actions(
+                        self._pop_consecutive_cancel_actions(action, scheduled_actions),
+                        processed_actions, cancelled_orders
+                    )
                 else:
                     await self._process_action(
                         action, current_price, symbol_market,
@@ -365,22 +370,7 @@ class MarketMakingTradingModeConsumer(trading_modes.AbstractTradingModeConsumer)
                 await self.create_order(action.order_data, current_price, symbol_market, **kwargs)
             )
         elif isinstance(action, CancelOrderAction):
-            if action.order.is_open():
-                try:
-                    await self.trading_mode.cancel_order(action.order)
-                    cancelled_orders.append(action.order.order_id)
-                except trading_errors.UnexpectedExchangeSideOrderStateError as err:
-                    self.logger.warning(f"Skipped order cancel: {err}, order: {str(action.order)}")
-                except trading_errors.OrderCancelError as err:
-                    self.logger.warning(
-                        f"Error when cancelling order, considering order as closed. Error: {err}, "
-                        f"order: {str(action.order)}"
-                    )
-            else:
-                self.logger.info(
-                    f"{self.trading_mode.symbol} {self.exchange_manager.exchange_name} ignored cancel order "
-                    f"action: Order is not open anymore. Order: {str(action.order)}"
-                )
+            await self._cancel_orders([action], cancelled_orders)
         else:
             raise NotImplementedError(
                 f"{self.trading_mode.symbol} {self.exchange_manager.exchange_name} {action} is not supported"
@@ -390,6 +380,47 @@ class MarketMakingTradingModeConsumer(trading_modes.AbstractTradingModeConsumer)
         else:
             processed_actions[actions_class] += 1
 
+    def _pop_consecutive_cancel_actions(
+        self, action: CancelOrderAction, scheduled_actions: collections.deque
+    ) -> list[CancelOrderAction]:
+        cancel_actions = [action]
+        while scheduled_actions and isinstance(scheduled_actions[0], CancelOrderAction):
+            cancel_actions.append(scheduled_actions.popleft())
+        return cancel_actions
+
+    async def _process_cancel_actions(
+        self, actions: list[CancelOrderAction], processed_actions: dict, cancelled_orders: list
+    ):
+        # consecutive cancel actions are processed together to cancel orders in bulk when possible
+        await self._cancel_orders(actions, cancelled_orders)
+        actions_class = CancelOrderAction.__name__
+        processed_actions[actions_class] = processed_actions.get(actions_class, 0) + len(actions)
+
+    async def _cancel_orders(self, actions: list[CancelOrderAction], cancelled_orders: list):
+        to_cancel_orders = []
+        for action in actions:
+            if action.order.is_open():
+                to_cancel_orders.append(action.order)
+            else:
+                self.logger.info(
+                    f"{self.trading_mode.symbol} {self.exchange_manager.exchange_name} ignored cancel order "
+                    f"action: Order is not open anymore. Order: {str(action.order)}"
+                )
+        if not to_cancel_orders:
+            return
+        try:
+            await self.trading_mode.cancel_orders(to_cancel_orders)
+            cancelled_orders.extend(order.order_id for order in to_cancel_orders)
+        except trading_errors.UnexpectedExchangeSideOrderStateError as err:
+            self.logger.warning(f"Skipped order cancel: {err}, orders: {[str(o) for o in to_cancel_orders]}")
+            cancelled_orders.extend(order.order_id for order in to_cancel_orders if order.is_cancelled())
+        except trading_errors.OrderCancelError as err:
+            self.logger.warning(
+                f"Error when cancelling order, considering order as closed. Error: {err}, "
+                f"orders: {[str(o) for o in to_cancel_orders]}"
+            )
+            cancelled_orders.extend(order.order_id for order in to_cancel_orders if order.is_cancelled())
+
     async def create_order(self, order_data, current_price, symbol_market, **kwargs):
         created_order = None
         currency, market = symbol_util.parse_symbol(order_data.symbol).base_and_quote()
@@ -30,6 +30,7 @@ import octobot_trading.api as trading_api
 import octobot_trading.exchange_channel as exchanges_channel
 import octobot_trading.enums as trading_enums
 import octobot_trading.exchanges as exchanges
+import octobot_trading.personal_data as trading_personal_data
 import tentacles.Trading.Mode.market_making_trading_mode.market_making_trading as market_making_trading
 
 import tests.test_utils.config as test_utils_config
@@ -338,6 +339,47 @@ async def test_handle_market_making_orders_missing_funds_for_buy_orders():
             submit_trading_evaluation_mock.reset_mock()
 
 
+async def test_process_plan_cancels_consecutive_orders_together():
+    symbol = "BTC/USDT"
+    async with _get_tools(symbol) as (producer, consumer, exchange_manager):
+        orders = [
+            trading_personal_data.create_order_instance(
+                trader=exchange_manager.trader,
+                order_type=trading_enums.TraderOrderType.BUY_LIMIT,
+                symbol=symbol,
+                current_price=decimal.Decimal(1000),
+                quantity=decimal.Decimal("0.1"),
+                price=decimal.Decimal(price),
+            )
+            for price in (900, 800, 700, 600)
+        ]
+        assert await exchange_manager.trader.create_orders(orders) == orders
+        # already cancelled order: ignored
+        await exchange_manager.trader.cancel_order(orders[1])
+        plan = market_making_trading.OrdersUpdatePlan([
+            market_making_trading.CancelOrderAction(orders[0]),
+            market_making_trading.CancelOrderAction(orders[1]),
+            market_making_trading.CancelOrderAction(orders[2]),
+            market_making_trading.CreateOrderAction(market_making_trading.OrderData(
+                side=trading_enums.TradeOrderSide.SELL, quantity=decimal.Decimal("0.1"),
+                price=decimal.Decimal(1100), symbol=symbol
+            )),
+            market_making_trading.CancelOrderAction(orders[3]),
+        ])
+        with mock.patch.object(
+            consumer.trading_mode, "cancel_orders", mock.AsyncMock(wraps=consumer.trading_mode.cancel_orders)
+        ) as cancel_orders_mock:
+            created_orders = await consumer._process_plan(plan, decimal.Decimal(1000), SYMBOL_MARKET)
+            assert len(created_orders) == 1
+            # consecutive cancel actions are processed together
+            assert cancel_orders_mock.mock_calls == [
+                mock.call([orders[0], orders[2]]),
+                mock.call([orders[3]]),
+            ]
+        assert all(order.is_cancelled() for order in orders)
+        assert exchange_manager.exchange_personal_data.orders_manager.get_open_orders(symbol) == created_orders
+
+
 async def test_register_on_reference_exchanges_if_required():
     symbol = "BTC/USDT"
     async with _get_tools(symbol) as (producer, consumer, exchange_manager):
@@ -565,6 +565,11 @@ class SimpleMarketMakingTradingModeConsumer(market_making_trading.MarketMakingTr
                         skipped_actions[actions_class] = 1
                     else:
                         skipped_actions[actions_class] += 1
+                elif isinstance(action, market_making_trading.CancelOrderAction) and not is_from_postponed_actions:
+                    await self._process_cancel_actions(
+                        self._pop_consecutive_cancel_actions(action, scheduled_actions),
+                        processed_actions, cancelled_orders
+                    )
                 else:
                     # actions can be postponed as long as all initially scheduled_actions are not completed or postponed
                     await self._process_action(
@@ -443,6 +443,7 @@ class StaggeredOrdersTradingMode(trading_modes.AbstractTradingMode):
 
 class StaggeredOrdersTradingModeConsumer(trading_modes.AbstractTradingModeConsumer):
     ORDER_DATA_KEY = "order_data"
+    ORDERS_DATA_KEY = "orders_data"
     CURRENT_PRICE_KEY = "current_price"
     SYMBOL_MARKET_KEY = "symbol_market"
     COMPLETING_TRAILING_KEY = "completing_trailing"
@@ -467,14 +468,18 @@ class StaggeredOrdersTradingModeConsumer(trading_modes.AbstractTradingModeConsum
         dependencies = kwargs[self.CREATE_ORDER_DEPENDENCIES_PARAM]
         try:
             if not self.skip_orders_creation:
-                order_data = data[self.ORDER_DATA_KEY]
                 current_price = data[self.CURRENT_PRICE_KEY]
                 symbol_market = data[self.SYMBOL_MARKET_KEY]
+                if self.ORDERS_DATA_KEY in data:
+                    return await self.create_orders(
+                        data[self.ORDERS_DATA_KEY], current_price, symbol_market, dependencies
+                    )
+                order_data = data[self.ORDER_DATA_KEY]
                 return await self.create_order(
                     order_data, current_price, symbol_market, dependencies
                 )
             else:
-                self.logger.info(f"Skipped {data.get(self.ORDER_DATA_KEY, '')}")
+                self.logger.info(f"Skipped {data.get(self.ORDERS_DATA_KEY, data.get(self.ORDER_DATA_KEY, ''))}")
         finally:
             if data[self.COMPLETING_TRAILING_KEY]:
                 for producer in self.trading_mode.producers:
@@ -487,67 +492,16 @@ class StaggeredOrdersTradingModeConsumer(trading_modes.AbstractTradingModeConsum
         dependencies: typing.Optional[commons_signals.SignalDependencies]
     ):
         created_order = None
-        currency, market = symbol_util.parse_symbol(order_data.symbol).base_and_quote()
         try:
-            base_available = trading_api.get_portfolio_currency(self.exchange_manager, currency).available
-            quote_available = trading_api.get_portfolio_currency(self.exchange_manager, market).available
-            selling = order_data.side == trading_enums.TradeOrderSide.SELL
-            quantity = trading_personal_data.decimal_adapt_order_quantity_because_fees(
-                self.exchange_manager, order_data.symbol,
-                trading_enums.TraderOrderType.SELL_LIMIT if selling else trading_enums.TraderOrderType.BUY_LIMIT,
-                order_data.quantity, order_data.price, order_data.side
-            )
-            if selling and base_available < quantity and base_available > quantity * CREATED_ORDER_AVAILABLE_FUNDS_ALLOWED_RATIO:
-                quantity = quantity * CREATED_ORDER_AVAILABLE_FUNDS_ALLOWED_RATIO
-                self.logger.info(f"Slightly adapted {order_data.symbol} {order_data.side.value} quantity to {quantity} to fit available funds")
-            elif not selling:
-                cost = quantity * order_data.price
-                if quote_available < cost and quote_available > cost * CREATED_ORDER_AVAILABLE_FUNDS_ALLOWED_RATIO:
-                    quantity = quantity * CREATED_ORDER_AVAILABLE_FUNDS_ALLOWED_RATIO
-                    self.logger.info(f"Slightly adapted {order_data.symbol} {order_data.side.value} quantity to {quantity} to fit available funds")
-            for order_quantity, order_price in trading_personal_data.decimal_check_and_adapt_order_details_if_necessary(
-                    quantity,
-                    order_data.price,
-                    symbol_market):
-                if selling:
-                    if base_available < order_quantity:
-                        self.logger.warning(
-                            f"Skipping {order_data.symbol} {order_data.side.value} "
-                            f"[{self.exchange_manager.exchange_name}] order creation of "
-                            f"{order_quantity} at {float(order_price)}: "
-                            f"not enough {currency}: available: {base_available}, required: {order_quantity}"
-                        )
-                        return []
-                elif quote_available < order_quantity * order_price:
-                    self.logger.warning(
-                        f"Skipping {order_data.symbol} {order_data.side.value} "
-                        f"[{self.exchange_manager.exchange_name}] order creation of "
-                        f"{order_quantity} at {float(order_price)}: "
-                        f"not enough {market}: available: {quote_available}, required: {order_quantity * order_price}"
-                    )
-                    return []
-                order_type = trading_enums.TraderOrderType.SELL_LIMIT if selling \
-                    else trading_enums.TraderOrderType.BUY_LIMIT
-                current_order = trading_personal_data.create_order_instance(
-                    trader=self.exchange_manager.trader,
-                    order_type=order_type,
-                    symbol=order_data.symbol,
-                    current_price=current_price,
-                    quantity=order_quantity,
-                    price=order_price,
-                    associated_entry_id=order_data.associated_entry_id
-                )
-                # disable instant fill to avoid looping order fill in simulator
-                current_order.allow_instant_fill = False
+            orders = self._get_orders_to_create(order_data, current_price, symbol_market, {})
+            if orders is None:
+                return []
+            for current_order in orders:
                 created_order = await self.trading_mode.create_order(
                     current_order, dependencies=dependencies
                 )
             if not created_order:
-                self.logger.warning(
-                    f"No order created for {order_data} (cost: {quantity * order_data.price}): "
-                    f"incompatible with exchange minimum rules. "
-                    f"Limits: {symbol_market[trading_enums.ExchangeConstantsMarketStatusColumns.LIMITS.value]}"
-                )
+                self._log_no_created_order(order_data, symbol_market)
         except trading_errors.MissingFunds as e:
             raise e
         except Exception as e:
@@ -555,6 +509,107 @@ class StaggeredOrdersTradingModeConsumer(trading_modes.AbstractTradingModeConsum
             return None
         return [] if created_order is None else [created_order]
 
+    async def create_orders(
+        self, orders_data: list, current_price, symbol_market,
+        dependencies: typing.Optional[commons_signals.SignalDependencies]
+    ) -> list:
+        to_create_orders = []
+        # funds of the orders to create are not locked yet: keep track of them
+        locked_funds = {}
+        for order_data in orders_data:
+            try:
+                orders = self._get_orders_to_create(order_data, current_price, symbol_market, locked_funds)
+                if orders == []:
+                    self._log_no_created_order(order_data, symbol_market)
+                to_create_orders.extend(orders or [])
+            except Exception as e:
+                self.logger.exception(e, True, f"Failed to create order : {e}. Order: {order_data}")
+        if not to_create_orders:
+            return []
+        try:
+            created_orders = await self.trading_mode.create_orders(to_create_orders, dependencies=dependencies)
+        except trading_errors.MissingFunds as e:
+            # orders might have been partially created: don't retry the whole batch, missing orders will be
+            # created again on the next orders check
+            self.logger.error(f"Failed to create {len(to_create_orders)} orders: {e}")
+            return []
+        except Exception as e:
+            self.logger.exception(e, True, f"Failed to create orders : {e}. Orders: {orders_data}")
+            return []
+        return [order for order in created_orders if order is not None]
+
+    def _get_orders_to_create(
+        self, order_data, current_price, symbol_market, locked_funds: dict
+    ) -> typing.Optional[list]:
+        currency, market = symbol_util.parse_symbol(order_data.symbol).base_and_quote()
+        base_available = trading_api.get_portfolio_currency(self.exchange_manager, currency).available \
+            - locked_funds.get(currency, trading_constants.ZERO)
+        quote_available = trading_api.get_portfolio_currency(self.exchange_manager, market).available \
+            - locked_funds.get(market, trading_constants.ZERO)
+        selling = order_data.side == trading_enums.TradeOrderSide.SELL
+        quantity = trading_personal_data.decimal_adapt_order_quantity_because_fees(
+            self.exchange_manager, order_data.symbol,
+            trading_enums.TraderOrderType.SELL_LIMIT if selling else trading_enums.TraderOrderType.BUY_LIMIT,
+            order_data.quantity, order_data.price, order_data.side
+        )
+        if selling and base_available < quantity and base_available > quantity * CREATED_ORDER_AVAILABLE_FUNDS_ALLOWED_RATIO:
+            quantity = quantity * CREATED_ORDER_AVAILABLE_FUNDS_ALLOWED_RATIO
+            self.logger.info(f"Slightly adapted {order_data.symbol} {order_data.side.value} quantity to {quantity} to fit available funds")
+        elif not selling:
+            cost = quantity * order_data.price
+            if quote_available < cost and quote_available > cost * CREATED_ORDER_AVAILABLE_FUNDS_ALLOWED_RATIO:
+                quantity = quantity * CREATED_ORDER_AVAILABLE_FUNDS_ALLOWED_RATIO
+                self.logger.info(f"Slightly adapted {order_data.symbol} {order_data.side.value} quantity to {quantity} to fit available funds")
+        orders = []
+        for order_quantity, order_price in trading_personal_data.decimal_check_and_adapt_order_details_if_necessary(
+                quantity,
+                order_data.price,
+                symbol_market):
+            if selling:
+                if base_available < order_quantity:
+                    self.logger.warning(
+                        f"Skipping {order_data.symbol} {order_data.side.value} "
+                        f"[{self.exchange_manager.exchange_name}] order creation of "
+                        f"{order_quantity} at {float(order_price)}: "
+                        f"not enough {currency}: available: {base_available}, required: {order_quantity}"
+                    )
+                    return None
+            elif quote_available < order_quantity * order_price:
+                self.logger.warning(
+                    f"Skipping {order_data.symbol} {order_data.side.value} "
+                    f"[{self.exchange_manager.exchange_name}] order creation of "
+                    f"{order_quantity} at {float(order_price)}: "
+                    f"not enough {market}: available: {quote_available}, required: {order_quantity * order_price}"
+                )
+                return None
+            order_type = trading_enums.TraderOrderType.SELL_LIMIT if selling \
+                else trading_enums.TraderOrderType.BUY_LIMIT
+            current_order = trading_personal_data.create_order_instance(
+                trader=self.exchange_manager.trader,
+                order_type=order_type,
+                symbol=order_data.symbol,
+                current_price=current_price,
+                quantity=order_quantity,
+                price=order_price,
+                associated_entry_id=order_data.associated_entry_id
+            )
+            # disable instant fill to avoid looping order fill in simulator
+            current_order.allow_instant_fill = False
+            orders.append(current_order)
+        for order in orders:
+            locked_currency = currency if selling else market
+            locked_funds[locked_currency] = locked_funds.get(locked_currency, trading_constants.ZERO) + (
+                order.origin_quantity if selling else order.origin_quantity * order.origin_price
+            )
+        return orders
+
+    def _log_no_created_order(self, order_data, symbol_market):
+        self.logger.warning(
+            f"No order created for {order_data} (cost: {order_data.quantity * order_data.price}): "
+            f"incompatible with exchange minimum rules. "
+            f"Limits: {symbol_market[trading_enums.ExchangeConstantsMarketStatusColumns.LIMITS.value]}"
+        )
+
 
 class StaggeredOrdersTradingModeProducer(trading_modes.AbstractTradingModeProducer):
     FILL = 1
@@ -1193,11 +1248,7 @@ class StaggeredOrdersTradingModeProducer(trading_modes.AbstractTradingModeProduc
         dependencies: typing.Optional[commons_signals.SignalDependencies]
     ) -> tuple[list, list, int, typing.Optional[commons_signals.SignalDependencies]]:
         self.logger.info("Resetting orders")
-        cancelled_and_dependency_results = await asyncio.gather(*(self._cancel_open_order(order, dependencies) for order in sorted_orders))
-        orders_dependencies = commons_signals.SignalDependencies()
-        for result in cancelled_and_dependency_results:
-            if result[0] and result[1] is not None:
-                orders_dependencies.extend(result[1])
+        _, orders_dependencies = await self._cancel_open_orders(sorted_orders, dependencies)
         self._reset_available_funds()
         state = self.NEW
         buy_orders = self._create_orders(
@@ -1510,16 +1561,24 @@ class StaggeredOrdersTradingModeProducer(trading_modes.AbstractTradingModeProduc
             )
         return trades_with_missing_mirror_order_fills
 
-    async def _cancel_open_order(
-        self, order, dependencies: typing.Optional[commons_signals.SignalDependencies]
-    ) -> tuple[bool, typing.Optional[commons_signals.SignalDependencies]]:
-        if not (order.is_cancelled() or order.is_closed()):
-            try:
-                cancelled, cancel_order_dependency = await self.trading_mode.cancel_order(order, dependencies=dependencies)
-                return cancelled, (cancel_order_dependency if cancelled else None)
-            except trading_errors.UnexpectedExchangeSideOrderStateError as err:
-                self.logger.warning(f"Skipped order cancel: {err}, order: {order}")
-        return False, None
+    async def _cancel_open_orders(
+        self, orders: list, dependencies: typing.Optional[commons_signals.SignalDependencies]
+    ) -> tuple[list, commons_signals.SignalDependencies]:
+        to_cancel_orders = [order for order in orders if not (order.is_cancelled() or order.is_closed())]
+        if not to_cancel_orders:
+            return [], commons_signals.SignalDependencies()
+        try:
+            # cancel orders together to use bulk cancel requests when possible
+            cancelled, _ = await self.trading_mode.cancel_orders(to_cancel_orders, dependencies=dependencies)
+            cancelled_orders = [
+                order
+                for order, order_cancelled in zip(to_cancel_orders, cancelled)
+                if order_cancelled
+            ]
+        except trading_errors.UnexpectedExchangeSideOrderStateError as err:
+            self.logger.warning(f"Skipped orders cancel: {err}, orders: {to_cancel_orders}")
+            cancelled_orders = [order for order in to_cancel_orders if order.is_cancelled()]
+        return cancelled_orders, signals.get_orders_dependencies(cancelled_orders)
 
     async def _prepare_trailing(
         self, sorted_orders: list, recently_closed_trades: list, 
@@ -1613,19 +1672,10 @@ class StaggeredOrdersTradingModeProducer(trading_modes.AbstractTradingModeProduc
     async def _cancel_replaced_orders(
         self, replaced_orders: list[typing.Union[OrderData, trading_personal_data.Order]], dependencies
     ) -> tuple[list[OrderData], list[trading_personal_data.Order], commons_signals.SignalDependencies]:
-        cancelled_orders = []
-        cancelled_replaced_orders = []
-        new_dependencies = commons_signals.SignalDependencies()
-        for order in replaced_orders:
-            if isinstance(order, OrderData):
-                cancelled_replaced_orders.append(order)
-            else:
-                cancelled, cancel_order_dependency = await self._cancel_open_order(order, dependencies)
-                if cancelled:
-                    cancelled_orders.append(order)
-                    if cancel_order_dependency:
-                        new_dependencies.extend(cancel_order_dependency)
-
+        cancelled_replaced_orders = [order for order in replaced_orders if isinstance(order, OrderData)]
+        cancelled_orders, new_dependencies = await self._cancel_open_orders(
+            [order for order in replaced_orders if not isinstance(order, OrderData)], dependencies
+        )
         return cancelled_replaced_orders, cancelled_orders, new_dependencies
 
     async def _compute_trailing_replaced_orders(
@@ -1828,14 +1878,9 @@ class StaggeredOrdersTradingModeProducer(trading_modes.AbstractTradingModeProduc
         # 1. cancel all open orders
         convert_dependencies = commons_signals.SignalDependencies()
         try:
-            cancelled_orders = []
             self.logger.info(f"{log_header}cancelling {len(open_orders)} open orders on {self.symbol}")
-            for order in open_orders:
-                cancelled, cancel_order_dependency = await self._cancel_open_order(order, dependencies)
-                if cancelled:
-                    cancelled_orders.append(order)
-                    if cancel_order_dependency:
-                        convert_dependencies.extend(cancel_order_dependency)
+            cancelled_orders, cancel_orders_dependencies = await self._cancel_open_orders(open_orders, dependencies)
+            convert_dependencies.extend(cancel_orders_dependencies)
         except Exception as err:
             self.logger.exception(err, True, f"Error in {log_header} cancel orders step: {err}")
             cancelled_orders = []
@@ -2712,14 +2757,32 @@ class StaggeredOrdersTradingModeProducer(trading_modes.AbstractTradingModeProduc
                                              data=data,
                                              dependencies=dependencies)
 
+    async def _create_orders_batch(
+        self, orders: list, current_price, completing_trailing, dependencies: list[str]
+    ):
+        data = {
+            StaggeredOrdersTradingModeConsumer.ORDERS_DATA_KEY: orders,
+            StaggeredOrdersTradingModeConsumer.CURRENT_PRICE_KEY: current_price,
+            StaggeredOrdersTradingModeConsumer.SYMBOL_MARKET_KEY: self.symbol_market,
+            StaggeredOrdersTradingModeConsumer.COMPLETING_TRAILING_KEY: completing_trailing,
+        }
+        # orders can be on both sides: available funds are checked for each order by the consumer
+        await self.submit_trading_evaluation(cryptocurrency=self.trading_mode.cryptocurrency,
+                                             symbol=self.trading_mode.symbol,
+                                             time_frame=None,
+                                             state=trading_enums.EvaluatorStates.NEUTRAL,
+                                             data=data,
+                                             dependencies=dependencies)
+
     async def _create_not_virtual_orders(
         self, orders_to_create: list, current_price: decimal.Decimal, 
         triggering_trailing: bool, dependencies: typing.Optional[commons_signals.SignalDependencies]
     ):
         locks_available_funds = self._should_lock_available_funds(triggering_trailing)
-        for index, order in enumerate(orders_to_create):
-            is_completing_trailing = triggering_trailing and (index == len(orders_to_create) - 1)
-            await self._create_order(order, current_price, is_completing_trailing, dependencies)
+        if orders_to_create:
+            # create orders together to use bulk creation requests when possible
+            await self._create_orders_batch(orders_to_create, current_price, triggering_trailing, dependencies)
+        for order in orders_to_create:
             if locks_available_funds:
                 base, quote = symbol_util.parse_symbol(order.symbol).base_and_quote()
                 # keep track of the required funds
@@ -39,6 +39,7 @@ import octobot_trading.enums as trading_enums
 import octobot_trading.exchanges as exchanges
 import octobot_trading.personal_data as trading_personal_data
 import octobot_trading.constants as trading_constants
+import octobot_trading.errors as trading_errors
 import octobot_trading.signals as trading_signals
 import octobot_trading.modes
 
@@ -496,13 +497,16 @@ async def test_use_existing_orders_only():
         producer.use_existing_orders_only = True
         assert producer.flat_increment is None
         assert producer.flat_spread is None
-        with mock.patch.object(producer, '_create_order', new=mock.AsyncMock()) as mocked_producer_create_order:
+        with mock.patch.object(producer, '_create_order', new=mock.AsyncMock()) as mocked_producer_create_order, \
+                mock.patch.object(producer, '_create_orders_batch', new=mock.AsyncMock()) \
+                as mocked_producer_create_orders_batch:
             trading_api.force_set_mark_price(exchange_manager, symbol, 4000)
             await producer._ensure_staggered_orders()
             # price info: create trades
             assert producer.current_price == 4000
             assert producer.state == trading_enums.EvaluatorStates.NEUTRAL
             mocked_producer_create_order.assert_not_called()
+            mocked_producer_create_orders_batch.assert_not_called()
         assert producer.flat_increment is not None
         assert producer.flat_spread is not None
         await asyncio.create_task(_wait_for_orders_creation(2))
@@ -1427,6 +1431,65 @@ async def test_create_order():
             assert created_orders[0].origin_quantity == decimal.Decimal("0.97970000")
 
 
+async def test_create_orders():
+    symbol = "BTC/USD"
+    async with _get_tools(symbol) as tools:
+        producer, consumer, exchange_manager = tools
+        _, _, _, _, symbol_market = await trading_personal_data.get_pre_order_data(exchange_manager,
+                                                                                   symbol=producer.symbol,
+                                                                                   timeout=1)
+        producer.symbol_market = symbol_market
+        producer._refresh_symbol_data(symbol_market)
+        dependencies = trading_signals.get_orders_dependencies([mock.Mock(order_id="123")])
+        with mock.patch.object(
+            trading_personal_data, "decimal_adapt_order_quantity_because_fees",
+            mock.Mock(side_effect=lambda exchange_manager, symbol, order_type, quantity, price, side: quantity)
+        ), mock.patch.object(
+            consumer.trading_mode, "create_orders", mock.AsyncMock(wraps=consumer.trading_mode.create_orders)
+        ) as create_orders_mock, mock.patch.object(
+            consumer.trading_mode, "create_order", mock.AsyncMock()
+        ) as create_order_mock:
+            orders_data = [
+                staggered_orders_trading.OrderData(
+                    trading_enums.TradeOrderSide.SELL, decimal.Decimal(6), decimal.Decimal(100), symbol, False
+                ),
+                # not enough BTC left once the first sell order funds are taken into account
+                staggered_orders_trading.OrderData(
+                    trading_enums.TradeOrderSide.SELL, decimal.Decimal(5), decimal.Decimal(110), symbol, False
+                ),
+                staggered_orders_trading.OrderData(
+                    trading_enums.TradeOrderSide.BUY, decimal.Decimal(1), decimal.Decimal(90), symbol, False
+                ),
+            ]
+            created_orders = await consumer.create_orders(orders_data, decimal.Decimal(95), symbol_market, dependencies)
+            # all orders are created at once
+            create_order_mock.assert_not_called()
+            create_orders_mock.assert_awaited_once()
+            assert create_orders_mock.mock_calls[0].kwargs["dependencies"] == dependencies
+            assert [
+                (order.side, order.origin_quantity, order.origin_price)
+                for order in created_orders
+            ] == [
+                (trading_enums.TradeOrderSide.SELL, decimal.Decimal(6), decimal.Decimal(100)),
+                (trading_enums.TradeOrderSide.BUY, decimal.Decimal(1), decimal.Decimal(90)),
+            ]
+            assert create_orders_mock.mock_calls[0].args[0] == created_orders
+            assert trading_api.get_portfolio_currency(exchange_manager, "BTC").available == decimal.Decimal(4)
+            assert trading_api.get_portfolio_currency(exchange_manager, "USD").available == decimal.Decimal(910)
+
+            # no order to create
+            create_orders_mock.reset_mock()
+            assert await consumer.create_orders(orders_data[1:2], decimal.Decimal(95), symbol_market, None) == []
+            create_orders_mock.assert_not_called()
+
+            # missing funds: orders are not created again
+            with mock.patch.object(
+                exchange_manager.trader, "create_orders", mock.AsyncMock(side_effect=trading_errors.MissingFunds)
+            ) as trader_create_orders_mock:
+                assert await consumer.create_orders(orders_data[2:], decimal.Decimal(95), symbol_market, None) == []
+                trader_create_orders_mock.assert_awaited_once()
+
+
 async def test_create_state():
     symbol = "BTC/USD"
     async with _get_tools(symbol) as tools:
@@ -1526,6 +1589,21 @@ async def test_create_new_orders():
         assert await consumer.create_new_orders(symbol, None, None, data=data, dependencies=dependencies)
         assert producer.is_currently_trailing is False  # updated to false
 
+        # valid input with multiple orders
+        producer.is_currently_trailing = True
+        data = {
+            consumer.ORDERS_DATA_KEY: [to_create_order, to_create_order],
+            consumer.CURRENT_PRICE_KEY: price,
+            consumer.SYMBOL_MARKET_KEY: symbol_market,
+            consumer.COMPLETING_TRAILING_KEY: True,
+        }
+        with mock.patch.object(consumer, "create_orders", mock.AsyncMock(return_value=["order"])) as create_orders_mock:
+            assert await consumer.create_new_orders(symbol, None, None, data=data, dependencies=dependencies) == ["order"]
+            create_orders_mock.assert_awaited_once_with(
+                [to_create_order, to_create_order], price, symbol_market, dependencies
+            )
+        assert producer.is_currently_trailing is False  # updated to false
+
         # invalid input 1
         data = {
             consumer.ORDER_DATA_KEY: to_create_order,
@@ -1928,14 +2006,22 @@ async def test_cancel_replaced_orders():
     symbol = "BTC/USD"
     async with _get_tools(symbol) as tools:
         producer, _, exchange_manager = tools
+        cancel_orders_dependencies = trading_signals.get_orders_dependencies([mock.Mock(order_id="345")])
+
+        async def _cancel_open_orders(orders, dependencies):
+            return orders, (cancel_orders_dependencies if orders else commons_signals.SignalDependencies())
+
         with mock.patch.object(
-            producer, "_cancel_open_order", mock.AsyncMock(return_value=(True, trading_signals.get_orders_dependencies([mock.Mock(order_id="345")])))
-        ) as _cancel_open_order_mock:
+            producer, "_cancel_open_orders", mock.AsyncMock(side_effect=_cancel_open_orders)
+        ) as _cancel_open_orders_mock:
             # 1. no replaced orders
             cancelled_replaced_orders, cancelled_orders, dependencies = await producer._cancel_replaced_orders(
                 [], trading_signals.get_orders_dependencies([mock.Mock(order_id="123")])
             )
-            _cancel_open_order_mock.assert_not_called()
+            _cancel_open_orders_mock.assert_awaited_once_with(
+                [], trading_signals.get_orders_dependencies([mock.Mock(order_id="123")])
+            )
+            _cancel_open_orders_mock.reset_mock()
             assert cancelled_replaced_orders == []
             assert cancelled_orders == []
             assert dependencies == commons_signals.SignalDependencies()
@@ -1945,25 +2031,66 @@ async def test_cancel_replaced_orders():
             cancelled_replaced_orders, cancelled_orders, dependencies = await producer._cancel_replaced_orders(
                 replaced_orders, trading_signals.get_orders_dependencies([mock.Mock(order_id="123")])
             )
-            _cancel_open_order_mock.assert_has_calls([
-                mock.call(replaced_orders[0], trading_signals.get_orders_dependencies([mock.Mock(order_id="123")])),
-                mock.call(replaced_orders[1], trading_signals.get_orders_dependencies([mock.Mock(order_id="123")])),
-            ])
+            # orders are cancelled together
+            _cancel_open_orders_mock.assert_awaited_once_with(
+                replaced_orders, trading_signals.get_orders_dependencies([mock.Mock(order_id="123")])
+            )
+            _cancel_open_orders_mock.reset_mock()
             assert cancelled_replaced_orders == []
             assert cancelled_orders == replaced_orders
-            assert dependencies == trading_signals.get_orders_dependencies([mock.Mock(order_id="345"), mock.Mock(order_id="345")])
+            assert dependencies == cancel_orders_dependencies
 
             # 3. replaced "real" orders and "fake" orders
             replaced_orders = [mock.Mock(order_id="123"), staggered_orders_trading.OrderData(trading_enums.TradeOrderSide.BUY, decimal.Decimal("0.01"), decimal.Decimal("100"), symbol, False)]
             cancelled_replaced_orders, cancelled_orders, dependencies = await producer._cancel_replaced_orders(
                 replaced_orders, trading_signals.get_orders_dependencies([mock.Mock(order_id="123")])
             )
-            _cancel_open_order_mock.assert_has_calls([
-                mock.call(replaced_orders[0], trading_signals.get_orders_dependencies([mock.Mock(order_id="123")])),
-            ])
+            _cancel_open_orders_mock.assert_awaited_once_with(
+                [replaced_orders[0]], trading_signals.get_orders_dependencies([mock.Mock(order_id="123")])
+            )
             assert cancelled_replaced_orders == [replaced_orders[1]]
             assert cancelled_orders == [replaced_orders[0]]
-            assert dependencies == trading_signals.get_orders_dependencies([mock.Mock(order_id="345")])
+            assert dependencies == cancel_orders_dependencies
+
+
+async def test_cancel_open_orders():
+    symbol = "BTC/USD"
+    async with _get_tools(symbol) as tools:
+        producer, _, exchange_manager = tools
+        cancelled_order = mock.Mock(order_id="1", is_cancelled=mock.Mock(return_value=True))
+        open_orders = [
+            mock.Mock(order_id=order_id, is_cancelled=mock.Mock(return_value=False), is_closed=mock.Mock(return_value=False))
+            for order_id in ("2", "3", "4")
+        ]
+        dependencies = trading_signals.get_orders_dependencies([mock.Mock(order_id="123")])
+        with mock.patch.object(
+            producer.trading_mode, "cancel_orders", mock.AsyncMock(return_value=([True, False, True], None))
+        ) as cancel_orders_mock:
+            # 1. nothing to cancel
+            assert await producer._cancel_open_orders([cancelled_order], dependencies) == \
+                ([], commons_signals.SignalDependencies())
+            cancel_orders_mock.assert_not_called()
+
+            # 2. cancel open orders at once
+            cancelled_orders, cancel_dependencies = await producer._cancel_open_orders(
+                [cancelled_order] + open_orders, dependencies
+            )
+            cancel_orders_mock.assert_awaited_once_with(open_orders, dependencies=dependencies)
+            assert cancelled_orders == [open_orders[0], open_orders[2]]
+            assert cancel_dependencies == trading_signals.get_orders_dependencies([open_orders[0], open_orders[2]])
+            cancel_orders_mock.reset_mock()
+
+            # 3. unexpected order state
+            async def _cancel_orders(orders, dependencies=None):
+                # only the 2nd order got cancelled
+                orders[1].is_cancelled.return_value = True
+                raise trading_errors.UnexpectedExchangeSideOrderStateError
+
+            cancel_orders_mock.side_effect = _cancel_orders
+            cancelled_orders, cancel_dependencies = await producer._cancel_open_orders(open_orders, dependencies)
+            cancel_orders_mock.assert_awaited_once_with(open_orders, dependencies=dependencies)
+            assert cancelled_orders == [open_orders[1]]
+            assert cancel_dependencies == trading_signals.get_order_dependency(open_orders[1])
 
 
 async def test_convert_order_funds():
@@ -2443,8 +2570,8 @@ async def test_prepare_full_grid_trailing():
         dependencies = trading_signals.get_orders_dependencies([mock.Mock(order_id="123")])
         log_header = f"[{producer.exchange_manager.exchange_name}] {producer.symbol} @ {123} full grid trailing process: "
         with mock.patch.object(
-            producer.trading_mode, "cancel_order", mock.AsyncMock(wraps=producer.trading_mode.cancel_order)
-        ) as cancel_order_mock, mock.patch.object(
+            producer.trading_mode, "cancel_orders", mock.AsyncMock(wraps=producer.trading_mode.cancel_orders)
+        ) as cancel_orders_mock, mock.patch.object(
             octobot_trading.modes, "convert_asset_to_target_asset", mock.AsyncMock(wraps=octobot_trading.modes.convert_asset_to_target_asset)
         ) as convert_asset_to_target_asset_mock:
             cancelled_orders, created_orders, trailing_buy_orders, trailing_sell_orders, end_dependencies = await producer._prepare_full_grid_trailing(
@@ -2452,14 +2579,11 @@ async def test_prepare_full_grid_trailing():
             )
             assert trailing_buy_orders == trailing_sell_orders == []
             assert end_dependencies == trading_signals.get_order_dependency(created_orders[0])
-            assert cancel_order_mock.call_count == len(open_orders)
-            assert all(
-                call.kwargs["dependencies"] is dependencies
-                for call in cancel_order_mock.mock_calls
-            )
-            cancelled_orders_dependencies = trading_signals.get_orders_dependencies(
-                [call.args[0] for call in cancel_order_mock.mock_calls]
-            )
+            # all orders are cancelled at once
+            cancel_orders_mock.assert_awaited_once()
+            assert cancel_orders_mock.mock_calls[0].args[0] == open_orders
+            assert cancel_orders_mock.mock_calls[0].kwargs["dependencies"] is dependencies
+            cancelled_orders_dependencies = trading_signals.get_orders_dependencies(open_orders)
             assert convert_asset_to_target_asset_mock.call_count == 1
             assert convert_asset_to_target_asset_mock.mock_calls[0].kwargs["dependencies"] == cancelled_orders_dependencies
         assert len(cancelled_orders) == len(open_orders)
@@ -0,0 +1,49 @@
+#  Drakkar-Software OctoBot-Tentacles
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import time
+
+import numpy as np
+import tulipy
+
+import tentacles.Evaluator.Util as EvaluatorUtil
+
+CANDLES_COUNT = 5000
+EVALUATIONS_COUNT = 100
+
+
+def test_incremental_rsi_per_candle_cost():
+    # run with: pytest tests_additional/benchmarks -s
+    # constant per candle cost when only keeping the last values, whole history is recomputed otherwise
+    close = 100 + np.cumsum(np.random.default_rng(42).normal(0, 1, CANDLES_COUNT))
+    times = np.arange(CANDLES_COUNT, dtype=np.float64) * 60
+    candles_indicator = EvaluatorUtil.IncrementalCandlesIndicator(
+        lambda: EvaluatorUtil.IncrementalRSI(14, history_size=40)
+    )
+    candles_indicator.get_values(times[:-EVALUATIONS_COUNT], close[:-EVALUATIONS_COUNT])
+    t0 = time.perf_counter()
+    for end_index in range(CANDLES_COUNT - EVALUATIONS_COUNT, CANDLES_COUNT):
+        rsi_values = candles_indicator.get_values(times[:end_index], close[:end_index])
+    incremental_elapsed = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for end_index in range(CANDLES_COUNT - EVALUATIONS_COUNT, CANDLES_COUNT):
+        tulipy_rsi_values = tulipy.rsi(close[:end_index], 14)
+    full_elapsed = time.perf_counter() - t0
+    print(
+        f"RSI per candle cost on {CANDLES_COUNT} candles: "
+        f"incremental: {round(incremental_elapsed / EVALUATIONS_COUNT * 1e6, 2)}µs, "
+        f"full recompute: {round(full_elapsed / EVALUATIONS_COUNT * 1e6, 2)}µs"
+    )
+    np.testing.assert_allclose(rsi_values, tulipy_rsi_values[-len(rsi_values):])
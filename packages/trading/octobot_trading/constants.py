@@ -112,7 +112,13 @@ CCXT_OHLCV_CACHE_LIMIT = int(os.getenv("CCXT_OHLCV_CACHE_LIMIT", str(CCXT_DEFAUL
 CCXT_WATCH_ORDER_BOOK_LIMIT = int(os.getenv("CCXT_WATCH_ORDER_BOOK_LIMIT", str(CCXT_DEFAULT_CACHE_LIMIT)))
 CCXT_TIMEOUT_ON_EXIT_MS = 100
 THROTTLED_WS_UPDATES = float(os.getenv("THROTTLED_WS_UPDATES", "0.1"))  # avoid spamming CPU
+# when True, a single websocket feed is used for all symbols of a feed when supported by the exchange
+USE_MULTI_SYMBOLS_WEBSOCKET_FEEDS = os_util.parse_boolean_environment_var("USE_MULTI_SYMBOLS_WEBSOCKET_FEEDS", "False")
 MAX_CANDLES_IN_RAM = int(os.getenv("MAX_CANDLES_IN_RAM", "3000"))    # max candles per CandlesManager
+# use O(1) append ring buffers for live candles, getters then return read-only views
+ENABLE_RING_BUFFER_CANDLES = os_util.parse_boolean_environment_var("ENABLE_RING_BUFFER_CANDLES", "False")
+# compare the incrementally maintained open orders exposure to a full open orders recompute (slow, debug only)
+CHECK_OPEN_ORDERS_EXPOSURE = os_util.parse_boolean_environment_var("CHECK_OPEN_ORDERS_EXPOSURE", "False")
 STORAGE_ORIGIN_VALUE = "origin_value"
 DISPLAY_TIME_FRAME = commons_enums.TimeFrames.ONE_HOUR
 DEFAULT_SUBACCOUNT_ID = "default_subaccount_id"
@@ -134,6 +140,10 @@ ALLOW_EMPTY_TICKERS = os_util.parse_boolean_environment_var("ALLOW_EMPTY_TICKERS
 ENABLE_LIVE_CANDLES_STORAGE = os_util.parse_boolean_environment_var("ENABLE_LIVE_CANDLES_STORAGE", "False")
 ENABLE_HISTORICAL_ORDERS_UPDATES_STORAGE = os_util.parse_boolean_environment_var("ENABLE_HISTORICAL_ORDERS_UPDATES_STORAGE", "False")
 ENABLE_SIMULATED_ORDERS_STORAGE = os_util.parse_boolean_environment_var("ENABLE_SIMULATED_ORDERS_STORAGE", "False")
+# when enabled, open orders updates are appended to a journal instead of rewriting every open order on each update
+ENABLE_ORDERS_STORAGE_JOURNAL = os_util.parse_boolean_environment_var("ENABLE_ORDERS_STORAGE_JOURNAL", "False")
+# number of journaled order updates after which the journal is compacted into a new open orders snapshot
+ORDERS_STORAGE_JOURNAL_COMPACTION_SIZE = int(os.getenv("ORDERS_STORAGE_JOURNAL_COMPACTION_SIZE", "500"))
 AUTH_UPDATE_DEBOUNCE_DURATION = float(os.getenv("AUTH_UPDATE_DEBOUNCE_DURATION", "10"))
 
 # Decimal default values (decimals are immutable, can be stored as constant)
@@ -264,6 +274,8 @@ BALANCE_CHANNEL = "Balance"
 BALANCE_PROFITABILITY_CHANNEL = "BalanceProfitability"
 POSITIONS_CHANNEL = "Positions"
 INDIVIDUAL_ORDER_SYNC_TIMEOUT = 1 * commons_constants.MINUTE_TO_SECONDS
+# max number of simultaneous order creation or cancel requests when bulk orders requests are not supported
+MAX_CONCURRENT_ORDER_REQUESTS = int(os.getenv("MAX_CONCURRENT_ORDER_REQUESTS", "5"))
 MAX_TRADES_COUNT = int(os.getenv("MAX_TRADES_COUNT", "10000"))    # larger values can use a large part of ram
 
 # History
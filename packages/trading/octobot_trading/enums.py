@@ -696,6 +696,13 @@ class OrderUpdateType(enum.Enum):
     STATE_CHANGE = "state_transition"
 
 
+class StoredOrderJournalUpdateType(enum.Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    CANCELLED = "cancelled"
+    FILLED = "filled"
+
+
 class ExchangeFeatureKeys(enum.Enum):
     UNSUPPORTED_ORDERS = "unsupported_orders"
     SUPPORTED_BUNDLED_ORDERS = "supported_bundled_orders"
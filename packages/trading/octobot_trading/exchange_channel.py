@@ -94,6 +94,9 @@ class ExchangeChannel(channels.Channel):
     CRYPTOCURRENCY_KEY = "cryptocurrency"
     SYMBOL_KEY = "symbol"
     DEFAULT_PRIORITY_LEVEL = channel_enums.ChannelConsumerPriorityLevels.HIGH.value
+    # Key of the pushed data identifying updates that can replace each other in the queue
+    # of consumers created with conflate_updates=True. None when updates can't be conflated.
+    CONFLATION_KEY: typing.Optional[str] = None
 
     def __init__(self, exchange_manager):
         super().__init__()
@@ -110,9 +113,17 @@ class ExchangeChannel(channels.Channel):
                            priority_level: int = DEFAULT_PRIORITY_LEVEL,
                            symbol: str = channel_constants.CHANNEL_WILDCARD,
                            cryptocurrency: str = channel_constants.CHANNEL_WILDCARD,
+                           conflate_updates: bool = False,
                            **kwargs) -> ExchangeChannelConsumer:
+        """
+        :param conflate_updates: when True and supported by the channel, a pending update is replaced by
+        any newer update of the same symbol: the consumer only processes the latest value of each symbol.
+        Ignored on synchronized channels (backtesting).
+        """
+        conflation_key = self.get_consumer_conflation_key(self.CONFLATION_KEY if conflate_updates else None)
         consumer = consumer_instance if consumer_instance else self.CONSUMER_CLASS(
-            callback, size=size, priority_level=priority_level
+            callback, size=size, priority_level=priority_level,
+            **({} if conflation_key is None else {"conflation_key": conflation_key})
         )
         await self._add_new_consumer_and_run(consumer,
                                              cryptocurrency=cryptocurrency,
@@ -42,6 +42,7 @@ from octobot_trading.exchange_data import ohlcv
 from octobot_trading.exchange_data.ohlcv import (
     CandlesManager,
     PreloadedCandlesManager,
+    RingBufferCandlesManager,
     get_symbol_close_candles,
     get_symbol_open_candles,
     get_symbol_high_candles,
@@ -62,6 +63,8 @@ from octobot_trading.exchange_data.order_book import (
     OrderBookTickerProducer,
     OrderBookTickerChannel,
     OrderBookManager,
+    PriceLevels,
+    PriceLevelOrderBook,
     OrderBookUpdaterSimulator,
 )
 from octobot_trading.exchange_data import prices
@@ -181,6 +184,7 @@ __all__ = [
     "MarketsUpdater",
     "CandlesManager",
     "PreloadedCandlesManager",
+    "RingBufferCandlesManager",
     "get_symbol_close_candles",
     "get_symbol_open_candles",
     "get_symbol_high_candles",
@@ -198,6 +202,8 @@ __all__ = [
     "OrderBookTickerProducer",
     "OrderBookTickerChannel",
     "OrderBookManager",
+    "PriceLevels",
+    "PriceLevelOrderBook",
     "OrderBookUpdaterSimulator",
     "MarkPriceUpdaterSimulator",
     "MarkPriceProducer",
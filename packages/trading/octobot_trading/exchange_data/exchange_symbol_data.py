@@ -22,6 +22,7 @@ import octobot_commons.enums as commons_enums
 import octobot_backtesting.api as backtesting_api
 
 import octobot_trading.exchange_data.ohlcv.candles_manager as candles_manager
+import octobot_trading.exchange_data.ohlcv.ring_buffer_candles_manager as ring_buffer_candles_manager
 import octobot_trading.exchange_data.ticker.ticker_manager as ticker_manager
 import octobot_trading.exchange_data.order_book.order_book_manager as order_book_manager
 import octobot_trading.exchange_data.kline.kline_manager as kline_manager
@@ -30,6 +31,7 @@ import octobot_trading.exchange_data.prices.price_events_manager as price_events
 import octobot_trading.exchange_data.recent_trades.recent_trades_manager as recent_trades_manager
 import octobot_trading.exchange_data.funding.funding_manager as funding_manager
 import octobot_trading.exchanges
+import octobot_trading.constants as constants
 
 
 class ExchangeSymbolData:
@@ -43,7 +45,9 @@ class ExchangeSymbolData:
         self.price_events_manager: price_events_manager.PriceEventsManager = price_events_manager.PriceEventsManager()
         self.order_book_manager: order_book_manager.OrderBookManager = order_book_manager.OrderBookManager()
         self.prices_manager: prices_manager.PricesManager = prices_manager.PricesManager(self.exchange_manager, self.symbol)
-        self.recent_trades_manager: recent_trades_manager.RecentTradesManager = recent_trades_manager.RecentTradesManager()
+        self.recent_trades_manager: recent_trades_manager.RecentTradesManager = recent_trades_manager.RecentTradesManager(
+            max_recent_trades_count=self.exchange_manager.exchange_config.max_recent_trades_count
+        )
         self.ticker_manager: ticker_manager.TickerManager = ticker_manager.TickerManager()
         self.funding_manager: typing.Optional[funding_manager.FundingManager] = funding_manager.FundingManager() \
             if self.exchange_manager.is_margin or self.exchange_manager.is_future else None
@@ -90,7 +94,9 @@ class ExchangeSymbolData:
             if symbol_candles is not None:
                 return symbol_candles
         # If set, use exchange required_historical_candles_count as it is asked in configuration
-        symbol_candles = candles_manager.CandlesManager(
+        candles_manager_class = ring_buffer_candles_manager.RingBufferCandlesManager \
+            if constants.ENABLE_RING_BUFFER_CANDLES else candles_manager.CandlesManager
+        symbol_candles = candles_manager_class(
             max_candles_count=self.exchange_manager.exchange_config.required_historical_candles_count
         )
         await symbol_candles.initialize()
@@ -24,6 +24,9 @@ from octobot_trading.exchange_data.ohlcv.candles_manager import (
 from octobot_trading.exchange_data.ohlcv.preloaded_candles_manager import (
     PreloadedCandlesManager,
 )
+from octobot_trading.exchange_data.ohlcv.ring_buffer_candles_manager import (
+    RingBufferCandlesManager,
+)
 from octobot_trading.exchange_data.ohlcv.candles_adapter import (
     get_symbol_close_candles,
     get_symbol_open_candles,
@@ -45,6 +48,7 @@ from octobot_trading.exchange_data.ohlcv.channel.ohlcv_updater import (
 __all__ = [
     "CandlesManager",
     "PreloadedCandlesManager",
+    "RingBufferCandlesManager",
     "get_symbol_close_candles",
     "get_symbol_open_candles",
     "get_symbol_high_candles",
@@ -149,7 +149,7 @@ class CandlesManager(util.Initializable):
         """
         # check old candles
         for old_candle in candles_data[:-1]:
-            if old_candle[enums.PriceIndexes.IND_PRICE_TIME.value] not in self.time_candles:
+            if self._should_add_new_candle(old_candle[enums.PriceIndexes.IND_PRICE_TIME.value]):
                 self.add_new_candle(old_candle)
 
         try:
@@ -177,12 +177,44 @@ class CandlesManager(util.Initializable):
 
     # private
     def _set_all_candles(self, new_candles_data):
-        if isinstance(new_candles_data[-1], list):
+        if isinstance(new_candles_data, np.ndarray) and new_candles_data.ndim == 2:
+            self._set_all_candles_from_array(new_candles_data)
+        elif isinstance(new_candles_data[-1], list):
             for candle_data in new_candles_data:
                 self.add_new_candle(candle_data)
         else:
             self.add_new_candle(new_candles_data)
 
+    def _set_all_candles_from_array(self, candles_array):
+        # candles_array: one row per candle using PriceIndexes order, set all candles at once
+        candles_array = self._get_unique_candles(candles_array)[-self.max_candles_count:]
+        candles_count = len(candles_array)
+        self.close_candles[:candles_count] = candles_array[:, enums.PriceIndexes.IND_PRICE_CLOSE.value]
+        self.open_candles[:candles_count] = candles_array[:, enums.PriceIndexes.IND_PRICE_OPEN.value]
+        self.high_candles[:candles_count] = candles_array[:, enums.PriceIndexes.IND_PRICE_HIGH.value]
+        self.low_candles[:candles_count] = candles_array[:, enums.PriceIndexes.IND_PRICE_LOW.value]
+        self.time_candles[:candles_count] = candles_array[:, enums.PriceIndexes.IND_PRICE_TIME.value]
+        self.volume_candles[:candles_count] = candles_array[:, enums.PriceIndexes.IND_PRICE_VOL.value]
+        # same indexes as when adding candles one by one
+        self.reached_max = candles_count == self.max_candles_count
+        candles_index = candles_count - 1 if self.reached_max else candles_count
+        self.close_candles_index = candles_index
+        self.open_candles_index = candles_index
+        self.high_candles_index = candles_index
+        self.low_candles_index = candles_index
+        self.time_candles_index = candles_index
+        self.volume_candles_index = candles_index
+
+    @staticmethod
+    def _get_unique_candles(candles_array):
+        # keep the first candle of each open time, as add_new_candle does
+        _, first_indexes = np.unique(
+            candles_array[:, enums.PriceIndexes.IND_PRICE_TIME.value], return_index=True
+        )
+        if len(first_indexes) == len(candles_array):
+            return candles_array
+        return candles_array[np.sort(first_indexes)]
+
     def _change_current_candle(self):
         self.close_candles = data_util.shift_value_array(self.close_candles, -1, np.nan, np.float64)
         self.open_candles = data_util.shift_value_array(self.open_candles, -1, np.nan, np.float64)
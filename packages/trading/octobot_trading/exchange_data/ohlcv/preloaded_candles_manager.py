@@ -53,6 +53,8 @@ class PreloadedCandlesManager(candles_manager.CandlesManager):
         self.volume_candles = self._get_candle_values_array(new_candles_data, enums.PriceIndexes.IND_PRICE_VOL.value)
 
     def _get_candle_values_array(self, candles, key):
+        if isinstance(candles, np.ndarray) and candles.ndim == 2:
+            return np.array(candles[:, key], dtype=np.float64)
         return np.array([candle[key] for candle in candles], dtype=np.float64)
 
     def _get_candle_index(self, candle):
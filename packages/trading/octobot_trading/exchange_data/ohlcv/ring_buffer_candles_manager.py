@@ -0,0 +1,158 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+
+import octobot_commons.enums as enums
+
+import octobot_trading.exchange_data.ohlcv.candles_manager as candles_manager
+
+
+class RingBufferCandlesManager(candles_manager.CandlesManager):
+    """
+    CandlesManager storing candles in a single 2D buffer twice as large as max_candles_count.
+    Stored candles are the contiguous [start, end) window of this buffer: new candles are written after it
+    and the oldest candle is dropped by moving the window start, which makes appending and upserting a
+    candle O(1). Getters return read-only views instead of copies.
+    Written buffer values are never modified while returned views might use them: when the buffer is full,
+    stored candles are moved into a new buffer and updating a stored candle first copies the buffer
+    when views have been returned since the last copy.
+    """
+    CANDLE_VALUES_COUNT = len(enums.PriceIndexes)
+
+    def __init__(self, max_candles_count=None):
+        self._buffer: np.ndarray = None # type: ignore
+        self._start: int = 0
+        self._end: int = 0
+        self._slot_by_time: dict[float, int] = {}
+        self._shared_buffer: bool = False
+        super().__init__(max_candles_count=max_candles_count)
+
+    def _reset_candles(self):
+        self.candles_initialized = False
+        self.reached_max = False
+        self._buffer = self._create_buffer()
+        self._start = 0
+        self._end = 0
+        self._slot_by_time = {}
+        self._shared_buffer = False
+        self._update_views()
+
+    def upsert_candle(self, updated_candle):
+        slot = self._slot_by_time.get(float(updated_candle[enums.PriceIndexes.IND_PRICE_TIME.value]))
+        if slot is None:
+            # candle not in db, add it
+            self.add_new_candle(updated_candle)
+            return
+        if self._shared_buffer:
+            # returned views should not be updated: write into a copy
+            self._buffer = self._buffer.copy()
+            self._shared_buffer = False
+        self._write_candle(slot, updated_candle)
+        self._update_views()
+
+    def add_new_candle(self, new_candle_data):
+        candle_time = float(new_candle_data[enums.PriceIndexes.IND_PRICE_TIME.value])
+        if not self._should_add_new_candle(candle_time):
+            return
+        try:
+            if self._end == self._buffer.shape[1]:
+                self._move_candles_to_new_buffer()
+            if self._end - self._start == self.max_candles_count:
+                # drop the oldest candle, its values are left untouched for returned views
+                self._slot_by_time.pop(self._buffer[enums.PriceIndexes.IND_PRICE_TIME.value, self._start], None)
+                self._start += 1
+            self._write_candle(self._end, new_candle_data)
+            self._slot_by_time[candle_time] = self._end
+            self._end += 1
+            self.reached_max = self._end - self._start == self.max_candles_count
+            self._update_views()
+        except IndexError as e:
+            self.logger.error(f"Fail to add new candle {new_candle_data} : {e}")
+
+    def get_candle_slot(self, candle_time):
+        """
+        :param candle_time: the open time of the candle to look for
+        :return: the buffer slot of the candle, None if this candle is not stored
+        """
+        return self._slot_by_time.get(float(candle_time))
+
+    # private
+    def _create_buffer(self):
+        return np.full(
+            (self.CANDLE_VALUES_COUNT, 2 * self.max_candles_count), fill_value=np.nan, dtype=np.float64
+        )
+
+    def _move_candles_to_new_buffer(self):
+        # happens once every max_candles_count appends: amortized O(1)
+        candles_count = self._end - self._start
+        buffer = self._create_buffer()
+        buffer[:, :candles_count] = self._buffer[:, self._start:self._end]
+        self._slot_by_time = {
+            candle_time: slot - self._start
+            for candle_time, slot in self._slot_by_time.items()
+        }
+        self._buffer = buffer
+        self._start = 0
+        self._end = candles_count
+        self._shared_buffer = False
+
+    def _set_all_candles_from_array(self, candles_array):
+        candles_array = self._get_unique_candles(candles_array)[-self.max_candles_count:]
+        candles_count = len(candles_array)
+        # buffer rows are ordered as PriceIndexes
+        self._buffer[:, :candles_count] = candles_array[:, :self.CANDLE_VALUES_COUNT].T
+        self._slot_by_time = dict(zip(
+            candles_array[:, enums.PriceIndexes.IND_PRICE_TIME.value].tolist(), range(candles_count)
+        ))
+        self._start = 0
+        self._end = candles_count
+        self.reached_max = candles_count == self.max_candles_count
+        self._update_views()
+
+    def _should_add_new_candle(self, new_open_time):
+        return float(new_open_time) not in self._slot_by_time
+
+    def _write_candle(self, slot, candle):
+        # buffer rows are ordered as PriceIndexes
+        self._buffer[:, slot] = candle[:self.CANDLE_VALUES_COUNT]
+
+    def _update_views(self):
+        self.close_candles = self._get_read_only_view(enums.PriceIndexes.IND_PRICE_CLOSE)
+        self.open_candles = self._get_read_only_view(enums.PriceIndexes.IND_PRICE_OPEN)
+        self.high_candles = self._get_read_only_view(enums.PriceIndexes.IND_PRICE_HIGH)
+        self.low_candles = self._get_read_only_view(enums.PriceIndexes.IND_PRICE_LOW)
+        self.time_candles = self._get_read_only_view(enums.PriceIndexes.IND_PRICE_TIME)
+        self.volume_candles = self._get_read_only_view(enums.PriceIndexes.IND_PRICE_VOL)
+        # same indexes as CandlesManager: max_candles_count - 1 once max_candles_count is reached
+        candles_index = self._end - self._start - 1 if self.reached_max else self._end - self._start
+        self.close_candles_index = candles_index
+        self.open_candles_index = candles_index
+        self.high_candles_index = candles_index
+        self.low_candles_index = candles_index
+        self.time_candles_index = candles_index
+        self.volume_candles_index = candles_index
+
+    def _get_read_only_view(self, price_index):
+        view = self._buffer[price_index.value, self._start:self._end]
+        view.flags.writeable = False
+        return view
+
+    def _extract_limited_data(self, data, limit=-1, max_limit=-1):
+        # data is already limited to stored candles: slicing it returns a view
+        self._shared_buffer = True
+        if limit == -1:
+            return data
+        return data[max(0, len(data) - limit):]
@@ -55,6 +55,8 @@ class OrderBookProducer(exchanges_channel.ExchangeChannelProducer):
 class OrderBookChannel(exchanges_channel.ExchangeChannel):
     PRODUCER_CLASS = OrderBookProducer
     CONSUMER_CLASS = exchanges_channel.ExchangeChannelConsumer
+    # each update is a snapshot of the symbol state: only the latest one is relevant
+    CONFLATION_KEY = exchanges_channel.ExchangeChannel.SYMBOL_KEY
 
 
 class OrderBookTickerProducer(exchanges_channel.ExchangeChannelProducer):
@@ -96,3 +98,5 @@ class OrderBookTickerProducer(exchanges_channel.ExchangeChannelProducer):
 class OrderBookTickerChannel(exchanges_channel.ExchangeChannel):
     PRODUCER_CLASS = OrderBookTickerProducer
     CONSUMER_CLASS = exchanges_channel.ExchangeChannelConsumer
+    # each update is a snapshot of the symbol state: only the latest one is relevant
+    CONFLATION_KEY = exchanges_channel.ExchangeChannel.SYMBOL_KEY
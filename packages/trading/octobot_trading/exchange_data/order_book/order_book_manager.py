@@ -20,6 +20,7 @@ import octobot_commons.logging as logging
 
 import octobot_trading.enums as enums
 import octobot_trading.util as util
+import octobot_trading.exchange_data.order_book.price_level_order_book as price_level_order_book
 from octobot_trading.enums import ExchangeConstantsOrderBookInfoColumns as ECOBIC
 
 ORDER_ID_NOT_FOUND = -1
@@ -31,8 +32,13 @@ class OrderBookManager(util.Initializable):
         super().__init__()
         self.logger: logging.BotLogger = logging.get_logger(self.__class__.__name__)
         self.order_book_initialized: bool = False
-        self.asks: sortedcontainers.SortedDict = sortedcontainers.SortedDict()
-        self.bids: sortedcontainers.SortedDict = sortedcontainers.SortedDict()
+        # aggregated [price, size] levels, updated by snapshots
+        self.price_levels: price_level_order_book.PriceLevelOrderBook = \
+            price_level_order_book.PriceLevelOrderBook()
+        # order level view, built from price_levels when accessed after a snapshot
+        self._asks: sortedcontainers.SortedDict = sortedcontainers.SortedDict()
+        self._bids: sortedcontainers.SortedDict = sortedcontainers.SortedDict()
+        self._are_orders_outdated: bool = False
         self.timestamp: float = 0
         self.ask_quantity: float = 0
         self.ask_price: float = 0
@@ -42,10 +48,30 @@ class OrderBookManager(util.Initializable):
     async def initialize_impl(self):
         self.reset_order_book()
 
+    @property
+    def asks(self) -> sortedcontainers.SortedDict:
+        self._update_orders_from_price_levels()
+        return self._asks
+
+    @asks.setter
+    def asks(self, asks):
+        self._asks = asks
+
+    @property
+    def bids(self) -> sortedcontainers.SortedDict:
+        self._update_orders_from_price_levels()
+        return self._bids
+
+    @bids.setter
+    def bids(self, bids):
+        self._bids = bids
+
     def reset_order_book(self):
         self.order_book_initialized = False
-        self.asks.clear()
-        self.bids.clear()
+        self._are_orders_outdated = False
+        self.price_levels.reset()
+        self._asks.clear()
+        self._bids.clear()
         self.timestamp = 0
         self.ask_quantity, self.ask_price, self.bid_quantity, self.bid_price = 0, 0, 0, 0
 
@@ -62,12 +88,28 @@ class OrderBookManager(util.Initializable):
             self.logger.error("Failed to parse new order book")
 
     def handle_new_books(self, asks, bids, timestamp=None):
-        self.reset_order_book()
-        self.handle_book_adds(_convert_price_size_list_to_order(asks, enums.TradeOrderSide.SELL.value))
-        self.handle_book_adds(_convert_price_size_list_to_order(bids, enums.TradeOrderSide.BUY.value))
+        """
+        Replace the book by the given [price, size] asks and bids, the book is unchanged when they can't be parsed
+        :return: the ((ask prices, ask sizes), (bid prices, bid sizes)) levels changed by this snapshot,
+        removed levels have a size of 0
+        """
+        try:
+            changes = self.price_levels.apply_snapshot(asks, bids)
+        except (ValueError, IndexError) as e:
+            self.logger.error(f"Failed to parse new order book: {e}")
+            return None
         if timestamp:
             self.timestamp = timestamp
+        self._are_orders_outdated = True
         self.order_book_initialized = True
+        return changes
+
+    def _update_orders_from_price_levels(self):
+        if not self._are_orders_outdated:
+            return
+        self._are_orders_outdated = False
+        self._asks = _convert_price_levels_to_orders(self.price_levels.asks, enums.TradeOrderSide.SELL.value)
+        self._bids = _convert_price_levels_to_orders(self.price_levels.bids, enums.TradeOrderSide.BUY.value)
 
     def handle_book_adds(self, orders):
         for order in orders:
@@ -197,17 +239,17 @@ def _order_id_index(order_id, order_list):
     return ORDER_ID_NOT_FOUND
 
 
-def _convert_price_size_list_to_order(price_size_list, side):
+def _convert_price_levels_to_orders(price_levels, side):
     """
-    Convert a [price, size] list to the book order format
-    :param price_size_list: the list of [price, size]
+    Convert price levels to the book orders format
+    :param price_levels: the PriceLevels to convert
     :param side: the order side
-    :return: the converted list
+    :return: the SortedDict of price: [order]
     """
-    return [
-        _convert_price_size_to_order(price_size, side)
-        for price_size in price_size_list
-    ]
+    return sortedcontainers.SortedDict(
+        (price, [_convert_price_size_to_order((price, size), side)])
+        for price, size in zip(price_levels.get_prices().tolist(), price_levels.get_sizes().tolist())
+    )
 
 
 def _convert_price_size_to_order(price_size, side):
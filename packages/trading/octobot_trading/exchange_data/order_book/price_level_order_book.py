@@ -0,0 +1,249 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import typing
+
+import numpy as np
+
+DEFAULT_PRICE_LEVELS_CAPACITY = 256
+PRICE_INDEX = 0
+SIZE_INDEX = 1
+
+
+class PriceLevels:
+    """
+    Aggregated price levels of an order book side.
+    Prices and sizes are stored in ascending price order in preallocated numpy arrays: finding a level is a
+    O(log n) binary search, updating an existing level is done in place and adding or removing a level only
+    shifts the following levels in memory.
+    Getters return read-only views ordered from the best price to the worst one.
+    """
+
+    def __init__(self, is_descending: bool, capacity: int = DEFAULT_PRICE_LEVELS_CAPACITY):
+        # bids are best first when read from the highest price
+        self.is_descending: bool = is_descending
+        self._prices: np.ndarray = np.empty(capacity, dtype=np.float64)
+        self._sizes: np.ndarray = np.empty(capacity, dtype=np.float64)
+        self._count: int = 0
+
+    def __len__(self):
+        return self._count
+
+    def clear(self):
+        self._count = 0
+
+    def get_prices(self, limit: typing.Optional[int] = None) -> np.ndarray:
+        """
+        :param limit: max number of levels to return, all levels if None
+        :return: the prices of the best levels, best price first
+        """
+        return self._get_view(self._prices, limit)
+
+    def get_sizes(self, limit: typing.Optional[int] = None) -> np.ndarray:
+        """
+        :param limit: max number of levels to return, all levels if None
+        :return: the sizes of the best levels, best price first
+        """
+        return self._get_view(self._sizes, limit)
+
+    def get_cumulative_sizes(self, limit: typing.Optional[int] = None) -> np.ndarray:
+        """
+        :param limit: max number of levels to return, all levels if None
+        :return: the depth available at each of the best levels (sum of this level and better levels sizes)
+        """
+        return np.cumsum(self.get_sizes(limit))
+
+    def get_depth(self, price: float) -> float:
+        """
+        :param price: the worst price to consider
+        :return: the total size of the levels at this price or better
+        """
+        price = float(price)
+        if self.is_descending:
+            return float(self._sizes[self._search(price, "left"):self._count].sum())
+        return float(self._sizes[:self._search(price, "right")].sum())
+
+    def get_best(self) -> typing.Optional[tuple[float, float]]:
+        """
+        :return: the (price, size) of the best level, None when empty
+        """
+        if self._count == 0:
+            return None
+        index = self._count - 1 if self.is_descending else 0
+        return float(self._prices[index]), float(self._sizes[index])
+
+    def get_size(self, price: float) -> float:
+        """
+        :return: the size of the given price level, 0 when this level is empty
+        """
+        price = float(price)
+        index = self._search(price, "left")
+        if index < self._count and self._prices[index] == price:
+            return float(self._sizes[index])
+        return 0
+
+    def set_level(self, price: float, size: float):
+        """
+        Set the size of a price level, a size of 0 removes the level
+        """
+        price = float(price)
+        size = float(size)
+        index = self._search(price, "left")
+        exists = index < self._count and self._prices[index] == price
+        if size > 0:
+            if exists:
+                self._sizes[index] = size
+            else:
+                self._insert(index, price, size)
+        elif exists:
+            self._remove(index)
+
+    def set_levels(self, levels: typing.Iterable):
+        """
+        :param levels: [price, size] levels to set, a size of 0 removes the level
+        """
+        for level in levels:
+            self.set_level(level[PRICE_INDEX], level[SIZE_INDEX])
+
+    def replace(self, levels: typing.Iterable) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Replace every level by the given snapshot levels
+        :param levels: [price, size] levels of the snapshot
+        :return: the (prices, sizes) of the levels changed by the snapshot, a size of 0 for removed levels
+        """
+        return self._replace_sorted(*_get_sorted_levels(levels))
+
+    def _replace_sorted(self, prices: np.ndarray, sizes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        previous_prices, previous_sizes = self._prices[:self._count], self._sizes[:self._count]
+        changed_prices = np.union1d(previous_prices, prices)
+        previous_changed_sizes = _get_sizes_at(previous_prices, previous_sizes, changed_prices)
+        changed_sizes = _get_sizes_at(prices, sizes, changed_prices)
+        changed = previous_changed_sizes != changed_sizes
+        changed_prices, changed_sizes = changed_prices[changed], changed_sizes[changed]
+        if len(prices) > len(self._prices):
+            self._prices = np.empty(len(prices) * 2, dtype=np.float64)
+            self._sizes = np.empty(len(prices) * 2, dtype=np.float64)
+        self._count = len(prices)
+        self._prices[:self._count] = prices
+        self._sizes[:self._count] = sizes
+        if self.is_descending:
+            return changed_prices[::-1], changed_sizes[::-1]
+        return changed_prices, changed_sizes
+
+    def _get_view(self, values: np.ndarray, limit: typing.Optional[int]) -> np.ndarray:
+        count = self._count if limit is None else min(limit, self._count)
+        view = values[self._count - count:self._count][::-1] if self.is_descending else values[:count]
+        view.flags.writeable = False
+        return view
+
+    def _search(self, price: float, side: str) -> int:
+        return int(np.searchsorted(self._prices[:self._count], price, side=side))
+
+    def _insert(self, index: int, price: float, size: float):
+        if self._count == len(self._prices):
+            self._prices = np.concatenate((self._prices, np.empty(len(self._prices) or 1, dtype=np.float64)))
+            self._sizes = np.concatenate((self._sizes, np.empty(len(self._sizes) or 1, dtype=np.float64)))
+        self._prices[index + 1:self._count + 1] = self._prices[index:self._count]
+        self._sizes[index + 1:self._count + 1] = self._sizes[index:self._count]
+        self._prices[index] = price
+        self._sizes[index] = size
+        self._count += 1
+
+    def _remove(self, index: int):
+        self._prices[index:self._count - 1] = self._prices[index + 1:self._count]
+        self._sizes[index:self._count - 1] = self._sizes[index + 1:self._count]
+        self._count -= 1
+
+
+class PriceLevelOrderBook:
+    """
+    Order book aggregated by price levels, fed by [price, size] snapshots and level updates
+    """
+
+    def __init__(self, capacity: int = DEFAULT_PRICE_LEVELS_CAPACITY):
+        self.asks: PriceLevels = PriceLevels(False, capacity=capacity)
+        self.bids: PriceLevels = PriceLevels(True, capacity=capacity)
+        self.timestamp: float = 0
+
+    def reset(self):
+        self.asks.clear()
+        self.bids.clear()
+        self.timestamp = 0
+
+    def apply_snapshot(self, asks, bids, timestamp=None) -> tuple:
+        """
+        Replace the book content by the given [price, size] asks and bids. The book is unchanged when
+        asks or bids can't be parsed.
+        :return: the ((ask prices, ask sizes), (bid prices, bid sizes)) levels changed by this snapshot,
+        removed levels have a size of 0
+        """
+        # parse both sides before updating any of them
+        sorted_asks, sorted_bids = _get_sorted_levels(asks), _get_sorted_levels(bids)
+        changes = self.asks._replace_sorted(*sorted_asks), self.bids._replace_sorted(*sorted_bids)
+        if timestamp:
+            self.timestamp = timestamp
+        return changes
+
+    def apply_updates(self, asks=None, bids=None, timestamp=None):
+        """
+        Apply [price, size] level updates, a size of 0 removes the level
+        """
+        if asks:
+            self.asks.set_levels(asks)
+        if bids:
+            self.bids.set_levels(bids)
+        if timestamp:
+            self.timestamp = timestamp
+
+    def get_best_ask(self) -> typing.Optional[tuple[float, float]]:
+        return self.asks.get_best()
+
+    def get_best_bid(self) -> typing.Optional[tuple[float, float]]:
+        return self.bids.get_best()
+
+    def get_spread(self) -> typing.Optional[float]:
+        best_ask, best_bid = self.get_best_ask(), self.get_best_bid()
+        if best_ask is None or best_bid is None:
+            return None
+        return best_ask[PRICE_INDEX] - best_bid[PRICE_INDEX]
+
+    def get_mid_price(self) -> typing.Optional[float]:
+        best_ask, best_bid = self.get_best_ask(), self.get_best_bid()
+        if best_ask is None or best_bid is None:
+            return None
+        return (best_ask[PRICE_INDEX] + best_bid[PRICE_INDEX]) / 2
+
+
+def _get_sorted_levels(levels) -> tuple[np.ndarray, np.ndarray]:
+    """
+    :return: the ascending prices and their sizes, duplicated prices are merged and empty levels ignored
+    """
+    levels = np.asarray(levels, dtype=np.float64)
+    if levels.size == 0:
+        return np.empty(0, dtype=np.float64), np.empty(0, dtype=np.float64)
+    prices, inverse = np.unique(levels[:, PRICE_INDEX], return_inverse=True)
+    sizes = np.bincount(inverse.ravel(), weights=levels[:, SIZE_INDEX], minlength=len(prices))
+    non_empty = sizes > 0
+    return prices[non_empty], sizes[non_empty]
+
+
+def _get_sizes_at(prices: np.ndarray, sizes: np.ndarray, at_prices: np.ndarray) -> np.ndarray:
+    """
+    :return: the sizes of the given ascending prices levels at at_prices, 0 for missing levels
+    """
+    if len(prices) == 0:
+        return np.zeros(len(at_prices), dtype=np.float64)
+    indexes = np.minimum(np.searchsorted(prices, at_prices), len(prices) - 1)
+    return np.where(prices[indexes] == at_prices, sizes[indexes], 0)
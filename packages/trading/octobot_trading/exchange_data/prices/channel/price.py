@@ -58,3 +58,5 @@ class MarkPriceProducer(exchanges_channel.IndirectExchangeChannelProducer):
 class MarkPriceChannel(exchanges_channel.ExchangeChannel):
     PRODUCER_CLASS = MarkPriceProducer
     CONSUMER_CLASS = exchanges_channel.ExchangeChannelConsumer
+    # each update is a snapshot of the symbol state: only the latest one is relevant
+    CONFLATION_KEY = exchanges_channel.ExchangeChannel.SYMBOL_KEY
@@ -59,7 +59,7 @@ class MarkPriceUpdater(prices_channel.MarkPriceProducer):
             .new_consumer(self.handle_recent_trades_update)
         self.ticker_consumer = await exchanges_channel.get_chan(constants.TICKER_CHANNEL,
                                                                 self.channel.exchange_manager.id) \
-            .new_consumer(self.handle_ticker_update)
+            .new_consumer(self.handle_ticker_update, conflate_updates=True)
 
     async def unsubscribe(self):
         if self.recent_trades_consumer:
@@ -17,6 +17,8 @@ import asyncio
 import decimal
 import typing
 
+import sortedcontainers
+
 import octobot_commons.logging as logging
 from octobot_trading.enums import ExchangeConstantsOrderColumns as ECOC
 
@@ -25,19 +27,30 @@ class PriceEventsManager:
     """
     Manage price events for a specific price and timestamp
     Mainly used for updating Order status
+    Pending events are stored by trigger direction and sorted by price to only check
+    events crossed by a new price
     """
 
     """
-    The price event index from a price event tuple
+    The price event tuple indexes
     """
+    PRICE_INDEX = 0
+    TIMESTAMP_INDEX = 1
     PRICE_EVENT_INDEX = 2
+    TRIGGER_ABOVE_INDEX = 3
     PRICE_KEY = "price"
     TIME_KEY = "time"
     MAX_LAST_RECENT_PRICES = 50
 
     def __init__(self):
         self.logger: logging.BotLogger = logging.get_logger(self.__class__.__name__)
-        self.events: list[tuple[decimal.Decimal, int, asyncio.Event, bool]] = []
+        # events waiting for a price above or equal to their price, sorted by price
+        self._above_events: sortedcontainers.SortedKeyList = sortedcontainers.SortedKeyList(key=_get_event_price)
+        # events waiting for a price below or equal to their price, sorted by price
+        self._below_events: sortedcontainers.SortedKeyList = sortedcontainers.SortedKeyList(key=_get_event_price)
+        # {event: (creation index, price event tuple)}, used to remove events and keep triggers in creation order
+        self._pending_events: dict[asyncio.Event, tuple[int, tuple[decimal.Decimal, int, asyncio.Event, bool]]] = {}
+        self._created_events_count: int = 0
         self._last_recent_prices: list[dict[str, typing.Union[decimal.Decimal, int]]] = []
 
     def stop(self):
@@ -48,7 +61,16 @@ class PriceEventsManager:
         Reset price events
         """
         self.clear_recent_prices()
-        self.events.clear()
+        self._above_events.clear()
+        self._below_events.clear()
+        self._pending_events.clear()
+
+    @property
+    def events(self) -> list[tuple[decimal.Decimal, int, asyncio.Event, bool]]:
+        """
+        :return: the pending price events in creation order
+        """
+        return [price_event_tuple for _, price_event_tuple in self._pending_events.values()]
 
     def get_min_and_max_prices(self) -> (float, float):
         if len(self._last_recent_prices) < 2:
@@ -115,7 +137,7 @@ class PriceEventsManager:
             price_event_tuple[PriceEventsManager.PRICE_EVENT_INDEX].set()
         else:
             # this event will be set when conditions are met
-            self.events.append(price_event_tuple)
+            self._add_event(price_event_tuple)
         return price_event_tuple[PriceEventsManager.PRICE_EVENT_INDEX]
 
     def _is_triggered_by_last_recent_prices(self, price, timestamp, trigger_above):
@@ -151,30 +173,56 @@ class PriceEventsManager:
         event_to_set.set()
         return self._remove_event(event_to_set)
 
+    def _add_event(self, price_event_tuple):
+        """
+        Add the event to pending events
+        :param price_event_tuple: the price event tuple to add
+        """
+        self._pending_events[price_event_tuple[self.PRICE_EVENT_INDEX]] = (
+            self._created_events_count, price_event_tuple
+        )
+        self._created_events_count += 1
+        self._get_sorted_events(price_event_tuple[self.TRIGGER_ABOVE_INDEX]).add(price_event_tuple)
+
     def _remove_event(self, event_to_remove):
         """
         Remove the event from events list
         :param event_to_remove: the event to remove
         """
-        for price_event_data in self.events:
-            if event_to_remove in price_event_data:
-                return self.events.remove(price_event_data)
+        try:
+            _, price_event_tuple = self._pending_events.pop(event_to_remove)
+        except KeyError:
+            return
+        self._get_sorted_events(price_event_tuple[self.TRIGGER_ABOVE_INDEX]).remove(price_event_tuple)
+
+    def _get_sorted_events(self, trigger_above) -> sortedcontainers.SortedKeyList:
+        return self._above_events if trigger_above else self._below_events
 
     def _check_events(self, price, timestamp):
         """
-        Check for each price, timestamp pair event if it should be triggered
+        Check for each price, timestamp pair event crossed by the given price if it should be triggered
         :param price: the price used to check
         :param timestamp: the timestamp used to check
-        :return: the event list that match
-        """
-        return [
-            event
-            for event_price, event_timestamp, event, trigger_above in self.events
-            if event_timestamp <= timestamp and
-            (
-                (trigger_above and event_price <= price) or
-                (not trigger_above and event_price >= price)
+        :return: the event list that match, in events creation order
+        """
+        triggered_events = [
+            price_event_tuple
+            for crossed_events in (
+                # waiting for a price above or equal to their price: event_price <= price
+                self._above_events.irange_key(max_key=price),
+                # waiting for a price below or equal to their price: event_price >= price
+                self._below_events.irange_key(min_key=price),
             )
+            for price_event_tuple in crossed_events
+            if price_event_tuple[self.TIMESTAMP_INDEX] <= timestamp
+        ]
+        if len(triggered_events) > 1:
+            triggered_events.sort(
+                key=lambda price_event_tuple: self._pending_events[price_event_tuple[self.PRICE_EVENT_INDEX]][0]
+            )
+        return [
+            price_event_tuple[self.PRICE_EVENT_INDEX]
+            for price_event_tuple in triggered_events
         ]
 
 
@@ -187,3 +235,7 @@ def _new_price_event(price, timestamp, trigger_above):
     :return: a tuple to be added into events list
     """
     return price, timestamp, asyncio.Event(), trigger_above
+
+
+def _get_event_price(price_event_tuple):
+    return price_event_tuple[PriceEventsManager.PRICE_INDEX]
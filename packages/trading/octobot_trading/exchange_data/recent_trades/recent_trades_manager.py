@@ -14,9 +14,11 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import collections
+import typing
 
 import octobot_commons.logging as logging
 
+import octobot_trading.enums as enums
 import octobot_trading.util as util
 
 
@@ -24,11 +26,17 @@ class RecentTradesManager(util.Initializable):
     MAX_RECENT_TRADES_COUNT = 100
     MAX_LIQUIDATIONS_COUNT = 20
 
-    def __init__(self):
+    def __init__(self, max_recent_trades_count: typing.Optional[int] = None,
+                 max_liquidations_count: typing.Optional[int] = None):
         super().__init__()
         self.logger: logging.BotLogger = logging.get_logger(self.__class__.__name__)
-        self.recent_trades: collections.deque[dict] = collections.deque(maxlen=self.MAX_RECENT_TRADES_COUNT)
-        self.liquidations: collections.deque[dict] = collections.deque(maxlen=self.MAX_LIQUIDATIONS_COUNT)
+        self.max_recent_trades_count: int = max_recent_trades_count or self.MAX_RECENT_TRADES_COUNT
+        self.max_liquidations_count: int = max_liquidations_count or self.MAX_LIQUIDATIONS_COUNT
+        self.recent_trades: collections.deque[dict] = collections.deque(maxlen=self.max_recent_trades_count)
+        self.liquidations: collections.deque[dict] = collections.deque(maxlen=self.max_liquidations_count)
+        # occurrences count of each stored element key, kept in sync with the bounded deques to filter duplicates
+        self._recent_trades_keys: dict[typing.Hashable, int] = {}
+        self._liquidations_keys: dict[typing.Hashable, int] = {}
         self._reset_recent_trades()
 
     async def initialize_impl(self):
@@ -36,28 +44,71 @@ class RecentTradesManager(util.Initializable):
 
     def set_all_recent_trades(self, recent_trades):
         if recent_trades:
-            self.recent_trades = recent_trades
-            return self.recent_trades
+            self.recent_trades = collections.deque(recent_trades, maxlen=self.max_recent_trades_count)
+            self._recent_trades_keys = {}
+            for trade in self.recent_trades:
+                key = _get_recent_trade_key(trade)
+                self._recent_trades_keys[key] = self._recent_trades_keys.get(key, 0) + 1
+            return recent_trades
 
     def add_new_trades(self, recent_trades):
         if recent_trades:
-            new_recent_trades: list = [
-                trade
-                for trade in recent_trades
-                if trade not in self.recent_trades
-            ]
-            self.recent_trades.extend(new_recent_trades)
-            return new_recent_trades
+            return _add_new_elements(
+                recent_trades, self.recent_trades, self._recent_trades_keys, _get_recent_trade_key
+            )
 
     def add_new_liquidations(self, liquidations):
         if liquidations:
-            new_liquidations: list = [
-                liquidation
-                for liquidation in liquidations
-                if liquidation not in self.liquidations]
-            self.liquidations.extend(new_liquidations)
-            return new_liquidations
+            return _add_new_elements(
+                liquidations, self.liquidations, self._liquidations_keys, _get_liquidation_key
+            )
 
     def _reset_recent_trades(self):
-        self.recent_trades = collections.deque(maxlen=self.MAX_RECENT_TRADES_COUNT)
-        self.liquidations = collections.deque(maxlen=self.MAX_LIQUIDATIONS_COUNT)
+        self.recent_trades = collections.deque(maxlen=self.max_recent_trades_count)
+        self.liquidations = collections.deque(maxlen=self.max_liquidations_count)
+        self._recent_trades_keys = {}
+        self._liquidations_keys = {}
+
+
+def _add_new_elements(
+    elements: list, stored_elements: collections.deque, stored_keys: dict, key_factory: typing.Callable
+) -> list:
+    # new elements are checked against stored elements as they were before this update
+    new_elements_by_key = {}
+    for element in elements:
+        key = key_factory(element)
+        if key not in stored_keys and key not in new_elements_by_key:
+            new_elements_by_key[key] = element
+    for key, element in new_elements_by_key.items():
+        if len(stored_elements) == stored_elements.maxlen:
+            # the oldest element is about to be dropped from the deque: forget its key
+            evicted_key = key_factory(stored_elements[0])
+            if stored_keys.get(evicted_key, 0) > 1:
+                stored_keys[evicted_key] -= 1
+            else:
+                stored_keys.pop(evicted_key, None)
+        stored_elements.append(element)
+        stored_keys[key] = stored_keys.get(key, 0) + 1
+    return list(new_elements_by_key.values())
+
+
+def _get_recent_trade_key(trade: dict) -> typing.Hashable:
+    if (trade_id := trade.get(enums.ExchangeConstantsOrderColumns.ID.value)) is not None:
+        return trade_id
+    return (
+        trade.get(enums.ExchangeConstantsOrderColumns.TIMESTAMP.value),
+        trade.get(enums.ExchangeConstantsOrderColumns.SIDE.value),
+        trade.get(enums.ExchangeConstantsOrderColumns.PRICE.value),
+        trade.get(enums.ExchangeConstantsOrderColumns.AMOUNT.value),
+    )
+
+
+def _get_liquidation_key(liquidation: dict) -> typing.Hashable:
+    if (liquidation_id := liquidation.get(enums.ExchangeConstantsLiquidationColumns.ID.value)) is not None:
+        return liquidation_id
+    return (
+        liquidation.get(enums.ExchangeConstantsLiquidationColumns.TIMESTAMP.value),
+        liquidation.get(enums.ExchangeConstantsLiquidationColumns.SIDE.value),
+        liquidation.get(enums.ExchangeConstantsLiquidationColumns.PRICE.value),
+        liquidation.get(enums.ExchangeConstantsLiquidationColumns.QUANTITY.value),
+    )
@@ -133,6 +133,8 @@ class TickerProducer(exchanges_channel.ExchangeChannelProducer):
 class TickerChannel(exchanges_channel.ExchangeChannel):
     PRODUCER_CLASS = TickerProducer
     CONSUMER_CLASS = exchanges_channel.ExchangeChannelConsumer
+    # each update is a snapshot of the symbol state: only the latest one is relevant
+    CONFLATION_KEY = exchanges_channel.ExchangeChannel.SYMBOL_KEY
 
 
 class MiniTickerProducer(exchanges_channel.ExchangeChannelProducer):
@@ -168,3 +170,5 @@ class MiniTickerProducer(exchanges_channel.ExchangeChannelProducer):
 class MiniTickerChannel(exchanges_channel.ExchangeChannel):
     PRODUCER_CLASS = MiniTickerProducer
     CONSUMER_CLASS = exchanges_channel.ExchangeChannelConsumer
+    # each update is a snapshot of the symbol state: only the latest one is relevant
+    CONFLATION_KEY = exchanges_channel.ExchangeChannel.SYMBOL_KEY
@@ -348,6 +348,17 @@ class AbstractExchange(octobot_trading.accounts.AbstractAccount):
         """
         raise NotImplementedError("cancel_order is not implemented")
 
+    async def cancel_orders(
+            self, exchange_order_ids: list[str], symbol: str, **kwargs: dict
+    ) -> list[enums.OrderStatus]:
+        """
+        Cancel orders on the exchange using a single request
+        :param exchange_order_ids: the orders ids on exchange
+        :param symbol: the orders symbol
+        :return: the status of each order after cancel
+        """
+        raise NotImplementedError("cancel_orders is not implemented")
+
     async def create_order(self, order_type: enums.TraderOrderType, symbol: str, quantity: decimal.Decimal,
                            price: decimal.Decimal = None, stop_price: decimal.Decimal = None,
                            side: enums.TradeOrderSide = None, current_price: decimal.Decimal = None,
@@ -367,6 +378,14 @@ class AbstractExchange(octobot_trading.accounts.AbstractAccount):
         """
         raise NotImplementedError("create_order is not implemented")
 
+    async def create_orders(self, orders: list[dict]) -> list[typing.Optional[dict]]:
+        """
+        Create orders on the exchange using a single request
+        :param orders: the create_order arguments of each order
+        :return: the created orders dicts, None for each order that could not be created
+        """
+        raise NotImplementedError("create_orders is not implemented")
+
     async def get_position(self, symbol: str, **kwargs: dict) -> dict:
         """
         Get a position
@@ -441,6 +460,18 @@ class AbstractExchange(octobot_trading.accounts.AbstractAccount):
         """
         raise NotImplementedError("supports_bundled_orders is not implemented")
 
+    def supports_bulk_orders_creation(self) -> bool:
+        """
+        Returns True when this exchange supports creating multiple orders using a single request.
+        """
+        raise NotImplementedError("supports_bulk_orders_creation is not implemented")
+
+    def supports_bulk_orders_cancel(self) -> bool:
+        """
+        Returns True when this exchange supports cancelling multiple orders using a single request.
+        """
+        raise NotImplementedError("supports_bulk_orders_cancel is not implemented")
+
     def get_bundled_order_parameters(self, order, stop_loss_price=None, take_profit_price=None) -> dict:
         """
         Returns the updated params when this exchange supports orders created upon other orders fill
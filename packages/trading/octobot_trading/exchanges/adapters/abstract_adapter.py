@@ -38,6 +38,11 @@ def _adapter(func):
 
 
 class AbstractAdapter:
+    # When True, fix_ methods of market data (ticker, ohlcv, kline, order book and public recent trades) build new
+    # structures and never edit the raw data they are given: raw data can be adapted without being copied first.
+    # parse_ methods can still edit the fixed data.
+    PRESERVES_RAW_MARKET_DATA: bool = False
+
     def __init__(self, connector):
         self.logger = logging.get_logger(self.__class__.__name__)
         self.connector = connector
@@ -82,6 +82,9 @@ class ExchangeConfig(util.Initializable):
         # When False, cancelled orders won't be saved in trades history
         self.is_saving_cancelled_orders_as_trade: bool = True
 
+        # max number of recent trades to keep per symbol, use RecentTradesManager default when None
+        self.max_recent_trades_count: typing.Optional[int] = None
+
         # When True, short timeframes will be added for real-time evaluators
         self.realtime_data_fetching: bool = False
 
@@ -164,6 +167,9 @@ class ExchangeConfig(util.Initializable):
     def set_is_saving_cancelled_orders_as_trade(self, value: bool):
         self.is_saving_cancelled_orders_as_trade = value
 
+    def set_max_recent_trades_count(self, value: typing.Optional[int]):
+        self.max_recent_trades_count = value
+
     async def add_watched_symbols(self, symbols: list[str]):
         await self.update_traded_symbol_pairs(
             added_pairs=symbols, removed_pairs=[], added_time_frames=[], watch_only=True
@@ -43,6 +43,9 @@ import octobot_commons.constants as common_constants
 
 
 class CCXTAdapter(adapters.AbstractAdapter):
+    # subclasses editing raw market data in their fix_ methods should set this to False
+    PRESERVES_RAW_MARKET_DATA = True
+
     def fix_order(self, raw: CCXTOrder, symbol=None, **kwargs) -> dict:
         fixed = super().fix_order(raw, **kwargs)
         try:
@@ -130,7 +133,9 @@ class CCXTAdapter(adapters.AbstractAdapter):
         if "time_frame" in kwargs:
             candles_s = common_enums.TimeFramesMinutes[common_enums.TimeFrames(kwargs["time_frame"])] * \
                         common_constants.MINUTE_TO_SECONDS
-        for _, ohlcv in enumerate(fixed):
+        # don't edit raw candles: they can be ccxt internal buffers
+        fixed = [list(ohlcv) for ohlcv in fixed]
+        for ohlcv in fixed:
             try:
                 int_val = int(self.get_uniformized_timestamp(ohlcv[common_enums.PriceIndexes.IND_PRICE_TIME.value]))
                 ohlcv[common_enums.PriceIndexes.IND_PRICE_TIME.value] = int_val - (int_val % candles_s)
@@ -144,8 +149,9 @@ class CCXTAdapter(adapters.AbstractAdapter):
         return fixed
 
     def fix_kline(self, raw: dict, **kwargs) -> dict:
-        fixed = super().fix_kline(raw, **kwargs)
-        for _, kline in enumerate(fixed):
+        # don't edit raw klines: they can be ccxt internal buffers
+        fixed = [list(kline) for kline in super().fix_kline(raw, **kwargs)]
+        for kline in fixed:
             try:
                 kline[common_enums.PriceIndexes.IND_PRICE_TIME.value] = \
                     int(self.get_uniformized_timestamp(kline[common_enums.PriceIndexes.IND_PRICE_TIME.value]))
@@ -159,7 +165,8 @@ class CCXTAdapter(adapters.AbstractAdapter):
         return fixed
 
     def fix_ticker(self, raw: CCXTTicker, **kwargs) -> dict:
-        fixed = super().fix_ticker(raw, **kwargs)
+        # don't edit raw ticker: it can be a ccxt internal buffer
+        fixed = dict(super().fix_ticker(raw, **kwargs))
         # CCXT standard ticker fixing logic
         if timestamp := fixed.get(enums.ExchangeConstantsTickersColumns.TIMESTAMP.value):
             fixed[enums.ExchangeConstantsTickersColumns.TIMESTAMP.value] = \
@@ -202,7 +209,8 @@ class CCXTAdapter(adapters.AbstractAdapter):
         return portfolio_util.parse_decimal_portfolio(fixed)
 
     def fix_order_book(self, raw: CCXTOrderBook, **kwargs) -> dict:
-        fixed = super().fix_order_book(raw, **kwargs)
+        # don't edit raw order book: it can be a ccxt internal buffer
+        fixed = dict(super().fix_order_book(raw, **kwargs))
         # CCXT standard order_book fixing logic
         try:
             exchange_timestamp = fixed[enums.ExchangeConstantsOrderBookInfoColumns.TIMESTAMP.value]
@@ -222,7 +230,8 @@ class CCXTAdapter(adapters.AbstractAdapter):
         return fixed # type: ignore
 
     def fix_public_recent_trades(self, raw: list[CCXTTrade], **kwargs) -> list[dict]:
-        fixed = super().fix_public_recent_trades(raw, **kwargs)
+        # don't edit raw trades: they can be ccxt internal buffers
+        fixed = [dict(recent_trade) for recent_trade in super().fix_public_recent_trades(raw, **kwargs)]
         # CCXT standard public_recent_trades fixing logic
         for recent_trade in fixed:
             try:
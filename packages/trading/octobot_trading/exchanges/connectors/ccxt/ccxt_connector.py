@@ -378,6 +378,16 @@ class CCXTConnector(abstract_exchange.AbstractExchange):
             self.client, exchanges.get_exchange_type(self.exchange_manager), order_type
         )
 
+    def supports_bulk_orders_creation(self) -> bool:
+        if self.client is None:
+            raise ValueError("Client is not initialized")
+        return bool(self.client.has.get('createOrders'))
+
+    def supports_bulk_orders_cancel(self) -> bool:
+        if self.client is None:
+            raise ValueError("Client is not initialized")
+        return bool(self.client.has.get('cancelOrders'))
+
     def fetch_stop_order_in_different_request(self, symbol: str) -> bool:
         if not self.client.has.get('fetchStopOrderInDifferentRequest'):
             return False
@@ -919,6 +929,22 @@ class CCXTConnector(abstract_exchange.AbstractExchange):
             symbol=symbol, quantity=quantity
         )
 
+    @ccxt_client_util.converted_ccxt_common_errors
+    async def create_orders(self, orders: list[dict]) -> list[typing.Optional[dict]]:
+        """
+        :param orders: ccxt create_orders arguments: dicts of symbol, type, side, amount, price and params
+        :return: the adapted created orders, None for each order that has not been created
+        """
+        try:
+            created_orders = await self.client.create_orders(orders)
+        except ccxt.async_support.NotSupported as err:
+            raise octobot_trading.errors.NotSupported(err) from err
+        return [
+            self.adapter.adapt_order(created_order, symbol=order["symbol"], quantity=order["amount"])
+            if created_order and created_order.get(ecoc.ID.value) else None
+            for order, created_order in zip(orders, created_orders)
+        ]
+
     def _add_stop_loss_price_param(self, params: dict, price: float):
         params = params or {}
         stop_loss_create_price_param = self.exchange_manager.exchange.get_option_value(
@@ -1066,6 +1092,37 @@ class CCXTConnector(abstract_exchange.AbstractExchange):
             )
             raise e
 
+    @ccxt_client_util.converted_ccxt_common_errors
+    async def cancel_orders(
+        self, exchange_order_ids: list[str], symbol: str, **kwargs: dict
+    ) -> list[enums.OrderStatus]:
+        try:
+            with self.error_describer(True):
+                cancelled_orders = await self.client.cancel_orders(exchange_order_ids, symbol=symbol, params=kwargs)
+        except (ccxt.async_support.NotSupported, octobot_trading.errors.NotSupported) as e:
+            raise octobot_trading.errors.NotSupported(e) from e
+        except Exception as e:
+            self.logger.exception(
+                e,
+                True,
+                f"Unexpected error when cancelling {len(exchange_order_ids)} {symbol} orders | "
+                f"{html_util.get_html_summary_if_relevant(e)} ({e.__class__.__name__})"
+            )
+            raise e
+        cancelled_orders_by_id = {
+            cancelled_order.get(ecoc.ID.value): cancelled_order
+            for cancelled_order in cancelled_orders or []
+            if cancelled_order
+        }
+        return [
+            # orders missing from the response are being cancelled: order states will sync them
+            enums.OrderStatus.CANCELED
+            if exchange_order_id in cancelled_orders_by_id
+            and personal_data.parse_is_cancelled(cancelled_orders_by_id[exchange_order_id])
+            else enums.OrderStatus.PENDING_CANCEL
+            for exchange_order_id in exchange_order_ids
+        ]
+
     @ccxt_client_util.converted_ccxt_common_errors
     async def cancel_order(
         self, exchange_order_id: str, symbol: str, order_type: enums.TraderOrderType, **kwargs: dict
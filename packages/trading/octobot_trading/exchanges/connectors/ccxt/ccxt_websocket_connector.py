@@ -54,6 +54,9 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
     FIX_CANDLES_TIMEZONE_IF_NEEDED: bool = False  # if True, the candles timestamps will be fixed to the UTC timezone, used when WS is returning candle timestamps in a non UTC timezone
     REQUIRES_PROXY_IF_REST_PROXY_ENABLED: bool = False # if True, the ws connector will require a proxy if the rest proxy is enabled.
     # If not provided, the ws connector won't be used
+    # if True, feeds of MULTI_SYMBOLS_CHANNELS use a single task and ccxt watcher for all their symbols
+    # when supported by the exchange. Per symbol tasks are used otherwise.
+    USE_MULTI_SYMBOLS_FEEDS: bool = trading_constants.USE_MULTI_SYMBOLS_WEBSOCKET_FEEDS
 
     IGNORED_FEED_PAIRS = {
         # When ticker or future index is available : no need to calculate mark price from recent trades
@@ -98,6 +101,27 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
         Feeds.L2_BOOK,
         Feeds.L3_BOOK,
     ]
+    # Feeds which callbacks only read the received data or give it to adapters.
+    # When the adapter preserves raw market data, their ccxt data is used without being copied first.
+    COPY_FREE_CHANNELS = [
+        Feeds.TICKER,
+        Feeds.TRADES,
+        Feeds.CANDLE,
+        Feeds.KLINE,
+        Feeds.L1_BOOK,
+        Feeds.L2_BOOK,
+        Feeds.L3_BOOK,
+    ]
+    # Feeds that can be watched for multiple symbols at once, associated to their ccxt multi symbols watcher
+    MULTI_SYMBOLS_CHANNELS = {
+        Feeds.TICKER: "watchTickers",
+        Feeds.TRADES: "watchTradesForSymbols",
+        Feeds.CANDLE: "watchOHLCVForSymbols",
+        Feeds.KLINE: "watchOHLCVForSymbols",
+        Feeds.L1_BOOK: "watchOrderBookForSymbols",
+        Feeds.L2_BOOK: "watchOrderBookForSymbols",
+        Feeds.L3_BOOK: "watchOrderBookForSymbols",
+    }
     AUTHENTICATED_CHANNELS = [
         trading_enums.WebsocketFeeds.ORDERS,
         trading_enums.WebsocketFeeds.PORTFOLIO,
@@ -550,6 +574,11 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
             Feeds.CANCEL_ORDER: self._get_generator("watchCancelOrder"),
         }
 
+    def _get_multi_symbols_feed_generator(self, feed):
+        if not self.USE_MULTI_SYMBOLS_FEEDS or feed not in self.MULTI_SYMBOLS_CHANNELS:
+            return Feeds.UNSUPPORTED
+        return self._get_generator(self.MULTI_SYMBOLS_CHANNELS[feed])
+
     def _get_generator(self, method_name):
         return (
             getattr(self.client, method_name)
@@ -631,10 +660,19 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
             kwargs["limit"] = limit
         if params is not None:
             kwargs["params"] = params
-        if symbols is not None:
+        multi_symbols_feed_generator = (
+            Feeds.UNSUPPORTED if symbols is None else self._get_multi_symbols_feed_generator(feed)
+        )
+        if multi_symbols_feed_generator is not Feeds.UNSUPPORTED:
+            # one task for all symbols: demultiplexed into per symbol callbacks
+            added_subscriptions = self._create_multi_symbols_task_if_necessary(
+                feed, feed_callback, multi_symbols_feed_generator, symbols, **kwargs
+            )
+            has_added_feed = bool(added_subscriptions)
+        elif symbols is not None:
             for symbol in symbols:
                 kwargs["symbol"] = symbol
-                # one task per symbol: ccxt_pro is not handling multi symbol generators
+                # one task per symbol: the exchange is not supporting multi symbols generators for this feed
                 if self._create_task_if_necessary(
                     feed, feed_callback, feed_generator, **kwargs
                 ):
@@ -670,6 +708,89 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
         enable_throttling = (
             feed in self.THROTTLED_CHANNELS and self.throttled_ws_updates != 0.0
         )
+        await self._watch_feed(
+            feed, callback, watch_func, self._get_feed_generator_by_feed, enable_throttling, *g_args, **g_kwargs
+        )
+
+    async def _multi_symbols_feed_task(self, feed, callback, watch_func, symbols, **kwargs):
+        initialized_symbols = await asyncio.gather(
+            *(self._wait_for_initialization(feed, symbol=symbol, **kwargs) for symbol in symbols)
+        )
+        ready_symbols = [
+            symbol
+            for symbol, is_initialized in zip(symbols, initialized_symbols)
+            if is_initialized
+        ]
+        if len(ready_symbols) < len(symbols):
+            self.logger.error(
+                f"Aborting {feed.value} feed connection with {kwargs} for "
+                f"{[symbol for symbol in symbols if symbol not in ready_symbols]}: "
+                f"missing required initialization data"
+            )
+        if not ready_symbols:
+            return
+
+        async def symbols_callback(update_data, **_):
+            for symbol, symbol_update_data in self._get_updates_by_symbol(
+                feed, update_data, kwargs.get("timeframe")
+            ):
+                await callback(symbol_update_data, symbol=symbol, **kwargs)
+
+        await self._watch_feed(
+            feed,
+            symbols_callback,
+            watch_func,
+            lambda: {feed: self._get_multi_symbols_feed_generator(feed)},
+            # never throttle: updates of other symbols received in between would be skipped
+            False,
+            **self._get_multi_symbols_watch_kwargs(feed, ready_symbols, kwargs),
+        )
+
+    def _get_multi_symbols_watch_kwargs(self, feed, symbols, kwargs):
+        # only keep args supported by multi symbols watchers
+        ignored_keys = ("timeframe", "since", "limit") if feed is Feeds.TICKER else ("timeframe", "since")
+        watch_kwargs = {
+            key: value for key, value in kwargs.items() if key not in ignored_keys
+        }
+        if feed in (Feeds.CANDLE, Feeds.KLINE):
+            watch_kwargs["symbolsAndTimeframes"] = [
+                [symbol, kwargs["timeframe"]] for symbol in symbols
+            ]
+        else:
+            watch_kwargs["symbols"] = symbols
+        if "since" in kwargs and feed in (Feeds.TRADES, Feeds.CANDLE, Feeds.KLINE):
+            watch_kwargs["since"] = kwargs["since"]
+        return watch_kwargs
+
+    def _get_updates_by_symbol(self, feed, update_data, time_frame) -> list[tuple[str, typing.Any]]:
+        """
+        :return: the (symbol, update data) of each symbol updated in a multi symbols watcher update
+        """
+        if feed is Feeds.TICKER:
+            # {symbol: ticker}
+            return list(update_data.items())
+        if feed is Feeds.TRADES:
+            # trades of possibly multiple symbols
+            trades_by_symbol = {}
+            for trade in update_data:
+                trades_by_symbol.setdefault(
+                    trade[trading_enums.ExchangeConstantsOrderColumns.SYMBOL.value], []
+                ).append(trade)
+            return list(trades_by_symbol.items())
+        if feed in (Feeds.CANDLE, Feeds.KLINE):
+            # {symbol: {time_frame: candles}}
+            return [
+                (symbol, candles_by_time_frame[time_frame])
+                for symbol, candles_by_time_frame in update_data.items()
+                if candles_by_time_frame.get(time_frame)
+            ]
+        # order book of a single symbol
+        return [(update_data[Ectc.SYMBOL.value], update_data)]
+
+    async def _watch_feed(
+        self, feed, callback, watch_func, get_generator_by_feed, enable_throttling, *g_args, **g_kwargs
+    ):
+        copy_update_data = not self._is_copy_free_channel(feed)
         ws_des = f"{watch_func.__name__} {g_kwargs}"
         subsequent_disconnections = 0
         already_got_feed_stopping_error = False
@@ -686,9 +807,11 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
                 subsequent_disconnections = 0
                 already_got_closed_by_user_error = False
                 if update_data:
-                    # Use a copy of the update data as it will be edited by adapters.
+                    # Use a copy of the update data when it might be edited by adapters.
                     # We should avoid editing the original object since it is also used in ccxt internally buffers
-                    await callback(copy.deepcopy(update_data), **g_kwargs)
+                    await callback(
+                        copy.deepcopy(update_data) if copy_update_data else update_data, **g_kwargs
+                    )
                 if enable_throttling:
                     # ccxt keeps updating the internal structures while waiting
                     # https://docs.ccxt.com/en/latest/ccxt.pro.manual.html?rtd_search=fetchLedger#incremental-data-structures
@@ -732,7 +855,7 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
                 await asyncio.sleep(reconnect_delay)
                 self.logger.debug(f"Reconnecting to {ws_des}")
                 # self.client might have changed
-                watch_func = self._get_feed_generator_by_feed()[feed]
+                watch_func = get_generator_by_feed()[feed]
                 subsequent_disconnections += (
                     1  # wait for a longer time before the next reconnect
                 )
@@ -749,7 +872,7 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
                 already_got_feed_stopping_error = True
                 await asyncio.sleep(self.LONG_RECONNECT_DELAY)  # avoid spamming
                 # self.client might have changed
-                watch_func = self._get_feed_generator_by_feed()[feed]
+                watch_func = get_generator_by_feed()[feed]
             except ccxt.NotSupported as err:
                 self.logger.exception(
                     err,
@@ -796,7 +919,7 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
                     1  # wait for a longer time before the next reconnect
                 )
                 # self.client might have changed
-                watch_func = self._get_feed_generator_by_feed()[feed]
+                watch_func = get_generator_by_feed()[feed]
 
     def _create_task_if_necessary(self, feed, feed_callback, feed_generator, **kwargs):
         identifier = self._get_feed_identifier(feed_generator, kwargs)
@@ -810,6 +933,34 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
             return True
         return False
 
+    def _create_multi_symbols_task_if_necessary(
+        self, feed, feed_callback, feed_generator, symbols, **kwargs
+    ) -> list[str]:
+        # symbols are registered one by one to subscribe only to new symbols when adding pairs
+        identifier_by_symbol = {
+            symbol: self._get_feed_identifier(feed_generator, {**kwargs, "symbol": symbol})
+            for symbol in symbols
+        }
+        new_symbols = [
+            symbol
+            for symbol, identifier in identifier_by_symbol.items()
+            if identifier not in self.feed_tasks
+        ]
+        if new_symbols:
+            self.logger.info(
+                f"Subscribing to {feed.value} for {len(new_symbols)} symbols with {kwargs} "
+                f"({len(self.feed_tasks)} total feeds)"
+            )
+            task = asyncio.create_task(
+                self._multi_symbols_feed_task(feed, feed_callback, feed_generator, new_symbols, **kwargs)
+            )
+            for symbol in new_symbols:
+                self.feed_tasks[identifier_by_symbol[symbol]] = task
+        return new_symbols
+
+    def _is_copy_free_channel(self, feed) -> bool:
+        return self.adapter.PRESERVES_RAW_MARKET_DATA and feed in self.COPY_FREE_CHANNELS
+
     async def _wait_for_initialization(self, feed, *g_args, **g_kwargs):
         if (
             not self.is_feed_requiring_init(feed)
@@ -981,23 +1132,6 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
                 total_count += len(pairs) * len(time_frames)
         return total_count
 
-    def _convert_book_prices_to_orders(self, book_prices_and_volumes, book_side):
-        """
-        Convert a book_prices format : {PRICE_1: SIZE_1, PRICE_2: SIZE_2...}
-        to OctoBot's order book format
-        :param book_prices: an order book dictionary (order_book.SortedDict)
-        :param book_side: a TradeOrderSide value
-        :return: the list of order book data converted
-        """
-        return [
-            {
-                ECOBIC.PRICE.value: float(book_price_and_volume[0]),
-                ECOBIC.SIZE.value: float(book_price_and_volume[1]),
-                ECOBIC.SIDE.value: book_side,
-            }
-            for book_price_and_volume in book_prices_and_volumes
-        ]
-
     """
     Callbacks
     """
@@ -1034,14 +1168,15 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
         """
         book_instance = self.get_book_instance(symbol)
 
-        book_instance.handle_book_adds(
-            self._convert_book_prices_to_orders(
-                order_book[ECOBIC.ASKS.value], trading_enums.TradeOrderSide.SELL.value
-            )
-            + self._convert_book_prices_to_orders(
-                order_book[ECOBIC.BIDS.value], trading_enums.TradeOrderSide.BUY.value
-            )
+        # ccxt order_book is the whole book: apply it as a snapshot
+        changes = book_instance.handle_new_books(
+            order_book[ECOBIC.ASKS.value],
+            order_book[ECOBIC.BIDS.value],
+            timestamp=order_book.get(ECOBIC.TIMESTAMP.value),
         )
+        if changes is None or not any(len(changed_prices) for changed_prices, _ in changes):
+            # invalid book or no updated price level
+            return
 
         await self.push_to_channel(
             trading_constants.ORDER_BOOK_CHANNEL,
@@ -1073,7 +1208,9 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
             except ValueError as err:
                 self.logger.info(f"Skipped websocket candle({symbol} {timeframe}): {err}")
                 return
-        kline = self.adapter.adapt_kline([copy.deepcopy(candles[-1])])[0]
+        kline = self.adapter.adapt_kline(
+            [candles[-1] if self.adapter.PRESERVES_RAW_MARKET_DATA else copy.deepcopy(candles[-1])]
+        )[0]
         adapted = self.adapter.adapt_ohlcv(candles, time_frame=time_frame)
         last_candle = adapted[-1]
         if symbol not in self.watched_pairs:
@@ -1323,11 +1460,15 @@ class CCXTWebsocketConnector(abstract_websocket_exchange.AbstractWebsocketExchan
         return self._errors_count[time_frame][error_key]
 
     def _fix_candles_timestamps(self, candles: list, time_frame: commons_enums.TimeFrames) -> list:
+        # return new candles: received candles can be ccxt internal buffers
+        fixed_candles = []
         for candle in candles:
-            candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value] = self._get_utc_candle_timestamp(
+            fixed_candle = list(candle)
+            fixed_candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value] = self._get_utc_candle_timestamp(
                 candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value], time_frame
             )
-        return candles
+            fixed_candles.append(fixed_candle)
+        return fixed_candles
 
     def _get_utc_candle_timestamp(self, timestamp: float, time_frame: commons_enums.TimeFrames) -> float:
         uniformized_timestamp = self.adapter.get_uniformized_timestamp(timestamp)
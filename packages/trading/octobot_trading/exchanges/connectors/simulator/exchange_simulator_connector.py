@@ -15,6 +15,7 @@
 #  License along with this library.
 import decimal
 import typing
+import uuid
 
 import octobot_backtesting.api as backtesting_api
 import octobot_backtesting.importers as importers
@@ -93,6 +94,41 @@ class ExchangeSimulatorConnector(abstract_exchange.AbstractExchange):
             self._get_exchange_class_rest_name(), util.get_exchange_type(self.exchange_manager), order_type
         )
 
+    def supports_bulk_orders_creation(self) -> bool:
+        return True
+
+    def supports_bulk_orders_cancel(self) -> bool:
+        return True
+
+    async def create_orders(self, orders: list[dict]) -> list[typing.Optional[dict]]:
+        # same limit orders only rule as real exchanges to keep backtesting on the real exchanges code path
+        if any(
+            order["order_type"] not in (enums.TraderOrderType.BUY_LIMIT, enums.TraderOrderType.SELL_LIMIT)
+            for order in orders
+        ):
+            raise errors.NotSupported("Only limit orders can be created in bulk")
+        creation_time = self.get_exchange_current_time()
+        return [
+            {
+                enums.ExchangeConstantsOrderColumns.EXCHANGE_ID.value: str(uuid.uuid4()),
+                enums.ExchangeConstantsOrderColumns.TIMESTAMP.value: creation_time,
+                enums.ExchangeConstantsOrderColumns.SYMBOL.value: order["symbol"],
+                enums.ExchangeConstantsOrderColumns.TYPE.value: enums.TradeOrderType.LIMIT.value,
+                enums.ExchangeConstantsOrderColumns.SIDE.value: order["side"].value,
+                enums.ExchangeConstantsOrderColumns.PRICE.value: float(order["price"]),
+                enums.ExchangeConstantsOrderColumns.AMOUNT.value: float(order["quantity"]),
+                enums.ExchangeConstantsOrderColumns.REMAINING.value: float(order["quantity"]),
+                enums.ExchangeConstantsOrderColumns.STATUS.value: enums.OrderStatus.OPEN.value,
+            }
+            for order in orders
+        ]
+
+    async def cancel_orders(
+        self, exchange_order_ids: list[str], symbol: str, **kwargs: dict
+    ) -> list[enums.OrderStatus]:
+        # simulated orders are always cancelled instantly
+        return [enums.OrderStatus.CANCELED] * len(exchange_order_ids)
+
     def _init_forced_market_statuses(self, additional_client_config):
         def market_filter(market):
             return market[enums.ExchangeConstantsMarketStatusColumns.SYMBOL.value] in self.symbols
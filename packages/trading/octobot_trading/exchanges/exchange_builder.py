@@ -119,6 +119,9 @@ class ExchangeBuilder:
         self.exchange_manager.exchange_config.set_is_saving_cancelled_orders_as_trade(
             not trading_mode_class.is_ignoring_cancelled_orders_trades()
         )
+        self.exchange_manager.exchange_config.set_max_recent_trades_count(
+            trading_mode_class.get_required_recent_trades_count()
+        )
 
     async def _build_trading_modes_if_required(self, trading_mode_class, tentacles_setup_config):
         if self._is_using_trading_modes:
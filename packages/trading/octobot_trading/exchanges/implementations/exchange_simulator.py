@@ -25,6 +25,8 @@ import octobot_trading.exchange_data.contracts.contract_factory as contract_fact
 
 class ExchangeSimulator(rest_exchange.RestExchange):
     DEFAULT_CONNECTOR_CLASS = exchange_simulator_connector.ExchangeSimulatorConnector
+    SUPPORTS_BULK_ORDERS_CREATION = True
+    SUPPORTS_BULK_ORDERS_CANCEL = True
 
     def __init__(
         self, config, exchange_manager, backtesting,
@@ -95,6 +97,10 @@ class ExchangeSimulator(rest_exchange.RestExchange):
     def is_simulated_exchange(cls) -> bool:
         return exchange_simulator_connector.ExchangeSimulatorConnector.is_simulated_exchange()
 
+    async def create_orders(self, orders: list[dict]) -> list[typing.Optional[dict]]:
+        # no exchange request: simulated orders don't require exchange errors handling
+        return await self.connector.create_orders(orders)
+
     async def create_backtesting_exchange_producers(self):
         return await self.connector.create_backtesting_exchange_producers()
 
@@ -14,6 +14,7 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import contextlib
 import decimal
 import uuid
 import typing
@@ -219,12 +220,20 @@ class Trader(util.Initializable):
             # force initialize to always create open state
             await order.initialize()
             return order
+        return await self._create_order(order, params, wait_for_creation, raise_all_creation_error, creation_timeout)
+
+    async def _create_order(
+        self, order, params: dict, wait_for_creation: bool, raise_all_creation_error: bool, creation_timeout: float,
+        exchange_creation: typing.Optional[asyncio.Task] = None
+    ) -> typing.Optional["order_import.Order"]:
         # octobot order
         created_order = order
         try:
             params = params or {}
             self.logger.info(f"Creating order: {logging.get_private_minimized_message_if_necessary(created_order)}")
-            created_order = await self._create_new_order(order, params, wait_for_creation, creation_timeout)
+            created_order = await self._create_new_order(
+                order, params, wait_for_creation, creation_timeout, exchange_creation=exchange_creation
+            )
             if created_order is None:
                 self.logger.warning(f"Order not created on {self.exchange_manager.exchange_name} "
                                     f"(failed attempt to create: {logging.get_private_minimized_message_if_necessary(order)}). This is likely due to "
@@ -243,6 +252,89 @@ class Trader(util.Initializable):
 
         return created_order
 
+    @enabled_or_forced_only
+    async def create_orders(
+        self, orders: list, params: dict = None, wait_for_creation=True, raise_all_creation_error=False,
+        creation_timeout=octobot_trading.constants.INDIVIDUAL_ORDER_SYNC_TIMEOUT
+    ) -> list[typing.Optional["order_import.Order"]]:
+        """
+        Create new orders from OrderFactory created orders.
+        When supported by the exchange, limit orders of the same symbol are created using a single request. Other real
+        orders creation requests are sent concurrently, up to MAX_CONCURRENT_ORDER_REQUESTS at a time.
+        :param orders: Orders to create
+        :param params: Additional parameters to give to each order upon creation (used in real trading only)
+        :param wait_for_creation: when True, always make sure the orders are completely created before returning.
+        :param raise_all_creation_error: when True, will raise each creation error when possible
+        (instead of retuning None)
+        :param creation_timeout: time before raising a timeout error when waiting for an order creation
+        :return: The created orders instances, in the same order as the given orders. None for uncreated orders
+        """
+        params = params or {}
+        created_orders = [None] * len(orders)
+        to_create_indexes = list(range(len(orders)))
+        indexes_by_symbol = {}
+        for index, order in enumerate(orders):
+            if (self._is_created_on_exchange(order) or self._is_created_on_exchange_simulator(order)) \
+                    and order.order_type in (enums.TraderOrderType.BUY_LIMIT, enums.TraderOrderType.SELL_LIMIT):
+                indexes_by_symbol.setdefault(order.symbol, []).append(index)
+        if any(len(indexes) > 1 for indexes in indexes_by_symbol.values()) \
+                and self.exchange_manager.exchange.supports_bulk_orders_creation():
+            for symbol, bulk_indexes in indexes_by_symbol.items():
+                if len(bulk_indexes) < 2:
+                    continue
+                try:
+                    self.logger.info(f"Creating {len(bulk_indexes)} {symbol} orders in bulk")
+                    bulk_created_orders = await self._bulk_create_new_orders(
+                        [orders[index] for index in bulk_indexes], params, wait_for_creation, creation_timeout,
+                        raise_all_creation_error
+                    )
+                    for index, created_order in zip(bulk_indexes, bulk_created_orders):
+                        created_orders[index] = created_order
+                    to_create_indexes = [index for index in to_create_indexes if index not in bulk_indexes]
+                except errors.NotSupported:
+                    self.logger.debug(
+                        f"Bulk orders creation is not supported on {self.exchange_manager.exchange_name} for "
+                        f"those orders. Falling back to one by one creation"
+                    )
+                    break
+                except (
+                    errors.MissingFunds, errors.AuthenticationError,
+                    errors.ExchangeCompliancyError, errors.OrderCreationError
+                ):
+                    # forward errors that require actions to fix the situation
+                    raise
+                except Exception as e:
+                    if raise_all_creation_error:
+                        raise
+                    self.logger.exception(e, True, f"Unexpected error when creating {symbol} orders in bulk: {e}")
+                    # orders might have been partially created: don't create them again
+                    to_create_indexes = [index for index in to_create_indexes if index not in bulk_indexes]
+
+        # only send exchange requests concurrently: remaining orders are initialized from this task as
+        # callers can hold the (task bound) portfolio lock
+        concurrent_indexes = [index for index in to_create_indexes if self._is_created_on_exchange(orders[index])]
+        exchange_creations = self._start_bounded_exchange_requests({
+            index: self.exchange_manager.exchange.create_order(
+                **self._get_exchange_order_creation_kwargs(orders[index], params)
+            )
+            for index in concurrent_indexes
+        }) if len(concurrent_indexes) > 1 else {}
+        creation_error = None
+        for index in to_create_indexes:
+            try:
+                created_orders[index] = await self._create_order(
+                    orders[index], params, wait_for_creation, raise_all_creation_error, creation_timeout,
+                    exchange_creation=exchange_creations.get(index)
+                )
+            except Exception as err:
+                if not exchange_creations:
+                    raise
+                # other orders might already be created on exchange: initialize them before raising
+                creation_error = creation_error or err
+        if creation_error is not None:
+            raise creation_error
+        return created_orders
+
     @enabled_or_forced_only
     async def create_artificial_order(
         self, order_type, symbol, current_price, quantity, price, reduce_only, close_position,
@@ -391,69 +483,157 @@ class Trader(util.Initializable):
 
     @authentication_required
     async def _create_new_order(
-        self, new_order, params: dict, wait_for_creation: bool, creation_timeout: float
+        self, new_order, params: dict, wait_for_creation: bool, creation_timeout: float,
+        exchange_creation: typing.Optional[asyncio.Task] = None
     ):
         """
         Creates an exchange managed order, it might be a simulated or a real order.
         Portfolio will be updated by the created order state after order will be initialized
+        :param exchange_creation: the already started exchange creation request of this order, if any
         """
         updated_order = new_order
         is_pending_creation = False
-        if not self.simulate and not new_order.is_self_managed() and (
-            new_order.is_in_active_inactive_transition or new_order.is_active
-        ):
-            order_params = self.exchange_manager.exchange.get_order_additional_params(new_order)
-            order_params.update(new_order.exchange_creation_params)
-            order_params.update(params)
-            created_order = await self.exchange_manager.exchange.create_order(
-                order_type=new_order.order_type,
-                symbol=new_order.symbol,
-                quantity=new_order.origin_quantity,
-                price=new_order.origin_price,
-                stop_price=new_order.origin_stop_price,
-                side=new_order.side,
-                current_price=new_order.created_last_price,
-                reduce_only=new_order.reduce_only,
-                params=order_params
+        if self._is_created_on_exchange(new_order):
+            created_order = await (
+                exchange_creation or self.exchange_manager.exchange.create_order(
+                    **self._get_exchange_order_creation_kwargs(new_order, params)
+                )
             )
             if created_order is None:
                 return None
             self.logger.debug(f"Successfully created order on {self.exchange_manager.exchange_name}: {logging.get_private_minimized_message_if_necessary(created_order)}")
+            updated_order, is_pending_creation = self._get_order_from_created_order(new_order, created_order)
+        return await self._initialize_new_order(
+            new_order, updated_order, is_pending_creation, wait_for_creation, creation_timeout
+        )
 
-            # get real order from exchange
-            updated_order = order_factory.create_order_instance_from_raw(
-                self, created_order, force_open_or_pending_creation=True, has_just_been_created=True
-            )
-            is_pending_creation = updated_order.status == enums.OrderStatus.PENDING_CREATION
-
-            # rebind local elements to new order instance
-            if new_order.order_group:
-                updated_order.add_to_order_group(new_order.order_group)
-            updated_order.order_id = new_order.order_id
-            updated_order.tag = new_order.tag
-            updated_order.chained_orders = new_order.chained_orders
-            for chained_order in new_order.chained_orders:
-                chained_order.triggered_by = updated_order
-            updated_order.triggered_by = new_order.triggered_by
-            updated_order.has_been_bundled = new_order.has_been_bundled
-            updated_order.exchange_creation_params = new_order.exchange_creation_params
-            updated_order.is_waiting_for_chained_trigger = new_order.is_waiting_for_chained_trigger
-            updated_order.associated_entry_ids = new_order.associated_entry_ids
-            updated_order.update_with_triggering_order_fees = new_order.update_with_triggering_order_fees
-            updated_order.trailing_profile = new_order.trailing_profile
-            updated_order.cancel_policy = new_order.cancel_policy
-            if new_order.active_trigger is not None:
-                updated_order.use_active_trigger(order_util.create_order_price_trigger(
-                    updated_order, new_order.active_trigger.trigger_price, new_order.active_trigger.trigger_above
+    @authentication_required
+    async def _bulk_create_new_orders(
+        self, new_orders: list, params: dict, wait_for_creation: bool, creation_timeout: float,
+        raise_all_creation_error: bool
+    ) -> list:
+        """
+        Creates orders using a single exchange request. Simulated orders go through the exchange simulator.
+        Portfolio will be updated by the created orders states after orders will be initialized.
+        Each created order is initialized even when the initialization of a previous one failed.
+        """
+        created_orders = await self.exchange_manager.exchange.create_orders([
+            self._get_exchange_order_creation_kwargs(new_order, params)
+            for new_order in new_orders
+        ])
+        updated_orders = []
+        initialization_error = None
+        for new_order, created_order in zip(new_orders, created_orders):
+            if created_order is None:
+                self.logger.warning(f"Order not created on {self.exchange_manager.exchange_name} "
+                                    f"(failed attempt to create: {logging.get_private_minimized_message_if_necessary(new_order)}). This is likely due to "
+                                    f"the order being refused by the exchange.")
+                updated_orders.append(None)
+                continue
+            self.logger.debug(f"Successfully created order on {self.exchange_manager.exchange_name}: {logging.get_private_minimized_message_if_necessary(created_order)}")
+            try:
+                if self._is_created_on_exchange(new_order):
+                    updated_order, is_pending_creation = self._get_order_from_created_order(new_order, created_order)
+                else:
+                    # simulated order: keep it as is, like when created alone
+                    updated_order, is_pending_creation = new_order, False
+                updated_orders.append(await self._initialize_new_order(
+                    new_order, updated_order, is_pending_creation, wait_for_creation, creation_timeout
                 ))
-            updated_order.is_in_active_inactive_transition = new_order.is_in_active_inactive_transition
-
-            if is_pending_creation:
-                # register order as pending order, it will then be added to live orders in order manager once open
-                self.exchange_manager.exchange_personal_data.orders_manager.register_pending_creation_order(
-                    updated_order
+            except Exception as e:
+                self.logger.exception(
+                    e, True, f"Unexpected error when initializing created order: {e}. "
+                             f"Order: {logging.get_private_minimized_message_if_necessary(created_order)}"
                 )
+                initialization_error = initialization_error or e
+                updated_orders.append(None)
+        if initialization_error is not None and raise_all_creation_error:
+            raise initialization_error
+        return updated_orders
+
+    def _is_created_on_exchange(self, order) -> bool:
+        return not self.simulate and not order.is_self_managed() and (
+            order.is_in_active_inactive_transition or order.is_active
+        )
+
+    def _is_created_on_exchange_simulator(self, order) -> bool:
+        # backtesting orders can go through the exchange simulator bulk requests to use the real orders code path
+        return self.simulate and self.exchange_manager.exchange.is_simulated_exchange() \
+            and not order.is_self_managed() and (order.is_in_active_inactive_transition or order.is_active)
+
+    def _start_bounded_exchange_requests(self, requests: dict) -> dict:
+        """
+        Starts the given exchange requests coroutines, up to MAX_CONCURRENT_ORDER_REQUESTS at a time.
+        Requests are run in separate tasks: they should never use the (task bound) portfolio lock.
+        :param requests: the exchange requests coroutines by key
+        :return: the started requests tasks by key
+        """
+        semaphore = asyncio.Semaphore(octobot_trading.constants.MAX_CONCURRENT_ORDER_REQUESTS)
+
+        async def _bounded_request(request):
+            async with semaphore:
+                return await request
+
+        return {
+            key: asyncio.create_task(_bounded_request(request))
+            for key, request in requests.items()
+        }
+
+    def _get_exchange_order_creation_kwargs(self, new_order, params: dict) -> dict:
+        order_params = self.exchange_manager.exchange.get_order_additional_params(new_order)
+        order_params.update(new_order.exchange_creation_params)
+        order_params.update(params)
+        return {
+            "order_type": new_order.order_type,
+            "symbol": new_order.symbol,
+            "quantity": new_order.origin_quantity,
+            "price": new_order.origin_price,
+            "stop_price": new_order.origin_stop_price,
+            "side": new_order.side,
+            "current_price": new_order.created_last_price,
+            "reduce_only": new_order.reduce_only,
+            "params": order_params,
+        }
+
+    def _get_order_from_created_order(self, new_order, created_order: dict) -> tuple:
+        # get real order from exchange
+        updated_order = order_factory.create_order_instance_from_raw(
+            self, created_order, force_open_or_pending_creation=True, has_just_been_created=True
+        )
+        is_pending_creation = updated_order.status == enums.OrderStatus.PENDING_CREATION
+
+        # rebind local elements to new order instance
+        if new_order.order_group:
+            updated_order.add_to_order_group(new_order.order_group)
+        updated_order.order_id = new_order.order_id
+        updated_order.tag = new_order.tag
+        updated_order.chained_orders = new_order.chained_orders
+        for chained_order in new_order.chained_orders:
+            chained_order.triggered_by = updated_order
+        updated_order.triggered_by = new_order.triggered_by
+        updated_order.has_been_bundled = new_order.has_been_bundled
+        updated_order.exchange_creation_params = new_order.exchange_creation_params
+        updated_order.is_waiting_for_chained_trigger = new_order.is_waiting_for_chained_trigger
+        updated_order.associated_entry_ids = new_order.associated_entry_ids
+        updated_order.update_with_triggering_order_fees = new_order.update_with_triggering_order_fees
+        updated_order.trailing_profile = new_order.trailing_profile
+        updated_order.cancel_policy = new_order.cancel_policy
+        if new_order.active_trigger is not None:
+            updated_order.use_active_trigger(order_util.create_order_price_trigger(
+                updated_order, new_order.active_trigger.trigger_price, new_order.active_trigger.trigger_above
+            ))
+        updated_order.is_in_active_inactive_transition = new_order.is_in_active_inactive_transition
+
+        if is_pending_creation:
+            # register order as pending order, it will then be added to live orders in order manager once open
+            self.exchange_manager.exchange_personal_data.orders_manager.register_pending_creation_order(
+                updated_order
+            )
+        return updated_order, is_pending_creation
 
+    async def _initialize_new_order(
+        self, new_order, updated_order, is_pending_creation: bool, wait_for_creation: bool, creation_timeout: float
+    ):
         try:
             await updated_order.initialize()
             if is_pending_creation and wait_for_creation \
@@ -596,10 +776,116 @@ class Trader(util.Initializable):
             )
         return False
 
+    @enabled_or_forced_only
+    async def cancel_orders(
+        self, orders: list, wait_for_cancelling=True,
+        cancelling_timeout=octobot_trading.constants.INDIVIDUAL_ORDER_SYNC_TIMEOUT
+    ) -> list[bool]:
+        """
+        Cancels the given orders and updates the portfolio, publish in order channel
+        if orders are from a real exchange.
+        When supported by the exchange, open limit orders of the same symbol are cancelled using a single request.
+        Other real orders cancel requests are sent concurrently, up to MAX_CONCURRENT_ORDER_REQUESTS at a time.
+        :param orders: Orders to cancel
+        :param wait_for_cancelling: when True, always make sure the orders are completely cancelled before returning.
+        :param cancelling_timeout: time before raising a timeout error when waiting for an order cancel
+        :return: the cancel result of each order, in the same order as the given orders
+        """
+        cancelled = [False] * len(orders)
+        to_cancel_indexes = list(range(len(orders)))
+        if (
+            not self.simulate or self.exchange_manager.exchange.is_simulated_exchange()
+        ) and self.exchange_manager.exchange.supports_bulk_orders_cancel():
+            indexes_by_symbol = {}
+            for index, order in enumerate(orders):
+                # like for creation, other order types can require specific cancel params
+                if self._is_cancellable_on_exchange(order) and order.order_type in (
+                    enums.TraderOrderType.BUY_LIMIT, enums.TraderOrderType.SELL_LIMIT
+                ):
+                    indexes_by_symbol.setdefault(order.symbol, []).append(index)
+            for symbol, indexes in indexes_by_symbol.items():
+                if len(indexes) < 2:
+                    continue
+                try:
+                    self.logger.info(f"Cancelling {len(indexes)} {symbol} orders in bulk")
+                    for index, success in zip(indexes, await self._bulk_cancel_orders(
+                        [orders[index] for index in indexes], wait_for_cancelling
+                    )):
+                        cancelled[index] = success
+                    to_cancel_indexes = [index for index in to_cancel_indexes if index not in indexes]
+                except errors.NotSupported:
+                    self.logger.debug(
+                        f"Bulk orders cancel is not supported on {self.exchange_manager.exchange_name}. Falling "
+                        f"back to one by one cancel"
+                    )
+                    break
+                except Exception as err:
+                    # cancel orders one by one to handle each order cancel error
+                    self.logger.exception(
+                        err, True, f"Failed to cancel {symbol} orders in bulk ({err}), falling back to one by one cancel"
+                    )
+
+        # only send exchange requests concurrently: remaining orders are cancelled from this task as
+        # callers can hold the (task bound) portfolio lock
+        concurrent_indexes = [
+            index
+            for index in to_cancel_indexes
+            if not self.simulate and self._is_cancellable_on_exchange(orders[index])
+        ]
+        exchange_cancels = self._start_bounded_exchange_requests({
+            index: self._cancel_order_on_exchange(orders[index])
+            for index in concurrent_indexes
+        }) if len(concurrent_indexes) > 1 else {}
+        cancel_error = None
+        for index in to_cancel_indexes:
+            try:
+                if index in exchange_cancels:
+                    self.logger.info(
+                        f"Cancelling order: {logging.get_private_minimized_message_if_necessary(orders[index])}"
+                    )
+                    cancelled[index] = await self._handle_order_cancellation(
+                        orders[index], None, wait_for_cancelling, cancelling_timeout,
+                        exchange_cancel=exchange_cancels[index]
+                    )
+                else:
+                    cancelled[index] = await self.cancel_order(
+                        orders[index], wait_for_cancelling=wait_for_cancelling, cancelling_timeout=cancelling_timeout,
+                        force_if_disabled=True
+                    )
+            except Exception as err:
+                if not exchange_cancels:
+                    raise
+                # other orders might already be cancelled on exchange: handle them before raising
+                cancel_error = cancel_error or err
+        if cancel_error is not None:
+            raise cancel_error
+        return cancelled
+
+    def _is_cancellable_on_exchange(self, order) -> bool:
+        return order.is_open() and order.is_active and not order.is_self_managed() \
+            and not order.is_waiting_for_chained_trigger
+
+    @authentication_required
+    async def _bulk_cancel_orders(self, orders: list, wait_for_cancelling: bool) -> list[bool]:
+        async with contextlib.AsyncExitStack() as orders_locks_stack:
+            if not self.simulate:
+                # like when cancelled alone, simulated orders are not locked
+                for order in orders:
+                    await orders_locks_stack.enter_async_context(order.lock)
+            orders_status = await self.exchange_manager.exchange.cancel_orders(
+                [order.exchange_order_id for order in orders], orders[0].symbol
+            )
+        return [
+            await self._on_order_cancel_status(
+                order, order_status, not self.simulate and order.is_refreshing(), None, wait_for_cancelling
+            )
+            for order, order_status in zip(orders, orders_status)
+        ]
+
     @authentication_required
     async def _handle_order_cancellation(
         self, order, ignored_order, wait_for_cancelling: bool, cancelling_timeout: float,
-        skip_pending_cancel_status: bool = False,
+        skip_pending_cancel_status: bool = False, exchange_cancel: typing.Optional[asyncio.Task] = None,
     ) -> bool:
         success = True
         if order.is_waiting_for_chained_trigger:
@@ -611,21 +897,7 @@ class Trader(util.Initializable):
         # if real order: cancel on exchange
         if not self.simulate and order.is_active and not order.is_self_managed():
             try:
-                async with order.lock:
-                    try:
-                        order_status = await self.exchange_manager.exchange.cancel_order(
-                            order.exchange_order_id, order.symbol, order.order_type
-                        )
-                    except errors.NotSupported:
-                        raise
-                    except (errors.OrderCancelError, Exception) as inner_err:
-                        # retry to cancel order
-                        self.logger.info(
-                            f"Failed to cancel order ({inner_err} {inner_err.__class__.__name__}), retrying"
-                        )
-                        order_status = await self.exchange_manager.exchange.cancel_order(
-                            order.exchange_order_id, order.symbol, order.order_type
-                        )
+                order_status = await (exchange_cancel or self._cancel_order_on_exchange(order))
             except errors.OrderCancelError as err:
                 if self.exchange_manager.exchange_personal_data.orders_manager.enable_order_auto_synchronization:
                     if await self._handle_order_cancel_error(order, err, wait_for_cancelling, cancelling_timeout):
@@ -649,15 +921,38 @@ class Trader(util.Initializable):
                 )
                 order_status = enums.OrderStatus.CANCELED
             is_order_refreshing = order.is_refreshing()
-            if order_status is enums.OrderStatus.CANCELED:
-                order.status = enums.OrderStatus.CANCELED
-                self.logger.debug(f"Successfully cancelled order {logging.get_private_minimized_message_if_necessary(order)}")
-            elif order_status is enums.OrderStatus.PENDING_CANCEL:
-                order.status = enums.OrderStatus.PENDING_CANCEL
-                self.logger.debug(f"Order cancel in progress for {logging.get_private_minimized_message_if_necessary(order)}")
         else:
-            order.status = enums.OrderStatus.CANCELED
+            order_status = enums.OrderStatus.CANCELED
+        return await self._on_order_cancel_status(
+            order, order_status, is_order_refreshing, ignored_order, wait_for_cancelling
+        )
+
+    async def _cancel_order_on_exchange(self, order) -> enums.OrderStatus:
+        async with order.lock:
+            try:
+                return await self.exchange_manager.exchange.cancel_order(
+                    order.exchange_order_id, order.symbol, order.order_type
+                )
+            except errors.NotSupported:
+                raise
+            except (errors.OrderCancelError, Exception) as inner_err:
+                # retry to cancel order
+                self.logger.info(
+                    f"Failed to cancel order ({inner_err} {inner_err.__class__.__name__}), retrying"
+                )
+                return await self.exchange_manager.exchange.cancel_order(
+                    order.exchange_order_id, order.symbol, order.order_type
+                )
 
+    async def _on_order_cancel_status(
+        self, order, order_status, is_order_refreshing: bool, ignored_order, wait_for_cancelling: bool
+    ) -> bool:
+        if order_status is enums.OrderStatus.CANCELED:
+            order.status = enums.OrderStatus.CANCELED
+            self.logger.debug(f"Successfully cancelled order {logging.get_private_minimized_message_if_necessary(order)}")
+        elif order_status is enums.OrderStatus.PENDING_CANCEL:
+            order.status = enums.OrderStatus.PENDING_CANCEL
+            self.logger.debug(f"Order cancel in progress for {logging.get_private_minimized_message_if_necessary(order)}")
         if not is_order_refreshing:
             # don't override state if order is already refreshing (most likely from open orders updater)
             await order.on_cancel(force_cancel=order.status is enums.OrderStatus.CANCELED,
@@ -19,6 +19,7 @@ import decimal
 import typing
 import copy
 import asyncio
+import functools
 
 import ccxt.async_support as ccxt
 from octobot_commons import logging
@@ -76,6 +77,10 @@ class RestExchange(abstract_exchange.AbstractExchange):
     FETCH_MIN_EXCHANGE_MARKETS = constants.FETCH_MIN_EXCHANGE_MARKETS
     WITHDRAW_NETWORK_PARAM_KEY = "network" # key to use in params to specify the network to withdraw to
     HAS_FETCHED_DETAILS = False  # set True when this exchange details (urls etc) have to be fetched before starting the exchange
+    # set True when orders can be created in bulk on this exchange: exchange-specific create_order
+    # behaviors are not applied to bulk orders, only use it when _get_bulk_order_params is enough
+    SUPPORTS_BULK_ORDERS_CREATION = False
+    SUPPORTS_BULK_ORDERS_CANCEL = False  # set True when orders can be cancelled in bulk on this exchange
 
 
     DEFAULT_CONNECTOR_CLASS = ccxt_connector.CCXTConnector
@@ -215,6 +220,12 @@ class RestExchange(abstract_exchange.AbstractExchange):
 
     def fetch_stop_order_in_different_request(self, symbol: str) -> bool:
         return self.connector.fetch_stop_order_in_different_request(symbol)
+
+    def supports_bulk_orders_creation(self) -> bool:
+        return self.SUPPORTS_BULK_ORDERS_CREATION and self.connector.supports_bulk_orders_creation()
+
+    def supports_bulk_orders_cancel(self) -> bool:
+        return self.SUPPORTS_BULK_ORDERS_CANCEL and self.connector.supports_bulk_orders_cancel()
     
     def supports_all_symbols_listing(self) -> bool:
         return bool(self.get_option_value(
@@ -243,6 +254,60 @@ class RestExchange(abstract_exchange.AbstractExchange):
                 return await self._verify_order(created_order, order_type, symbol, price, quantity, side)
         return None
 
+    async def create_orders(self, orders: list[dict]) -> list[typing.Optional[dict]]:
+        # only limit orders can be created in bulk: other order types require specific creation params
+        if any(
+            order["order_type"] not in (enums.TraderOrderType.BUY_LIMIT, enums.TraderOrderType.SELL_LIMIT)
+            for order in orders
+        ):
+            raise errors.NotSupported("Only limit orders can be created in bulk")
+        to_create_orders = []
+        for order in orders:
+            quantity = order["quantity"]
+            if self.exchange_manager.is_future:
+                # on futures exchange expects, quantity in contracts: convert quantity into contracts
+                quantity = quantity / self.get_contract_size(order["symbol"])
+            to_create_orders.append({**order, "quantity": quantity})
+        first_order = to_create_orders[0]
+        async with self._order_operation(
+            first_order["order_type"], first_order["symbol"], first_order["quantity"], first_order["price"], None
+        ):
+            with contextlib.ExitStack() as creating_orders_stack:
+                for order in to_create_orders:
+                    creating_orders_stack.enter_context(
+                        self.creating_order(order["side"], order["symbol"], order["quantity"], order["price"])
+                    )
+                created_orders = await self._create_with_retry(
+                    functools.partial(
+                        self.connector.create_orders,
+                        [
+                            {
+                                "symbol": order["symbol"],
+                                "type": enums.TradeOrderType.LIMIT.value,
+                                "side": order["side"].value,
+                                "amount": float(order["quantity"]),
+                                "price": float(order["price"]),
+                                "params": self._get_bulk_order_params(order),
+                            }
+                            for order in to_create_orders
+                        ]
+                    ),
+                    first_order["order_type"], first_order["symbol"], first_order["quantity"], first_order["price"],
+                    None
+                )
+                self.logger.debug(
+                    f"Created {len([created for created in created_orders if created])}/{len(to_create_orders)} "
+                    f"orders in bulk"
+                )
+                return [
+                    await self._verify_order(
+                        created_order, order["order_type"], order["symbol"], order["price"], order["quantity"],
+                        order["side"]
+                    ) if created_order else None
+                    for order, created_order in zip(to_create_orders, created_orders)
+                ]
+        return [None] * len(orders)
+
     async def edit_order(self, exchange_order_id: str, order_type: enums.TraderOrderType, symbol: str,
                          quantity: decimal.Decimal, price: decimal.Decimal,
                          stop_price: decimal.Decimal = None, side: enums.TradeOrderSide = None,
@@ -328,7 +393,7 @@ class RestExchange(abstract_exchange.AbstractExchange):
                 f"Error when handling order {html_util.get_html_summary_if_relevant(err)}. "
                 f"Exchange is refusing this order request because associated order would instantly trigger."
             ) from err
-        except (errors.OctoBotExchangeError, errors.OrderCreationError):
+        except (errors.OctoBotExchangeError, errors.OrderCreationError, errors.NotSupported):
             # custom error: forward it
             raise
         except Exception as e:
@@ -387,16 +452,32 @@ class RestExchange(abstract_exchange.AbstractExchange):
 
         return created_order
 
+    def _get_bulk_order_params(self, order: dict) -> dict:
+        """
+        Override to add exchange-specific params to each order created in bulk
+        :param order: the order_type, symbol, quantity, price, side and params of the order to create
+        :return: the params to create this order with
+        """
+        return order.get("params") or {}
+
     async def _create_order_with_retry(self, order_type, symbol, quantity: decimal.Decimal,
                                        price: decimal.Decimal, stop_price: decimal.Decimal,
                                        side: enums.TradeOrderSide,
                                        current_price: decimal.Decimal,
                                        reduce_only: bool, params) -> dict:
+        return await self._create_with_retry(
+            functools.partial(
+                self._create_specific_order, order_type, symbol, quantity, price=price,
+                stop_price=stop_price, side=side, current_price=current_price,
+                reduce_only=reduce_only, params=params
+            ),
+            order_type, symbol, quantity, price, stop_price
+        )
+
+    async def _create_with_retry(self, create_func, order_type, symbol, quantity: decimal.Decimal,
+                                 price: decimal.Decimal, stop_price: decimal.Decimal):
         try:
-            return await self._create_specific_order(order_type, symbol, quantity, price=price,
-                                                     stop_price=stop_price, side=side,
-                                                     current_price=current_price,
-                                                     reduce_only=reduce_only, params=params)
+            return await create_func()
         except ccxt.PermissionDenied as err:
             # exchange won't let this order create: raise
             raise errors.ExchangeAccountSymbolPermissionError(
@@ -429,10 +510,7 @@ class RestExchange(abstract_exchange.AbstractExchange):
                     f"Failed to create order ({html_util.get_html_summary_if_relevant(err)}) : "
                     f"order_type: {order_type}, symbol: {symbol}. Retrying order creation."
                 )
-                return await self._create_specific_order(order_type, symbol, quantity, price=price,
-                                                         stop_price=stop_price, side=side,
-                                                         current_price=current_price, reduce_only=reduce_only,
-                                                         params=params)
+                return await create_func()
             # not retriable, raise
             raise
         except (ccxt.InvalidOrder, ccxt.BadRequest) as err:
@@ -449,10 +527,7 @@ class RestExchange(abstract_exchange.AbstractExchange):
                 reload=True, market_filter=self.exchange_manager.market_filter
             )
             # retry order creation with updated markets (ccxt will use the updated market values)
-            return await self._create_specific_order(order_type, symbol, quantity, price=price,
-                                                     stop_price=stop_price, side=side,
-                                                     current_price=current_price, reduce_only=reduce_only,
-                                                     params=params)
+            return await create_func()
 
     def _ensure_order_details_completeness(self, order, order_required_fields=None, order_non_empty_fields=None):
         if order_required_fields is None:
@@ -864,6 +939,11 @@ class RestExchange(abstract_exchange.AbstractExchange):
     async def cancel_all_orders(self, symbol: str = None, **kwargs: dict) -> None:
         return await self.connector.cancel_all_orders(symbol=symbol, **kwargs)
 
+    async def cancel_orders(
+        self, exchange_order_ids: list[str], symbol: str, **kwargs: dict
+    ) -> list[enums.OrderStatus]:
+        return await self.connector.cancel_orders(exchange_order_ids, symbol, **kwargs)
+
     async def cancel_order(
         self, exchange_order_id: str, symbol: str, order_type: enums.TraderOrderType, **kwargs: dict
     ) -> enums.OrderStatus:
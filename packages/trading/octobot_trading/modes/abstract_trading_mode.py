@@ -220,6 +220,13 @@ class AbstractTradingMode(abstract_tentacle.AbstractTentacle):
         """
         return False
 
+    @classmethod
+    def get_required_recent_trades_count(cls) -> typing.Optional[int]:
+        """
+        :return: the number of recent trades to keep for each traded symbol, None to use the default value
+        """
+        return None
+
     @classmethod
     def get_parent_trading_mode_classes(cls, higher_parent_class_limit=None) -> list:
         return [
@@ -670,6 +677,20 @@ class AbstractTradingMode(abstract_tentacle.AbstractTentacle):
             dependencies=dependencies
         )
 
+    async def create_orders(
+        self, orders: list, params: typing.Optional[dict] = None,
+        wait_for_creation=True, creation_timeout=constants.INDIVIDUAL_ORDER_SYNC_TIMEOUT,
+        raise_all_creation_error=False,
+        dependencies: typing.Optional[commons_signals.SignalDependencies] = None
+    ) -> list:
+        return await signals.create_orders(
+            self.exchange_manager, self.should_emit_trading_signal(), orders,
+            params=params,
+            wait_for_creation=wait_for_creation, creation_timeout=creation_timeout,
+            raise_all_creation_error=raise_all_creation_error,
+            dependencies=dependencies
+        )
+
     async def cancel_order(
         self, order, ignored_order: object = None, wait_for_cancelling: bool = True,
         dependencies: typing.Optional[commons_signals.SignalDependencies] = None,
@@ -683,6 +704,16 @@ class AbstractTradingMode(abstract_tentacle.AbstractTentacle):
             skip_pending_cancel_status=skip_pending_cancel_status,
         )
 
+    async def cancel_orders(
+        self, orders: list, wait_for_cancelling: bool = True,
+        dependencies: typing.Optional[commons_signals.SignalDependencies] = None,
+    ) -> tuple[list[bool], commons_signals.SignalDependencies]:
+        return await signals.cancel_orders(
+            self.exchange_manager, self.should_emit_trading_signal(), orders,
+            wait_for_cancelling=wait_for_cancelling,
+            dependencies=dependencies,
+        )
+
     async def cancel_all_orders(
         self,
         symbol: str,
@@ -516,7 +516,7 @@ class Context(databases.CacheClient):
         )
 
     @contextlib.asynccontextmanager
-    async def backtesting_results(self, with_lock=False, cache_size=None, database_adaptor=databases.TinyDBAdaptor):
+    async def backtesting_results(self, with_lock=False, cache_size=None, database_adaptor=None):
         display = commons_display.display_translator_factory()
         run_dbs_identifier = databases.RunDatabasesIdentifier(
             self.trading_mode_class,
@@ -0,0 +1,109 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+import typing
+
+import octobot_commons.logging as logging
+import octobot_commons.symbols as symbol_util
+
+import octobot_trading.constants as constants
+import octobot_trading.enums as enums
+
+
+class OpenOrdersExposure:
+    """
+    Ledger of the assets involved in open orders, updated each time an open order changes:
+    - by currency: bought base amounts of buy orders and quote costs of sell orders
+    - by symbol: net pending value of orders (buy orders remaining value minus sell orders remaining value)
+    """
+
+    def __init__(self):
+        # order key: (currency, currency amount, symbol, symbol value)
+        self._contributions: dict[typing.Any, tuple] = {}
+        self._amounts_by_currency: dict[str, decimal.Decimal] = {}
+        self._values_by_symbol: dict[str, decimal.Decimal] = {}
+
+    def update_order(self, key, order):
+        """
+        Recompute the given order contribution, called when the order is added or updated
+        """
+        self.remove_order(key)
+        if order.status is not enums.OrderStatus.OPEN or not order.symbol:
+            return
+        currency, currency_amount = _get_currency_amount(order)
+        try:
+            symbol_value = _get_symbol_value(order)
+        except (TypeError, decimal.InvalidOperation) as err:
+            logging.get_logger(self.__class__.__name__).warning(
+                f"Ignored {order.symbol} open order value: {err} ({err.__class__.__name__})"
+            )
+            symbol_value = constants.ZERO
+        self._contributions[key] = (currency, currency_amount, order.symbol, symbol_value)
+        if currency is not None:
+            _add(self._amounts_by_currency, currency, currency_amount)
+        _add(self._values_by_symbol, order.symbol, symbol_value)
+
+    def remove_order(self, key):
+        contribution = self._contributions.pop(key, None)
+        if contribution is None:
+            return
+        currency, currency_amount, symbol, symbol_value = contribution
+        if currency is not None:
+            _add(self._amounts_by_currency, currency, -currency_amount)
+        _add(self._values_by_symbol, symbol, -symbol_value)
+
+    def clear(self):
+        self._contributions.clear()
+        self._amounts_by_currency.clear()
+        self._values_by_symbol.clear()
+
+    def get_currency_amount(self, currency: str) -> decimal.Decimal:
+        """
+        :return: the amount of currency bought by open buy orders plus the amount of currency
+        received from open sell orders
+        """
+        return self._amounts_by_currency.get(currency, constants.ZERO)
+
+    def get_symbol_value(self, symbol: str) -> decimal.Decimal:
+        """
+        :return: the net pending value of the symbol open orders: buy orders increase it, sell orders decrease it
+        """
+        return self._values_by_symbol.get(symbol, constants.ZERO)
+
+
+def _get_currency_amount(order) -> tuple:
+    if order.side is enums.TradeOrderSide.BUY:
+        return symbol_util.parse_symbol(order.symbol).base, order.origin_quantity
+    if order.side is enums.TradeOrderSide.SELL:
+        return symbol_util.parse_symbol(order.symbol).quote, order.total_cost
+    return None, constants.ZERO
+
+
+def _get_symbol_value(order) -> decimal.Decimal:
+    order_value = (order.origin_quantity - order.filled_quantity) * order.origin_price
+    if order.side is enums.TradeOrderSide.BUY:
+        return order_value
+    if order.side is enums.TradeOrderSide.SELL:
+        return -order_value
+    return constants.ZERO
+
+
+def _add(totals: dict, key, value: decimal.Decimal):
+    total = totals.get(key, constants.ZERO) + value
+    if total:
+        totals[key] = total
+    else:
+        totals.pop(key, None)
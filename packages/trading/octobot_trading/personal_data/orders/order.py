@@ -30,6 +30,7 @@ import octobot_trading.personal_data.orders.order_util as order_util
 import octobot_trading.personal_data.orders.trailing_profiles as trailing_profiles
 import octobot_trading.personal_data.orders.order_group as order_group_import
 import octobot_trading.personal_data.orders.order_state as order_state_import
+import octobot_trading.personal_data.orders.orders_index as orders_index_import
 import octobot_trading.personal_data.orders.decimal_order_adapter as decimal_order_adapter
 import octobot_trading.personal_data.orders.triggers.base_trigger as base_trigger_import
 import octobot_trading.personal_data.orders.cancel_policies.order_cancel_policy as order_cancel_policy_import
@@ -57,6 +58,8 @@ class Order(util.Initializable):
         self.simulated: bool = trader.simulate
 
         self.logger_name: typing.Optional[str] = None
+        # set when added to an OrdersManager, notified of indexed and open orders exposure attributes changes
+        self.orders_index: typing.Optional[orders_index_import.OrdersIndex] = None
         self.order_id: str = order_util.generate_order_id()        # used id; kept through instances and trading signals
         self.exchange_order_id: str = trader.parse_order_id(None)  # given by the exchange, local to the user account
         self.status: enums.OrderStatus = enums.OrderStatus.OPEN
@@ -378,6 +381,134 @@ class Order(util.Initializable):
         """
         self.chained_orders.append(chained_order)
 
+    @property
+    def status(self) -> enums.OrderStatus:
+        return self._status
+
+    @status.setter
+    def status(self, status: enums.OrderStatus):
+        if self.orders_index is None:
+            self._status = status
+        else:
+            previous_status, self._status = self._status, status
+            self.orders_index.on_order_update(self, orders_index_import.STATUS, previous_status, status)
+
+    @property
+    def symbol(self) -> str:
+        return self._symbol
+
+    @symbol.setter
+    def symbol(self, symbol: str):
+        if self.orders_index is None:
+            self._symbol = symbol
+        else:
+            previous_symbol, self._symbol = self._symbol, symbol
+            self.orders_index.on_order_update(self, orders_index_import.SYMBOL, previous_symbol, symbol)
+
+    @property
+    def tag(self) -> str:
+        return self._tag
+
+    @tag.setter
+    def tag(self, tag: str):
+        if self.orders_index is None:
+            self._tag = tag
+        else:
+            previous_tag, self._tag = self._tag, tag
+            self.orders_index.on_order_update(self, orders_index_import.TAG, previous_tag, tag)
+
+    @property
+    def order_group(self) -> typing.Optional["order_group_import.OrderGroup"]:
+        return self._order_group
+
+    @order_group.setter
+    def order_group(self, order_group: typing.Optional["order_group_import.OrderGroup"]):
+        if self.orders_index is None:
+            self._order_group = order_group
+        else:
+            previous_order_group, self._order_group = self._order_group, order_group
+            self.orders_index.on_order_update(self, orders_index_import.ORDER_GROUP, previous_order_group, order_group)
+
+    @property
+    def exchange_order_id(self) -> str:
+        return self._exchange_order_id
+
+    @exchange_order_id.setter
+    def exchange_order_id(self, exchange_order_id: str):
+        if self.orders_index is None:
+            self._exchange_order_id = exchange_order_id
+        else:
+            previous_exchange_order_id, self._exchange_order_id = self._exchange_order_id, exchange_order_id
+            self.orders_index.on_order_update(
+                self, orders_index_import.EXCHANGE_ORDER_ID, previous_exchange_order_id, exchange_order_id
+            )
+
+    @property
+    def side(self) -> enums.TradeOrderSide:
+        return self._side
+
+    @side.setter
+    def side(self, side: enums.TradeOrderSide):
+        if self.orders_index is None:
+            self._side = side
+        else:
+            previous_side, self._side = self._side, side
+            self.orders_index.on_order_update(self, orders_index_import.SIDE, previous_side, side)
+
+    @property
+    def origin_price(self) -> decimal.Decimal:
+        return self._origin_price
+
+    @origin_price.setter
+    def origin_price(self, origin_price: decimal.Decimal):
+        if self.orders_index is None:
+            self._origin_price = origin_price
+        else:
+            previous_origin_price, self._origin_price = self._origin_price, origin_price
+            self.orders_index.on_order_update(
+                self, orders_index_import.ORIGIN_PRICE, previous_origin_price, origin_price
+            )
+
+    @property
+    def origin_quantity(self) -> decimal.Decimal:
+        return self._origin_quantity
+
+    @origin_quantity.setter
+    def origin_quantity(self, origin_quantity: decimal.Decimal):
+        if self.orders_index is None:
+            self._origin_quantity = origin_quantity
+        else:
+            previous_origin_quantity, self._origin_quantity = self._origin_quantity, origin_quantity
+            self.orders_index.on_order_update(
+                self, orders_index_import.ORIGIN_QUANTITY, previous_origin_quantity, origin_quantity
+            )
+
+    @property
+    def filled_quantity(self) -> decimal.Decimal:
+        return self._filled_quantity
+
+    @filled_quantity.setter
+    def filled_quantity(self, filled_quantity: decimal.Decimal):
+        if self.orders_index is None:
+            self._filled_quantity = filled_quantity
+        else:
+            previous_filled_quantity, self._filled_quantity = self._filled_quantity, filled_quantity
+            self.orders_index.on_order_update(
+                self, orders_index_import.FILLED_QUANTITY, previous_filled_quantity, filled_quantity
+            )
+
+    @property
+    def total_cost(self) -> decimal.Decimal:
+        return self._total_cost
+
+    @total_cost.setter
+    def total_cost(self, total_cost: decimal.Decimal):
+        if self.orders_index is None:
+            self._total_cost = total_cost
+        else:
+            previous_total_cost, self._total_cost = self._total_cost, total_cost
+            self.orders_index.on_order_update(self, orders_index_import.TOTAL_COST, previous_total_cost, total_cost)
+
     async def update_order_status(self, force_refresh=False):
         """
         Update_order_status will define the rules for a simulated order to be filled / canceled
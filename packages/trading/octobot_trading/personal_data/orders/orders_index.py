@@ -0,0 +1,151 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import typing
+
+import octobot_trading.personal_data.orders.open_orders_exposure as open_orders_exposure_import
+
+STATUS = "status"
+SYMBOL = "symbol"
+TAG = "tag"
+ORDER_GROUP = "order_group"
+EXCHANGE_ORDER_ID = "exchange_order_id"
+INDEXED_ATTRIBUTES = (STATUS, SYMBOL, TAG, ORDER_GROUP, EXCHANGE_ORDER_ID)
+SIDE = "side"
+ORIGIN_PRICE = "origin_price"
+ORIGIN_QUANTITY = "origin_quantity"
+FILLED_QUANTITY = "filled_quantity"
+TOTAL_COST = "total_cost"
+OPEN_ORDERS_EXPOSURE_ATTRIBUTES = (STATUS, SYMBOL, SIDE, ORIGIN_PRICE, ORIGIN_QUANTITY, FILLED_QUANTITY, TOTAL_COST)
+
+
+class OrdersIndex:
+    """
+    Orders of an OrdersManager by status, symbol, tag, order group name and exchange order id.
+    Indexed orders notify their index when one of these attributes changes.
+    Lookups return orders in their indexing order, which is the OrdersManager.orders order.
+    Also maintains the open orders exposure of indexed orders.
+    """
+
+    def __init__(self):
+        # attribute: {value: {orders key: None}}
+        self._keys_by_value: dict[str, dict] = {attribute: {} for attribute in INDEXED_ATTRIBUTES}
+        self._orders: dict = {}
+        self._positions: dict = {}
+        self._keys_by_order_identity: dict[int, typing.Any] = {}
+        self._next_position: int = 0
+        self.open_orders_exposure: open_orders_exposure_import.OpenOrdersExposure = \
+            open_orders_exposure_import.OpenOrdersExposure()
+
+    def __len__(self):
+        return len(self._orders)
+
+    def add(self, key, order):
+        """
+        :param key: the order key in OrdersManager.orders
+        :param order: the order to index
+        """
+        if key in self._orders:
+            self.remove(key)
+        self._orders[key] = order
+        self._positions[key] = self._next_position
+        self._next_position += 1
+        self._keys_by_order_identity[id(order)] = key
+        for attribute in INDEXED_ATTRIBUTES:
+            self._add_key(attribute, _get_indexed_value(attribute, getattr(order, attribute, None)), key)
+        self.open_orders_exposure.update_order(key, order)
+        order.orders_index = self
+
+    def remove(self, key):
+        order = self._orders.pop(key, None)
+        if order is None:
+            return
+        self._positions.pop(key)
+        self._keys_by_order_identity.pop(id(order), None)
+        for attribute in INDEXED_ATTRIBUTES:
+            self._remove_key(attribute, _get_indexed_value(attribute, getattr(order, attribute, None)), key)
+        self.open_orders_exposure.remove_order(key)
+        if getattr(order, "orders_index", None) is self:
+            order.orders_index = None
+
+    def clear(self):
+        for key in list(self._orders):
+            self.remove(key)
+        self.open_orders_exposure.clear()
+        self._next_position = 0
+
+    def on_order_update(self, order, attribute: str, previous_value, value):
+        """
+        Called by indexed orders when an indexed or an open orders exposure attribute changes
+        """
+        key = self._keys_by_order_identity.get(id(order))
+        if key is None or self._orders.get(key) is not order:
+            return
+        if attribute in self._keys_by_value:
+            self._remove_key(attribute, _get_indexed_value(attribute, previous_value), key)
+            self._add_key(attribute, _get_indexed_value(attribute, value), key)
+        if attribute in OPEN_ORDERS_EXPOSURE_ATTRIBUTES:
+            self.open_orders_exposure.update_order(key, order)
+
+    def get_orders(self, **values) -> typing.Optional[list]:
+        """
+        :param values: attribute=value filters, None values are ignored
+        :return: the indexed orders matching the most selective of the given filters, None when no filter is given.
+        Other filters are not applied.
+        """
+        keys = None
+        for attribute, value in values.items():
+            if value is None:
+                continue
+            attribute_keys = self._keys_by_value[attribute].get(value, {})
+            if keys is None or len(attribute_keys) < len(keys):
+                keys = attribute_keys
+        if keys is None:
+            return None
+        return [self._orders[key] for key in sorted(keys, key=self._positions.__getitem__)]
+
+    def get_first_order(self, attribute: str, value):
+        """
+        :return: the first indexed order which attribute has the given value, None if there is no such order
+        """
+        keys = self._keys_by_value[attribute].get(value)
+        if not keys:
+            return None
+        # keys are not in indexing order when orders have been updated
+        return self._orders[min(keys, key=self._positions.__getitem__)]
+
+    def _add_key(self, attribute, value, key):
+        try:
+            self._keys_by_value[attribute].setdefault(value, {})[key] = None
+        except TypeError:
+            # unhashable value: can't be looked up
+            pass
+
+    def _remove_key(self, attribute, value, key):
+        try:
+            keys = self._keys_by_value[attribute].get(value)
+        except TypeError:
+            return
+        if keys is not None:
+            keys.pop(key, None)
+            if not keys:
+                self._keys_by_value[attribute].pop(value)
+
+
+def _get_indexed_value(attribute: str, value):
+    if attribute == ORDER_GROUP and value is not None:
+        # order groups are indexed by name
+        return getattr(value, "name", None)
+    return value
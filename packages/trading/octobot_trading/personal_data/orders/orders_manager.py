@@ -29,6 +29,8 @@ import octobot_trading.storage.orders_storage as orders_storage
 import octobot_trading.personal_data.orders.order as order_class
 import octobot_trading.personal_data.orders.order_factory as order_factory
 import octobot_trading.personal_data.orders.order_util as order_util
+import octobot_trading.personal_data.orders.orders_index as orders_index
+import octobot_trading.personal_data.orders.open_orders_exposure as open_orders_exposure
 import octobot_trading.personal_data.orders.orders_storage_operations as orders_storage_operations
 import octobot_trading.exchanges
 import octobot_trading.personal_data.orders.active_order_swap_strategies.active_order_swap_strategy as \
@@ -51,6 +53,9 @@ class OrdersManager(util.Initializable):
         self.enable_order_auto_synchronization: bool = True
         self.enable_order_fill_events: bool = True
         self.orders: collections.OrderedDict[str, order_class.Order] = collections.OrderedDict()
+        # self.orders by status, symbol, tag, group and exchange order id
+        self._orders_index: orders_index.OrdersIndex = orders_index.OrdersIndex()
+        self._indexed_orders: typing.Optional[dict[str, order_class.Order]] = None
         self.order_groups: dict[str, order_group_import.OrderGroup] = {}
         # orders that are expected from exchange but have not yet been fetched: will be removed when fetched
         self.pending_creation_orders: list[order_class.Order] = []
@@ -93,7 +98,13 @@ class OrdersManager(util.Initializable):
             enums.OrderStatus.CLOSED, symbol, since=since,
             until=until, limit=limit, tag=tag
         )
-    
+
+    def get_open_orders_exposure(self) -> open_orders_exposure.OpenOrdersExposure:
+        """
+        :return: the assets involved in open orders, kept up to date when orders are updated
+        """
+        return self._get_orders_index().open_orders_exposure
+
     @staticmethod
     def get_orders_to_cancel_from_policies(orders: list[order_class.Order]) -> list[order_class.Order]:
         return [
@@ -104,16 +115,16 @@ class OrdersManager(util.Initializable):
 
     def get_order(self, order_id: typing.Optional[str], exchange_order_id: typing.Optional[str]=None) -> order_class.Order:
         if order_id is None:
-            for order in self.orders.values():
-                if order.exchange_order_id == exchange_order_id:
-                    return order
-            raise KeyError(exchange_order_id)
+            order = self._get_orders_index().get_first_order(orders_index.EXCHANGE_ORDER_ID, exchange_order_id)
+            if order is None:
+                raise KeyError(exchange_order_id)
+            return order
         return self.orders[order_id]
 
     def get_order_from_group(self, group_name: str) -> list[order_class.Order]:
         return [
             order
-            for order in self.orders.values()
+            for order in self._get_indexed_orders(order_group=group_name)
             if order.order_group is not None and order.order_group.name == group_name
         ]
 
@@ -230,7 +241,9 @@ class OrdersManager(util.Initializable):
             self.logger.warning(
                 f"Adding order with None order_id to order manager: {logging.get_private_minimized_message_if_necessary(order)}"
             )
+        indexed_orders = self._get_orders_index()
         self.orders[order_id] = order
+        indexed_orders.add(order_id, order)
 
     def has_order(self, order_id, exchange_order_id=None) -> bool:
         if order_id is None:
@@ -239,10 +252,11 @@ class OrdersManager(util.Initializable):
                 return True
             except KeyError:
                 return False
-        return order_id in set(self.orders.keys())
+        return order_id in self.orders
 
     def remove_order_instance(self, order):
         if self.has_order(order.order_id):
+            self._get_orders_index().remove(order.order_id)
             self.orders.pop(order.order_id, None)
             order.clear()
         else:
@@ -253,6 +267,7 @@ class OrdersManager(util.Initializable):
 
     def replace_order(self, previous_id, order):
         if self.has_order(previous_id):
+            self._get_orders_index().remove(previous_id)
             self.orders.pop(previous_id, None)
         self._add_order(order.order_id, order)
         self._check_orders_size()
@@ -295,6 +310,8 @@ class OrdersManager(util.Initializable):
     def _reset_orders(self):
         self.orders_initialized = False
         self.orders = collections.OrderedDict()
+        self._orders_index.clear()
+        self._indexed_orders = self.orders
         for group in self.order_groups.values():
             group.clear()
         self.order_groups = {}
@@ -310,7 +327,7 @@ class OrdersManager(util.Initializable):
     ):
         orders = [
             order
-            for order in self.orders.values()
+            for order in self._get_indexed_orders(status=state, symbol=symbol, tag=tag)
             if (
                 (state is None or order.status == state) and
                 (symbol is None or (symbol and order.symbol == symbol)) and
@@ -323,8 +340,27 @@ class OrdersManager(util.Initializable):
         return orders if limit == constants.NO_DATA_LIMIT else orders[0:limit]
 
     def _remove_oldest_orders(self, nb_to_remove):
+        indexed_orders = self._get_orders_index()
         for _ in range(nb_to_remove):
-            self.orders.popitem(last=False)
+            order_id, _ = self.orders.popitem(last=False)
+            indexed_orders.remove(order_id)
+
+    def _get_indexed_orders(self, **values) -> typing.Iterable[order_class.Order]:
+        """
+        :param values: orders_index attribute=value filters, None values are ignored
+        :return: candidate orders for these filters, filters still have to be applied
+        """
+        orders = self._get_orders_index().get_orders(**values)
+        return self.orders.values() if orders is None else orders
+
+    def _get_orders_index(self) -> orders_index.OrdersIndex:
+        if self._indexed_orders is not self.orders or len(self._orders_index) != len(self.orders):
+            # self.orders has been replaced or edited without using this manager
+            self._orders_index.clear()
+            for order_id, order in self.orders.items():
+                self._orders_index.add(order_id, order)
+            self._indexed_orders = self.orders
+        return self._orders_index
 
     def clear(self):
         for order in self.orders.values():
@@ -171,7 +171,7 @@ class BalanceProfitabilityUpdater(portfolios_channel.BalanceProfitabilityProduce
         ).new_consumer(self.handle_balance_update)
         self.mark_price_consumer = await exchange_channel.get_chan(
             constants.MARK_PRICE_CHANNEL, self.channel.exchange_manager.id
-        ).new_consumer(self.handle_mark_price_update)
+        ).new_consumer(self.handle_mark_price_update, conflate_updates=True)
 
     async def stop(self) -> None:
         """
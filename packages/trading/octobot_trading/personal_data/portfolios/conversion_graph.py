@@ -0,0 +1,96 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import collections
+import typing
+
+import octobot_commons.symbols as symbol_util
+
+
+class ConversionGraph:
+    """
+    Graph of the currencies (nodes) that can be converted into each other using trading pairs (edges).
+    Shortest conversion bridges to a target currency are computed for every currency at once with a
+    breadth-first search from this target and kept until the graph changes.
+    """
+
+    def __init__(self, max_bridge_length: int):
+        self.max_bridge_length: int = max_bridge_length
+        # currency: {currency it can be converted into: None}
+        self._neighbours: dict[str, dict[str, None]] = {}
+        # target: {currency: next currency on the way to target}
+        self._next_currency_by_target: dict[str, dict[str, str]] = {}
+
+    def __contains__(self, currency: str) -> bool:
+        return currency in self._neighbours
+
+    def add_pair(self, symbol: str) -> None:
+        base, quote = symbol_util.parse_symbol(symbol).base_and_quote()
+        if base is None or quote is None or base == quote or self.has_pair(base, quote):
+            return
+        self._neighbours.setdefault(base, {})[quote] = None
+        self._neighbours.setdefault(quote, {})[base] = None
+        self._next_currency_by_target.clear()
+
+    def has_pair(self, currency: str, other_currency: str) -> bool:
+        return other_currency in self._neighbours.get(currency, {})
+
+    def clear(self) -> None:
+        self._neighbours.clear()
+        self._next_currency_by_target.clear()
+
+    def get_bridge(
+        self, currency: str, target: str, excluded_pairs: typing.Optional[list[tuple[str, str]]] = None
+    ) -> typing.Optional[list[tuple[str, str]]]:
+        """
+        :param currency: the currency to convert
+        :param target: the currency to convert into
+        :param excluded_pairs: (base, quote) pairs that can't be used in the bridge
+        :return: the (from currency, to currency) steps of the shortest bridge, None if there is no bridge
+        """
+        if excluded_pairs:
+            next_currencies = self._get_next_currencies(target, excluded_pairs)
+        else:
+            try:
+                next_currencies = self._next_currency_by_target[target]
+            except KeyError:
+                next_currencies = self._next_currency_by_target[target] = self._get_next_currencies(target, None)
+        if currency == target or currency not in next_currencies:
+            return None
+        bridge = []
+        while currency != target:
+            next_currency = next_currencies[currency]
+            bridge.append((currency, next_currency))
+            currency = next_currency
+        return bridge
+
+    def _get_next_currencies(
+        self, target: str, excluded_pairs: typing.Optional[list[tuple[str, str]]]
+    ) -> dict[str, str]:
+        excluded = set()
+        for base, quote in excluded_pairs or ():
+            excluded.add((base, quote))
+            excluded.add((quote, base))
+        next_currencies = {target: target}
+        to_visit = collections.deque([(target, 0)])
+        while to_visit:
+            currency, distance = to_visit.popleft()
+            if distance >= self.max_bridge_length:
+                continue
+            for neighbour in self._neighbours.get(currency, ()):
+                if neighbour not in next_currencies and (neighbour, currency) not in excluded:
+                    next_currencies[neighbour] = currency
+                    to_visit.append((neighbour, distance + 1))
+        return next_currencies
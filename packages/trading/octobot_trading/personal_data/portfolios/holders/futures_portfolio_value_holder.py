@@ -67,7 +67,7 @@ class FuturesPortfolioValueHolder(portfolio_value_holder.PortfolioValueHolder):
         if include_assets_in_open_orders:
             if currency_is_full_symbol:
                 # For full symbols get orders by exact symbol
-                pending_order_value = self._get_open_orders_value_for_symbol(symbol)
+                pending_order_value = self._get_open_orders_pending_value(symbol)
                 position_value += pending_order_value
             else:
                 # For simple currencies (e.g., "ETH"), use currency-based matching
@@ -169,16 +169,19 @@ class PortfolioValueHolder:
 
     def get_assets_holdings_value(self, assets, target_unit, init_price_fetchers=False):
         total_value = constants.ZERO
-        for asset, asset_holdings in self.portfolio_manager.portfolio.portfolio.items():
-            if asset not in assets:
-                continue
+        holdings_by_asset = {
+            asset: asset_holdings.total
+            for asset, asset_holdings in self.portfolio_manager.portfolio.portfolio.items()
+            if asset in assets
+        }
+        values_by_asset = self.value_converter.evaluate_values(
+            holdings_by_asset, target_currency=target_unit, init_price_fetchers=init_price_fetchers
+        )
+        for asset, holdings in holdings_by_asset.items():
             try:
-                total_value += self.value_converter.evaluate_value(
-                    asset, asset_holdings.total, raise_error=True,
-                    target_currency=target_unit, init_price_fetchers=init_price_fetchers
-                )
-            except errors.MissingPriceDataError:
-                self.logger.info(f"Missing {asset} price conversion, ignoring {float(asset_holdings.total)} holdings.")
+                total_value += values_by_asset[asset]
+            except KeyError:
+                self.logger.info(f"Missing {asset} price conversion, ignoring {float(holdings)} holdings.")
         return total_value
 
     def _get_orders_delta(self, currency: str) -> decimal.Decimal:
@@ -393,16 +396,21 @@ class PortfolioValueHolder:
         :param ignore_missing_currency_data: when True, ignore missing currencies values in calculation
         :param init_price_fetchers: When True, can init price using fetchers
         """
-        for currency in portfolio:
+        to_evaluate_currencies = {
+            currency: constants.ONE
+            for currency in portfolio
+            if currency not in evaluated_currencies and self._should_currency_be_considered(
+                currency, portfolio, ignore_missing_currency_data
+            )
+        }
+        currency_values = self.value_converter.evaluate_values(
+            to_evaluate_currencies, init_price_fetchers=init_price_fetchers
+        )
+        for currency in to_evaluate_currencies:
             try:
-                if currency not in evaluated_currencies and self._should_currency_be_considered(
-                        currency, portfolio, ignore_missing_currency_data
-                ):
-                    evaluated_pair_values[currency] = self.value_converter.evaluate_value(
-                        currency, constants.ONE, init_price_fetchers=init_price_fetchers
-                    )
-                    evaluated_currencies.add(currency)
-            except errors.MissingPriceDataError:
+                evaluated_pair_values[currency] = currency_values[currency]
+                evaluated_currencies.add(currency)
+            except KeyError:
                 missing_tickers.add(currency)
 
     def _evaluate_portfolio_value(self, portfolio, currencies_values=None, init_price_fetchers=True):
@@ -482,9 +490,33 @@ class PortfolioValueHolder:
         :param currency: the currency to evaluate
         :return: the total holdings in open orders
         """
-        assets_in_open_orders = self._get_orders_delta(currency)
+        orders_manager = self.portfolio_manager.exchange_manager.exchange_personal_data.orders_manager
+        assets_in_open_orders = orders_manager.get_open_orders_exposure().get_currency_amount(currency)
+        if constants.CHECK_OPEN_ORDERS_EXPOSURE:
+            self._check_open_orders_exposure(currency, assets_in_open_orders, self._get_orders_delta(currency))
         return assets_in_open_orders
 
+    def _get_open_orders_pending_value(self, symbol: str) -> decimal.Decimal:
+        """
+        Get the net pending order value for a specific symbol from the open orders exposure
+        :param symbol: the full symbol (e.g., 'BTC/USDC:USDC')
+        :return: the net pending order value in the settlement currency
+        """
+        orders_manager = self.portfolio_manager.exchange_manager.exchange_personal_data.orders_manager
+        pending_value = orders_manager.get_open_orders_exposure().get_symbol_value(symbol)
+        if constants.CHECK_OPEN_ORDERS_EXPOSURE:
+            self._check_open_orders_exposure(symbol, pending_value, self._get_open_orders_value_for_symbol(symbol))
+        return pending_value
+
+    def _check_open_orders_exposure(
+        self, key: str, exposure_value: decimal.Decimal, recomputed_value: decimal.Decimal
+    ) -> None:
+        if exposure_value != recomputed_value:
+            self.logger.error(
+                f"Invalid {key} open orders exposure: {exposure_value}, recomputed from open orders: "
+                f"{recomputed_value}"
+            )
+
     def _get_holdings_ratio_from_portfolio(self, currency, traded_symbols_only=False, include_assets_in_open_orders=False, coins_whitelist=None) -> decimal.Decimal:
         """
         Get the holdings ratio from the portfolio
@@ -25,6 +25,7 @@ import octobot_commons.constants as commons_constants
 import octobot_trading.constants as constants
 import octobot_trading.errors as errors
 import octobot_trading.exchanges as exchanges
+import octobot_trading.personal_data.portfolios.conversion_graph as conversion_graph
 
 if typing.TYPE_CHECKING:
     import octobot_trading.exchanges.util.exchange_data as exchange_data_import
@@ -53,6 +54,11 @@ class ValueConverter:
         # internal price conversion elements
         self._price_bridge_by_symbol = {}
         self._missing_price_bridges = set()
+        # bridges are made of up to MAX_PRICE_BRIDGE_DEPTH + 2 pairs
+        self._priced_pairs_graph = conversion_graph.ConversionGraph(self.MAX_PRICE_BRIDGE_DEPTH + 2)
+        # also includes pairs which price is not available yet
+        self._pairs_graph = conversion_graph.ConversionGraph(self.MAX_PRICE_BRIDGE_DEPTH + 2)
+        self._conversion_graphs_key = None
 
     def initialize_from_exchange_data(
         self, exchange_data: "exchange_data_import.ExchangeData", price_by_symbol: dict[str, float]
@@ -83,6 +89,13 @@ class ValueConverter:
         if symbol not in self.last_prices_by_trading_pair:
             self.reset_missing_price_bridges()
             self.logger.debug(f"Initialized last price for {symbol}")
+            are_conversion_graphs_up_to_date = self._conversion_graphs_key == self._get_conversion_graphs_key()
+            self.last_prices_by_trading_pair[symbol] = price
+            if are_conversion_graphs_up_to_date:
+                self._priced_pairs_graph.add_pair(symbol)
+                self._pairs_graph.add_pair(symbol)
+                self._conversion_graphs_key = self._get_conversion_graphs_key()
+            return
         self.last_prices_by_trading_pair[symbol] = price
 
     def evaluate_value(self, currency, quantity, raise_error=True, target_currency=None, init_price_fetchers=True):
@@ -104,6 +117,31 @@ class ValueConverter:
         )
         return self._check_currency_initialization(currency, currency_value)
 
+    def evaluate_values(
+        self, quantity_by_currency: dict[str, decimal.Decimal], target_currency=None, init_price_fetchers=True
+    ) -> dict[str, decimal.Decimal]:
+        """
+        Evaluate the value of each currency quantity in the reference (attribute) currency.
+        Price bridges of every currency are computed at once beforehand.
+        :param quantity_by_currency: the currencies quantities to evaluate
+        :param target_currency: asset to evaluate currencies into, defaults to self.portfolio_manager.reference_market
+        :param init_price_fetchers: will ask for missing ticker if price can't be converted if False
+        :return: the value of each currency quantity, currencies that can't be evaluated are not included
+        """
+        target_currency = target_currency or self.portfolio_manager.reference_market
+        if not self.portfolio_manager.exchange_manager.is_future:
+            self._save_price_bridges_to_target(quantity_by_currency, target_currency)
+        values = {}
+        for currency, quantity in quantity_by_currency.items():
+            try:
+                values[currency] = self.evaluate_value(
+                    currency, quantity, raise_error=True,
+                    target_currency=target_currency, init_price_fetchers=init_price_fetchers
+                )
+            except errors.MissingPriceDataError:
+                pass
+        return values
+
     def get_usd_like_value(self, currency, quantity, raise_error=True, init_price_fetchers=True):
         if symbol_util.is_usd_like_coin(currency):
             return quantity
@@ -283,91 +321,110 @@ class ValueConverter:
     def try_convert_currency_value_using_multiple_pairs(
             self, currency, target, quantity, base_bridge
     ) -> decimal.Decimal:
+        """
+        Convert a currency quantity using the shortest bridge of priced pairs, pairs without usable price are skipped
+        for example:
+        currency: ETH - ref market: USDT
+        ETH/USDT is not available. ETH/BTC and BTC/USDT are available though.
+        first convert ETH -> BTC and then BTC -> USDT
+        :param base_bridge: (base, quote) pairs that can't be used in the bridge
+        :return: the converted value, None when no bridge is available
+        :raise PendingPriceDataError: when a bridge is only missing prices of pairs that are being fetched
+        """
         # settlement_asset needs to be handled to add support for futures
-
-        # try with two pairs
-        # for example:
-        # currency: ETH - ref market: USDT
-        # ETH/USDT is not available. ETH/BTC and BTC/USDT are available though.
-        # first convert ETH -> BTC and then BTC -> USDT
-        #               | bridge part 1     | bridge part 2
-
         try:
             return self.convert_currency_value_from_saved_price_bridges(currency, target, quantity)
         except errors.MissingPriceDataError:
             if self.is_missing_price_bridge(currency, target):
                 return None
             # try to find a bridge
-        if len(base_bridge) > self.MAX_PRICE_BRIDGE_DEPTH:
-            self._save_missing_price_bridge(currency, target)
-            return None
-        part_1_base = currency
-        part_2_quote = target
-        # look into available symbols to find pair bridges
-        for bridge_part_1_symbol in self._get_priced_pairs():
-            parsed_bridge_part_1_symbol = symbol_util.parse_symbol(bridge_part_1_symbol)
-            if (parsed_bridge_part_1_symbol.base, parsed_bridge_part_1_symbol.quote) in base_bridge\
-               or (parsed_bridge_part_1_symbol.quote, parsed_bridge_part_1_symbol.base) in base_bridge:
-                # avoid looping in symbols
-                continue
-            # part 1: check if bridge_part_1_symbol can be used as part 1 of the bridge
-            is_inverse_part_1 = False
-            if part_1_base == parsed_bridge_part_1_symbol.quote:
-                is_inverse_part_1 = True
-            elif part_1_base != parsed_bridge_part_1_symbol.base:
-                continue
-            part_1_quote = parsed_bridge_part_1_symbol.quote
-            if is_inverse_part_1:
-                part_1_quote = parsed_bridge_part_1_symbol.base
-                part_1_base = parsed_bridge_part_1_symbol.quote
+        priced_pairs_graph, pairs_graph = self._get_conversion_graphs()
+        if bridge := self._get_usable_price_bridge(priced_pairs_graph, currency, target, base_bridge):
             try:
-                bridge_part_1_value = self.convert_currency_value_using_last_prices(
-                    quantity, part_1_base, part_1_quote
-                )
-                # check that bridge_part_1_value is really set
-                if not bridge_part_1_value:
-                    continue
-            except errors.MissingPriceDataError:
-                # first pair might not be initialized or is not available at all
-                # make sure it's not just initializing
-                self._ensure_no_pending_symbol_price(part_1_base, part_1_quote)
-                # try with other pairs
-                continue
-            # part 2: bridge part 1 is found and valued, try to get a compatible second part
-            # case 1: 2 parts bridge
-            try:
-                bridge_part_2_value = self.convert_currency_value_using_last_prices(
-                    constants.ONE,
-                    part_1_quote,
-                    part_2_quote,
-                )
-                if bridge_part_2_value:
+                value = self._convert_currency_value_using_bridge(quantity, bridge)
+                # check that value is really set
+                if value:
                     self._remove_from_missing_currency_data(currency)
-                    local_bridge = [(part_1_base, part_1_quote), (part_1_quote, part_2_quote)]
-                    self._save_price_bridge(currency, target, local_bridge)
-                    return bridge_part_1_value * bridge_part_2_value
+                    self._save_price_bridges(bridge)
+                    return value
             except errors.MissingPriceDataError:
-                # conversion pairs might not be initialized or is not available at all
-                self._ensure_no_pending_symbol_price(part_1_quote, part_2_quote)
-                # otherwise continue with other pairs
-            bridge = base_bridge + [(part_1_base, part_1_quote)]
-            # case 2: X parts bridge
-            nested_value = self.try_convert_currency_value_using_multiple_pairs(
-                part_1_quote, target, constants.ONE, bridge
-            )
-            if nested_value:
-                try:
-                    extended_bridge = [(part_1_base, part_1_quote)] \
-                        + self.get_saved_price_conversion_bridge(part_1_quote, target)
-                    self._save_price_bridge(currency, target, extended_bridge)
-                except KeyError:
-                    # should not happen, however if it does, do not crash
-                    pass
-                return bridge_part_1_value * nested_value
+                pass
+        if bridge := pairs_graph.get_bridge(currency, target, excluded_pairs=base_bridge):
+            for base, quote in bridge:
+                if not priced_pairs_graph.has_pair(base, quote):
+                    # make sure the missing price is not just initializing
+                    self._ensure_no_pending_symbol_price(base, quote)
         # no bridge found
         self._save_missing_price_bridge(currency, target)
         return None
 
+    def _save_price_bridges_to_target(self, currencies: typing.Iterable[str], target: str):
+        """
+        Save the price bridges of the given currencies that are not directly priced in target
+        """
+        priced_pairs_graph, _ = self._get_conversion_graphs()
+        for currency in currencies:
+            if currency == target or self.is_missing_price_bridge(currency, target) \
+                    or symbol_util.merge_currencies(currency, target) in self._price_bridge_by_symbol:
+                continue
+            bridge = self._get_usable_price_bridge(priced_pairs_graph, currency, target, None)
+            if bridge and len(bridge) > 1:
+                self._save_price_bridges(bridge)
+
+    def _get_usable_price_bridge(
+        self, priced_pairs_graph: conversion_graph.ConversionGraph, currency: str, target: str,
+        excluded_pairs: typing.Optional[list[tuple[str, str]]]
+    ) -> typing.Optional[list[tuple[str, str]]]:
+        """
+        :return: the shortest bridge which pairs all have a usable price: pairs with a zero price are skipped
+        """
+        excluded_pairs = list(excluded_pairs) if excluded_pairs else []
+        while bridge := priced_pairs_graph.get_bridge(currency, target, excluded_pairs=excluded_pairs):
+            unusable_pairs = [(base, quote) for base, quote in bridge if not self._has_usable_price(base, quote)]
+            if not unusable_pairs:
+                return bridge
+            # look for a bridge using other pairs
+            excluded_pairs.extend(unusable_pairs)
+        return None
+
+    def _has_usable_price(self, base, quote) -> bool:
+        try:
+            return bool(self.convert_currency_value_using_last_prices(constants.ONE, base, quote))
+        except errors.MissingPriceDataError:
+            return False
+
+    def _convert_currency_value_using_bridge(self, quantity, bridge: list) -> decimal.Decimal:
+        converted_value = quantity
+        for base, quote in bridge:
+            converted_value = self.convert_currency_value_using_last_prices(converted_value, base, quote)
+        return converted_value
+
+    def _get_conversion_graphs(
+        self
+    ) -> tuple[conversion_graph.ConversionGraph, conversion_graph.ConversionGraph]:
+        """
+        :return: the priced pairs graph and the graph including pairs which price is not available yet,
+        rebuilt when priced pairs have been edited without using update_last_price or pairs to price have changed
+        """
+        conversion_graphs_key = self._get_conversion_graphs_key()
+        if conversion_graphs_key != self._conversion_graphs_key:
+            self._priced_pairs_graph.clear()
+            self._pairs_graph.clear()
+            for pair in self.last_prices_by_trading_pair:
+                self._priced_pairs_graph.add_pair(pair)
+            for pair in self._get_priced_pairs():
+                self._pairs_graph.add_pair(pair)
+            self._conversion_graphs_key = conversion_graphs_key
+        return self._priced_pairs_graph, self._pairs_graph
+
+    def _get_conversion_graphs_key(self) -> tuple:
+        # pairs can be replaced without changing their count: compare pairs themselves
+        return (
+            frozenset(self.last_prices_by_trading_pair),
+            frozenset(self.portfolio_manager.exchange_manager.exchange_config.traded_symbol_pairs),
+            frozenset(self.initializing_symbol_prices_pairs) if self.initializing_symbol_prices else frozenset(),
+        )
+
     def _get_priced_pairs(self):
         for pair in self.last_prices_by_trading_pair:
             # first look into pairs with price
@@ -393,15 +450,20 @@ class ValueConverter:
     def _save_price_bridge(self, currency, target, bridge):
         self._price_bridge_by_symbol[symbol_util.merge_currencies(currency, target)] = bridge
 
+    def _save_price_bridges(self, bridge):
+        """
+        Save the bridge and its intermediary bridges: they are the shortest bridges to the same target
+        """
+        target = bridge[-1][1]
+        for index in range(len(bridge) - 1):
+            self._save_price_bridge(bridge[index][0], target, bridge[index:])
+
     def convert_currency_value_from_saved_price_bridges(self, currency, target, quantity) -> decimal.Decimal:
         try:
             bridge = self._price_bridge_by_symbol[symbol_util.merge_currencies(currency, target)]
-            converted_value = quantity
-            for base, quote in bridge:
-                converted_value = self.convert_currency_value_using_last_prices(converted_value, base, quote)
-            return converted_value
         except KeyError as err:
             raise errors.MissingPriceDataError from err
+        return self._convert_currency_value_using_bridge(quantity, bridge)
 
     def reset_missing_price_bridges(self):
         self._missing_price_bridges = set()
@@ -66,7 +66,7 @@ class PositionsUpdater(positions_channel.PositionsProducer):
         # subscribe to mark_price channel if necessary
         if not self._has_mark_price_in_position():
             await exchanges_channel.get_chan(constants.MARK_PRICE_CHANNEL, self.channel.exchange_manager.id) \
-                .new_consumer(self.handle_mark_price)
+                .new_consumer(self.handle_mark_price, conflate_updates=True)
 
         # fetch current positions from exchange
         await self.initialize_positions()
@@ -42,7 +42,9 @@ from octobot_trading.signals.signal_creation import (
     remote_signal_publisher,
     should_emit_trading_signal,
     create_order,
+    create_orders,
     cancel_order,
+    cancel_orders,
     edit_order,
     set_leverage,
     update_order_as_inactive,
@@ -62,7 +64,9 @@ __all__ = [
     "remote_signal_publisher",
     "should_emit_trading_signal",
     "create_order",
+    "create_orders",
     "cancel_order",
+    "cancel_orders",
     "edit_order",
     "set_leverage",
     "update_order_as_inactive",
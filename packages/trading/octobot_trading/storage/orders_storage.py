@@ -42,7 +42,10 @@ class OrdersStorage(abstract_storage.AbstractStorage):
     LIVE_CHANNEL = channels_name.OctoBotTradingChannelsName.ORDERS_CHANNEL.value
     HISTORY_TABLE = commons_enums.DBTables.ORDERS.value
     HISTORICAL_OPEN_ORDERS_TABLE = commons_enums.DBTables.HISTORICAL_ORDERS_UPDATES.value
+    JOURNAL_TABLE = commons_enums.DBTables.ORDERS_JOURNAL.value
     ENABLE_HISTORICAL_ORDER_UPDATES_STORAGE = constants.ENABLE_HISTORICAL_ORDERS_UPDATES_STORAGE
+    # when True, order updates are appended to JOURNAL_TABLE and periodically compacted into HISTORY_TABLE
+    ENABLE_JOURNAL = constants.ENABLE_ORDERS_STORAGE_JOURNAL
     IS_MULTI_EXCHANGE_STORAGE = True   # set True when this storage is updating data from all other exchanges as well
 
     def __init__(self, exchange_manager, use_live_consumer_in_backtesting=None, is_historical=None):
@@ -51,6 +54,9 @@ class OrdersStorage(abstract_storage.AbstractStorage):
             use_live_consumer_in_backtesting=use_live_consumer_in_backtesting, is_historical=is_historical
         )
         self.startup_orders = {}
+        # ids of the open orders stored in HISTORY_TABLE + JOURNAL_TABLE, None until the first snapshot is stored
+        self._journaled_order_ids: typing.Optional[set[str]] = None
+        self._journal_size: int = 0
 
     def should_store_data(self):
         return (
@@ -73,21 +79,74 @@ class OrdersStorage(abstract_storage.AbstractStorage):
         await self.trigger_debounced_update_auth_data(False)
         # only store the current snapshot of open orders when order updates are received
         if self.should_store_data():
-            await self._update_history()
+            if self.ENABLE_JOURNAL:
+                await self._update_journal(order)
+            else:
+                await self._update_history()
             if self.ENABLE_HISTORICAL_ORDER_UPDATES_STORAGE:
                 await self._add_historical_open_orders(order, update_type)
             await self.trigger_debounced_flush()
 
     @abstract_storage.AbstractStorage.hard_reset_and_retry_if_necessary
     async def _update_history(self):
+        open_orders = self.exchange_manager.exchange_personal_data.orders_manager.get_open_orders()
         await self._get_db().replace_all(
             self.HISTORY_TABLE,
             [
                 _format_order(order, self.exchange_manager)
-                for order in self.exchange_manager.exchange_personal_data.orders_manager.get_open_orders()
+                for order in open_orders
             ],
             cache=False,
         )
+        # compact journal once the snapshot is written: the new snapshot includes every journaled update.
+        # Always clear it as it is replayed at startup, even when written by a previous run using ENABLE_JOURNAL
+        await self._get_db().delete_all(self.JOURNAL_TABLE)
+        if self.ENABLE_JOURNAL:
+            self._journaled_order_ids = set(order.order_id for order in open_orders)
+            self._journal_size = 0
+
+    @abstract_storage.AbstractStorage.hard_reset_and_retry_if_necessary
+    async def _update_journal(self, order_dict: dict):
+        if self._journaled_order_ids is None or self._journal_size >= constants.ORDERS_STORAGE_JOURNAL_COMPACTION_SIZE:
+            # first update since startup (stored orders might be outdated) or large journal: store a new snapshot
+            await self._update_history()
+            return
+        order_id = order_dict[enums.ExchangeConstantsOrderColumns.ID.value]
+        try:
+            order = self.exchange_manager.exchange_personal_data.orders_manager.get_order(order_id)
+        except KeyError:
+            order = None
+        details = None
+        if order is not None and order.status is enums.OrderStatus.OPEN:
+            update_type = enums.StoredOrderJournalUpdateType.UPDATED if order_id in self._journaled_order_ids \
+                else enums.StoredOrderJournalUpdateType.CREATED
+            details = _format_order(order, self.exchange_manager)
+            self._journaled_order_ids.add(order_id)
+        elif order_id in self._journaled_order_ids:
+            update_type = enums.StoredOrderJournalUpdateType.FILLED if order_dict.get(
+                enums.ExchangeConstantsOrderColumns.STATUS.value
+            ) in (enums.OrderStatus.FILLED.value, enums.OrderStatus.CLOSED.value) \
+                else enums.StoredOrderJournalUpdateType.CANCELLED
+            self._journaled_order_ids.remove(order_id)
+        else:
+            # not an open order and not stored as open: nothing to update
+            return
+        try:
+            await self._get_db().log(
+                self.JOURNAL_TABLE,
+                {
+                    enums.StoredOrdersAttr.ORDER_ID.value: order_id,
+                    enums.StoredOrdersAttr.UPDATE_TYPE.value: update_type.value,
+                    enums.StoredOrdersAttr.UPDATE_TIME.value: time.time(),
+                    enums.StoredOrdersAttr.ORDER_DETAILS.value: details,
+                },
+                cache=False,
+            )
+        except Exception:
+            # journal can't be trusted anymore: store a new snapshot on next update
+            self._journaled_order_ids = None
+            raise
+        self._journal_size += 1
 
     async def _add_historical_open_orders(self, order_dict: dict, update_type: str):
         update_time = time.time()
@@ -135,7 +194,11 @@ class OrdersStorage(abstract_storage.AbstractStorage):
         if self.should_store_data():
             self.startup_orders = {
                 _get_startup_order_key(order): from_order_document(order)
-                for order in copy.deepcopy(await self._get_db().all(self.HISTORY_TABLE))
+                for order in _replay_journal(
+                    copy.deepcopy(await self._get_db().all(self.HISTORY_TABLE)),
+                    # always replay journal: it might have been written by a previous run using ENABLE_JOURNAL
+                    copy.deepcopy(await self._get_db().all(self.JOURNAL_TABLE)),
+                )
                 if order    # skip empty order details (error when serializing)
             }
         else:
@@ -169,6 +232,7 @@ class OrdersStorage(abstract_storage.AbstractStorage):
         await super().clear_database_history(database, flush=False)
         if cls.ENABLE_HISTORICAL_ORDER_UPDATES_STORAGE:
             await database.delete(cls.HISTORICAL_OPEN_ORDERS_TABLE, None)
+        await database.delete(cls.JOURNAL_TABLE, None)
         if flush:
             await database.flush()
 
@@ -287,6 +351,28 @@ def _format_order_update(exchange_manager, order_dict, update_type, update_time)
     return order_update
 
 
+def _replay_journal(history_orders: list[dict], journal: list[dict]) -> list[dict]:
+    """
+    :return: the stored open orders after applying journaled updates to the stored snapshot
+    """
+    if not journal:
+        return history_orders
+    orders_by_id = {
+        order[constants.STORAGE_ORIGIN_VALUE].get(enums.ExchangeConstantsOrderColumns.ID.value): order
+        for order in history_orders
+        if order    # skip empty order details (error when serializing)
+    }
+    for order_update in journal:
+        order_id = order_update[enums.StoredOrdersAttr.ORDER_ID.value]
+        if order_update[enums.StoredOrdersAttr.UPDATE_TYPE.value] in (
+            enums.StoredOrderJournalUpdateType.CREATED.value, enums.StoredOrderJournalUpdateType.UPDATED.value
+        ):
+            orders_by_id[order_id] = order_update[enums.StoredOrdersAttr.ORDER_DETAILS.value]
+        else:
+            orders_by_id.pop(order_id, None)
+    return list(orders_by_id.values())
+
+
 def from_order_document(order_document):
     order_dict = dict(order_document)
     try:
@@ -69,6 +69,21 @@ def test_replace_all_candles():
     assert candles_manager.close_candles[9] == new_candles[9][PriceIndexes.IND_PRICE_CLOSE.value]
 
 
+def test_replace_all_candles_from_array():
+    candles = _gen_candles(CandlesManager.MAX_CANDLES_COUNT + 10)
+    for candles_data in (candles[:10], candles[:CandlesManager.MAX_CANDLES_COUNT], candles):
+        candles_manager = CandlesManager()
+        array_candles_manager = CandlesManager()
+        candles_manager.replace_all_candles(candles_data)
+        # duplicated candles are ignored
+        array_candles_manager.replace_all_candles(np.array(candles_data + candles_data[-3:], dtype=np.float64))
+        assert array_candles_manager.reached_max is candles_manager.reached_max
+        assert array_candles_manager.close_candles_index == candles_manager.close_candles_index
+        assert array_candles_manager.get_candles() == candles_manager.get_candles()
+        for price_index, values in candles_manager.get_symbol_prices().items():
+            np.testing.assert_array_equal(array_candles_manager.get_symbol_prices()[price_index], values)
+
+
 def test_get_symbol_prices():
     candles_manager = CandlesManager()
     candle = _gen_candles(1)[0]
@@ -0,0 +1,180 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+
+import mock
+import pytest
+
+import octobot_backtesting.api as backtesting_api
+import octobot_commons.asyncio_tools as asyncio_tools
+import octobot_commons.enums as commons_enums
+import octobot_trading.constants as constants
+import octobot_trading.exchange_channel as exchange_channel
+import octobot_trading.exchange_data as exchange_data
+import octobot_trading.exchanges as exchanges
+
+from octobot_trading.enums import TraderOrderType
+from octobot_trading.personal_data.orders.types import BuyLimitOrder
+from tests import event_loop
+from tests.exchanges import backtesting_trader, backtesting_config, backtesting_exchange_manager, fake_backtesting, \
+    DEFAULT_BACKTESTING_SYMBOL, DEFAULT_BACKTESTING_TF
+from tests.personal_data.orders import created_order
+from tests.test_utils.random_numbers import decimal_random_recent_trade
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+TIME_FRAME_SECONDS = commons_enums.TimeFramesMinutes[DEFAULT_BACKTESTING_TF] * 60
+
+
+async def test_data_timestamps_time_points_fill_resting_limit_order_on_gapped_data(backtesting_trader):
+    _, exchange_manager, trader = backtesting_trader
+    backtesting = exchange_manager.exchange.backtesting
+    backtesting.exchange_ids = [exchange_manager.id]
+    exchanges.Exchanges.instance().add_exchange(exchange_manager, "")
+    # no data from 4h to 10h, the order can only be filled by the 10h candle
+    candles = [_get_candle(hour, 100) for hour in range(0, 4)] + \
+        [_get_candle(10, 80)] + \
+        [_get_candle(hour, 100) for hour in range(11, 14)]
+    # ohlcv are stored using their candle close time
+    rows = [
+        (candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value] + TIME_FRAME_SECONDS, candle)
+        for candle in candles
+    ]
+    time_manager = backtesting.time_manager
+    time_manager.initialize()
+    time_manager.starting_timestamp = 0
+    time_manager.finishing_timestamp = rows[-1][0]
+    time_manager.time_interval = TIME_FRAME_SECONDS
+    time_manager.start()
+    time_manager.register_data_timestamps(
+        [row[0] for row in rows],
+        check_callback=backtesting_api.get_open_orders_and_positions_check_callback(backtesting),
+        data_timestamps_offset=TIME_FRAME_SECONDS
+    )
+    updater = _get_ohlcv_updater_simulator(exchange_manager, rows)
+    price_events_manager = exchange_manager.exchange_symbols_data.get_exchange_symbol_data(
+        DEFAULT_BACKTESTING_SYMBOL
+    ).price_events_manager
+
+    async def _process_time_points(until_timestamp):
+        processed_time_points = []
+        while time_manager.current_timestamp < until_timestamp:
+            time_manager.next_timestamp()
+            processed_time_points.append(time_manager.current_timestamp)
+            await updater.handle_timestamp(time_manager.current_timestamp)
+            # as in RecentTradeUpdaterSimulator: future candle prices are used as recent trades
+            future_candle = exchange_manager.exchange.get_current_future_candles()[DEFAULT_BACKTESTING_SYMBOL][
+                DEFAULT_BACKTESTING_TF.value
+            ]
+            if future_candle is not None:
+                price_events_manager.handle_recent_trades([
+                    decimal_random_recent_trade(
+                        price=decimal.Decimal(str(future_candle[price_index.value])),
+                        timestamp=future_candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value]
+                    )
+                    for price_index in (commons_enums.PriceIndexes.IND_PRICE_LOW,
+                                        commons_enums.PriceIndexes.IND_PRICE_HIGH)
+                ])
+                await asyncio_tools.wait_asyncio_next_cycle()
+        return processed_time_points
+
+    # without open orders: time points without new data are skipped
+    assert await _process_time_points(_get_hour(2)) == [_get_hour(1), _get_hour(2)]
+
+    order = created_order(BuyLimitOrder, TraderOrderType.BUY_LIMIT, trader)
+    order.update(
+        price=decimal.Decimal(str(85)),
+        quantity=decimal.Decimal(str(1)),
+        symbol=DEFAULT_BACKTESTING_SYMBOL,
+        order_type=TraderOrderType.BUY_LIMIT,
+    )
+    await order.initialize()
+    await exchange_manager.exchange_personal_data.orders_manager.upsert_order_instance(order)
+    assert not order.is_filled()
+
+    # with an open order: every time point is processed, the order is filled when the 10h candle becomes
+    # the future candle
+    assert await _process_time_points(_get_hour(10)) == [_get_hour(hour) for hour in range(3, 11)]
+    assert order.is_filled()
+
+    # no more open order: time points without new data are skipped again
+    assert await _process_time_points(time_manager.finishing_timestamp) == [
+        _get_hour(hour) for hour in range(11, 15)
+    ]
+
+
+async def test_data_timestamps_time_points_read_future_candles_on_gapped_data(backtesting_trader):
+    _, exchange_manager, _ = backtesting_trader
+    candles = [_get_candle(hour, 100) for hour in (0, 1, 10, 11)]
+    rows = [
+        (candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value] + TIME_FRAME_SECONDS, candle)
+        for candle in candles
+    ]
+    time_manager = exchange_manager.exchange.backtesting.time_manager
+    time_manager.initialize()
+    time_manager.starting_timestamp = 0
+    time_manager.finishing_timestamp = rows[-1][0]
+    time_manager.time_interval = TIME_FRAME_SECONDS
+    time_manager.start()
+    time_manager.register_data_timestamps([row[0] for row in rows], data_timestamps_offset=TIME_FRAME_SECONDS)
+    updater = _get_ohlcv_updater_simulator(exchange_manager, rows)
+    future_candles = []
+    while not time_manager.has_finished():
+        time_manager.next_timestamp()
+        await updater.handle_timestamp(time_manager.current_timestamp)
+        future_candles.append(exchange_manager.exchange.get_current_future_candles()[DEFAULT_BACKTESTING_SYMBOL][
+            DEFAULT_BACKTESTING_TF.value
+        ])
+    # the first candle after the gap is read as a future candle before being pushed
+    assert candles[2] in future_candles
+    assert [candle for candle in candles[1:] if candle not in future_candles] == []
+
+
+def _get_ohlcv_updater_simulator(exchange_manager, rows):
+    importer = mock.Mock(symbols=[DEFAULT_BACKTESTING_SYMBOL], time_frames=[DEFAULT_BACKTESTING_TF])
+
+    async def _get_ohlcv_from_timestamps(inferior_timestamp=-1, superior_timestamp=-1, **_):
+        return [row for row in rows if inferior_timestamp <= row[0] <= superior_timestamp]
+
+    importer.get_ohlcv_from_timestamps = _get_ohlcv_from_timestamps
+    exchange_manager.exchange.connector.current_future_candles = {DEFAULT_BACKTESTING_SYMBOL: {}}
+    updater = exchange_data.OHLCVUpdaterSimulator(
+        exchange_channel.get_chan(constants.OHLCV_CHANNEL, exchange_manager.id), importer
+    )
+    updater.traded_pairs = [DEFAULT_BACKTESTING_SYMBOL]
+    updater.traded_time_frame = [DEFAULT_BACKTESTING_TF]
+    updater.future_candle_time_frame = DEFAULT_BACKTESTING_TF
+    updater.future_candle_sec_length = TIME_FRAME_SECONDS
+    updater.last_timestamp_pushed = 0
+    updater.push = mock.AsyncMock()
+    return updater
+
+
+def _get_hour(hour):
+    return hour * TIME_FRAME_SECONDS
+
+
+def _get_candle(hour, low_price):
+    # [time, close, open, high, low, vol] as PriceIndexes
+    candle = [0] * len(commons_enums.PriceIndexes)
+    candle[commons_enums.PriceIndexes.IND_PRICE_TIME.value] = _get_hour(hour)
+    candle[commons_enums.PriceIndexes.IND_PRICE_OPEN.value] = 100
+    candle[commons_enums.PriceIndexes.IND_PRICE_HIGH.value] = 110
+    candle[commons_enums.PriceIndexes.IND_PRICE_LOW.value] = low_price
+    candle[commons_enums.PriceIndexes.IND_PRICE_CLOSE.value] = 100
+    candle[commons_enums.PriceIndexes.IND_PRICE_VOL.value] = 1
+    return candle
@@ -0,0 +1,196 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+import pytest
+
+from octobot_commons.enums import PriceIndexes
+from octobot_trading.exchange_data.ohlcv.candles_manager import CandlesManager
+from octobot_trading.exchange_data.ohlcv.ring_buffer_candles_manager import RingBufferCandlesManager
+
+
+def test_constructor():
+    candles_manager = RingBufferCandlesManager()
+    assert candles_manager.candles_initialized is False
+    assert candles_manager.close_candles_index == 0
+    assert candles_manager.max_candles_count == CandlesManager.MAX_CANDLES_COUNT
+    assert len(candles_manager.close_candles) == 0
+    assert len(candles_manager.get_symbol_close_candles()) == 0
+
+
+def test_add_new_candle():
+    candles_manager = RingBufferCandlesManager()
+    candle = _gen_candles(1)[0]
+    candles_manager.add_new_candle(candle)
+    assert candles_manager.close_candles_index == 1
+    assert candles_manager.get_symbol_candles_count() == 1
+    assert candles_manager.close_candles[0] == candle[PriceIndexes.IND_PRICE_CLOSE.value]
+    assert candles_manager.time_candles[candles_manager.time_candles_index - 1] == \
+        candle[PriceIndexes.IND_PRICE_TIME.value]
+
+    # already added: ignored
+    candles_manager.add_new_candle(candle)
+    assert candles_manager.get_symbol_candles_count() == 1
+
+
+def test_add_old_and_new_candles():
+    candles_manager = RingBufferCandlesManager()
+    candles_manager.add_old_and_new_candles(_gen_candles(1))
+    many_candles = _gen_candles(10)
+    candles_manager.add_old_and_new_candles(many_candles)
+    assert candles_manager.reached_max is False
+    assert candles_manager.close_candles_index == 10
+    np.testing.assert_array_equal(
+        candles_manager.get_symbol_close_candles(),
+        [candle[PriceIndexes.IND_PRICE_CLOSE.value] for candle in many_candles]
+    )
+
+
+def test_upsert_candle():
+    candles_manager = RingBufferCandlesManager()
+    candles = _gen_candles(5)
+    candles_manager.replace_all_candles(candles)
+    updated_candle = list(candles[2])
+    updated_candle[PriceIndexes.IND_PRICE_CLOSE.value] = 42
+    candles_manager.upsert_candle(updated_candle)
+    assert candles_manager.get_symbol_candles_count() == 5
+    assert candles_manager.get_symbol_close_candles()[2] == 42
+
+    # unknown candle: appended
+    candles_manager.upsert_candle(_get_candle(6))
+    assert candles_manager.get_symbol_candles_count() == 6
+    assert candles_manager.get_symbol_close_candles()[-1] == _get_candle(6)[PriceIndexes.IND_PRICE_CLOSE.value]
+
+
+def test_getters_return_read_only_views():
+    candles_manager = RingBufferCandlesManager()
+    candles_manager.replace_all_candles(_gen_candles(20))
+    close_candles = candles_manager.get_symbol_close_candles(5)
+    assert len(close_candles) == 5
+    assert close_candles.flags.c_contiguous
+    assert np.shares_memory(close_candles, candles_manager.close_candles)
+    with pytest.raises(ValueError):
+        close_candles[-1] = 1
+    assert len(candles_manager.get_symbol_close_candles(100)) == 20
+    assert len(candles_manager.get_symbol_close_candles(0)) == 0
+
+
+def test_reach_max_candles_count():
+    candles_manager = RingBufferCandlesManager()
+    all_candles = _gen_candles(candles_manager.max_candles_count * 2 + 3)
+    max_candles = all_candles[0:candles_manager.max_candles_count]
+    other_candles = all_candles[candles_manager.max_candles_count:]
+
+    candles_manager.add_old_and_new_candles(max_candles)
+    assert candles_manager.reached_max is True
+    # same as CandlesManager
+    assert candles_manager.get_symbol_candles_count() == candles_manager.max_candles_count - 1
+
+    # should remove oldest (first) candles and insert new ones instead
+    for candle in other_candles:
+        candles_manager.add_new_candle(candle)
+    expected = all_candles[-candles_manager.max_candles_count:]
+    for price_index, values in candles_manager.get_symbol_prices().items():
+        np.testing.assert_array_equal(values, [candle[price_index] for candle in expected])
+    assert candles_manager.get_candles(2) == [list(map(float, candle)) for candle in expected[-3:-1]]
+    # evicted candles are forgotten, stored ones are still indexed
+    assert candles_manager.get_candle_slot(all_candles[0][PriceIndexes.IND_PRICE_TIME.value]) is None
+    assert candles_manager.get_candle_slot(expected[0][PriceIndexes.IND_PRICE_TIME.value]) is not None
+
+
+def test_same_values_as_candles_manager():
+    max_candles_count = CandlesManager.MAX_CANDLES_COUNT + 10
+    candles_manager = CandlesManager(max_candles_count=max_candles_count)
+    ring_candles_manager = RingBufferCandlesManager(max_candles_count=max_candles_count)
+    all_candles = _gen_candles(max_candles_count * 3 + 50)
+
+    def _assert_same_values():
+        assert ring_candles_manager.reached_max is candles_manager.reached_max
+        assert ring_candles_manager.get_symbol_candles_count() == candles_manager.get_symbol_candles_count()
+        assert ring_candles_manager.time_candles_index == candles_manager.time_candles_index
+        assert ring_candles_manager.get_candles() == candles_manager.get_candles()
+        assert ring_candles_manager.get_candles(5) == candles_manager.get_candles(5)
+        for limit in (-1, 1, 50, max_candles_count):
+            ring_prices = ring_candles_manager.get_symbol_prices(limit)
+            for price_index, values in candles_manager.get_symbol_prices(limit).items():
+                np.testing.assert_array_equal(ring_prices[price_index], values)
+
+    for manager in (candles_manager, ring_candles_manager):
+        manager.replace_all_candles(all_candles[:100])
+        manager.add_old_and_new_candles(all_candles[90:110])
+    _assert_same_values()
+    for index, candle in enumerate(all_candles[110:]):
+        for manager in (candles_manager, ring_candles_manager):
+            manager.add_new_candle(candle)
+            updated_candle = list(candle)
+            updated_candle[PriceIndexes.IND_PRICE_CLOSE.value] = -index
+            manager.upsert_candle(updated_candle)
+        if index % 100 == 0:
+            _assert_same_values()
+    _assert_same_values()
+
+
+def test_returned_views_are_not_updated():
+    max_candles_count = CandlesManager.MAX_CANDLES_COUNT
+    candles_manager = RingBufferCandlesManager()
+    all_candles = _gen_candles(max_candles_count * 4)
+    candles_manager.replace_all_candles(all_candles[:max_candles_count])
+    close_candles = candles_manager.get_symbol_close_candles()
+    expected_close_candles = close_candles.copy()
+    time_candles = candles_manager.get_symbol_time_candles(10)
+    expected_time_candles = time_candles.copy()
+    # add candles: buffer is full, then candles are moved into new buffers
+    for candle in all_candles[max_candles_count:]:
+        candles_manager.add_new_candle(candle)
+        last_close_candles = candles_manager.get_symbol_close_candles(1)
+        # update last candle
+        updated_candle = list(candle)
+        updated_candle[PriceIndexes.IND_PRICE_CLOSE.value] = 42
+        candles_manager.upsert_candle(updated_candle)
+        assert last_close_candles[-1] == candle[PriceIndexes.IND_PRICE_CLOSE.value]
+        assert candles_manager.get_symbol_close_candles(1)[-1] == 42
+    np.testing.assert_array_equal(close_candles, expected_close_candles)
+    np.testing.assert_array_equal(time_candles, expected_time_candles)
+    np.testing.assert_array_equal(
+        candles_manager.get_symbol_time_candles(),
+        [candle[PriceIndexes.IND_PRICE_TIME.value] for candle in all_candles[-max_candles_count:]]
+    )
+
+
+def test_replace_all_candles_from_array():
+    max_candles_count = CandlesManager.MAX_CANDLES_COUNT + 10
+    all_candles = _gen_candles(max_candles_count + 50)
+    for candles in (all_candles[:100], all_candles):
+        ring_candles_manager = RingBufferCandlesManager(max_candles_count=max_candles_count)
+        array_ring_candles_manager = RingBufferCandlesManager(max_candles_count=max_candles_count)
+        ring_candles_manager.replace_all_candles(candles)
+        array_ring_candles_manager.replace_all_candles(np.array(candles, dtype=np.float64))
+        for manager in (ring_candles_manager, array_ring_candles_manager):
+            manager.add_old_and_new_candles(all_candles[90:110])
+            manager.upsert_candle(all_candles[-1][:PriceIndexes.IND_PRICE_CLOSE.value] + [42, 42])
+        assert array_ring_candles_manager.reached_max is ring_candles_manager.reached_max
+        assert array_ring_candles_manager.get_candles() == ring_candles_manager.get_candles()
+        for limit in (-1, 1, 50):
+            ring_prices = ring_candles_manager.get_symbol_prices(limit)
+            for price_index, values in array_ring_candles_manager.get_symbol_prices(limit).items():
+                np.testing.assert_array_equal(ring_prices[price_index], values)
+
+
+def _gen_candles(size) -> list:
+    return [_get_candle(seed) for seed in range(1, size + 1)]
+
+
+def _get_candle(seed):
+    return [int(seed), seed * 10, seed * 100, seed * 1000, seed * 10000, seed * 100000]
@@ -212,3 +212,29 @@ def get_order_at_id_in_order_list(order_id, order_list):
             return order[0]
     return None
 
+
+
+async def test_handle_new_books_changes_and_orders(order_book_manager):
+    order_book_manager.handle_new_books([[101, 1], [102, 2]], [[99, 1]])
+    (ask_prices, ask_sizes), (bid_prices, bid_sizes) = order_book_manager.handle_new_books(
+        [[101, 1], [102, 3]], [[98, 1]]
+    )
+    assert ask_prices.tolist() == [102]
+    assert ask_sizes.tolist() == [3]
+    assert bid_prices.tolist() == [99, 98]
+    assert bid_sizes.tolist() == [0, 1]
+    assert order_book_manager.get_ask() == (101, [{
+        ECOBIC.SIDE.value: TradeOrderSide.SELL.value,
+        ECOBIC.PRICE.value: 101,
+        ECOBIC.SIZE.value: 1,
+        ECOBIC.ORDER_ID.value: None
+    }])
+    assert order_book_manager.get_bid()[0] == 98
+    assert order_book_manager.handle_new_books([[1, 2, 3], [4]], []) is None
+    assert order_book_manager.handle_new_books([[103, 1]], [[1, 2, 3], [4]]) is None
+    # invalid snapshots don't change the book
+    assert list(order_book_manager.asks) == [101, 102]
+    assert list(order_book_manager.bids) == [98]
+    order_book_manager.reset_order_book()
+    assert len(order_book_manager.price_levels.asks) == 0
+    assert not order_book_manager.asks
@@ -0,0 +1,120 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import random
+
+import numpy as np
+import pytest
+
+from octobot_trading.exchange_data.order_book.price_level_order_book import PriceLevels, PriceLevelOrderBook
+
+
+@pytest.fixture
+def book():
+    return PriceLevelOrderBook(capacity=2)
+
+
+def test_apply_snapshot(book):
+    book.apply_snapshot(
+        asks=[[101, 1], [103, 3], [102, 2]],
+        bids=[[99, 1], [97, 3], [98, 2], [96, 0]],
+        timestamp=10
+    )
+    assert book.timestamp == 10
+    assert book.asks.get_prices().tolist() == [101, 102, 103]
+    assert book.asks.get_sizes().tolist() == [1, 2, 3]
+    # bids are best (highest) first, empty levels are ignored
+    assert book.bids.get_prices().tolist() == [99, 98, 97]
+    assert book.bids.get_sizes().tolist() == [1, 2, 3]
+    assert book.get_best_ask() == (101, 1)
+    assert book.get_best_bid() == (99, 1)
+    assert book.get_spread() == 2
+    assert book.get_mid_price() == 100
+    with pytest.raises(ValueError):
+        book.asks.get_prices()[0] = 1
+
+
+def test_apply_snapshot_changes(book):
+    book.apply_snapshot(asks=[[101, 1], [102, 2]], bids=[[99, 1], [98, 2]])
+    (ask_prices, ask_sizes), (bid_prices, bid_sizes) = book.apply_snapshot(
+        asks=[[101, 1], [102, 5], [104, 1]], bids=[[98, 2]]
+    )
+    assert ask_prices.tolist() == [102, 104]
+    assert ask_sizes.tolist() == [5, 1]
+    assert bid_prices.tolist() == [99]
+    assert bid_sizes.tolist() == [0]
+    (ask_prices, _), (bid_prices, _) = book.apply_snapshot(asks=[[101, 1], [102, 5], [104, 1]], bids=[[98, 2]])
+    assert len(ask_prices) == len(bid_prices) == 0
+    (ask_prices, ask_sizes), (bid_prices, bid_sizes) = book.apply_snapshot(asks=[], bids=[])
+    assert ask_prices.tolist() == [101, 102, 104]
+    assert ask_sizes.tolist() == [0, 0, 0]
+    assert bid_prices.tolist() == [98]
+    assert book.get_best_ask() is book.get_best_bid() is book.get_spread() is None
+
+
+def test_apply_invalid_snapshot(book):
+    book.apply_snapshot(asks=[[101, 1]], bids=[[99, 1]], timestamp=1)
+    with pytest.raises(ValueError):
+        book.apply_snapshot(asks=[[102, 2]], bids=[[1, 2, 3], [4]], timestamp=2)
+    # asks are not replaced when bids are invalid
+    assert book.get_best_ask() == (101, 1)
+    assert book.get_best_bid() == (99, 1)
+    assert book.timestamp == 1
+
+
+def test_apply_updates(book):
+    book.apply_snapshot(asks=[[101, 1]], bids=[[99, 1]])
+    book.apply_updates(
+        asks=[[103, 3], [102, 2], [101, 0], [100.5, 0]],
+        bids=[[99, 4], [97, 1], [98, 2]],
+        timestamp=5
+    )
+    assert book.timestamp == 5
+    assert book.asks.get_prices().tolist() == [102, 103]
+    assert book.bids.get_prices().tolist() == [99, 98, 97]
+    assert book.bids.get_sizes().tolist() == [4, 2, 1]
+    assert book.bids.get_size(98) == 2
+    assert book.bids.get_size(95) == 0
+    book.apply_updates(bids=[[98, 0]])
+    assert book.bids.get_prices().tolist() == [99, 97]
+
+
+def test_top_levels_and_depth(book):
+    book.apply_snapshot(asks=[[101, 1], [102, 2], [103, 3]], bids=[[99, 1], [98, 2], [97, 3]])
+    assert book.asks.get_prices(2).tolist() == [101, 102]
+    assert book.bids.get_prices(2).tolist() == [99, 98]
+    assert book.bids.get_sizes(10).tolist() == [1, 2, 3]
+    assert book.asks.get_cumulative_sizes().tolist() == [1, 3, 6]
+    assert book.bids.get_cumulative_sizes(2).tolist() == [1, 3]
+    assert book.asks.get_depth(102) == 3
+    assert book.asks.get_depth(100) == 0
+    assert book.bids.get_depth(98) == 3
+    assert book.bids.get_depth(90) == 6
+
+
+def test_random_updates_match_dict_book():
+    levels = PriceLevels(True, capacity=1)
+    expected = {}
+    for _ in range(2000):
+        price = float(random.randint(1, 200))
+        size = float(random.choice((0, random.randint(1, 10))))
+        levels.set_level(price, size)
+        if size:
+            expected[price] = size
+        else:
+            expected.pop(price, None)
+    assert levels.get_prices().tolist() == sorted(expected, reverse=True)
+    assert levels.get_sizes().tolist() == [expected[price] for price in sorted(expected, reverse=True)]
+    assert np.all(np.diff(levels.get_prices()) < 0)
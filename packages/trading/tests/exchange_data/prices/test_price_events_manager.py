@@ -31,7 +31,7 @@ pytestmark = pytest.mark.asyncio
 
 async def test_reset(price_events_manager):
     if not os.getenv('CYTHON_IGNORE'):
-        price_events_manager.events.append(None)
+        price_events_manager.new_event(decimal_random_price(), random_timestamp(), True, allow_instant_fill=False)
         assert price_events_manager.events
         price_events_manager.reset()
         assert not price_events_manager.events
@@ -171,3 +171,23 @@ async def test_remove_event(price_events_manager):
         price_events_manager.remove_event(event_2)
         assert event_2 not in price_events_manager.events
         assert len(price_events_manager.events) == 0
+
+
+async def test_handle_price_only_sets_crossed_events_in_creation_order(price_events_manager):
+    above_event_1 = price_events_manager.new_event(decimal.Decimal("12"), 10, True)
+    below_event_1 = price_events_manager.new_event(decimal.Decimal("8"), 10, False)
+    above_event_2 = price_events_manager.new_event(decimal.Decimal("11"), 10, True)
+    above_event_3 = price_events_manager.new_event(decimal.Decimal("11"), 20, True)
+    below_event_2 = price_events_manager.new_event(decimal.Decimal("9"), 10, False)
+    assert price_events_manager._check_events(decimal.Decimal("10"), 10) == []
+    assert price_events_manager._check_events(decimal.Decimal("12"), 10) == [above_event_1, above_event_2]
+    assert price_events_manager._check_events(decimal.Decimal("12"), 20) == \
+           [above_event_1, above_event_2, above_event_3]
+    assert price_events_manager._check_events(decimal.Decimal("8"), 10) == [below_event_1, below_event_2]
+
+    price_events_manager.handle_price(decimal.Decimal("11"), 15)
+    assert above_event_2.is_set()
+    assert not any(event.is_set() for event in (above_event_1, above_event_3, below_event_1, below_event_2))
+    if not os.getenv('CYTHON_IGNORE'):
+        assert [price_event[2] for price_event in price_events_manager.events] == \
+               [above_event_1, below_event_1, above_event_3, below_event_2]
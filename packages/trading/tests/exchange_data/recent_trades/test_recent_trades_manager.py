@@ -17,6 +17,8 @@ import os
 
 import pytest
 
+from octobot_trading.enums import ExchangeConstantsOrderColumns as ECOC, ExchangeConstantsLiquidationColumns
+from octobot_trading.exchange_data.recent_trades.recent_trades_manager import RecentTradesManager
 from tests.exchange_data import recent_trades_manager, price_events_manager
 
 # All test coroutines will be treated as marked.
@@ -111,6 +113,56 @@ async def test_add_new_liquidations(recent_trades_manager):
     recent_trades_manager.add_new_liquidations(None)
     assert not recent_trades_manager.liquidations
 
+    liquidation_1 = {
+        ExchangeConstantsLiquidationColumns.ID.value: "1",
+        ExchangeConstantsLiquidationColumns.TIMESTAMP.value: 1,
+    }
+    liquidation_2 = {
+        ExchangeConstantsLiquidationColumns.TIMESTAMP.value: 2,
+        ExchangeConstantsLiquidationColumns.PRICE.value: 10,
+        ExchangeConstantsLiquidationColumns.QUANTITY.value: 1,
+    }
+    assert recent_trades_manager.add_new_liquidations([liquidation_1, liquidation_2]) == [liquidation_1, liquidation_2]
+    assert recent_trades_manager.add_new_liquidations([dict(liquidation_2), dict(liquidation_1)]) == []
+    assert list(recent_trades_manager.liquidations) == [liquidation_1, liquidation_2]
+
+
+async def test_add_new_trades_with_ids(recent_trades_manager):
+    trade_1 = random_recent_trade()
+    trade_1[ECOC.ID.value] = "1"
+    trade_2 = random_recent_trade()
+    trade_2[ECOC.ID.value] = "2"
+    assert recent_trades_manager.add_new_trades([trade_1, trade_2]) == [trade_1, trade_2]
+    # same id: already stored trade, even when other values differ
+    updated_trade_1 = random_recent_trade()
+    updated_trade_1[ECOC.ID.value] = "1"
+    assert recent_trades_manager.add_new_trades([updated_trade_1]) == []
+    # duplicates in the same update are filtered
+    trade_3 = random_recent_trade()
+    trade_3[ECOC.ID.value] = "3"
+    assert recent_trades_manager.add_new_trades([trade_3, dict(trade_3)]) == [trade_3]
+    assert list(recent_trades_manager.recent_trades) == [trade_1, trade_2, trade_3]
+
+
+async def test_add_new_trades_max_recent_trades_count():
+    manager = RecentTradesManager(max_recent_trades_count=3)
+    await manager.initialize()
+    trades = [random_recent_trade(timestamp=timestamp) for timestamp in range(5)]
+    assert manager.add_new_trades(trades[:3]) == trades[:3]
+    assert manager.add_new_trades(trades[2:]) == trades[3:]
+    assert list(manager.recent_trades) == trades[2:]
+    # trades dropped from recent_trades are not considered as duplicates anymore
+    assert manager.add_new_trades(trades[:1]) == trades[:1]
+    assert list(manager.recent_trades) == trades[3:] + trades[:1]
+    assert manager.add_new_trades(trades[3:]) == []
+    assert len(manager._recent_trades_keys) == 3
+
+    # set_all_recent_trades keeps the max recent trades count and resets duplicates check
+    assert manager.set_all_recent_trades(trades) == trades
+    assert list(manager.recent_trades) == trades[2:]
+    assert manager.add_new_trades(trades) == trades[:2]
+    assert list(manager.recent_trades) == trades[4:] + trades[:2]
+
 
 async def test_reset_recent_trades(recent_trades_manager):
     if not os.getenv('CYTHON_IGNORE'):
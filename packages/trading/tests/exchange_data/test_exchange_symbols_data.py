@@ -76,6 +76,15 @@ async def test_get_exchange_symbol_data_without_creation(exchange_symbols_data):
         exchange_symbols_data.get_exchange_symbol_data("ETH/BTC", allow_creation=False)
 
 
+async def test_get_exchange_symbol_data_recent_trades_count(exchange_symbols_data, exchange_manager):
+    default_symbol_data = exchange_symbols_data.get_exchange_symbol_data("BTC/USDT")
+    assert default_symbol_data.recent_trades_manager.max_recent_trades_count == \
+        default_symbol_data.recent_trades_manager.MAX_RECENT_TRADES_COUNT
+    exchange_manager.exchange_config.set_max_recent_trades_count(5000)
+    assert exchange_symbols_data.get_exchange_symbol_data("ETH/USDT").recent_trades_manager.recent_trades.maxlen \
+        == 5000
+
+
 class TestExchangeSymbolsDataInitializeCandlesFromExchangeData:
     async def test_does_nothing_when_no_markets(self, exchange_symbols_data):
         await exchange_symbols_data.initialize_candles_from_exchange_data(_build_exchange_data([]))
@@ -0,0 +1,90 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import copy
+import mock
+
+import octobot_commons.enums as commons_enums
+
+import octobot_trading.exchanges as exchanges
+import octobot_trading.enums as enums
+
+TICKER = {
+    "symbol": "BTC/USDT",
+    "timestamp": 1700000000123,
+    "datetime": "2023-11-14T22:13:20.123Z",
+    "high": 37500.5,
+    "low": 36200.0,
+    "bid": 37000.1,
+    "ask": 37000.2,
+    "last": 37000.15,
+    "close": 37000.15,
+    "baseVolume": 1234.5,
+    "info": {"s": "BTCUSDT", "c": "37000.15"},
+}
+TRADES = [
+    {
+        "id": "123",
+        "timestamp": 1700000000123,
+        "datetime": "2023-11-14T22:13:20.123Z",
+        "symbol": "BTC/USDT",
+        "side": "buy",
+        "price": 37000.15,
+        "amount": 0.01,
+        "cost": 370.0015,
+        "order": None,
+        "type": None,
+        "takerOrMaker": None,
+        "fee": None,
+        "info": {"t": 123},
+    }
+]
+CANDLES = [
+    [1700000040000, "37000.1", "37010.5", "36990.0", "37005.2", "12.5"],
+    [1700000100000, 37005.2, 37020.0, 37001.1, 37015.3, 3.2],
+]
+ORDER_BOOK = {
+    "symbol": "BTC/USDT",
+    "timestamp": 1700000000123,
+    "asks": [[37000.2, 1.5], [37000.3, 2.0]],
+    "bids": [[37000.1, 0.5], [37000.0, 3.0]],
+    "nonce": 42,
+}
+
+
+def test_preserves_raw_market_data():
+    adapter = exchanges.CCXTAdapter(mock.Mock())
+    assert adapter.PRESERVES_RAW_MARKET_DATA is True
+    ticker, trades, candles, order_book = (
+        copy.deepcopy(TICKER), copy.deepcopy(TRADES), copy.deepcopy(CANDLES), copy.deepcopy(ORDER_BOOK)
+    )
+
+    adapted_ticker = adapter.adapt_ticker(ticker)
+    assert adapted_ticker[enums.ExchangeConstantsTickersColumns.TIMESTAMP.value] == 1700000000
+    adapted_trades = adapter.adapt_public_recent_trades(trades)
+    assert adapted_trades[0][enums.ExchangeConstantsOrderColumns.TIMESTAMP.value] == 1700000000.123
+    assert enums.ExchangeConstantsOrderColumns.INFO.value not in adapted_trades[0]
+    adapted_candles = adapter.adapt_ohlcv(candles, time_frame=commons_enums.TimeFrames.ONE_MINUTE.value)
+    assert adapted_candles[0] == [1700000040, 37000.1, 37010.5, 36990.0, 37005.2, 12.5]
+    adapted_kline = adapter.adapt_kline([candles[-1]])[0]
+    assert adapted_kline == [1700000100, 37005.2, 37020.0, 37001.1, 37015.3, 3.2]
+    adapted_order_book = adapter.adapt_order_book(order_book)
+    assert adapted_order_book[enums.ExchangeConstantsOrderBookInfoColumns.TIMESTAMP.value] == 1700000000.123
+
+    # raw data is left untouched
+    assert ticker == TICKER
+    assert trades == TRADES
+    assert candles == CANDLES
+    assert order_book == ORDER_BOOK
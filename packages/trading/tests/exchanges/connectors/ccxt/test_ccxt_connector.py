@@ -174,6 +174,46 @@ async def test_get_ccxt_order_type(ccxt_connector):
     assert ccxt_connector.get_ccxt_order_type(enums.TraderOrderType.SELL_MARKET) == enums.TradeOrderType.MARKET.value
 
 
+async def test_supports_bulk_orders(ccxt_connector):
+    ccxt_connector.client = mock.Mock(has={"createOrders": True})
+    assert ccxt_connector.supports_bulk_orders_creation() is True
+    assert ccxt_connector.supports_bulk_orders_cancel() is False
+    ccxt_connector.client = mock.Mock(has={"createOrders": None, "cancelOrders": True})
+    assert ccxt_connector.supports_bulk_orders_creation() is False
+    assert ccxt_connector.supports_bulk_orders_cancel() is True
+
+
+async def test_create_orders(ccxt_connector):
+    orders = [
+        {"symbol": "BTC/USDT", "type": "limit", "side": "buy", "amount": 1.0, "price": 10.0, "params": {}},
+        {"symbol": "ETH/USDT", "type": "limit", "side": "sell", "amount": 2.0, "price": 20.0, "params": {}},
+    ]
+    ccxt_connector.client = mock.Mock(create_orders=mock.AsyncMock(return_value=[{"id": "1"}, {"id": None}]))
+    with mock.patch.object(
+        ccxt_connector.adapter, "adapt_order", mock.Mock(return_value={"adapted": True})
+    ) as adapt_order_mock:
+        assert await ccxt_connector.create_orders(orders) == [{"adapted": True}, None]
+        ccxt_connector.client.create_orders.assert_called_once_with(orders)
+        adapt_order_mock.assert_called_once_with({"id": "1"}, symbol="BTC/USDT", quantity=1.0)
+        ccxt_connector.client.create_orders.side_effect = ccxt.NotSupported
+        with pytest.raises(octobot_trading.errors.NotSupported):
+            await ccxt_connector.create_orders(orders)
+
+
+async def test_cancel_orders(ccxt_connector):
+    ccxt_connector.client = mock.Mock(cancel_orders=mock.AsyncMock(return_value=[
+        {"id": "1", "status": enums.OrderStatus.CANCELED.value},
+        {"id": "2", "status": enums.OrderStatus.OPEN.value},
+    ]))
+    assert await ccxt_connector.cancel_orders(["1", "2", "3"], "BTC/USDT", plop=1) == [
+        enums.OrderStatus.CANCELED, enums.OrderStatus.PENDING_CANCEL, enums.OrderStatus.PENDING_CANCEL
+    ]
+    ccxt_connector.client.cancel_orders.assert_called_once_with(["1", "2", "3"], symbol="BTC/USDT", params={"plop": 1})
+    ccxt_connector.client.cancel_orders.side_effect = ccxt.NotSupported
+    with pytest.raises(octobot_trading.errors.NotSupported):
+        await ccxt_connector.cancel_orders(["1"], "BTC/USDT")
+
+
 async def test_get_trade_fee(exchange_manager, future_trader_simulator_with_default_linear):
     future_symbol = "BTC/USDT:USDT"
     future_fees_value = 0.0004
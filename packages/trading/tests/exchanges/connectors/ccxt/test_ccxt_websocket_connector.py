@@ -0,0 +1,171 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import mock
+import pytest
+
+import octobot_commons.enums as commons_enums
+
+import octobot_trading.exchanges as exchanges
+import octobot_trading.enums as enums
+
+from tests.exchanges import simulated_exchange_manager, DEFAULT_EXCHANGE_NAME
+
+pytestmark = pytest.mark.asyncio
+
+
+class MultiSymbolsCCXTWebsocketConnector(exchanges.CCXTWebsocketConnector):
+    USE_MULTI_SYMBOLS_FEEDS = True
+
+    @classmethod
+    def get_name(cls):
+        return DEFAULT_EXCHANGE_NAME
+
+
+async def test_subscribe_feed_with_multi_symbols_feeds(simulated_exchange_manager):
+    connector = MultiSymbolsCCXTWebsocketConnector(simulated_exchange_manager.config, simulated_exchange_manager)
+    try:
+        with mock.patch.dict(connector.client.has, {"watchTicker": True, "watchTickers": True}), \
+             mock.patch.object(connector, "_multi_symbols_feed_task", mock.Mock(return_value=None)) \
+             as _multi_symbols_feed_task_mock, \
+             mock.patch.object(connector, "_feed_task", mock.Mock(return_value=None)) as _feed_task_mock, \
+             mock.patch("asyncio.create_task", mock.Mock()) as create_task_mock:
+            connector._subscribe_feed(enums.WebsocketFeeds.TICKER, symbols=["BTC/USDT", "ETH/USDT"])
+            _multi_symbols_feed_task_mock.assert_called_once_with(
+                enums.WebsocketFeeds.TICKER, connector.ticker, connector.client.watchTickers, ["BTC/USDT", "ETH/USDT"]
+            )
+            create_task_mock.assert_called_once()
+            # both symbols are registered on the same task
+            assert len(connector.feed_tasks) == 2
+            assert len(set(connector.feed_tasks.values())) == 1
+            _multi_symbols_feed_task_mock.reset_mock()
+            create_task_mock.reset_mock()
+
+            # only subscribe to new symbols
+            connector._subscribe_feed(enums.WebsocketFeeds.TICKER, symbols=["BTC/USDT", "ETH/USDT", "SOL/USDT"])
+            _multi_symbols_feed_task_mock.assert_called_once_with(
+                enums.WebsocketFeeds.TICKER, connector.ticker, connector.client.watchTickers, ["SOL/USDT"]
+            )
+            create_task_mock.assert_called_once()
+            assert len(connector.feed_tasks) == 3
+            _multi_symbols_feed_task_mock.reset_mock()
+            create_task_mock.reset_mock()
+
+            # already subscribed
+            connector._subscribe_feed(enums.WebsocketFeeds.TICKER, symbols=["ETH/USDT"])
+            _multi_symbols_feed_task_mock.assert_not_called()
+            create_task_mock.assert_not_called()
+            _feed_task_mock.assert_not_called()
+
+            # unsupported multi symbols watcher: fallback to per symbol tasks
+            with mock.patch.dict(connector.client.has, {"watchTrades": True, "watchTradesForSymbols": False}):
+                connector._subscribe_feed(enums.WebsocketFeeds.TRADES, symbols=["BTC/USDT", "ETH/USDT"])
+                _multi_symbols_feed_task_mock.assert_not_called()
+                assert _feed_task_mock.call_count == 2
+                assert create_task_mock.call_count == 2
+                assert len(connector.feed_tasks) == 5
+    finally:
+        await connector.close()
+
+
+async def test_multi_symbols_feed_task(simulated_exchange_manager):
+    connector = MultiSymbolsCCXTWebsocketConnector(simulated_exchange_manager.config, simulated_exchange_manager)
+    time_frame = commons_enums.TimeFrames.ONE_MINUTE.value
+    candles = [[1700000040000, 37000.1, 37010.5, 36990.0, 37005.2, 12.5]]
+    updates = {
+        enums.WebsocketFeeds.TICKER: {"BTC/USDT": {"symbol": "BTC/USDT"}, "ETH/USDT": {"symbol": "ETH/USDT"}},
+        enums.WebsocketFeeds.TRADES: [
+            {"symbol": "BTC/USDT", "id": "1"}, {"symbol": "ETH/USDT", "id": "2"}, {"symbol": "BTC/USDT", "id": "3"}
+        ],
+        enums.WebsocketFeeds.CANDLE: {"BTC/USDT": {time_frame: candles}, "ETH/USDT": {"5m": candles}},
+        enums.WebsocketFeeds.L2_BOOK: {"symbol": "ETH/USDT", "asks": [], "bids": []},
+    }
+    expected_callback_calls = {
+        enums.WebsocketFeeds.TICKER: [
+            mock.call({"symbol": "BTC/USDT"}, symbol="BTC/USDT"),
+            mock.call({"symbol": "ETH/USDT"}, symbol="ETH/USDT"),
+        ],
+        enums.WebsocketFeeds.TRADES: [
+            mock.call([{"symbol": "BTC/USDT", "id": "1"}, {"symbol": "BTC/USDT", "id": "3"}], symbol="BTC/USDT"),
+            mock.call([{"symbol": "ETH/USDT", "id": "2"}], symbol="ETH/USDT"),
+        ],
+        enums.WebsocketFeeds.CANDLE: [
+            mock.call(candles, symbol="BTC/USDT", timeframe=time_frame),
+        ],
+        enums.WebsocketFeeds.L2_BOOK: [
+            mock.call(updates[enums.WebsocketFeeds.L2_BOOK], symbol="ETH/USDT"),
+        ],
+    }
+    expected_watch_kwargs = {
+        enums.WebsocketFeeds.TICKER: {"symbols": ["BTC/USDT", "ETH/USDT"]},
+        enums.WebsocketFeeds.TRADES: {"symbols": ["BTC/USDT", "ETH/USDT"]},
+        enums.WebsocketFeeds.CANDLE: {"symbolsAndTimeframes": [["BTC/USDT", time_frame], ["ETH/USDT", time_frame]]},
+        enums.WebsocketFeeds.L2_BOOK: {"symbols": ["BTC/USDT", "ETH/USDT"]},
+    }
+    try:
+        for feed, update in updates.items():
+            callback = mock.AsyncMock()
+            watch_calls = []
+
+            async def watch_func(*args, **kwargs):
+                watch_calls.append(kwargs)
+                connector.should_stop = True
+                return update
+
+            kwargs = {"timeframe": time_frame} if feed is enums.WebsocketFeeds.CANDLE else {}
+            connector.should_stop = False
+            with mock.patch.object(connector, "_wait_for_initialization", mock.AsyncMock(return_value=True)):
+                await connector._multi_symbols_feed_task(feed, callback, watch_func, ["BTC/USDT", "ETH/USDT"], **kwargs)
+            assert watch_calls == [expected_watch_kwargs[feed]]
+            assert callback.mock_calls == expected_callback_calls[feed]
+
+        # symbols missing initialization data are not watched
+        callback = mock.AsyncMock()
+        watch_func = mock.AsyncMock()
+        connector.should_stop = False
+        with mock.patch.object(connector, "_wait_for_initialization", mock.AsyncMock(return_value=False)):
+            await connector._multi_symbols_feed_task(
+                enums.WebsocketFeeds.CANDLE, callback, watch_func, ["BTC/USDT"], timeframe=time_frame
+            )
+        watch_func.assert_not_called()
+        callback.assert_not_called()
+    finally:
+        await connector.close()
+
+
+async def test_book(simulated_exchange_manager):
+    connector = MultiSymbolsCCXTWebsocketConnector(simulated_exchange_manager.config, simulated_exchange_manager)
+    try:
+        with mock.patch.object(connector, "push_to_channel", mock.AsyncMock()) as push_to_channel_mock:
+            await connector.book({"asks": [[101, 1], [102, 2]], "bids": [[99, 1]], "timestamp": 1}, symbol="BTC/USDT")
+            push_to_channel_mock.assert_awaited_once()
+            book_instance = connector.get_book_instance("BTC/USDT")
+            assert list(book_instance.asks) == [101, 102]
+            assert list(book_instance.bids) == [99]
+            assert book_instance.timestamp == 1
+            push_to_channel_mock.reset_mock()
+
+            # ccxt books are whole books: replace levels instead of adding them
+            await connector.book({"asks": [[102, 3]], "bids": [[99, 1]], "timestamp": 2}, symbol="BTC/USDT")
+            push_to_channel_mock.assert_awaited_once()
+            assert list(book_instance.asks) == [102]
+            assert book_instance.get_asks(102)[0][enums.ExchangeConstantsOrderBookInfoColumns.SIZE.value] == 3
+            push_to_channel_mock.reset_mock()
+
+            # unchanged book
+            await connector.book({"asks": [[102, 3]], "bids": [[99, 1]], "timestamp": 3}, symbol="BTC/USDT")
+            push_to_channel_mock.assert_not_called()
+    finally:
+        await connector.close()
@@ -14,6 +14,9 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import decimal
+
+import ccxt.async_support as ccxt
 import octobot_commons.enums as commons_enums
 import mock
 import octobot_trading.constants as constants
@@ -233,3 +236,117 @@ class TestDefaultRestExchangeLazyMarketLoading:
         ensure_lazy_market_loaded_mock.assert_awaited_once_with(symbol)
         get_market_status_mock.assert_called_once_with(symbol, price_example=None, with_fixer=False)
         assert result is market_status
+
+
+class TestDefaultRestExchangeBulkOrders:
+
+    async def test_supports_bulk_orders_only_when_enabled_on_exchange(self, default_rest_exchange):
+        with (
+            mock.patch.object(
+                default_rest_exchange.connector, "supports_bulk_orders_creation", mock.Mock(return_value=True)
+            ),
+            mock.patch.object(
+                default_rest_exchange.connector, "supports_bulk_orders_cancel", mock.Mock(return_value=True)
+            ),
+        ):
+            # exchange-specific create_order behaviors would be skipped: disabled by default
+            assert default_rest_exchange.supports_bulk_orders_creation() is False
+            assert default_rest_exchange.supports_bulk_orders_cancel() is False
+            with (
+                mock.patch.object(default_rest_exchange, "SUPPORTS_BULK_ORDERS_CREATION", True),
+                mock.patch.object(default_rest_exchange, "SUPPORTS_BULK_ORDERS_CANCEL", True),
+            ):
+                assert default_rest_exchange.supports_bulk_orders_creation() is True
+                assert default_rest_exchange.supports_bulk_orders_cancel() is True
+                default_rest_exchange.connector.supports_bulk_orders_creation.return_value = False
+                default_rest_exchange.connector.supports_bulk_orders_cancel.return_value = False
+                assert default_rest_exchange.supports_bulk_orders_creation() is False
+                assert default_rest_exchange.supports_bulk_orders_cancel() is False
+
+    async def test_create_orders(self, default_rest_exchange):
+        orders = [_get_limit_order_kwargs("70", params={"a": 1}), _get_limit_order_kwargs("60")]
+        created_order = {"id": "1"}
+        with (
+            mock.patch.object(
+                default_rest_exchange.connector, "create_orders", mock.AsyncMock(return_value=[created_order, None])
+            ) as create_orders_mock,
+            mock.patch.object(
+                default_rest_exchange, "_verify_order", mock.AsyncMock(side_effect=lambda order, *_: order)
+            ) as _verify_order_mock,
+            mock.patch.object(
+                default_rest_exchange, "_get_bulk_order_params",
+                mock.Mock(side_effect=lambda order: {**(order["params"] or {}), "b": 2})
+            ) as _get_bulk_order_params_mock,
+        ):
+            assert await default_rest_exchange.create_orders(orders) == [created_order, None]
+            create_orders_mock.assert_awaited_once_with([
+                {
+                    "symbol": "BTC/USDT", "type": trading_enums.TradeOrderType.LIMIT.value,
+                    "side": trading_enums.TradeOrderSide.BUY.value, "amount": 1.0, "price": 70.0,
+                    "params": {"a": 1, "b": 2},
+                },
+                {
+                    "symbol": "BTC/USDT", "type": trading_enums.TradeOrderType.LIMIT.value,
+                    "side": trading_enums.TradeOrderSide.BUY.value, "amount": 1.0, "price": 60.0,
+                    "params": {"b": 2},
+                },
+            ])
+            assert _get_bulk_order_params_mock.call_count == 2
+            # only verify created orders
+            _verify_order_mock.assert_awaited_once()
+            create_orders_mock.reset_mock()
+
+            # other order types require specific creation params
+            with pytest.raises(errors.NotSupported):
+                await default_rest_exchange.create_orders(
+                    orders + [{**orders[0], "order_type": trading_enums.TraderOrderType.BUY_MARKET}]
+                )
+            create_orders_mock.assert_not_awaited()
+
+    async def test_create_orders_errors(self, default_rest_exchange):
+        orders = [_get_limit_order_kwargs("70"), _get_limit_order_kwargs("60")]
+        with (
+            mock.patch.object(default_rest_exchange.connector, "create_orders", mock.AsyncMock()) as create_orders_mock,
+            mock.patch.object(default_rest_exchange, "_verify_order", mock.AsyncMock(side_effect=lambda order, *_: order)),
+        ):
+            # same errors as when creating orders one by one
+            for raised_error, expected_error in (
+                (ccxt.PermissionDenied, errors.AuthenticationError),
+                (ccxt.OBUntradableSymbol, errors.UntradableSymbolError),
+                (ccxt.OBInternalSyncError, errors.ExchangeInternalSyncError),
+                (ccxt.InsufficientFunds, errors.MissingFunds),
+                # raised by the connector when the exchange doesn't support those orders
+                (errors.NotSupported, errors.NotSupported),
+            ):
+                create_orders_mock.side_effect = raised_error
+                with pytest.raises(expected_error):
+                    await default_rest_exchange.create_orders(orders)
+                create_orders_mock.assert_awaited_once()
+                create_orders_mock.reset_mock()
+
+            # retriable error: retry creation
+            create_orders_mock.side_effect = [ccxt.ExchangeNotAvailable("Internal Server Error"), [{"id": "1"}, None]]
+            assert await default_rest_exchange.create_orders(orders) == [{"id": "1"}, None]
+            assert create_orders_mock.await_count == 2
+
+    async def test_cancel_orders(self, default_rest_exchange):
+        statuses = [trading_enums.OrderStatus.CANCELED, trading_enums.OrderStatus.PENDING_CANCEL]
+        with mock.patch.object(
+            default_rest_exchange.connector, "cancel_orders", mock.AsyncMock(return_value=statuses)
+        ) as cancel_orders_mock:
+            assert await default_rest_exchange.cancel_orders(["1", "2"], "BTC/USDT", a=1) == statuses
+            cancel_orders_mock.assert_awaited_once_with(["1", "2"], "BTC/USDT", a=1)
+
+
+def _get_limit_order_kwargs(price, params=None):
+    return {
+        "order_type": trading_enums.TraderOrderType.BUY_LIMIT,
+        "symbol": "BTC/USDT",
+        "quantity": decimal.Decimal("1"),
+        "price": decimal.Decimal(price),
+        "stop_price": None,
+        "side": trading_enums.TradeOrderSide.BUY,
+        "current_price": decimal.Decimal(price),
+        "reduce_only": False,
+        "params": params,
+    }
@@ -19,7 +19,10 @@ import mock
 import pytest
 import octobot_trading.constants as constants
 import octobot_commons.constants as commons_constants
-from octobot_trading.enums import FeePropertyColumns, ExchangeConstantsMarketPropertyColumns, TraderOrderType
+from octobot_trading.enums import FeePropertyColumns, ExchangeConstantsMarketPropertyColumns, TraderOrderType, \
+    TradeOrderSide, ExchangeConstantsOrderColumns, OrderStatus
+import octobot_trading.errors as errors
+import octobot_trading.personal_data as personal_data
 from octobot_trading.api.exchange import cancel_ccxt_throttle_task
 import octobot_trading.exchanges.util as exchange_util
 
@@ -160,3 +163,66 @@ async def test_init_exchange_tentacle(backtesting_trader):
             init_adapter
         )
         get_rest_exchange_class_mock.assert_called_once()
+
+
+async def test_create_orders(backtesting_trader):
+    _, exchange_manager, trader_inst = backtesting_trader
+    assert exchange_manager.exchange.supports_bulk_orders_creation()
+    orders = [
+        {
+            "order_type": TraderOrderType.BUY_LIMIT, "symbol": DEFAULT_BACKTESTING_SYMBOL,
+            "quantity": decimal.Decimal("1"), "price": decimal.Decimal(price), "side": TradeOrderSide.BUY,
+        }
+        for price in ("70", "60")
+    ]
+    created_orders = await exchange_manager.exchange.create_orders(orders)
+    assert [created_order[ExchangeConstantsOrderColumns.PRICE.value] for created_order in created_orders] == [70, 60]
+    assert all(
+        exchange_manager.exchange._ensure_order_details_completeness(created_order)
+        and created_order[ExchangeConstantsOrderColumns.STATUS.value] == OrderStatus.OPEN.value
+        for created_order in created_orders
+    )
+    with pytest.raises(errors.NotSupported):
+        await exchange_manager.exchange.create_orders(
+            orders + [{**orders[0], "order_type": TraderOrderType.STOP_LOSS}]
+        )
+
+
+async def test_cancel_orders(backtesting_trader):
+    _, exchange_manager, trader_inst = backtesting_trader
+    assert exchange_manager.exchange.supports_bulk_orders_cancel()
+    assert await exchange_manager.exchange.cancel_orders(["1", "2"], DEFAULT_BACKTESTING_SYMBOL) == \
+        [OrderStatus.CANCELED, OrderStatus.CANCELED]
+
+
+async def test_trader_create_and_cancel_orders(backtesting_trader):
+    _, exchange_manager, trader_inst = backtesting_trader
+    orders_manager = exchange_manager.exchange_personal_data.orders_manager
+    orders = []
+    for price in ("70", "60"):
+        order = personal_data.BuyLimitOrder(trader_inst)
+        order.update(order_type=TraderOrderType.BUY_LIMIT, symbol=DEFAULT_BACKTESTING_SYMBOL,
+                     current_price=decimal.Decimal("70"), quantity=decimal.Decimal("1"), price=decimal.Decimal(price))
+        orders.append(order)
+    connector = exchange_manager.exchange.connector
+    with mock.patch.object(connector, "create_orders", mock.AsyncMock(wraps=connector.create_orders)) \
+            as create_orders_mock, \
+            mock.patch.object(connector, "cancel_orders", mock.AsyncMock(wraps=connector.cancel_orders)) \
+            as cancel_orders_mock, \
+            mock.patch.object(trader_inst, "_get_order_from_created_order", mock.Mock()) \
+            as _get_order_from_created_order_mock:
+        # backtesting orders go through the same bulk requests as real orders
+        assert await trader_inst.create_orders(orders) == orders
+        create_orders_mock.assert_called_once()
+        assert [order["price"] for order in create_orders_mock.mock_calls[0].args[0]] == \
+            [decimal.Decimal("70"), decimal.Decimal("60")]
+        # simulated orders are kept as is
+        _get_order_from_created_order_mock.assert_not_called()
+        assert orders_manager.get_open_orders() == orders
+
+        assert await trader_inst.cancel_orders(orders) == [True, True]
+        cancel_orders_mock.assert_called_once_with(
+            [order.exchange_order_id for order in orders], DEFAULT_BACKTESTING_SYMBOL
+        )
+        assert orders_manager.get_open_orders() == []
+        assert all(order.is_cancelled() for order in orders)
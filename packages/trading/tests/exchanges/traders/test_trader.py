@@ -13,6 +13,7 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import asyncio
 import copy
 import os
 import ccxt.async_support
@@ -186,11 +187,13 @@ class TestTrader:
         trader_inst.set_is_enabled(False)
         methods = [
             trader_inst.create_order,
+            trader_inst.create_orders,
             trader_inst.create_artificial_order,
             trader_inst.edit_order,
             trader_inst.update_order_as_inactive,
             trader_inst.update_order_as_active,
             trader_inst.cancel_order,
+            trader_inst.cancel_orders,
             trader_inst.cancel_all_orders,
             trader_inst.cancel_order_with_id,
             trader_inst.cancel_open_orders,
@@ -451,6 +454,261 @@ class TestTrader:
 
         await stop(exchange_manager)
 
+    async def test_create_orders(self):
+        _, exchange_manager, trader_inst = await init_default()
+        orders_manager = exchange_manager.exchange_personal_data.orders_manager
+        orders = [self._get_buy_limit_order(trader_inst, price) for price in ("70", "60")]
+        market_buy = BuyMarketOrder(trader_inst)
+        market_buy.update(order_type=TraderOrderType.BUY_MARKET,
+                          symbol=self.DEFAULT_SYMBOL,
+                          current_price=decimal.Decimal("70"),
+                          quantity=decimal.Decimal("1"),
+                          price=decimal.Decimal("70"))
+        orders.append(market_buy)
+
+        created_orders = await trader_inst.create_orders(orders)
+        assert created_orders == orders
+        assert orders_manager.get_open_orders() == orders[:2]
+        assert market_buy.is_filled()
+        await stop(exchange_manager)
+
+    async def test_create_orders_in_bulk(self):
+        _, exchange_manager, trader_inst = await init_default()
+        limit_orders = [self._get_buy_limit_order(trader_inst, price) for price in ("70", "60")]
+        stop_order = StopLossOrder(trader_inst)
+        stop_order.update(order_type=TraderOrderType.STOP_LOSS,
+                          symbol=self.DEFAULT_SYMBOL,
+                          current_price=decimal.Decimal("70"),
+                          quantity=decimal.Decimal("1"),
+                          price=decimal.Decimal("50"))
+        orders = [limit_orders[0], stop_order, limit_orders[1]]
+        created_limit_orders = [mock.Mock(), mock.Mock()]
+        created_stop_order = mock.Mock()
+        try:
+            trader_inst.simulate = False
+            with mock.patch.object(
+                exchange_manager.exchange, "supports_bulk_orders_creation", mock.Mock(return_value=True)
+            ), mock.patch.object(
+                exchange_manager.exchange, "create_order", mock.AsyncMock(return_value={})
+            ) as exchange_create_order_mock, mock.patch.object(
+                trader_inst, "_bulk_create_new_orders", mock.AsyncMock(return_value=created_limit_orders)
+            ) as _bulk_create_new_orders_mock, mock.patch.object(
+                trader_inst, "_create_order", mock.AsyncMock(return_value=created_stop_order)
+            ) as _create_order_mock:
+                assert await trader_inst.create_orders(orders, params={"a": 1}) == [
+                    created_limit_orders[0], created_stop_order, created_limit_orders[1]
+                ]
+                _bulk_create_new_orders_mock.assert_called_once_with(
+                    limit_orders, {"a": 1}, True, constants.INDIVIDUAL_ORDER_SYNC_TIMEOUT, False
+                )
+                # a single remaining order: created without concurrent requests
+                _create_order_mock.assert_called_once_with(
+                    stop_order, {"a": 1}, True, False, constants.INDIVIDUAL_ORDER_SYNC_TIMEOUT,
+                    exchange_creation=None
+                )
+                exchange_create_order_mock.assert_not_called()
+                _bulk_create_new_orders_mock.reset_mock()
+                _create_order_mock.reset_mock()
+
+                # bulk creation is not supported for those orders: fallback to concurrent creation requests
+                _bulk_create_new_orders_mock.side_effect = errors.NotSupported
+                assert await trader_inst.create_orders(orders) == [created_stop_order] * 3
+                _bulk_create_new_orders_mock.assert_called_once()
+                assert [call.args[0] for call in _create_order_mock.mock_calls] == orders
+                exchange_creations = [call.kwargs["exchange_creation"] for call in _create_order_mock.mock_calls]
+                # stop order is self-managed: not created on exchange
+                assert exchange_creations[1] is None
+                assert await asyncio.gather(exchange_creations[0], exchange_creations[2]) == [{}] * 2
+                assert exchange_create_order_mock.call_count == 2
+                _bulk_create_new_orders_mock.reset_mock()
+                _create_order_mock.reset_mock()
+
+                # unexpected error: orders might be partially created, don't create them again
+                _bulk_create_new_orders_mock.side_effect = ZeroDivisionError
+                assert await trader_inst.create_orders(orders) == [None, created_stop_order, None]
+                _bulk_create_new_orders_mock.assert_called_once()
+                _create_order_mock.assert_called_once()
+                with pytest.raises(ZeroDivisionError):
+                    await trader_inst.create_orders(orders, raise_all_creation_error=True)
+                _bulk_create_new_orders_mock.side_effect = errors.MissingFunds
+                with pytest.raises(errors.MissingFunds):
+                    await trader_inst.create_orders(orders)
+        finally:
+            trader_inst.simulate = True
+        await stop(exchange_manager)
+
+    async def test_create_orders_concurrently(self):
+        _, exchange_manager, trader_inst = await init_default()
+        orders = [self._get_buy_limit_order(trader_inst, price) for price in ("70", "60", "50", "40")]
+        running_requests = []
+        max_running_requests = []
+
+        async def _create_order(**kwargs):
+            running_requests.append(kwargs["price"])
+            max_running_requests.append(len(running_requests))
+            await asyncio.sleep(0.01)
+            running_requests.remove(kwargs["price"])
+            if kwargs["price"] == decimal.Decimal("60"):
+                raise errors.MissingFunds
+            return {"price": kwargs["price"]}
+
+        def _get_order_from_created_order(new_order, created_order):
+            assert created_order == {"price": new_order.origin_price}
+            return new_order, False
+
+        try:
+            trader_inst.simulate = False
+            with mock.patch.object(constants, "MAX_CONCURRENT_ORDER_REQUESTS", 2), mock.patch.object(
+                exchange_manager.exchange, "create_order", mock.AsyncMock(side_effect=_create_order)
+            ) as create_order_mock, mock.patch.object(
+                trader_inst, "_get_order_from_created_order", mock.Mock(side_effect=_get_order_from_created_order)
+            ), mock.patch.object(
+                trader_inst, "_initialize_new_order",
+                mock.AsyncMock(side_effect=lambda new_order, updated_order, *_: updated_order)
+            ) as _initialize_new_order_mock:
+                # as in trading modes consumers: orders are created while holding the portfolio lock
+                async with exchange_manager.exchange_personal_data.portfolio_manager.portfolio.lock:
+                    with pytest.raises(errors.MissingFunds):
+                        await asyncio.wait_for(trader_inst.create_orders(orders), 1)
+                assert create_order_mock.call_count == 4
+                assert max(max_running_requests) == 2
+                # error is raised once every created order is initialized
+                assert [call.args[0] for call in _initialize_new_order_mock.mock_calls] == \
+                    [orders[0], orders[2], orders[3]]
+        finally:
+            trader_inst.simulate = True
+        await stop(exchange_manager)
+
+    async def test_bulk_create_new_orders_initializes_each_created_order(self):
+        _, exchange_manager, trader_inst = await init_default()
+        orders = [self._get_buy_limit_order(trader_inst, price) for price in ("70", "60", "50", "40")]
+        initialized_orders = [mock.Mock(), mock.Mock()]
+        with mock.patch.object(
+            exchange_manager.exchange, "create_orders",
+            mock.AsyncMock(return_value=[{"id": "1"}, None, {"id": "3"}, {"id": "4"}])
+        ) as create_orders_mock, mock.patch.object(
+            trader_inst, "_get_order_from_created_order", mock.Mock(return_value=(mock.Mock(), False))
+        ), mock.patch.object(
+            trader_inst, "_initialize_new_order",
+            mock.AsyncMock(side_effect=[initialized_orders[0], ZeroDivisionError, initialized_orders[1]])
+        ) as _initialize_new_order_mock:
+            # initialization error on the 3rd order: the 4th order is still initialized
+            assert await trader_inst._bulk_create_new_orders(
+                orders, {}, True, constants.INDIVIDUAL_ORDER_SYNC_TIMEOUT, False
+            ) == [initialized_orders[0], None, None, initialized_orders[1]]
+            create_orders_mock.assert_called_once()
+            assert _initialize_new_order_mock.call_count == 3
+            _initialize_new_order_mock.reset_mock()
+
+            _initialize_new_order_mock.side_effect = [initialized_orders[0], ZeroDivisionError, initialized_orders[1]]
+            with pytest.raises(ZeroDivisionError):
+                await trader_inst._bulk_create_new_orders(
+                    orders, {}, True, constants.INDIVIDUAL_ORDER_SYNC_TIMEOUT, True
+                )
+            # error is raised once every created order is initialized
+            assert _initialize_new_order_mock.call_count == 3
+        await stop(exchange_manager)
+
+    async def test_cancel_orders(self):
+        _, exchange_manager, trader_inst = await init_default()
+        orders_manager = exchange_manager.exchange_personal_data.orders_manager
+        orders = [self._get_buy_limit_order(trader_inst, price) for price in ("70", "60")]
+        assert await trader_inst.create_orders(orders) == orders
+        assert orders_manager.get_open_orders() == orders
+
+        assert await trader_inst.cancel_orders(orders) == [True, True]
+        assert orders_manager.get_open_orders() == []
+        assert all(order.is_cancelled() for order in orders)
+        await stop(exchange_manager)
+
+    async def test_create_and_cancel_orders_from_portfolio_lock(self):
+        _, exchange_manager, trader_inst = await init_default()
+        orders_manager = exchange_manager.exchange_personal_data.orders_manager
+        orders = [self._get_buy_limit_order(trader_inst, price) for price in ("70", "60")]
+        # as in trading modes consumers: orders are created and cancelled while holding the portfolio lock
+        async with exchange_manager.exchange_personal_data.portfolio_manager.portfolio.lock:
+            assert await asyncio.wait_for(trader_inst.create_orders(orders), 1) == orders
+            assert orders_manager.get_open_orders() == orders
+            assert await asyncio.wait_for(trader_inst.cancel_orders(orders), 1) == [True, True]
+        assert orders_manager.get_open_orders() == []
+        await stop(exchange_manager)
+
+    async def test_cancel_orders_in_bulk(self):
+        _, exchange_manager, trader_inst = await init_default()
+        orders_manager = exchange_manager.exchange_personal_data.orders_manager
+        orders = [self._get_buy_limit_order(trader_inst, price) for price in ("70", "60", "50")]
+        assert await trader_inst.create_orders(orders) == orders
+        try:
+            trader_inst.simulate = False
+            with mock.patch.object(
+                exchange_manager.exchange, "supports_bulk_orders_cancel", mock.Mock(return_value=True)
+            ), mock.patch.object(
+                exchange_manager.exchange, "cancel_orders",
+                mock.AsyncMock(return_value=[OrderStatus.CANCELED, OrderStatus.CANCELED])
+            ) as cancel_orders_mock, mock.patch.object(
+                exchange_manager.exchange, "cancel_order", mock.AsyncMock(return_value=OrderStatus.CANCELED)
+            ) as cancel_order_mock:
+                assert await trader_inst.cancel_orders(orders[:2]) == [True, True]
+                cancel_orders_mock.assert_called_once_with(
+                    [orders[0].exchange_order_id, orders[1].exchange_order_id], self.DEFAULT_SYMBOL
+                )
+                cancel_order_mock.assert_not_called()
+                assert orders_manager.get_open_orders() == orders[2:]
+                cancel_orders_mock.reset_mock()
+
+                # bulk cancel is not supported: fallback to one by one cancel
+                cancel_orders_mock.side_effect = errors.NotSupported
+                remaining_orders = [orders[2], self._get_buy_limit_order(trader_inst, "40")]
+                trader_inst.simulate = True
+                assert await trader_inst.create_order(remaining_orders[1]) is remaining_orders[1]
+                trader_inst.simulate = False
+                assert await trader_inst.cancel_orders(remaining_orders) == [True, True]
+                cancel_orders_mock.assert_called_once()
+                assert cancel_order_mock.call_count == 2
+                assert orders_manager.get_open_orders() == []
+        finally:
+            trader_inst.simulate = True
+        await stop(exchange_manager)
+
+    async def test_cancel_orders_concurrently(self):
+        _, exchange_manager, trader_inst = await init_default()
+        orders = [self._get_buy_limit_order(trader_inst, price) for price in ("70", "60", "50")]
+        assert await trader_inst.create_orders(orders) == orders
+        origin_on_order_cancel_status = trader_inst._on_order_cancel_status
+
+        async def _on_order_cancel_status(order, *args):
+            if order is orders[1]:
+                raise errors.UnexpectedExchangeSideOrderStateError
+            return await origin_on_order_cancel_status(order, *args)
+
+        try:
+            trader_inst.simulate = False
+            with mock.patch.object(
+                exchange_manager.exchange, "cancel_order", mock.AsyncMock(return_value=OrderStatus.CANCELED)
+            ) as cancel_order_mock, mock.patch.object(
+                trader_inst, "_on_order_cancel_status", mock.AsyncMock(side_effect=_on_order_cancel_status)
+            ) as _on_order_cancel_status_mock:
+                # as in trading modes consumers: orders are cancelled while holding the portfolio lock
+                async with exchange_manager.exchange_personal_data.portfolio_manager.portfolio.lock:
+                    with pytest.raises(errors.UnexpectedExchangeSideOrderStateError):
+                        await asyncio.wait_for(trader_inst.cancel_orders(orders), 1)
+                assert cancel_order_mock.call_count == 3
+                # error is raised once every cancelled order is handled
+                assert [call.args[0] for call in _on_order_cancel_status_mock.mock_calls] == orders
+                assert orders[0].is_cancelled() and orders[2].is_cancelled()
+        finally:
+            trader_inst.simulate = True
+        await stop(exchange_manager)
+
+    def _get_buy_limit_order(self, trader_inst, price):
+        limit_buy = BuyLimitOrder(trader_inst)
+        limit_buy.update(order_type=TraderOrderType.BUY_LIMIT,
+                         symbol=self.DEFAULT_SYMBOL,
+                         current_price=decimal.Decimal("70"),
+                         quantity=decimal.Decimal("1"),
+                         price=decimal.Decimal(price))
+        return limit_buy
+
     async def test_cancel_open_orders_default_symbol(self):
         config, exchange_manager, trader_inst = await init_default()
         orders_manager = exchange_manager.exchange_personal_data.orders_manager
@@ -1508,7 +1766,7 @@ async def test_create_order(future_trader_simulator_with_default_linear):
     with mock.patch.object(trader_inst, "_create_new_order", mock.AsyncMock()) as _create_new_order_mock:
         assert await trader_inst.create_order(order_mock)
         _create_new_order_mock.assert_called_once_with(
-            order_mock, {}, True, constants.INDIVIDUAL_ORDER_SYNC_TIMEOUT
+            order_mock, {}, True, constants.INDIVIDUAL_ORDER_SYNC_TIMEOUT, exchange_creation=None
         )
     for err in (errors.MissingFunds, errors.AuthenticationError, errors.ExchangeCompliancyError):
         with mock.patch.object(
@@ -1519,7 +1777,7 @@ async def test_create_order(future_trader_simulator_with_default_linear):
                     order_mock, params="params", wait_for_creation=False, creation_timeout=1
                 )
             _create_new_order_mock.assert_called_once_with(
-                order_mock, "params", False, 1
+                order_mock, "params", False, 1, exchange_creation=None
             )
         with mock.patch.object(
             trader_inst, "_create_new_order", mock.AsyncMock(side_effect=ZeroDivisionError)
@@ -1529,7 +1787,7 @@ async def test_create_order(future_trader_simulator_with_default_linear):
                 order_mock, params="params", wait_for_creation=False, creation_timeout=1
             ) is None
             _create_new_order_mock.assert_called_once_with(
-                order_mock, "params", False, 1
+                order_mock, "params", False, 1, exchange_creation=None
             )
 
 
@@ -0,0 +1,53 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import contextlib
+
+import mock
+import pytest
+
+import octobot_commons.constants as commons_constants
+import octobot_commons.databases as databases
+
+from tests.modes.script_keywords import null_context
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+@contextlib.asynccontextmanager
+async def _run_dbs_identifier_as_meta_db(run_dbs_identifier, **_):
+    yield run_dbs_identifier
+
+
+@pytest.mark.parametrize("use_sqlite_run_databases, expected_adaptor", [
+    (True, databases.SQLiteAdaptor),
+    (False, databases.TinyDBAdaptor),
+])
+async def test_backtesting_results_uses_configured_database_adaptor(
+    null_context, use_sqlite_run_databases, expected_adaptor
+):
+    null_context.trading_mode_class = "TradingMode"
+    null_context.optimization_campaign_name = "campaign"
+    with mock.patch.object(commons_constants, "USE_SQLITE_RUN_DATABASES", use_sqlite_run_databases), \
+         mock.patch.object(databases.RunDatabasesIdentifier, "exchange_base_identifier_exists",
+                           mock.AsyncMock(return_value=True)), \
+         mock.patch.object(databases.MetaDatabase, "database", _run_dbs_identifier_as_meta_db):
+        async with null_context.backtesting_results() as (run_dbs_identifier, _):
+            assert run_dbs_identifier.database_adaptor is expected_adaptor
+        # explicit adaptors are still used
+        async with null_context.backtesting_results(database_adaptor=databases.TinyDBAdaptor) as \
+                (run_dbs_identifier, _):
+            assert run_dbs_identifier.database_adaptor is databases.TinyDBAdaptor
@@ -20,6 +20,8 @@ import pytest
 import pytest_asyncio
 import time
 
+import octobot_commons.symbols as commons_symbols
+
 import octobot_trading.personal_data as personal_data
 import octobot_trading.exchanges as exchanges
 import octobot_trading.exchanges.util.exchange_data as exchange_data_import
@@ -415,6 +417,96 @@ async def test_get_orders_to_cancel_from_policies(order_and_exchange_managers):
     assert orders_manager.get_orders_to_cancel_from_policies(two_orders) == two_orders
 
 
+async def test_orders_selection_follows_orders_updates(order_and_exchange_managers):
+    orders_manager, exchange_manager = order_and_exchange_managers
+    await reset_orders_manager(orders_manager, enums.OrderStatus.OPEN.value)
+    open_orders = orders_manager.get_open_orders(symbol=DEFAULT_SYMBOL)
+    # market order is filled
+    assert [order.order_id for order in open_orders] == ["2", "3", "4"]
+    assert orders_manager.get_open_orders(symbol="ETH/USDT") == []
+
+    # status, symbol, tag and exchange order id changes are taken into account
+    open_orders[0].status = enums.OrderStatus.PENDING_CANCEL
+    open_orders[1].symbol = "ETH/USDT"
+    open_orders[2].tag = "tag"
+    open_orders[2].exchange_order_id = "exchange-4"
+    assert orders_manager.get_open_orders(symbol=DEFAULT_SYMBOL) == [open_orders[2]]
+    assert orders_manager.get_pending_cancel_orders() == [open_orders[0]]
+    assert orders_manager.get_open_orders(symbol="ETH/USDT") == [open_orders[1]]
+    assert orders_manager.get_all_orders(tag="tag") == [open_orders[2]]
+    assert orders_manager.get_order(None, exchange_order_id="exchange-4") is open_orders[2]
+    with pytest.raises(KeyError):
+        orders_manager.get_order(None, exchange_order_id="4")
+
+    # order groups
+    group = orders_manager.create_group(personal_data.OneCancelsTheOtherOrderGroup)
+    assert orders_manager.get_order_from_group(group.name) == []
+    open_orders[2].add_to_order_group(group)
+    open_orders[1].add_to_order_group(group)
+    assert orders_manager.get_order_from_group(group.name) == [open_orders[1], open_orders[2]]
+
+    # removed orders are not indexed anymore
+    orders_manager.remove_order_instance(open_orders[2])
+    assert open_orders[2].orders_index is None
+    assert orders_manager.get_order_from_group(group.name) == [open_orders[1]]
+    assert not orders_manager.has_order(None, exchange_order_id="exchange-4")
+
+    # orders added without using the orders manager are selected
+    removed_order = personal_data.create_order_instance_from_raw(
+        exchange_manager.trader, _get_raw_order(RAW_ORDERS[3], enums.OrderStatus.OPEN.value)
+    )
+    removed_order.symbol = "ETH/USDT"
+    orders_manager.orders[removed_order.order_id] = removed_order
+    assert orders_manager.get_open_orders(symbol="ETH/USDT") == [open_orders[1], removed_order]
+    orders_manager.orders = {open_orders[0].order_id: open_orders[0]}
+    assert orders_manager.get_all_orders() == [open_orders[0]]
+    assert orders_manager.get_open_orders(symbol="ETH/USDT") == []
+
+
+async def test_remove_oldest_orders_updates_selection(order_and_exchange_managers):
+    orders_manager, exchange_manager = order_and_exchange_managers
+    await reset_orders_manager(orders_manager, enums.OrderStatus.OPEN.value)
+    for order in orders_manager.get_open_orders():
+        order.exchange_order_id = f"exchange-{order.order_id}"
+    orders_manager._remove_oldest_orders(2)
+    assert [order.order_id for order in orders_manager.get_open_orders(symbol=DEFAULT_SYMBOL)] == ["4"]
+    assert not orders_manager.has_order(None, exchange_order_id="exchange-2")
+    assert orders_manager.get_order(None, exchange_order_id="exchange-4").order_id == "4"
+
+
+async def test_open_orders_exposure_follows_orders_updates(order_and_exchange_managers):
+    orders_manager, exchange_manager = order_and_exchange_managers
+    await reset_orders_manager(orders_manager, enums.OrderStatus.OPEN.value)
+    value_holder = exchange_manager.exchange_personal_data.portfolio_manager.portfolio_value_holder
+    symbol = commons_symbols.parse_symbol(DEFAULT_SYMBOL)
+
+    def assert_exposure_is_up_to_date():
+        exposure = orders_manager.get_open_orders_exposure()
+        assert exposure.get_currency_amount(symbol.base) == value_holder._get_orders_delta(symbol.base)
+        assert exposure.get_currency_amount(symbol.quote) == value_holder._get_orders_delta(symbol.quote)
+        assert exposure.get_symbol_value(DEFAULT_SYMBOL) == \
+               value_holder._get_open_orders_value_for_symbol(DEFAULT_SYMBOL)
+
+    open_orders = orders_manager.get_open_orders(symbol=DEFAULT_SYMBOL)
+    assert_exposure_is_up_to_date()
+    assert orders_manager.get_open_orders_exposure().get_symbol_value(DEFAULT_SYMBOL) != constants.ZERO
+
+    # partial fill, quantity edit, cancel and removal
+    open_orders[0].filled_quantity = open_orders[0].origin_quantity / decimal.Decimal(2)
+    assert_exposure_is_up_to_date()
+    open_orders[1].origin_quantity *= decimal.Decimal(3)
+    open_orders[1].total_cost = decimal.Decimal("12")
+    assert_exposure_is_up_to_date()
+    open_orders[2].status = enums.OrderStatus.CANCELED
+    assert_exposure_is_up_to_date()
+    orders_manager.remove_order_instance(open_orders[1])
+    assert_exposure_is_up_to_date()
+
+    orders_manager.clear()
+    assert orders_manager.get_open_orders_exposure().get_symbol_value(DEFAULT_SYMBOL) == constants.ZERO
+    assert orders_manager.get_open_orders_exposure().get_currency_amount(symbol.quote) == constants.ZERO
+
+
 class TestOrdersManagerInitializeFromExchangeData:
     @staticmethod
     async def _initialize_from_exchange_data(orders_manager, exchange_data):
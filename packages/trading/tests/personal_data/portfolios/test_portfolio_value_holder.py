@@ -719,3 +719,33 @@ async def test_get_open_orders_value_for_symbol_multiple_orders(backtesting_trad
         assert isinstance(result, decimal.Decimal)
         assert result == decimal.Decimal("300")
 
+
+
+@pytest.mark.parametrize("backtesting_exchange_manager", ["spot", "futures"], indirect=True)
+async def test_open_orders_exposure_check(backtesting_trader):
+    config, exchange_manager, trader = backtesting_trader
+    portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+    portfolio_value_holder = portfolio_manager.portfolio_value_holder
+    orders_manager = exchange_manager.exchange_personal_data.orders_manager
+
+    sell_order = personal_data.SellLimitOrder(trader)
+    sell_order.update(order_type=enums.TraderOrderType.SELL_LIMIT,
+                      symbol="BTC/USDT",
+                      current_price=decimal.Decimal("40"),
+                      quantity=decimal.Decimal("5"),
+                      price=decimal.Decimal("40"))
+    await orders_manager.upsert_order_instance(sell_order)
+    with mock.patch.object(constants, "CHECK_OPEN_ORDERS_EXPOSURE", True), \
+         mock.patch.object(portfolio_value_holder.logger, "error", mock.Mock()) as error_mock:
+        assert portfolio_value_holder._get_total_holdings_in_open_orders("USDT") == decimal.Decimal("200")
+        assert portfolio_value_holder._get_open_orders_pending_value("BTC/USDT") == decimal.Decimal("-200")
+        error_mock.assert_not_called()
+        sell_order.filled_quantity = decimal.Decimal("2")
+        assert portfolio_value_holder._get_open_orders_pending_value("BTC/USDT") == decimal.Decimal("-120")
+        error_mock.assert_not_called()
+
+        # orders updated without notifying the orders index are detected
+        sell_order.orders_index = None
+        sell_order.total_cost = decimal.Decimal("100")
+        assert portfolio_value_holder._get_total_holdings_in_open_orders("USDT") == decimal.Decimal("200")
+        error_mock.assert_called_once()
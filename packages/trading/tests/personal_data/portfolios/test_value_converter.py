@@ -156,6 +156,119 @@ def test_try_convert_currency_value_using_multiple_pairs_with_nested_bridges(bac
         decimal.Decimal("0.1") / decimal.Decimal("0.0000001")
 
 
+def test_try_convert_currency_value_using_multiple_pairs_uses_shortest_bridge(backtesting_trader):
+    config, exchange_manager, trader = backtesting_trader
+    portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+    value_converter = portfolio_manager.portfolio_value_holder.value_converter
+
+    # ADA -> USDT -> BTC -> ETH and ADA -> DOT -> ETH bridges
+    value_converter.update_last_price("ADA/USDT", decimal.Decimal("2"))
+    value_converter.update_last_price("BTC/USDT", decimal.Decimal("100"))
+    value_converter.update_last_price("ETH/BTC", decimal.Decimal("0.1"))
+    value_converter.update_last_price("ADA/DOT", decimal.Decimal("4"))
+    value_converter.update_last_price("DOT/ETH", decimal.Decimal("0.5"))
+    assert value_converter.try_convert_currency_value_using_multiple_pairs("ADA", "ETH", constants.ONE, []) == \
+           decimal.Decimal("2")
+    assert value_converter.get_saved_price_conversion_bridge("ADA", "ETH") == [("ADA", "DOT"), ("DOT", "ETH")]
+    # excluded pairs are not used
+    assert value_converter.try_convert_currency_value_using_multiple_pairs(
+        "ADA", "ETH", constants.ONE, [("DOT", "ADA")]
+    ) == decimal.Decimal("2")   # saved bridge
+    value_converter._price_bridge_by_symbol.clear()
+    assert value_converter.try_convert_currency_value_using_multiple_pairs(
+        "ADA", "ETH", constants.ONE, [("DOT", "ADA")]
+    ) == decimal.Decimal(2) / decimal.Decimal(100) / decimal.Decimal("0.1")
+
+    # prices edited without update_last_price are taken into account
+    value_converter.last_prices_by_trading_pair["XRP/ADA"] = decimal.Decimal("0.5")
+    assert value_converter.try_convert_currency_value_using_multiple_pairs("XRP", "ETH", constants.ONE, []) == \
+           decimal.Decimal("1")
+    assert value_converter.get_saved_price_conversion_bridge("XRP", "ETH") == [
+        ("XRP", "ADA"), ("ADA", "DOT"), ("DOT", "ETH")
+    ]
+
+
+def test_try_convert_currency_value_using_multiple_pairs_skips_zero_prices(backtesting_trader):
+    config, exchange_manager, trader = backtesting_trader
+    portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+    value_converter = portfolio_manager.portfolio_value_holder.value_converter
+
+    # ADA -> DOT -> ETH is the shortest bridge but DOT/ETH has no price yet
+    value_converter.update_last_price("ADA/USDT", decimal.Decimal("2"))
+    value_converter.update_last_price("BTC/USDT", decimal.Decimal("100"))
+    value_converter.update_last_price("ETH/BTC", decimal.Decimal("0.1"))
+    value_converter.update_last_price("ADA/DOT", decimal.Decimal("4"))
+    value_converter.update_last_price("DOT/ETH", constants.ZERO)
+    assert value_converter.try_convert_currency_value_using_multiple_pairs("ADA", "ETH", constants.ONE, []) == \
+           decimal.Decimal(2) / decimal.Decimal(100) / decimal.Decimal("0.1")
+    assert value_converter.get_saved_price_conversion_bridge("ADA", "ETH") == [
+        ("ADA", "USDT"), ("USDT", "BTC"), ("BTC", "ETH")
+    ]
+    # same when saving bridges of multiple currencies
+    value_converter._price_bridge_by_symbol.clear()
+    value_converter._save_price_bridges_to_target(["ADA"], "ETH")
+    assert value_converter.get_saved_price_conversion_bridge("ADA", "ETH") == [
+        ("ADA", "USDT"), ("USDT", "BTC"), ("BTC", "ETH")
+    ]
+
+
+def test_conversion_graphs_are_updated_when_pairs_are_replaced(backtesting_trader):
+    config, exchange_manager, trader = backtesting_trader
+    portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+    value_converter = portfolio_manager.portfolio_value_holder.value_converter
+
+    value_converter.update_last_price("BTC/USDT", decimal.Decimal("100"))
+    value_converter.update_last_price("ETH/BTC", decimal.Decimal("0.1"))
+    assert value_converter.try_convert_currency_value_using_multiple_pairs("ETH", "USDT", constants.ONE, []) == \
+           decimal.Decimal("10")
+    # replace a priced pair: same number of priced pairs
+    value_converter.last_prices_by_trading_pair.pop("ETH/BTC")
+    value_converter.last_prices_by_trading_pair["ADA/BTC"] = decimal.Decimal("0.5")
+    assert value_converter.try_convert_currency_value_using_multiple_pairs("ADA", "USDT", constants.ONE, []) == \
+           decimal.Decimal("50")
+    # replace a traded pair: same number of traded pairs
+    traded_symbol_pairs = exchange_manager.exchange_config.traded_symbol_pairs
+    traded_symbol_pairs.append("DOT/BTC")
+    _, pairs_graph = value_converter._get_conversion_graphs()
+    assert pairs_graph.has_pair("DOT", "BTC")
+    traded_symbol_pairs[traded_symbol_pairs.index("DOT/BTC")] = "XRP/PLOP"
+    _, pairs_graph = value_converter._get_conversion_graphs()
+    assert not pairs_graph.has_pair("DOT", "BTC")
+    assert pairs_graph.has_pair("XRP", "PLOP")
+
+
+def test_evaluate_values(backtesting_trader):
+    config, exchange_manager, trader = backtesting_trader
+    portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+    value_converter = portfolio_manager.portfolio_value_holder.value_converter
+    value_converter.update_last_price("BTC/USDT", decimal.Decimal("100"))
+    value_converter.update_last_price("ETH/BTC", decimal.Decimal("0.1"))
+    value_converter.update_last_price("ADA/ETH", decimal.Decimal("0.5"))
+    value_converter.update_last_price("CRO/PLOP", decimal.Decimal("0.5"))
+
+    assert value_converter.evaluate_values({
+        "USDT": decimal.Decimal("3"),
+        "BTC": decimal.Decimal("2"),
+        "ETH": decimal.Decimal("10"),
+        "ADA": decimal.Decimal("4"),
+        "CRO": decimal.Decimal("1"),
+    }, target_currency="USDT", init_price_fetchers=False) == {
+        "USDT": decimal.Decimal("3"),
+        "BTC": decimal.Decimal("200"),
+        "ETH": decimal.Decimal("100"),
+        "ADA": decimal.Decimal("20"),
+        # CRO can't be valued in backtesting
+        "CRO": constants.ZERO,
+    }
+    # bridges are saved
+    assert value_converter.get_saved_price_conversion_bridge("ADA", "USDT") == [
+        ("ADA", "ETH"), ("ETH", "BTC"), ("BTC", "USDT")
+    ]
+    assert value_converter.get_saved_price_conversion_bridge("ETH", "USDT") == [("ETH", "BTC"), ("BTC", "USDT")]
+    with pytest.raises(KeyError):
+        value_converter.get_saved_price_conversion_bridge("CRO", "USDT")
+
+
 def test_get_usd_like_value(backtesting_trader):
     config, exchange_manager, trader = backtesting_trader
     portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
@@ -14,11 +14,19 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import decimal
+import mock
+import pytest
+import pytest_asyncio
+
+import octobot_commons.databases as commons_databases
 
 import octobot_trading.personal_data as personal_data
+import octobot_trading.constants as constants
 import octobot_trading.enums as enums
 import octobot_trading.storage.orders_storage as orders_storage
 
+from tests.exchanges import simulated_exchange_manager, simulated_trader
+
 
 def _minimal_origin_value(**overrides):
     origin_value = {
@@ -80,3 +88,147 @@ class TestRestoreOrderStorageOriginValue:
         origin_value = {}
         restored_origin_value = orders_storage.restore_order_storage_origin_value(origin_value)
         assert restored_origin_value == {}
+
+
+@pytest_asyncio.fixture
+async def journaled_orders_storage(simulated_trader, tmp_path):
+    _, exchange_manager, trader = simulated_trader
+    database = commons_databases.DBWriterReader(str(tmp_path / "orders.json"))
+    storage = orders_storage.OrdersStorage(exchange_manager)
+    with mock.patch.object(orders_storage.OrdersStorage, "ENABLE_JOURNAL", True), \
+         mock.patch.object(storage, "should_store_data", mock.Mock(return_value=True)), \
+         mock.patch.object(storage, "_get_db", mock.Mock(return_value=database)), \
+         mock.patch.object(storage, "trigger_debounced_update_auth_data", mock.AsyncMock()), \
+         mock.patch.object(storage, "trigger_debounced_flush", mock.AsyncMock()):
+        try:
+            yield storage, trader, database
+        finally:
+            await database.close()
+
+
+async def _create_open_order(trader, exchange_order_id):
+    order = personal_data.BuyLimitOrder(trader)
+    order.update(
+        order_type=enums.TraderOrderType.BUY_LIMIT,
+        symbol="BTC/USDT",
+        current_price=decimal.Decimal("70"),
+        quantity=decimal.Decimal("10"),
+        price=decimal.Decimal("70"),
+        exchange_order_id=exchange_order_id,
+        status=enums.OrderStatus.OPEN,
+    )
+    await trader.exchange_manager.exchange_personal_data.orders_manager.upsert_order_instance(order)
+    return order
+
+
+async def _close_order(trader, order, status):
+    order.status = status
+    trader.exchange_manager.exchange_personal_data.orders_manager.remove_order_instance(order)
+
+
+async def _call_live_callback(storage, order):
+    await storage._live_callback(
+        storage.exchange_manager.exchange_name, storage.exchange_manager.id, "BTC", order.symbol, order.to_dict(),
+        enums.OrderUpdateType.STATE_CHANGE.value, True
+    )
+
+
+def _get_update_types(journal):
+    return [order_update[enums.StoredOrdersAttr.UPDATE_TYPE.value] for order_update in journal]
+
+
+@pytest.mark.asyncio
+async def test_journaled_orders_storage(journaled_orders_storage):
+    storage, trader, database = journaled_orders_storage
+    order_1 = await _create_open_order(trader, "exchange-id-1")
+    # first update: stored as a snapshot
+    await _call_live_callback(storage, order_1)
+    assert len(await database.all(storage.HISTORY_TABLE)) == 1
+    assert await database.all(storage.JOURNAL_TABLE) == []
+
+    order_2 = await _create_open_order(trader, "exchange-id-2")
+    order_3 = await _create_open_order(trader, "exchange-id-3")
+    with mock.patch.object(database, "replace_all", mock.AsyncMock(wraps=database.replace_all)) as replace_all_mock:
+        for order in (order_2, order_3, order_1):
+            await _call_live_callback(storage, order)
+        await _close_order(trader, order_1, enums.OrderStatus.FILLED)
+        await _call_live_callback(storage, order_1)
+        await _close_order(trader, order_2, enums.OrderStatus.CANCELED)
+        await _call_live_callback(storage, order_2)
+        # already removed
+        await _call_live_callback(storage, order_2)
+        # only updated orders are stored
+        replace_all_mock.assert_not_called()
+    assert len(await database.all(storage.HISTORY_TABLE)) == 1
+    assert _get_update_types(await database.all(storage.JOURNAL_TABLE)) == [
+        enums.StoredOrderJournalUpdateType.CREATED.value,
+        enums.StoredOrderJournalUpdateType.CREATED.value,
+        enums.StoredOrderJournalUpdateType.UPDATED.value,
+        enums.StoredOrderJournalUpdateType.FILLED.value,
+        enums.StoredOrderJournalUpdateType.CANCELLED.value,
+    ]
+
+    # startup orders are loaded from snapshot + journal
+    await storage._load_startup_orders()
+    assert list(storage.startup_orders) == ["exchange-id-3"]
+    assert storage.startup_orders["exchange-id-3"][constants.STORAGE_ORIGIN_VALUE][
+        enums.ExchangeConstantsOrderColumns.PRICE.value
+    ] == decimal.Decimal("70")
+
+    # compact journal on store
+    await storage.store_history()
+    assert await database.all(storage.JOURNAL_TABLE) == []
+    assert [
+        order[constants.STORAGE_ORIGIN_VALUE][enums.ExchangeConstantsOrderColumns.EXCHANGE_ID.value]
+        for order in await database.all(storage.HISTORY_TABLE)
+    ] == ["exchange-id-3"]
+    await storage._load_startup_orders()
+    assert list(storage.startup_orders) == ["exchange-id-3"]
+
+
+@pytest.mark.asyncio
+async def test_journaled_orders_storage_compaction(journaled_orders_storage):
+    storage, trader, database = journaled_orders_storage
+    orders = [await _create_open_order(trader, f"exchange-id-{i}") for i in range(5)]
+    with mock.patch.object(constants, "ORDERS_STORAGE_JOURNAL_COMPACTION_SIZE", 2):
+        for order in orders:
+            await _call_live_callback(storage, order)
+    # snapshot, 2 journaled updates, snapshot, 1 journaled update
+    assert len(await database.all(storage.HISTORY_TABLE)) == 5
+    assert len(await database.all(storage.JOURNAL_TABLE)) == 1
+    await storage._load_startup_orders()
+    assert sorted(storage.startup_orders) == [f"exchange-id-{i}" for i in range(5)]
+    await orders_storage.OrdersStorage.clear_database_history(database)
+    assert await database.all(storage.JOURNAL_TABLE) == []
+
+
+@pytest.mark.asyncio
+async def test_orders_storage_snapshot_clears_previous_run_journal(journaled_orders_storage):
+    storage, trader, database = journaled_orders_storage
+    order_1 = await _create_open_order(trader, "exchange-id-1")
+    await _call_live_callback(storage, order_1)
+    order_2 = await _create_open_order(trader, "exchange-id-2")
+    await _call_live_callback(storage, order_2)
+    assert len(await database.all(storage.JOURNAL_TABLE)) == 1
+    await _close_order(trader, order_2, enums.OrderStatus.CANCELED)
+
+    # next run without journal: the previous run journal should not be replayed on top of the new snapshot
+    with mock.patch.object(orders_storage.OrdersStorage, "ENABLE_JOURNAL", False):
+        await _call_live_callback(storage, order_2)
+    assert await database.all(storage.JOURNAL_TABLE) == []
+    await storage._load_startup_orders()
+    assert list(storage.startup_orders) == ["exchange-id-1"]
+
+
+@pytest.mark.asyncio
+async def test_orders_storage_snapshot_is_written_before_clearing_journal(journaled_orders_storage):
+    storage, trader, database = journaled_orders_storage
+    calls = []
+    order = await _create_open_order(trader, "exchange-id-1")
+    with mock.patch.object(
+        database, "replace_all", mock.AsyncMock(side_effect=lambda *_, **__: calls.append("replace_all"))
+    ), mock.patch.object(
+        database, "delete_all", mock.AsyncMock(side_effect=lambda *_, **__: calls.append("delete_all"))
+    ):
+        await _call_live_callback(storage, order)
+    assert calls == ["replace_all", "delete_all"]
@@ -0,0 +1,136 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import time
+
+import mock
+import pytest
+
+import octobot_commons.enums as commons_enums
+
+import octobot_trading.exchanges as exchanges
+import octobot_trading.enums as enums
+
+from tests.exchanges import simulated_exchange_manager, DEFAULT_EXCHANGE_NAME
+
+pytestmark = pytest.mark.asyncio
+
+MESSAGES_COUNT = 5000
+SYMBOL = "BTC/USDT"
+BOOK_DEPTH = 100
+# ccxt-pro payloads as received from watchTicker, watchTrades, watchOHLCV and watchOrderBook
+TICKER = {
+    "symbol": SYMBOL,
+    "timestamp": 1700000000123,
+    "datetime": "2023-11-14T22:13:20.123Z",
+    "high": 37500.5, "low": 36200.0, "bid": 37000.1, "bidVolume": 1.2, "ask": 37000.2, "askVolume": 0.8,
+    "vwap": 36900.4, "open": 36500.0, "close": 37000.15, "last": 37000.15, "previousClose": None,
+    "change": 500.15, "percentage": 1.37, "average": 36750.07, "baseVolume": 1234.5, "quoteVolume": 45551234.7,
+    "info": {
+        "e": "24hrTicker", "E": 1700000000123, "s": "BTCUSDT", "p": "500.15", "P": "1.370", "w": "36900.4",
+        "x": "36499.99", "c": "37000.15", "Q": "0.012", "b": "37000.10", "B": "1.2", "a": "37000.20", "A": "0.8",
+        "o": "36500.00", "h": "37500.50", "l": "36200.00", "v": "1234.5", "q": "45551234.7", "O": 1699913600123,
+        "C": 1700000000123, "F": 3280000000, "L": 3280123456, "n": 123457,
+    },
+}
+TRADES = [
+    {
+        "id": str(3280123456 + index), "order": None, "timestamp": 1700000000123 + index,
+        "datetime": "2023-11-14T22:13:20.123Z", "symbol": SYMBOL, "type": None, "side": "buy" if index % 2 else "sell",
+        "takerOrMaker": None, "price": 37000.15 + index, "amount": 0.012, "cost": 444.0018, "fee": None, "fees": [],
+        "info": {
+            "e": "trade", "E": 1700000000123 + index, "s": "BTCUSDT", "t": 3280123456 + index,
+            "p": str(37000.15 + index), "q": "0.012", "T": 1700000000123 + index, "m": bool(index % 2), "M": True,
+        },
+    }
+    for index in range(3)
+]
+CANDLES = [
+    [1700000040000, 37000.1, 37010.5, 36990.0, 37005.2, 12.5],
+]
+ORDER_BOOK = {
+    "symbol": SYMBOL,
+    "timestamp": 1700000000123,
+    "datetime": "2023-11-14T22:13:20.123Z",
+    "nonce": 40187654321,
+    "asks": [[37000.2 + index / 10, 0.5 + index / 100] for index in range(BOOK_DEPTH)],
+    "bids": [[37000.1 - index / 10, 0.5 + index / 100] for index in range(BOOK_DEPTH)],
+}
+
+
+class BenchmarkedCCXTWebsocketConnector(exchanges.CCXTWebsocketConnector):
+    def __init__(self, config, exchange_manager, adapter_class=None, additional_config=None, websocket_name=None):
+        super().__init__(config, exchange_manager, adapter_class=adapter_class, additional_config=additional_config,
+                         websocket_name=websocket_name)
+        self.throttled_ws_updates = 0
+        self.pushed_updates = 0
+
+    async def push_to_channel(self, channel_name, *args, **kwargs):
+        self.pushed_updates += 1
+
+    @classmethod
+    def get_name(cls):
+        return DEFAULT_EXCHANGE_NAME
+
+
+async def _get_messages_per_second(connector, feed, callback, payload, **kwargs) -> float:
+    remaining_messages = MESSAGES_COUNT
+
+    async def watch_recorded_payload(*_, **__):
+        nonlocal remaining_messages
+        remaining_messages -= 1
+        if remaining_messages == 0:
+            connector.should_stop = True
+        return payload
+
+    connector.should_stop = False
+    t0 = time.perf_counter()
+    await connector._feed_task(feed, callback, watch_recorded_payload, symbol=SYMBOL, **kwargs)
+    return MESSAGES_COUNT / (time.perf_counter() - t0)
+
+
+async def test_ccxt_websocket_connector_messages_per_second(simulated_exchange_manager):
+    # run with: pytest tests_additional/benchmarks -s
+    connector = BenchmarkedCCXTWebsocketConnector(simulated_exchange_manager.config, simulated_exchange_manager)
+    feeds = [
+        (enums.WebsocketFeeds.TICKER, connector.ticker, TICKER, {}),
+        (enums.WebsocketFeeds.TRADES, connector.recent_trades, TRADES, {}),
+        (
+            enums.WebsocketFeeds.CANDLE, connector.candle, CANDLES,
+            {"timeframe": commons_enums.TimeFrames.ONE_MINUTE.value}
+        ),
+        (enums.WebsocketFeeds.L2_BOOK, connector.book, ORDER_BOOK, {}),
+    ]
+    try:
+        for feed, callback, payload, kwargs in feeds:
+            with mock.patch.object(exchanges.CCXTAdapter, "PRESERVES_RAW_MARKET_DATA", False):
+                copied_messages_per_second = await _get_messages_per_second(
+                    connector, feed, callback, payload, **kwargs
+                )
+            copy_free_messages_per_second = await _get_messages_per_second(
+                connector, feed, callback, payload, **kwargs
+            )
+            print(
+                f"{feed.value}: {round(copied_messages_per_second)} messages/s with deep copies, "
+                f"{round(copy_free_messages_per_second)} messages/s copy-free "
+                f"(x{round(copy_free_messages_per_second / copied_messages_per_second, 2)})"
+            )
+        assert connector.pushed_updates > 0
+        # recorded payloads are left untouched
+        assert TICKER["timestamp"] == 1700000000123
+        assert "info" in TRADES[0]
+        assert CANDLES[0][0] == 1700000040000
+    finally:
+        await connector.close()
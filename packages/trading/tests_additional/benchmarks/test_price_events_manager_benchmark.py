@@ -0,0 +1,59 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+import random
+import time
+
+import pytest
+
+import octobot_trading.exchange_data as exchange_data
+
+pytestmark = pytest.mark.asyncio
+
+PENDING_EVENTS_COUNT = 10000
+PRICE_UPDATES_COUNT = 10000
+
+
+async def test_handle_price_with_10k_pending_events():
+    # run with: pytest tests_additional/benchmarks -s
+    random.seed(42)
+    price_events_manager = exchange_data.PriceEventsManager()
+    reference_price = decimal.Decimal(1000)
+    events = [
+        # grid like resting orders: buy orders below and sell orders above reference price
+        price_events_manager.new_event(
+            reference_price + decimal.Decimal(index + 1) if index % 2 else reference_price - decimal.Decimal(index + 1),
+            0,
+            bool(index % 2)
+        )
+        for index in range(PENDING_EVENTS_COUNT)
+    ]
+    assert len(price_events_manager.events) == PENDING_EVENTS_COUNT
+
+    t0 = time.perf_counter()
+    for timestamp in range(PRICE_UPDATES_COUNT):
+        # prices oscillating close to the reference price: only a few events are crossed
+        price_events_manager.handle_price(
+            reference_price + decimal.Decimal(random.randint(-20, 20)), timestamp
+        )
+    elapsed = time.perf_counter() - t0
+    print(
+        f"{PRICE_UPDATES_COUNT} price updates with {PENDING_EVENTS_COUNT} pending events: "
+        f"{round(elapsed, 3)}s ({round(elapsed / PRICE_UPDATES_COUNT * 1e6, 2)}µs per update)"
+    )
+    set_events = [event for event in events if event.is_set()]
+    assert 0 < len(set_events) <= 42
+    assert len(price_events_manager.events) == PENDING_EVENTS_COUNT - len(set_events)
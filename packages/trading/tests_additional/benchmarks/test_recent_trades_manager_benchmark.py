@@ -0,0 +1,57 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import time
+
+import pytest
+
+import octobot_trading.exchange_data as exchange_data
+
+pytestmark = pytest.mark.asyncio
+
+MAX_RECENT_TRADES_COUNT = 1000
+MESSAGES_COUNT = 10000
+TRADES_PER_MESSAGE = 10
+
+
+async def test_add_new_trades_with_1k_recent_trades_window():
+    # run with: pytest tests_additional/benchmarks -s
+    recent_trades_manager = exchange_data.RecentTradesManager(max_recent_trades_count=MAX_RECENT_TRADES_COUNT)
+    await recent_trades_manager.initialize()
+    messages = [
+        [
+            # each message contains the last trades of the stream: half of them have already been received
+            {
+                "id": str(trade_index), "timestamp": 1700000000000 + trade_index, "side": "buy",
+                "price": 37000.15 + trade_index % 10, "amount": 0.012,
+            }
+            for trade_index in range(
+                message_index * TRADES_PER_MESSAGE // 2, message_index * TRADES_PER_MESSAGE // 2 + TRADES_PER_MESSAGE
+            )
+        ]
+        for message_index in range(MESSAGES_COUNT)
+    ]
+    t0 = time.perf_counter()
+    added_trades_count = sum(
+        len(recent_trades_manager.add_new_trades(message))
+        for message in messages
+    )
+    elapsed = time.perf_counter() - t0
+    print(
+        f"{MESSAGES_COUNT} recent trades messages with a {MAX_RECENT_TRADES_COUNT} trades window: "
+        f"{round(elapsed, 3)}s ({round(elapsed / MESSAGES_COUNT * 1e6, 2)}µs per message)"
+    )
+    assert added_trades_count == (MESSAGES_COUNT + 1) * TRADES_PER_MESSAGE // 2
+    assert len(recent_trades_manager.recent_trades) == MAX_RECENT_TRADES_COUNT
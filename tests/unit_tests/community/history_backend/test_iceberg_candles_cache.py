@@ -0,0 +1,168 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import datetime
+import os
+
+import mock
+import pytest
+import pytest_asyncio
+
+pyarrow = pytest.importorskip("pyarrow")
+pytest.importorskip("pyiceberg.catalog.sql")
+
+import octobot_commons.enums as commons_enums
+import octobot.constants as constants
+import octobot.community.history_backend.iceberg_candles_cache as iceberg_candles_cache
+import octobot.community.history_backend.iceberg_historical_backend_client as iceberg_historical_backend_client
+
+pytestmark = pytest.mark.asyncio
+
+EXCHANGE = "binance"
+SYMBOL = "BTC/USDT"
+TIME_FRAME = commons_enums.TimeFrames.ONE_MINUTE
+CANDLES_PER_BUCKET = 10
+# aligned on buckets
+START_TIME = 1718784000
+COLUMN_NAMES = ["timestamp", "exchange_internal_name", "symbol", "time_frame", "open", "high", "low", "close", "volume"]
+
+
+def _get_candles_rows(first_index: int, count: int) -> list[list]:
+    return [
+        [
+            datetime.datetime.fromtimestamp(START_TIME + index * 60, tz=datetime.timezone.utc).replace(tzinfo=None),
+            EXCHANGE, SYMBOL, TIME_FRAME.value,
+            float(index), index + 2., index - 2., index + 1., index * 10.
+        ]
+        for index in range(first_index, first_index + count)
+    ]
+
+
+def _get_snapshot_id(client) -> int:
+    return client._get_snapshot_id(
+        client._get_or_create_table(iceberg_historical_backend_client.TableNames.OHLCV_HISTORY)
+    )
+
+
+@pytest_asyncio.fixture
+async def sql_catalog_client_factory(tmp_path):
+    catalog_properties = {
+        "type": "sql",
+        "uri": f"sqlite:///{tmp_path}/catalog.db",
+        "warehouse": f"file://{tmp_path}/warehouse",
+    }
+    clients = []
+
+    async def _create_client(candles_cache):
+        client = iceberg_historical_backend_client.IcebergHistoricalBackendClient(
+            enable_async_batch_inserts=False, candles_cache=candles_cache
+        )
+        await client.open()
+        clients.append(client)
+        return client
+
+    with mock.patch.object(constants, "ICEBERG_CATALOG_NAME", "local"), \
+         mock.patch.object(constants, "ICEBERG_CATALOG_NAMESPACE", "octobot"), \
+         mock.patch.object(constants, "CREATE_ICEBERG_DB_IF_MISSING", True), \
+         mock.patch.object(
+             iceberg_historical_backend_client.IcebergHistoricalBackendClient, "_get_catalog_properties",
+             mock.Mock(return_value=catalog_properties)
+         ):
+        yield _create_client
+        for client in clients:
+            client._executor.shutdown()
+
+
+async def test_fetch_candles_history_with_cache(sql_catalog_client_factory, tmp_path):
+    cache = iceberg_candles_cache.IcebergCandlesCache(
+        os.path.join(tmp_path, "cache"), 10 * 1024 * 1024, CANDLES_PER_BUCKET
+    )
+    client = await sql_catalog_client_factory(cache)
+    uncached_client = await sql_catalog_client_factory(None)
+    # no table statistics yet: load empty candles ranges before inserting candles
+    assert await client.fetch_candles_history_range(EXCHANGE, SYMBOL, TIME_FRAME) == (0, 0)
+    await client.insert_candles_history(_get_candles_rows(0, 35), COLUMN_NAMES)
+    last_time = START_TIME + 40 * 60
+    with mock.patch.object(client, "_scan_candles_history", mock.Mock(wraps=client._scan_candles_history)) \
+         as _scan_candles_history_mock:
+        candles = await client.fetch_candles_history(EXCHANGE, SYMBOL, TIME_FRAME, START_TIME + 60, last_time)
+        # all missing buckets are fetched at once
+        _scan_candles_history_mock.assert_called_once()
+        assert len(candles) == 34
+        assert candles[0][commons_enums.PriceIndexes.IND_PRICE_TIME.value] == START_TIME + 60
+        assert candles == await uncached_client.fetch_candles_history(
+            EXCHANGE, SYMBOL, TIME_FRAME, START_TIME + 60, last_time
+        )
+        # 3 complete and 2 partial buckets
+        snapshot_id = _get_snapshot_id(client)
+        assert sorted(os.listdir(os.path.join(cache.cache_path, EXCHANGE, "BTC%2FUSDT", TIME_FRAME.value))) == [
+            f"{START_TIME}.parquet", f"{START_TIME + 600}.parquet", f"{START_TIME + 1200}.parquet",
+            f"{START_TIME + 1800}.{snapshot_id}.partial.parquet", f"{START_TIME + 2400}.{snapshot_id}.partial.parquet",
+        ]
+        _scan_candles_history_mock.reset_mock()
+
+        # same snapshot: everything is cached
+        assert await client.fetch_candles_history(EXCHANGE, SYMBOL, TIME_FRAME, START_TIME + 60, last_time) \
+            == candles
+        assert (await client.fetch_candles_history_arrays(
+            EXCHANGE, SYMBOL, TIME_FRAME, START_TIME + 60, last_time
+        )).tolist() == candles
+        _scan_candles_history_mock.assert_not_called()
+
+        # new candles: only partial buckets are fetched again, using a single scan
+        await client.insert_candles_history(_get_candles_rows(35, 10), COLUMN_NAMES)
+        updated_candles = await client.fetch_candles_history(EXCHANGE, SYMBOL, TIME_FRAME, START_TIME + 60, last_time)
+        _scan_candles_history_mock.assert_called_once()
+        assert len(updated_candles) == 40
+        assert updated_candles[:34] == candles
+        assert updated_candles == await uncached_client.fetch_candles_history(
+            EXCHANGE, SYMBOL, TIME_FRAME, START_TIME + 60, last_time
+        )
+        # outdated partial buckets have been replaced
+        snapshot_id = _get_snapshot_id(client)
+        assert sorted(os.listdir(os.path.join(cache.cache_path, EXCHANGE, "BTC%2FUSDT", TIME_FRAME.value))) == [
+            f"{START_TIME}.parquet", f"{START_TIME + 600}.parquet", f"{START_TIME + 1200}.parquet",
+            f"{START_TIME + 1800}.parquet", f"{START_TIME + 2400}.{snapshot_id}.partial.parquet",
+        ]
+
+
+async def test_cache_size_limit(tmp_path):
+    cache = iceberg_candles_cache.IcebergCandlesCache(
+        os.path.join(tmp_path, "cache"), 10 * 1024 * 1024, CANDLES_PER_BUCKET
+    )
+    buckets = cache.get_buckets(TIME_FRAME, START_TIME, START_TIME + 25 * 60, (START_TIME, START_TIME + 100 * 60))
+    assert [bucket.start for bucket in buckets] == [START_TIME, START_TIME + 600, START_TIME + 1200]
+    assert all(bucket.is_complete for bucket in buckets)
+    candles = pyarrow.table({"timestamp": pyarrow.array([datetime.datetime(2024, 6, 19)], pyarrow.timestamp("us"))})
+    cache.set(EXCHANGE, SYMBOL, TIME_FRAME, buckets[0], 1, candles)
+    file_size = cache.get_size()
+    assert cache.get(EXCHANGE, SYMBOL, TIME_FRAME, buckets[0], 2).equals(candles)
+    cache.max_size = file_size * 2
+    cache.set(EXCHANGE, SYMBOL, TIME_FRAME, buckets[1], 1, candles)
+    os.utime(cache._get_complete_bucket_file(cache._get_bucket_path(EXCHANGE, SYMBOL, TIME_FRAME, buckets[1])), (0, 0))
+    # buckets[1] is the least recently used one
+    cache.set(EXCHANGE, SYMBOL, TIME_FRAME, buckets[2], 1, candles)
+    assert cache.get_size() == file_size * 2
+    assert cache.get(EXCHANGE, SYMBOL, TIME_FRAME, buckets[0], 1) is not None
+    assert cache.get(EXCHANGE, SYMBOL, TIME_FRAME, buckets[1], 1) is None
+    assert cache.get(EXCHANGE, SYMBOL, TIME_FRAME, buckets[2], 1) is not None
+
+    # partial buckets are only valid for their snapshot
+    partial_bucket = cache.get_buckets(TIME_FRAME, START_TIME, START_TIME, (START_TIME, START_TIME))[0]
+    assert partial_bucket.is_complete is False
+    cache.clear()
+    cache.set(EXCHANGE, SYMBOL, TIME_FRAME, partial_bucket, 1, candles)
+    assert cache.get(EXCHANGE, SYMBOL, TIME_FRAME, partial_bucket, 1) is not None
+    assert cache.get(EXCHANGE, SYMBOL, TIME_FRAME, partial_bucket, 2) is None
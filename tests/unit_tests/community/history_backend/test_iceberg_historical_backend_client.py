@@ -0,0 +1,96 @@
+#  This file is part of OctoBot (https://github.com/Drakkar-Software/OctoBot)
+#  Copyright (c) 2025 Drakkar-Software, All rights reserved.
+#
+#  OctoBot is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  OctoBot is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public
+#  License along with OctoBot. If not, see <https://www.gnu.org/licenses/>.
+import datetime
+
+import numpy
+import pytest
+
+pyarrow = pytest.importorskip("pyarrow")
+
+import octobot_commons.enums as commons_enums
+import octobot.community.history_backend.iceberg_historical_backend_client as iceberg_historical_backend_client
+import octobot.community.history_backend.util as history_backend_util
+
+IcebergHistoricalBackendClient = iceberg_historical_backend_client.IcebergHistoricalBackendClient
+START_TIME = datetime.datetime(2024, 6, 19, 8, 30)
+
+
+def _get_ohlcvs_table(rows: list[tuple[str, str, int]]) -> pyarrow.Table:
+    # rows: (symbol, time_frame, minutes from START_TIME), shuffled and with duplicates as in iceberg scans
+    values = [float(minutes) for _, _, minutes in rows]
+    table = pyarrow.table({
+        "time_frame": [time_frame for _, time_frame, _ in rows],
+        "symbol": [symbol for symbol, _, _ in rows],
+        "timestamp": pyarrow.array(
+            [START_TIME + datetime.timedelta(minutes=minutes) for _, _, minutes in rows], pyarrow.timestamp("us")
+        ),
+        "open": values,
+        "high": [value + 2 for value in values],
+        "low": [value - 2 for value in values],
+        "close": [value + 1 for value in values],
+        "volume": [value * 10 for value in values],
+    })
+    # iceberg scans return multiple chunks
+    return pyarrow.concat_tables([table.slice(0, len(rows) // 2), table.slice(len(rows) // 2)])
+
+
+def _get_python_ohlcvs(ohlcvs_table: pyarrow.Table, extended: bool) -> list:
+    formatted = IcebergHistoricalBackendClient._format_ohlcvs(ohlcvs_table, extended)
+    return history_backend_util.deduplicate(formatted, [0, 1, 2] if extended else [0])
+
+
+def test_get_ohlcvs_array():
+    ohlcvs_table = _get_ohlcvs_table([
+        ("BTC/USDT", "1m", minutes) for minutes in (3, 1, 2, 1, 0, 3, 4)
+    ])
+    ohlcvs = IcebergHistoricalBackendClient._get_ohlcvs_array(
+        IcebergHistoricalBackendClient._sort_and_deduplicate_ohlcvs(ohlcvs_table, False)
+    )
+    assert isinstance(ohlcvs, numpy.ndarray)
+    assert ohlcvs.shape == (5, len(commons_enums.PriceIndexes))
+    # same values as python ohlcvs
+    assert ohlcvs.tolist() == _get_python_ohlcvs(ohlcvs_table, False)
+    # UTC timestamps
+    assert ohlcvs[0][commons_enums.PriceIndexes.IND_PRICE_TIME.value] == 1718785800
+    assert ohlcvs[-1][commons_enums.PriceIndexes.IND_PRICE_CLOSE.value] == 5
+
+    # empty table
+    empty_ohlcvs = IcebergHistoricalBackendClient._get_ohlcvs_array(
+        IcebergHistoricalBackendClient._sort_and_deduplicate_ohlcvs(ohlcvs_table.slice(0, 0), False)
+    )
+    assert empty_ohlcvs.shape == (0, len(commons_enums.PriceIndexes))
+
+
+def test_get_ohlcvs_arrays_by_symbol_and_time_frame():
+    rows = [
+        ("ETH/USDT", "1h", 120), ("BTC/USDT", "1m", 2), ("BTC/USDT", "1h", 60), ("BTC/USDT", "1m", 1),
+        ("ETH/USDT", "1h", 60), ("BTC/USDT", "1m", 2), ("BTC/USDT", "1h", 0), ("ETH/USDT", "1h", 60),
+    ]
+    ohlcvs_table = _get_ohlcvs_table(rows)
+    ohlcvs_by_symbol = IcebergHistoricalBackendClient._get_ohlcvs_arrays_by_symbol_and_time_frame(
+        IcebergHistoricalBackendClient._sort_and_deduplicate_ohlcvs(ohlcvs_table, True)
+    )
+    assert list(ohlcvs_by_symbol) == ["BTC/USDT", "ETH/USDT"]
+    assert list(ohlcvs_by_symbol["BTC/USDT"]) == ["1h", "1m"]
+    assert list(ohlcvs_by_symbol["ETH/USDT"]) == ["1h"]
+    expected = {}
+    for time_frame, symbol, *ohlcv in _get_python_ohlcvs(ohlcvs_table, True):
+        expected.setdefault(symbol, {}).setdefault(time_frame, []).append(ohlcv)
+    for symbol, ohlcvs_by_time_frame in ohlcvs_by_symbol.items():
+        for time_frame, ohlcvs in ohlcvs_by_time_frame.items():
+            assert ohlcvs.tolist() == expected[symbol][time_frame]
+    assert len(ohlcvs_by_symbol["BTC/USDT"]["1m"]) == 2
+    assert len(ohlcvs_by_symbol["ETH/USDT"]["1h"]) == 2